@@ -32,18 +32,74 @@ from xml.sax.saxutils import escape as _xml_escape
 logger = logging.getLogger("spellbook.hook")
 
 
+# ---------------------------------------------------------------------------
+# Per-run context
+# ---------------------------------------------------------------------------
+# When this module runs as a standalone hook process, handlers read the
+# process environment and write to the real stdout/stderr. When the daemon's
+# warm dispatcher (``spellbook.hooks.dispatcher``) runs the same handlers on
+# behalf of a hook shim, each request executes on its own thread with the
+# shim's environment and captured output streams installed here. Handlers
+# must go through these accessors instead of touching ``os.environ`` or
+# ``sys.stdout``/``sys.stderr`` directly.
+_ctx = threading.local()
+
+
+def _getenv(key: str, default: str | None = None) -> str | None:
+    """Read an environment variable from the active run's environment."""
+    env = getattr(_ctx, "env", None)
+    if env is None:
+        return os.environ.get(key, default)
+    return env.get(key, default)
+
+
+def _environ_copy() -> dict[str, str]:
+    """Return a mutable copy of the active run's environment."""
+    env = getattr(_ctx, "env", None)
+    return dict(os.environ if env is None else env)
+
+
+def _home() -> Path:
+    """Return the active run's home directory."""
+    env = getattr(_ctx, "env", None)
+    if env is not None and env.get("HOME"):
+        return Path(env["HOME"])
+    return Path.home()
+
+
+def _stdout():
+    """Return the stream hook output (LLM context injection) is written to."""
+    return getattr(_ctx, "stdout", None) or sys.stdout
+
+
+def _stderr():
+    """Return the stream hook diagnostics and block reasons are written to."""
+    return getattr(_ctx, "stderr", None) or sys.stderr
+
+
 # ---------------------------------------------------------------------------
 # MCP Communication
 # ---------------------------------------------------------------------------
-MCP_HOST = os.environ.get("SPELLBOOK_MCP_HOST", "127.0.0.1")
-MCP_PORT = os.environ.get("SPELLBOOK_MCP_PORT", "8765")
-_host_part = f"[{MCP_HOST}]" if ":" in MCP_HOST else MCP_HOST  # IPv6 bracket
-MCP_URL = f"http://{_host_part}:{MCP_PORT}/mcp"
-TOKEN_FILE = Path.home() / ".local" / "spellbook" / ".mcp-token"
-CONFIG_PATH = Path(os.environ.get(
-    "SPELLBOOK_CONFIG_PATH",
-    str(Path.home() / ".config" / "spellbook" / "spellbook.json"),
-))
+# Resolved per call rather than at import: the warm dispatcher keeps this
+# module loaded across runs whose environments differ.
+def _daemon_base_url() -> str:
+    """Return the daemon's base URL from SPELLBOOK_MCP_HOST/PORT."""
+    host = _getenv("SPELLBOOK_MCP_HOST", "127.0.0.1")
+    port = _getenv("SPELLBOOK_MCP_PORT", "8765")
+    host_part = f"[{host}]" if ":" in host else host  # IPv6 bracket
+    return f"http://{host_part}:{port}"
+
+
+def _token_file() -> Path:
+    return _home() / ".local" / "spellbook" / ".mcp-token"
+
+
+def _config_path() -> Path:
+    return Path(_getenv(
+        "SPELLBOOK_CONFIG_PATH",
+        str(_home() / ".config" / "spellbook" / "spellbook.json"),
+    ))
+
 
 def _utcnow() -> datetime:
     """Return current UTC time. Indirection lets tests freeze time."""
@@ -52,13 +108,13 @@ def _utcnow() -> datetime:
 
 def _detect_platform() -> str:
     """Detect which AI coding assistant platform is running."""
-    if os.environ.get("OPENCODE") == "1":
+    if _getenv("OPENCODE") == "1":
         return "opencode"
-    if os.environ.get("CODEX_SANDBOX") or os.environ.get("CODEX_SANDBOX_NETWORK_DISABLED"):
+    if _getenv("CODEX_SANDBOX") or _getenv("CODEX_SANDBOX_NETWORK_DISABLED"):
         return "codex"
-    if os.environ.get("GEMINI_CLI") == "1":
+    if _getenv("GEMINI_CLI") == "1":
         return "gemini-cli"
-    if os.environ.get("CLAUDE_PROJECT_DIR") or os.environ.get("CLAUDE_ENV_FILE"):
+    if _getenv("CLAUDE_PROJECT_DIR") or _getenv("CLAUDE_ENV_FILE"):
         return "claude-code"
     # ForgeCode session marker not yet exposed by upstream as of this writing;
     # sessions running under forge will fall through to "unknown". Tracked as
@@ -79,9 +135,10 @@ def _mcp_call(tool_name: str, arguments: dict | None = None) -> dict | None:
         "Accept": "application/json, text/event-stream",
     }
     headers["X-Spellbook-Client"] = _detect_platform()
-    if TOKEN_FILE.exists():
+    token_file = _token_file()
+    if token_file.exists():
         try:
-            headers["Authorization"] = f"Bearer {TOKEN_FILE.read_text().strip()}"
+            headers["Authorization"] = f"Bearer {token_file.read_text().strip()}"
         except OSError:
             pass
 
@@ -96,7 +153,8 @@ def _mcp_call(tool_name: str, arguments: dict | None = None) -> dict | None:
     }).encode()
 
     try:
-        req = urllib.request.Request(MCP_URL, data=body, headers=headers, method="POST")
+        req = urllib.request.Request(
+            f"{_daemon_base_url()}/mcp", data=body, headers=headers, method="POST")
         with urllib.request.urlopen(req, timeout=1.5) as resp:
             raw = resp.read().decode()
         return _parse_mcp_response(raw)
@@ -137,8 +195,9 @@ def _parse_mcp_response(raw: str) -> dict | None:
 def _get_config_value(key: str, default=None):
     """Read a single config value from the spellbook config file."""
     try:
-        if CONFIG_PATH.exists():
-            config = json.loads(CONFIG_PATH.read_text())
+        config_path = _config_path()
+        if config_path.exists():
+            config = json.loads(config_path.read_text())
             return config.get(key, default)
     except (json.JSONDecodeError, OSError):
         pass
@@ -158,7 +217,7 @@ def _log_hook_error(event: str, tool: str, exc: BaseException) -> None:
     result = _http_post("/api/hook-log", payload)
     if result is None:
         # Daemon unreachable -- write to stderr so it shows in Claude Code output
-        print(f"[spellbook-hook] Error in {event}:{tool}:\n{tb}", file=sys.stderr)
+        print(f"[spellbook-hook] Error in {event}:{tool}:\n{tb}", file=_stderr())
 
 
 _pending_emitter_threads: list[threading.Thread] = []
@@ -170,16 +229,35 @@ def _fire_and_forget(fn, *args):
     The thread is tracked in ``_pending_emitter_threads`` so ``main()`` can
     drain outstanding emitters with a short aggregate timeout before exit —
     otherwise the hook's ``sys.exit`` can race the POST and drop the record.
+    Under the warm dispatcher the thread carries the request's environment,
+    stderr and working directory with it, so the function sees the shim's
+    settings rather than the daemon's.
     """
+    env = getattr(_ctx, "env", None)
+    stderr = getattr(_ctx, "stderr", None)
+    cwd = None
+    if env is not None:
+        from spellbook.core import run_context
+
+        cwd = run_context.getcwd()
 
     def _wrapper():
+        _ctx.env = env
+        _ctx.stderr = stderr
         try:
-            fn(*args)
+            if env is None:
+                fn(*args)
+            else:
+                with run_context.bind(env, cwd):
+                    fn(*args)
         except Exception as e:
             _log_hook_error("fire_and_forget", fn.__name__, e)
 
     t = threading.Thread(target=_wrapper, daemon=True)
-    _pending_emitter_threads.append(t)
+    # Inside the daemon's warm dispatcher the process outlives the request,
+    # so there is nothing to drain and tracking would only leak threads.
+    if not getattr(_ctx, "warm", False):
+        _pending_emitter_threads.append(t)
     t.start()
 
 
@@ -227,13 +305,14 @@ def _http_post(path: str, payload: dict, timeout: float = 5) -> dict | None:
     """Direct HTTP POST (not JSON-RPC) to a daemon REST endpoint.
 
     ``path`` is an absolute URL path (e.g. ``/api/hook-log``).  The daemon
-    base URL is derived from MCP_HOST and MCP_PORT.
+    base URL is derived from SPELLBOOK_MCP_HOST and SPELLBOOK_MCP_PORT.
     """
-    url = f"http://{_host_part}:{MCP_PORT}{path}"
+    url = f"{_daemon_base_url()}{path}"
     headers = {"Content-Type": "application/json"}
-    if TOKEN_FILE.exists():
+    token_file = _token_file()
+    if token_file.exists():
         try:
-            headers["Authorization"] = f"Bearer {TOKEN_FILE.read_text().strip()}"
+            headers["Authorization"] = f"Bearer {token_file.read_text().strip()}"
         except OSError:
             pass
     try:
@@ -281,12 +360,12 @@ def _send_os_notification(title: str, body: str) -> None:
             script = 'on run {title, body}\n  display notification body with title title\nend run'
             subprocess.run(
                 ["osascript", "-e", script, title, body],
-                capture_output=True, timeout=5,
+                capture_output=True, timeout=5, env=_environ_copy(),
             )
         else:
             subprocess.run(
                 ["notify-send", title, body],
-                capture_output=True, timeout=5,
+                capture_output=True, timeout=5, env=_environ_copy(),
             )
     except Exception:
         pass
@@ -339,7 +418,7 @@ def _handle_check_result(result: dict) -> None:
             for f in result["findings"]
             if f.get("severity") != "LOW"
         )
-        print(json.dumps({"error": f"Security check failed: {reasons}"}), file=sys.stderr)
+        print(json.dumps({"error": f"Security check failed: {reasons}"}), file=_stderr())
         sys.exit(2)
 
 
@@ -366,7 +445,8 @@ def _emit_ask_and_exit(findings: list[dict]) -> None:
                     "permissionDecisionReason": reason,
                 }
             }
-        )
+        ),
+        file=_stdout(),
     )
     sys.exit(0)
 
@@ -392,12 +472,12 @@ def _gate_bash(data: dict) -> None:
         from spellbook.gates.check import check_tool_input
     except ImportError as e:
         _log_hook_error("gate_bash", "Bash", e)
-        print(json.dumps({"error": "Security check failed: security module not available"}), file=sys.stderr)
+        print(json.dumps({"error": "Security check failed: security module not available"}), file=_stderr())
         sys.exit(2)
 
     tool_input = data.get("tool_input")
     if not tool_input:
-        print(json.dumps({"error": "Security check failed: no tool input provided"}), file=sys.stderr)
+        print(json.dumps({"error": "Security check failed: no tool input provided"}), file=_stderr())
         sys.exit(2)
 
     result = check_tool_input("Bash", tool_input, cwd=data.get("cwd", ""))
@@ -414,12 +494,12 @@ def _gate_spawn(data: dict) -> None:
         from spellbook.gates.check import check_tool_input
     except ImportError as e:
         _log_hook_error("gate_spawn", "spawn_claude_session", e)
-        print(json.dumps({"error": "Security check failed: security module not available"}), file=sys.stderr)
+        print(json.dumps({"error": "Security check failed: security module not available"}), file=_stderr())
         sys.exit(2)
 
     tool_input = data.get("tool_input")
     if not tool_input:
-        print(json.dumps({"error": "Security check failed: no tool input provided"}), file=sys.stderr)
+        print(json.dumps({"error": "Security check failed: no tool input provided"}), file=_stderr())
         sys.exit(2)
 
     result = check_tool_input("spawn_claude_session", tool_input, cwd=data.get("cwd", ""))
@@ -436,12 +516,12 @@ def _gate_state_sanitize(data: dict) -> None:
         from spellbook.gates.check import check_tool_input
     except ImportError as e:
         _log_hook_error("gate_state_sanitize", "workflow_state_save", e)
-        print(json.dumps({"error": "Security check failed: security module not available"}), file=sys.stderr)
+        print(json.dumps({"error": "Security check failed: security module not available"}), file=_stderr())
         sys.exit(2)
 
     tool_input = data.get("tool_input")
     if not tool_input:
-        print(json.dumps({"error": "Security check failed: no tool input provided"}), file=sys.stderr)
+        print(json.dumps({"error": "Security check failed: no tool input provided"}), file=_stderr())
         sys.exit(2)
 
     result = check_tool_input("workflow_state_save", tool_input, cwd=data.get("cwd", ""))
@@ -475,7 +555,7 @@ def _notify_on_complete(tool_name: str, data: dict) -> None:
     Reads timer file created by _record_tool_start, checks elapsed time
     against threshold, and sends a platform-specific notification.
     """
-    if os.environ.get("SPELLBOOK_NOTIFY_ENABLED", "true") != "true":
+    if _getenv("SPELLBOOK_NOTIFY_ENABLED", "true") != "true":
         return
     if tool_name in _EXCLUDED_TOOLS:
         return
@@ -491,10 +571,10 @@ def _notify_on_complete(tool_name: str, data: dict) -> None:
     except (ValueError, OSError):
         return
     elapsed = int(time.time()) - start_time
-    threshold = int(os.environ.get("SPELLBOOK_NOTIFY_THRESHOLD", "30"))
+    threshold = int(_getenv("SPELLBOOK_NOTIFY_THRESHOLD", "30"))
     if elapsed < threshold:
         return
-    title = os.environ.get("SPELLBOOK_NOTIFY_TITLE", "Spellbook")
+    title = _getenv("SPELLBOOK_NOTIFY_TITLE", "Spellbook")
     body = f"{tool_name} finished ({elapsed}s)"
     _send_os_notification(title, body)
 
@@ -697,7 +777,7 @@ def _emit_block_and_exit(reasoning: str) -> None:
         f"  {_xml_escape(reasoning)}\n"
         "  Retry the same tool call within 30 seconds to bypass this check.\n"
         "</worker-llm-tool-safety>",
-        file=sys.stderr,
+        file=_stderr(),
     )
     sys.exit(2)
 
@@ -850,7 +930,7 @@ def _wl_tool_safety_sniff(
         # Known transient failures: FAIL OPEN. Stderr notice only.
         print(
             f"[worker-llm] tool_safety: {e} (failing open)",
-            file=sys.stderr,
+            file=_stderr(),
         )
     except Exception as e:
         # Paranoid catch: any unexpected exception must not block the user.
@@ -863,15 +943,14 @@ def _wl_tool_safety_sniff(
 
 # Mirror of the helper's bus-dir resolution. Kept in sync with
 # skills/agent2agent/scripts/agent2agent.py.
-_A2A_DEFAULT_BUS_DIR = Path.home() / ".local" / "share" / "agent2agent"
 _A2A_NAME_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]{0,63}$")
 _A2A_SESSION_ID_RE = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
 _A2A_NOTIFY_TIMEOUT_S = 3.0
 
 
 def _a2a_bus_dir() -> Path:
-    env = os.environ.get("AGENT2AGENT_DIR")
-    return Path(env) if env else _A2A_DEFAULT_BUS_DIR
+    env = _getenv("AGENT2AGENT_DIR")
+    return Path(env) if env else _home() / ".local" / "share" / "agent2agent"
 
 
 def _a2a_helper_path() -> Path:
@@ -880,7 +959,7 @@ def _a2a_helper_path() -> Path:
     Honors $SPELLBOOK_DIR (set in tests and most installs); otherwise falls
     back to the source location relative to this hook file.
     """
-    env = os.environ.get("SPELLBOOK_DIR")
+    env = _getenv("SPELLBOOK_DIR")
     if env:
         return Path(env) / "skills" / "agent2agent" / "scripts" / "agent2agent.py"
     # spellbook_hook.py lives at <repo>/hooks/spellbook_hook.py
@@ -913,11 +992,18 @@ def _agent2agent_notify_for_prompt(data: dict) -> str | None:
     if not bound_name or not _A2A_NAME_RE.match(bound_name):
         return None
 
+    # Fast path: an empty inbox has nothing to announce, so skip the helper
+    # spawn. A missing inbox (closed name) still goes to the helper, which
+    # owns the stale-binding cleanup.
+    counts = _a2a_message_counts(bus / bound_name)
+    if counts is not None and counts[0] == 0:
+        return None
+
     helper = _a2a_helper_path()
     if not helper.exists():
         return None
 
-    helper_env = os.environ.copy()
+    helper_env = _environ_copy()
     # Pass the active session id so the helper can perform stale-binding
     # cleanup (it falls back to $CLAUDE_CODE_SESSION_ID, which may not be
     # propagated into the hook subprocess by every harness).
@@ -993,21 +1079,34 @@ def _bg_agent_alive(agent_id, state) -> bool:
     return age < 90.0
 
 
-def _a2a_count_pending(name_dir: Path) -> int:
-    """Stat/enumerate-only count of pending messages for an orphan hint, over
-    TWO sibling locations summed (design §7.3). ``name_dir`` is the per-name
-    root ``<bus>/<name>`` (= agent2agent.py::name_dir(name)); inbox and pending
-    are SIBLINGS under it, NOT nested:
-        inbox   = name_dir / "inbox"     (agent2agent.py::inbox_dir)
-        pending = name_dir / "pending"   (agent2agent.py::pending_dir)
-    They are computed INDEPENDENTLY here — pending is NEVER inbox/"pending".
-    Predicate matches agent2agent.py::_list_inbox (a *.json file, not a dotfile)
-    for the inbox, and the drain filter (non-dotfile) for pending batches.
-    Bodies are NEVER opened (IR-3). Any error yields a best-effort
-    partial/zero count.
-    """
-    total = 0
+# Cached message counts live in <bus>/.counts/<name>, outside the name dir so
+# a write can never resurrect a name that `close` is removing. The file records
+# the (mtime_ns, inode) of inbox/, pending/ and each pending/<batch>/ as of
+# the scan that produced it; any message arriving, being read or being staged
+# changes one of those directory stamps, so a matching file is a correct count
+# at the cost of a few stats. Directories modified within the racy window are
+# never recorded: a second change inside one timestamp tick could leave the
+# stamp unchanged (git's "racily clean" rule).
+_A2A_COUNT_DIR = ".counts"
+_A2A_COUNT_RACY_NS = 2_000_000_000
+
+
+def _a2a_dir_stamp(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_ino]
+
+
+def _a2a_scan_counts(name_dir: Path) -> tuple[int, int, dict]:
+    """Enumerate ``(inbox, staged, stamps)`` for ``name_dir`` (see
+    ``_a2a_count_pending`` for the predicates). Stamps are taken BEFORE each
+    directory is listed, so a change during the scan invalidates them."""
+    stamps: dict[str, list[int] | None] = {}
+    inbox_count = 0
     inbox = name_dir / "inbox"
+    stamps["inbox"] = _a2a_dir_stamp(inbox)
     try:
         for entry in inbox.iterdir():
             if (
@@ -1015,22 +1114,89 @@ def _a2a_count_pending(name_dir: Path) -> int:
                 and entry.name.endswith(".json")
                 and not entry.name.startswith(".")
             ):
-                total += 1
+                inbox_count += 1
     except OSError:
         pass
+    staged = 0
     pending_root = name_dir / "pending"  # SIBLING of inbox, not inbox/"pending"
+    stamps["pending"] = _a2a_dir_stamp(pending_root)
     try:
         batches = [d for d in pending_root.iterdir() if d.is_dir()]
     except OSError:
         batches = []
     for batch in batches:
+        stamps["pending/" + batch.name] = _a2a_dir_stamp(batch)
         try:
             for f in batch.iterdir():
                 if f.is_file() and not f.name.startswith("."):
-                    total += 1
+                    staged += 1
         except OSError:
             continue
-    return total
+    return inbox_count, staged, stamps
+
+
+def _a2a_message_counts(name_dir: Path) -> tuple[int, int] | None:
+    """Return ``(inbox, staged)`` message counts for ``name_dir``, or ``None``
+    when its ``inbox/`` does not exist (never opened, or closed).
+
+    Served from ``<bus>/.counts/<name>`` when every recorded directory stamp
+    still matches; otherwise rescans and, if the stamps are settled, rewrites
+    the file (best-effort, atomic). Bodies are NEVER opened (IR-3).
+    """
+    if not (name_dir / "inbox").is_dir():
+        return None
+    count_dir = name_dir.parent / _A2A_COUNT_DIR
+    count_path = count_dir / name_dir.name
+    try:
+        cached = json.loads(count_path.read_text(encoding="utf-8"))
+        stamps = cached["stamps"]
+        if all(_a2a_dir_stamp(name_dir / rel) == st for rel, st in stamps.items()):
+            return int(cached["inbox"]), int(cached["staged"])
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        pass
+    inbox_count, staged, stamps = _a2a_scan_counts(name_dir)
+    horizon = time.time_ns() - _A2A_COUNT_RACY_NS
+    if all(st is None or st[0] < horizon for st in stamps.values()):
+        payload = json.dumps(
+            {"inbox": inbox_count, "staged": staged, "stamps": stamps}
+        )
+        try:
+            count_dir.mkdir(exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=str(count_dir), prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    fh.write(payload)
+                os.replace(tmp, count_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                raise
+        except OSError:
+            pass  # advisory cache
+    return inbox_count, staged
+
+
+def _a2a_count_pending(name_dir: Path) -> int:
+    """Stat/enumerate-only count of pending messages for an orphan hint, over
+    TWO sibling locations summed (design §7.3). ``name_dir`` is the per-name
+    root ``<bus>/<name>`` (= agent2agent.py::name_dir(name)); inbox and pending
+    are SIBLINGS under it, NOT nested:
+        inbox   = name_dir / "inbox"     (agent2agent.py::inbox_dir)
+        pending = name_dir / "pending"   (agent2agent.py::pending_dir)
+    They are computed INDEPENDENTLY here — pending is NEVER inbox/"pending".
+    Predicate matches agent2agent.py::_list_inbox (a *.json file, not a dotfile)
+    for the inbox, and the drain filter (non-dotfile) for pending batches.
+    Counts come from the ``<bus>/.counts`` cache when its directory stamps
+    still match (``_a2a_message_counts``), so an unchanged inbox costs a few
+    stats instead of a directory walk. Bodies are NEVER opened (IR-3). Any
+    error yields a best-effort partial/zero count.
+    """
+    counts = _a2a_message_counts(name_dir)
+    if counts is None:
+        return 0
+    return counts[0] + counts[1]
 
 
 def _agent2agent_check_orphaned_chain(data: dict) -> str | None:
@@ -1136,7 +1302,7 @@ def _develop_nudge_marker_dir() -> Path:
     Honors ``$SPELLBOOK_CONFIG_DIR`` (set in tests and most installs) and falls
     back to ``~/.local/spellbook`` (the default config dir) per design §6.2.
     """
-    base = os.environ.get("SPELLBOOK_CONFIG_DIR") or str(Path.home() / ".local" / "spellbook")
+    base = _getenv("SPELLBOOK_CONFIG_DIR") or str(_home() / ".local" / "spellbook")
     return Path(base) / "runtime" / "develop-nudge"
 
 
@@ -1457,8 +1623,155 @@ def _record_hook_event_fire_and_forget(
         pass  # Best-effort; hooks must never fail on observability.
 
 
+# ---------------------------------------------------------------------------
+# Warm dispatch (daemon-side execution)
+# ---------------------------------------------------------------------------
+# Every hook event otherwise pays interpreter startup plus the gates/bashlex/
+# worker-LLM imports. The daemon keeps this module loaded and serves events
+# over a Unix domain socket (see ``spellbook.hooks.dispatcher``); this process
+# then only forwards stdin and relays the result. Any failure to reach the
+# dispatcher falls back to the in-process path below, so the security gates
+# stay FAIL-CLOSED when the daemon is down.
+
+_HOOK_SOCKET_NAME = "hook-dispatch.sock"
+_HOOK_SOCKET_CONNECT_TIMEOUT_S = 0.25
+_HOOK_SOCKET_DEFAULT_TIMEOUT_S = 60.0
+
+
+def _hook_socket_path() -> Path | None:
+    """Resolve the warm dispatcher socket, or None when disabled.
+
+    ``SPELLBOOK_HOOK_SOCKET`` overrides the location; setting it to an empty
+    string disables warm dispatch entirely.
+    """
+    override = os.environ.get("SPELLBOOK_HOOK_SOCKET")
+    if override is not None:
+        return Path(override) if override else None
+    base = os.environ.get("SPELLBOOK_CONFIG_DIR") or str(Path.home() / ".local" / "spellbook")
+    return Path(base) / _HOOK_SOCKET_NAME
+
+
+def _dispatch_via_socket(raw: str) -> tuple[int, str, str] | None:
+    """Run the event in the daemon's warm dispatcher.
+
+    Returns ``(exit_code, stdout, stderr)`` on success, or None whenever the
+    dispatcher is unavailable, declines the request, or replies with
+    anything malformed. None means "run in-process instead".
+    """
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    path = _hook_socket_path()
+    if path is None or not path.exists():
+        return None
+    try:
+        timeout = float(os.environ.get(
+            "SPELLBOOK_HOOK_SOCKET_TIMEOUT", _HOOK_SOCKET_DEFAULT_TIMEOUT_S,
+        ))
+    except ValueError:
+        timeout = _HOOK_SOCKET_DEFAULT_TIMEOUT_S
+
+    request = json.dumps({
+        "script": str(Path(__file__).resolve()),
+        "stdin": raw,
+        "env": dict(os.environ),
+        "cwd": os.getcwd(),
+    }).encode()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(_HOOK_SOCKET_CONNECT_TIMEOUT_S)
+            sock.connect(str(path))
+            sock.settimeout(timeout)
+            sock.sendall(request)
+            sock.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        reply = json.loads(b"".join(chunks).decode())
+    except (OSError, ValueError) as e:
+        logger.debug("warm hook dispatch unavailable: %s", e)
+        return None
+
+    if not isinstance(reply, dict) or reply.get("fallback"):
+        return None
+    exit_code = reply.get("exit_code")
+    stdout = reply.get("stdout")
+    stderr = reply.get("stderr")
+    if not isinstance(exit_code, int) or not isinstance(stdout, str) or not isinstance(stderr, str):
+        return None
+    return exit_code, stdout, stderr
+
+
+def run_captured(
+    raw: str, env: dict[str, str], cwd: str | None = None,
+) -> tuple[int, str, str]:
+    """Run one hook event with ``env``, ``cwd`` and captured output streams.
+
+    Entry point for the daemon's warm dispatcher. Mirrors a standalone hook
+    process: returns the exit code it would have exited with, plus
+    everything it would have written to stdout and stderr. ``env`` and
+    ``cwd`` are also bound in :mod:`spellbook.core.run_context` so the
+    gates see the shim's settings and resolve relative paths against the
+    shim's directory, not the daemon's. Safe to call from several threads
+    at once.
+    """
+    import io
+
+    from spellbook.core import run_context
+
+    _ctx.env = env
+    _ctx.stdout = io.StringIO()
+    _ctx.stderr = io.StringIO()
+    _ctx.warm = True
+    exit_code = 0
+    try:
+        with run_context.bind(env, cwd):
+            _run(raw)
+    except SystemExit as e:
+        if e.code is None:
+            exit_code = 0
+        elif isinstance(e.code, int):
+            exit_code = e.code
+        else:
+            _ctx.stderr.write(f"{e.code}\n")
+            exit_code = 1
+    finally:
+        stdout = _ctx.stdout.getvalue()
+        stderr = _ctx.stderr.getvalue()
+        _ctx.env = None
+        _ctx.stdout = None
+        _ctx.stderr = None
+        _ctx.warm = False
+    return exit_code, stdout, stderr
+
+
 def main():
-    """Parse stdin and dispatch to handlers."""
+    """Read stdin and run the event warm in the daemon, else in-process."""
+    raw = sys.stdin.read().strip()
+    if raw:
+        warm = _dispatch_via_socket(raw)
+        if warm is not None:
+            exit_code, stdout, stderr = warm
+            if stdout:
+                sys.stdout.write(stdout)
+                sys.stdout.flush()
+            if stderr:
+                sys.stderr.write(stderr)
+                sys.stderr.flush()
+            sys.exit(exit_code)
+    _run(raw)
+
+
+def _run(raw: str) -> None:
+    """Dispatch one raw hook payload to the handlers.
+
+    Exits via ``sys.exit`` exactly like the original standalone hook body;
+    :func:`main` and :func:`run_captured` decide what that exit means.
+    """
     start = time.monotonic()
     event_name = ""
     tool_name = ""
@@ -1477,7 +1790,6 @@ def main():
     # fires. Without this, the hook process can exit before the daemon POST
     # completes and the record is silently dropped.
     try:
-        raw = sys.stdin.read().strip()
         if not raw:
             _emit_record()
             sys.exit(0)
@@ -1504,7 +1816,7 @@ def main():
         try:
             output = dispatch(event_name, tool_name, data)
             if output:
-                print(output)
+                print(output, file=_stdout())
         except SystemExit as e:
             # _emit_block_and_exit calls sys.exit(2); capture exit code.
             exit_code = int(e.code) if isinstance(e.code, int) else 1
@@ -0,0 +1,128 @@
+"""Benchmark agent2agent inbox wake latency, watcher CPU and hook pending counts.
+
+For each ``watch`` backend (``poll``: 500 ms directory polling; ``auto``:
+inotify on Linux) spawns a watcher on a fresh bus, lets it idle for
+``--idle`` seconds while sampling its CPU time from ``/proc/<pid>/stat``,
+then drops a message and times how long the watcher takes to print
+``PENDING_BATCH``. Repeated ``--rounds`` times per backend.
+
+Then times the UserPromptSubmit hook's pending count for a name with
+``--messages`` inbox files, from a fresh directory scan and from the
+cached ``<bus>/.counts/<name>`` file.
+
+AGENT2AGENT_DIR points at a temporary directory so the real bus is left alone.
+
+Usage: uv run python scripts/bench_a2a_watch.py [--rounds 5] [--idle 3] [--messages 200]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+HELPER = PROJECT_ROOT / "skills" / "agent2agent" / "scripts" / "agent2agent.py"
+sys.path.insert(0, str(PROJECT_ROOT / "hooks"))
+
+_CLK_TCK = os.sysconf("SC_CLK_TCK")
+
+
+def _cpu_seconds(pid: int) -> float:
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    # utime and stime are fields 14 and 15; the split starts at field 3
+    return (int(fields[11]) + int(fields[12])) / _CLK_TCK
+
+
+def _drop(inbox: Path, msg_id: str) -> None:
+    fd, tmp = tempfile.mkstemp(dir=str(inbox), prefix=".tmp-", suffix=".json")
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        json.dump({"id": msg_id, "from": "bob", "body": "hi"}, fh)
+    os.replace(tmp, inbox / f"{msg_id}.json")
+
+
+def _round(backend: str, idle: float) -> tuple[float, float]:
+    with tempfile.TemporaryDirectory() as bus:
+        env = {**os.environ, "AGENT2AGENT_DIR": bus}
+        subprocess.run(
+            [sys.executable, str(HELPER), "open", "alice"], env=env, check=True,
+            capture_output=True,
+        )
+        proc = subprocess.Popen(
+            [sys.executable, str(HELPER), "watch", "alice", "--max-elapsed", "60",
+             "--backend", backend],
+            env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        )
+        try:
+            time.sleep(0.5)
+            cpu0 = _cpu_seconds(proc.pid)
+            time.sleep(idle)
+            cpu = _cpu_seconds(proc.pid) - cpu0
+            started = time.perf_counter()
+            _drop(Path(bus) / "alice" / "inbox", "msg-0001")
+            line = proc.stdout.readline()
+            latency = time.perf_counter() - started
+            assert line.startswith("PENDING_BATCH"), line
+        finally:
+            proc.kill()
+            proc.wait()
+        return latency, cpu / idle
+
+
+def _bench_watch(rounds: int, idle: float) -> None:
+    for backend in ("poll", "auto"):
+        results = [_round(backend, idle) for _ in range(rounds)]
+        latencies = [r[0] * 1000 for r in results]
+        cpu = [r[1] * 1000 for r in results]
+        print(f"watch --backend {backend:4}: wake median {statistics.median(latencies):6.1f} ms "
+              f"(max {max(latencies):6.1f}), idle CPU {statistics.mean(cpu):5.2f} ms/s")
+
+
+def _bench_counts(messages: int) -> None:
+    import spellbook_hook
+
+    with tempfile.TemporaryDirectory() as bus:
+        name_dir = Path(bus) / "alice"
+        inbox = name_dir / "inbox"
+        (name_dir / "pending").mkdir(parents=True)
+        inbox.mkdir()
+        for i in range(messages):
+            (inbox / f"msg-{i:05d}.json").write_text("{}", encoding="utf-8")
+        past = time.time() - 60
+        for path in (inbox, name_dir / "pending"):
+            os.utime(path, (past, past))
+
+        n = 2000
+        cache = Path(bus) / ".counts" / "alice"
+        t0 = time.perf_counter()
+        for _ in range(n):
+            if cache.exists():
+                cache.unlink()
+            spellbook_hook._a2a_count_pending(name_dir)
+        scan = (time.perf_counter() - t0) / n
+        t0 = time.perf_counter()
+        for _ in range(n):
+            spellbook_hook._a2a_count_pending(name_dir)
+        cached = (time.perf_counter() - t0) / n
+        print(f"hook pending count ({messages} msgs): scan {scan * 1e6:7.1f} us, "
+              f"cached {cached * 1e6:7.1f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--idle", type=float, default=3.0)
+    parser.add_argument("--messages", type=int, default=200)
+    args = parser.parse_args()
+
+    _bench_watch(args.rounds, args.idle)
+    _bench_counts(args.messages)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark canvas listing and detail reads (``list_canvases``/``read_canvas``).
+
+Creates ``--canvases`` canvases with ``--page-kb`` KB pages in a temporary
+canvas root, backdates their files (as for canvases nobody is writing to
+right now), then times the calls the admin canvas page and ``canvas_list``
+make on every poll or change event.
+
+Usage: uv run python scripts/bench_canvas_catalog.py [--canvases 200] [--page-kb 64]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def _time(fn, calls: int) -> float:
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - t0) / calls * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--canvases", type=int, default=200)
+    parser.add_argument("--page-kb", type=int, default=64)
+    parser.add_argument("--calls", type=int, default=50)
+    args = parser.parse_args()
+
+    from spellbook.canvas import store
+
+    with tempfile.TemporaryDirectory() as root:
+        store._resolve_canvas_root = lambda: root
+        page = ("lorem ipsum " * 90 + "\n") * (args.page_kb * 1024 // 1081 + 1)
+        for i in range(args.canvases):
+            store.open_canvas(f"canvas-{i}", title=f"Canvas {i}")
+            store.write_page(f"canvas-{i}", page)
+        past = time.time() - 3600
+        for dirpath, _dirs, files in os.walk(root):
+            for name in files:
+                os.utime(os.path.join(dirpath, name), (past, past))
+            os.utime(dirpath, (past, past))
+
+        print(f"{args.canvases} canvases, {args.page_kb} KB pages")
+        ms = _time(store.list_canvases, args.calls)
+        print(f"list_canvases        {ms:8.3f} ms/call")
+        ms = _time(lambda: store.read_canvas("canvas-7"), args.calls)
+        print(f"read_canvas          {ms:8.3f} ms/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark ``spellbook`` CLI startup.
+
+For a few cheap invocations, reports the median wall time of ``--runs``
+fresh interpreter runs of ``python -m spellbook.cli.main ...`` and the
+import cost that ``python -X importtime`` attributes to spellbook (the
+summed cumulative time of every top-level import made while building the
+parser and parsing the arguments, excluding the interpreter's own startup
+imports).
+
+Usage: uv run python scripts/bench_cli_startup.py [--runs 20]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+INVOCATIONS = (
+    ["--help"],
+    ["--version"],
+    ["session", "--help"],
+    ["config", "--help"],
+)
+
+PARSE = (
+    "import sys\n"
+    "from spellbook.cli.main import create_parser\n"
+    "try:\n"
+    "    create_parser().parse_args(sys.argv[1:])\n"
+    "except SystemExit:\n"
+    "    pass\n"
+)
+
+
+def import_ms(argv: list[str]) -> float:
+    """Summed cumulative import time (ms) of top-level imports after startup."""
+    baseline = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "pass"],
+        capture_output=True, text=True,
+    ).stderr
+    startup = {line.split("|")[-1].strip() for line in baseline.splitlines() if "|" in line}
+    err = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PARSE, *argv],
+        capture_output=True, text=True, cwd=PROJECT_ROOT,
+    ).stderr
+    total = 0
+    for line in err.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Top-level entries only (nested ones are indented past one space).
+        if name.startswith("  ") or not cumulative.strip().isdigit():
+            continue
+        if name.strip() not in startup:
+            total += int(cumulative)
+    return total / 1000
+
+
+def wall_ms(argv: list[str], runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "spellbook.cli.main", *argv],
+            capture_output=True, cwd=PROJECT_ROOT,
+        )
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    for argv in INVOCATIONS:
+        label = "spellbook " + " ".join(argv)
+        print(
+            f"{label:26s} wall median {wall_ms(argv, args.runs):7.1f} ms  "
+            f"imports {import_ms(argv):6.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Microbenchmark config lookups per second.
+
+Writes a spellbook.json of realistic size under a temporary HOME, then
+times ``config_get`` on a hot key (what ``_ttl_seconds`` and
+``feature_enabled`` do on every call) and, when available,
+``config_get_many`` for the ten ``worker_llm_*`` keys.
+
+Usage: uv run python scripts/bench_config.py [--seconds 2]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+WORKER_KEYS = [
+    "worker_llm_base_url",
+    "worker_llm_model",
+    "worker_llm_api_key",
+    "worker_llm_timeout_s",
+    "worker_llm_max_tokens",
+    "worker_llm_tool_safety_timeout_s",
+    "worker_llm_allow_prompt_overrides",
+    "worker_llm_feature_roundtable",
+    "worker_llm_feature_tool_safety",
+    "worker_llm_safety_cache_ttl_s",
+]
+
+
+def _rate(label: str, fn, seconds: float) -> None:
+    calls = 0
+    deadline = time.perf_counter() + seconds
+    t0 = time.perf_counter()
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            fn()
+        calls += 100
+    elapsed = time.perf_counter() - t0
+    print(f"{label:40s} {calls / elapsed:12,.0f} lookups/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        os.environ["HOME"] = home
+        from spellbook.core import config
+
+        config_path = config.get_config_path()
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        sample = {f"option_{i}": {"enabled": i % 2 == 0, "value": i} for i in range(60)}
+        sample.update({"worker_llm_base_url": "http://localhost:11434/v1", "worker_llm_model": "m"})
+        config_path.write_text(json.dumps(sample, indent=2))
+
+        _rate("config_get('worker_llm_safety_cache_ttl_s')",
+              lambda: config.config_get("worker_llm_safety_cache_ttl_s"), args.seconds)
+        _rate("config_get x10 (worker keys)",
+              lambda: [config.config_get(k) for k in WORKER_KEYS], args.seconds)
+        if hasattr(config, "config_get_many"):
+            _rate("config_get_many(10 worker keys)",
+                  lambda: config.config_get_many(WORKER_KEYS), args.seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Benchmark MCP tool latency against NullPool vs. pooled daemon engines.
+
+Drives the fractal MCP tool handlers the daemon serves (``create_graph``,
+``get_snapshot``, ``update_graph_status``) through the default session
+factories, first with the NullPool engines every process starts with and
+then after ``enable_pooling()``, the state the daemon runs in. A concurrent
+burst mimics an agent fanning out several tool calls at once.
+
+HOME points at a temporary directory so the real databases are left alone.
+
+Usage: uv run python scripts/bench_db_pool.py [--calls 200] [--burst 16]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def _summary(label: str, samples: list[float]) -> str:
+    ms = sorted(s * 1000 for s in samples)
+    p95 = ms[max(int(len(ms) * 0.95) - 1, 0)]
+    return (
+        f"{label:36s} p50 {statistics.median(ms):7.2f} ms  "
+        f"p95 {p95:7.2f} ms  mean {statistics.fmean(ms):7.2f} ms"
+    )
+
+
+async def _run(calls: int, burst: int) -> dict[str, list[float]]:
+    from spellbook.fractal.graph_ops import create_graph, update_graph_status
+    from spellbook.fractal.query_ops import get_snapshot
+
+    graph = await create_graph("Why is the sky blue?", "pulse", "autonomous")
+    graph_id = graph["graph_id"]
+
+    async def timed(coro_fn) -> float:
+        t0 = time.perf_counter()
+        await coro_fn()
+        return time.perf_counter() - t0
+
+    results: dict[str, list[float]] = {"get_snapshot": [], "update_graph_status": []}
+    for i in range(calls):
+        results["get_snapshot"].append(await timed(lambda: get_snapshot(graph_id)))
+        status = "paused" if i % 2 == 0 else "active"
+        results["update_graph_status"].append(
+            await timed(lambda: update_graph_status(graph_id, status))
+        )
+
+    burst_samples: list[float] = []
+    for _ in range(max(calls // burst, 1)):
+        burst_samples.extend(
+            await asyncio.gather(*(timed(lambda: get_snapshot(graph_id)) for _ in range(burst)))
+        )
+    results[f"get_snapshot x{burst} burst"] = burst_samples
+    return results
+
+
+async def _bench(calls: int, burst: int) -> None:
+    from spellbook.db import disable_pooling, enable_pooling, pool_stats
+
+    unpooled = await _run(calls, burst)
+    enable_pooling()
+    try:
+        pooled = await _run(calls, burst)
+        stats = pool_stats()["fractal.db"]
+    finally:
+        await disable_pooling()
+
+    for name in unpooled:
+        print(_summary(f"{name} (NullPool)", unpooled[name]))
+        print(_summary(f"{name} (pooled)", pooled[name]))
+        speedup = statistics.median(unpooled[name]) / statistics.median(pooled[name])
+        print(f"{'':36s} {speedup:.1f}x")
+    print(
+        "fractal.db pool: writer connects {w[connects]} / checkouts {w[checkouts]}, "
+        "reader connects {r[connects]} / checkouts {r[checkouts]}".format(
+            w=stats["writer"], r=stats["reader"]
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--burst", type=int, default=16)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        os.environ["HOME"] = home
+        from spellbook.fractal.schema import init_fractal_schema
+
+        init_fractal_schema()
+        asyncio.run(_bench(args.calls, args.burst))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Benchmark admin event fan-out: event bus plus the WebSocket send loop.
+
+Subscribes ``--clients`` fake WebSocket connections the way
+``spellbook.admin.routes.ws`` does (one bus queue and one ``_send_loop``
+task each) and publishes ``--events`` worker-LLM events in bursts of
+``--burst``, as a busy hook session does. The fake socket does the work a
+real one would: ``send_json`` JSON-encodes its argument, ``send_text``
+just takes the string. Reports the publish cost, the CPU time until every
+client has been sent every event, and the number of frames written.
+
+A second run has half of the clients subscribe to ``fractal`` only; a bus
+that honors filters never queues the worker-LLM events for them.
+
+Usage: uv run python scripts/bench_event_bus.py [--clients 50] [--events 5000]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+class FakeWebSocket:
+    def __init__(self) -> None:
+        self.frames = 0
+        self.events = 0
+
+    async def send_json(self, data) -> None:
+        json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        self.frames += 1
+        self.events += 1
+
+    async def send_text(self, text: str) -> None:
+        self.frames += 1
+        self.events += text.count('"type": "event"')
+
+
+async def run(clients: int, events: int, burst: int, filtered: int) -> dict:
+    from spellbook.admin.events import Event, EventBus, Subsystem
+    from spellbook.admin.routes import ws as ws_route
+
+    bus = EventBus()
+    ws_route.event_bus = bus
+    sockets, tasks = [], []
+    for i in range(clients):
+        queue = await bus.subscribe(f"ws-{i}")
+        if i < filtered and hasattr(bus, "set_filter"):
+            bus.set_filter(f"ws-{i}", [Subsystem.FRACTAL])
+        sock = FakeWebSocket()
+        sockets.append(sock)
+        tasks.append(asyncio.create_task(ws_route._send_loop(sock, queue)))
+
+    data = {
+        "task": "tool_safety", "model": "bench", "latency_ms": 42,
+        "status": "ok", "prompt_len": 812, "response_len": 96,
+        "error": None, "override_loaded": False,
+    }
+    expected = {id(s): events for s in sockets}
+    if hasattr(bus, "set_filter"):
+        for s in sockets[:filtered]:
+            expected[id(s)] = 0
+
+    publish_s = 0.0
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    for start in range(0, events, burst):
+        t0 = time.perf_counter()
+        for _ in range(min(burst, events - start)):
+            await bus.publish(Event(Subsystem.WORKER_LLM, "call_ok", dict(data)))
+        publish_s += time.perf_counter() - t0
+        await asyncio.sleep(0.01)
+    # Until every client has everything, or nothing moved for a second
+    # (events dropped from a full queue never arrive).
+    last, idle_since = -1, time.perf_counter()
+    while any(s.events < expected[id(s)] for s in sockets):
+        await asyncio.sleep(0.005)
+        delivered = sum(s.events for s in sockets)
+        if delivered != last:
+            last, idle_since = delivered, time.perf_counter()
+        elif time.perf_counter() - idle_since > 1.0:
+            break
+    cpu = time.process_time() - cpu0
+    wall = time.perf_counter() - wall0
+    for t in tasks:
+        t.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return {
+        "publish_us": publish_s / events * 1e6,
+        "cpu_s": cpu,
+        "wall_s": wall,
+        "frames": sum(s.frames for s in sockets),
+        "delivered": sum(s.events for s in sockets),
+        "dropped": bus.total_dropped_events,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--burst", type=int, default=100)
+    args = parser.parse_args()
+
+    for label, filtered in (("all clients unfiltered", 0), ("half filtered to fractal", args.clients // 2)):
+        r = asyncio.run(run(args.clients, args.events, args.burst, filtered))
+        print(
+            f"{label:26s} publish {r['publish_us']:6.1f} us/event  "
+            f"CPU {r['cpu_s']:6.2f} s  wall {r['wall_s']:6.2f} s  "
+            f"frames {r['frames']:7d}  delivered {r['delivered']:7d}  dropped {r['dropped']:6d}"
+        )
+
+
+if __name__ == "__main__":
+    main()
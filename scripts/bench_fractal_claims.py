@@ -0,0 +1,102 @@
+"""Benchmark concurrent fractal ``claim_work`` throughput.
+
+Bulk-loads one active graph with ``--nodes`` open questions (``--branches``
+branches under the root), then runs ``--workers`` concurrent workers that
+claim until the graph has no open work left, each through its own
+connection as parallel subagents would. Reports claims per second, how
+many nodes were claimed more than once, and how many calls failed with
+an error (e.g. ``database is locked``) and were retried. With
+``--batch K`` workers call ``claim_work_batch`` for up to K nodes.
+
+HOME points at a temporary directory so the real databases are left alone.
+
+Usage: uv run python scripts/bench_fractal_claims.py [--nodes 2000] [--workers 12] [--batch 1]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def _load(nodes: int, branches: int) -> None:
+    from spellbook.fractal import schema
+
+    conn = schema.get_fractal_connection()
+    conn.execute(
+        "INSERT INTO graphs (id, seed, intensity, checkpoint_mode) "
+        "VALUES ('g', 'Why is the sky blue?', 'deep', 'autonomous')"
+    )
+    rows = [("n0", None, 0)]
+    rows += [(f"n{i}", "n0", 1) for i in range(1, branches + 1)]
+    rows += [
+        (f"n{i}", f"n{1 + i % branches}", 2) for i in range(branches + 1, nodes)
+    ]
+    conn.executemany(
+        "INSERT INTO nodes (id, graph_id, parent_id, node_type, text, depth) "
+        "VALUES (?, 'g', ?, 'question', 'q', ?)",
+        rows,
+    )
+    if hasattr(schema, "_rebuild_node_closure"):
+        schema._rebuild_node_closure(conn.cursor())
+    conn.commit()
+
+
+async def _worker(worker_id: str, batch: int, claims: list, errors: Counter) -> None:
+    from spellbook.fractal import node_ops
+
+    while True:
+        try:
+            if batch > 1:
+                result = await node_ops.claim_work_batch("g", worker_id, batch)
+                nodes = [n["node_id"] for n in result["nodes"]]
+            else:
+                result = await node_ops.claim_work("g", worker_id)
+                nodes = [result["node_id"]] if result["node_id"] else []
+        except Exception as e:
+            errors[type(e).__name__] += 1
+            continue
+        if not nodes:
+            return
+        claims.extend(nodes)
+
+
+async def _bench(workers: int, batch: int) -> None:
+    claims: list = []
+    errors: Counter = Counter()
+    t0 = time.perf_counter()
+    await asyncio.gather(*(_worker(f"w{i}", batch, claims, errors) for i in range(workers)))
+    elapsed = time.perf_counter() - t0
+    duplicates = sum(n - 1 for n in Counter(claims).values() if n > 1)
+    print(f"claimed {len(set(claims))} nodes in {elapsed:.2f} s "
+          f"({len(claims) / elapsed:.0f} claims/s)")
+    print(f"double claims {duplicates}, failed calls {sum(errors.values())} {dict(errors)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=2000)
+    parser.add_argument("--branches", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=12)
+    parser.add_argument("--batch", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        os.environ["HOME"] = home
+        from spellbook.fractal.schema import init_fractal_schema
+
+        init_fractal_schema()
+        _load(args.nodes, args.branches)
+        print(f"graph: {args.nodes} open questions, {args.workers} workers, batch {args.batch}")
+        asyncio.run(_bench(args.workers, args.batch))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark the fractal convergence, contradiction and saturation queries.
+
+Builds one graph with ``--branches`` top-level branches of ``--width``
+questions each, links questions pairwise with convergence and
+contradiction edges, then times ``query_convergence``,
+``query_contradictions`` and ``get_saturation_status``.
+
+HOME points at a temporary directory so the real databases are left alone.
+
+Usage: uv run python scripts/bench_fractal_queries.py [--branches 20] [--width 100]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+async def _build(branches: int, width: int) -> str:
+    from spellbook.fractal.graph_ops import create_graph
+    from spellbook.fractal.node_ops import add_node, update_node
+
+    graph = await create_graph("Why is the sky blue?", "deep", "autonomous")
+    graph_id = graph["graph_id"]
+    leaves = []
+    for b in range(branches):
+        branch = await add_node(graph_id, graph["root_node_id"], "question", f"branch {b}")
+        for w in range(width):
+            leaf = await add_node(graph_id, branch["node_id"], "question", f"q {b}.{w}")
+            leaves.append(leaf["node_id"])
+    for i in range(0, len(leaves) - 3, 4):
+        await update_node(
+            graph_id,
+            leaves[i],
+            json.dumps({"convergence_with": [leaves[i + 1]], "convergence_insight": "x"}),
+        )
+        await update_node(
+            graph_id,
+            leaves[i + 2],
+            json.dumps({"contradiction_with": [leaves[i + 3]], "contradiction_tension": "y"}),
+        )
+    return graph_id
+
+
+async def _bench(branches: int, width: int, repeat: int) -> None:
+    from spellbook.fractal.query_ops import (
+        get_saturation_status,
+        query_contradictions,
+        query_convergence,
+    )
+
+    graph_id = await _build(branches, width)
+    print(f"graph: {branches} branches x {width} questions")
+    for fn in (query_convergence, query_contradictions, get_saturation_status):
+        samples = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            await fn(graph_id)
+            samples.append((time.perf_counter() - t0) * 1000)
+        print(f"{fn.__name__:24s} median {statistics.median(samples):8.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--branches", type=int, default=20)
+    parser.add_argument("--width", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        os.environ["HOME"] = home
+        from spellbook.fractal.schema import init_fractal_schema
+
+        init_fractal_schema()
+        asyncio.run(_bench(args.branches, args.width, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Benchmark fractal subtree queries on a large synthetic graph.
+
+Bulk-loads one graph of ``--nodes`` nodes (a breadth-first tree with
+``--fanout`` children per node, every third node answered) plus its
+parent_child edges straight into fractal.db, backfilling the node closure
+table when the tree has one. Then times ``get_branch`` at the root, a
+top-level branch and a depth-2 node, ``get_saturation_status``, and the
+per-call cost of ``add_node``.
+
+HOME points at a temporary directory so the real databases are left alone.
+
+Usage: uv run python scripts/bench_fractal_subtree.py [--nodes 50000] [--fanout 6]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def _load(nodes: int, fanout: int) -> dict:
+    from spellbook.fractal import schema
+
+    conn = schema.get_fractal_connection()
+    conn.execute(
+        "INSERT INTO graphs (id, seed, intensity, checkpoint_mode) "
+        "VALUES ('g', 'Why is the sky blue?', 'deep', 'autonomous')"
+    )
+    rows = [("n0", None, 0, "open")]
+    edges = []
+    depth = {"n0": 0}
+    for i in range(1, nodes):
+        node_id, parent = f"n{i}", f"n{(i - 1) // fanout}"
+        depth[node_id] = depth[parent] + 1
+        rows.append((node_id, parent, depth[node_id], "answered" if i % 3 == 0 else "open"))
+        edges.append((parent, node_id))
+    conn.executemany(
+        "INSERT INTO nodes (id, graph_id, parent_id, node_type, text, depth, status) "
+        "VALUES (?, 'g', ?, 'question', 'q', ?, ?)",
+        rows,
+    )
+    conn.executemany(
+        "INSERT INTO edges (graph_id, from_node, to_node, edge_type) "
+        "VALUES ('g', ?, ?, 'parent_child')",
+        edges,
+    )
+    if hasattr(schema, "_rebuild_node_closure"):
+        schema._rebuild_node_closure(conn.cursor())
+    conn.commit()
+    return {"root": "n0", "branch": "n1", "depth 2": f"n{fanout + 1}"}
+
+
+async def _time(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+async def _bench(targets: dict, repeat: int, adds: int) -> None:
+    from spellbook.fractal.node_ops import add_node
+    from spellbook.fractal.query_ops import get_branch, get_saturation_status
+
+    for label, node_id in targets.items():
+        ms = await _time(lambda: get_branch("g", node_id), repeat)
+        result = await get_branch("g", node_id)
+        print(
+            f"get_branch {label:9s} ({len(result['nodes']):6d} nodes) "
+            f"median {ms:9.2f} ms"
+        )
+    ms = await _time(lambda: get_saturation_status("g"), repeat)
+    print(f"{'get_saturation_status':32s} median {ms:9.2f} ms")
+
+    t0 = time.perf_counter()
+    for i in range(adds):
+        await add_node("g", targets["depth 2"], "question", f"extra {i}")
+    print(f"{'add_node':32s} mean   {(time.perf_counter() - t0) * 1000 / adds:9.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=50_000)
+    parser.add_argument("--fanout", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--adds", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        os.environ["HOME"] = home
+        from spellbook.fractal.schema import init_fractal_schema
+
+        init_fractal_schema()
+        t0 = time.perf_counter()
+        targets = _load(args.nodes, args.fanout)
+        print(f"graph: {args.nodes} nodes, fanout {args.fanout} "
+              f"(loaded in {time.perf_counter() - t0:.1f} s)")
+        asyncio.run(_bench(targets, args.repeat, args.adds))
+
+
+if __name__ == "__main__":
+    main()
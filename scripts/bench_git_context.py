@@ -0,0 +1,66 @@
+"""Benchmark git context lookups (detect_git_context and friends).
+
+Creates a temporary repository with a linked worktree and times
+``detect_git_context``, ``resolve_repo_root`` and ``get_current_branch``
+per call from both working trees, as the MCP server does on every tool
+call that resolves the project directory.
+
+Usage: uv run python scripts/bench_git_context.py [--calls 200]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+_ENV = {
+    **os.environ,
+    "GIT_AUTHOR_NAME": "Bench",
+    "GIT_AUTHOR_EMAIL": "b@b",
+    "GIT_COMMITTER_NAME": "Bench",
+    "GIT_COMMITTER_EMAIL": "b@b",
+}
+
+
+def _git(cwd: str, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=cwd, capture_output=True, check=True, env=_ENV)
+
+
+def _time(fn, path: str, calls: int) -> float:
+    fn(path)
+    t0 = time.perf_counter()
+    for _ in range(calls):
+        fn(path)
+    return (time.perf_counter() - t0) / calls * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    from spellbook.core.branch_ancestry import get_current_branch
+    from spellbook.core.path_utils import detect_git_context, resolve_repo_root
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = os.path.join(tmp, "repo")
+        worktree = os.path.join(tmp, "wt")
+        os.mkdir(repo)
+        _git(repo, "init", "-q", "-b", "main")
+        _git(repo, "commit", "-q", "--allow-empty", "-m", "init")
+        _git(repo, "worktree", "add", "-q", "-b", "feature", worktree)
+
+        for label, path in (("main", repo), ("worktree", worktree)):
+            for fn in (detect_git_context, resolve_repo_root, get_current_branch):
+                ms = _time(fn, path, args.calls)
+                print(f"{fn.__name__:<20} {label:<9} {ms:8.3f} ms/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark full-mode health checks (the spellbook_health_check tool path).
+
+Puts a fake ``gh`` on PATH that takes ``--gh-ms`` per invocation (the real
+one spends most of its time on ``gh auth status``'s network round trip),
+builds a skills tree of ``--skills`` skills, and times ``run_health_check``
+in full mode: the first (cold) call, then the median of ``--calls`` repeat
+calls. Uses the shared ``health_cache`` when this tree has one.
+
+Usage: uv run python scripts/bench_health_check.py [--gh-ms 300] [--skills 200]
+"""
+
+import argparse
+import inspect
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--gh-ms", type=float, default=300.0)
+    parser.add_argument("--skills", type=int, default=200)
+    parser.add_argument("--calls", type=int, default=20)
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp())
+    bin_dir = root / "bin"
+    bin_dir.mkdir()
+    gh = bin_dir / "gh"
+    gh.write_text(
+        "#!/bin/sh\n"
+        f"sleep {args.gh_ms / 1000}\n"
+        'if [ "$1" = "--version" ]; then echo "gh version 2.45.0 (2024-03-04)"; fi\n'
+    )
+    gh.chmod(0o755)
+    os.environ["PATH"] = f"{bin_dir}{os.pathsep}{os.environ['PATH']}"
+    os.environ["HOME"] = str(root)
+
+    for name in ("config", "data"):
+        (root / name).mkdir()
+    skills = root / "skills"
+    for i in range(args.skills):
+        (skills / f"skill-{i}").mkdir(parents=True)
+        (skills / f"skill-{i}" / "SKILL.md").write_text("# skill\n")
+
+    from spellbook.core.db import init_db
+    from spellbook.health import checker
+
+    db_path = str(root / "spellbook.db")
+    init_db(db_path)
+    kwargs = dict(
+        db_path=db_path,
+        config_dir=str(root / "config"),
+        data_dir=str(root / "data"),
+        skills_dir=str(skills),
+        server_uptime=60.0,
+        version="bench",
+        tools_available=[],
+    )
+    if "cache" in inspect.signature(checker.run_health_check).parameters:
+        kwargs["cache"] = checker.health_cache
+
+    t0 = time.perf_counter()
+    result = checker.run_health_check(**kwargs)
+    cold_ms = (time.perf_counter() - t0) * 1000
+    assert result.domains["github_cli"].status == checker.HealthStatus.HEALTHY, result
+
+    samples = []
+    for _ in range(args.calls):
+        t0 = time.perf_counter()
+        checker.run_health_check(**kwargs)
+        samples.append((time.perf_counter() - t0) * 1000)
+
+    print(f"gh {args.gh_ms:g} ms/invocation, {args.skills} skills")
+    print(f"first full check    {cold_ms:8.1f} ms")
+    print(f"repeat full check   median {statistics.median(samples):8.1f} ms  max {max(samples):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark hook latency: cold in-process dispatch vs. warm daemon dispatch.
+
+Spawns ``hooks/spellbook_hook.py`` the way the harness does (one process per
+event, payload on stdin) and times each invocation end to end, in two modes:
+
+  cold  SPELLBOOK_HOOK_SOCKET="" -- every event imports the gates and runs
+        dispatch() in the hook process (the pre-dispatcher behavior).
+  warm  a HookDispatcher started by this script serves the socket; the hook
+        process only forwards stdin and relays the reply.
+
+MCP/HTTP calls are pointed at a closed port so both modes measure hook
+overhead rather than daemon round-trips.
+
+Usage: uv run python scripts/bench_hook_dispatch.py [--runs 50]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from spellbook.hooks.dispatcher import HookDispatcher  # noqa: E402
+
+HOOK_SCRIPT = PROJECT_ROOT / "hooks" / "spellbook_hook.py"
+
+PAYLOADS = {
+    "bash-allow": {
+        "hook_event_name": "PreToolUse",
+        "tool_name": "Bash",
+        "tool_input": {"command": "git status && pytest -x tests/"},
+    },
+    "bash-deny": {
+        "hook_event_name": "PreToolUse",
+        "tool_name": "Bash",
+        "tool_input": {"command": "rm -rf /"},
+    },
+    "post-read": {
+        "hook_event_name": "PostToolUse",
+        "tool_name": "Read",
+        "tool_input": {"file_path": "README.md"},
+        "tool_result": "ok",
+    },
+}
+
+
+def _time_runs(payload: str, env: dict, runs: int) -> list[float]:
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        subprocess.run(
+            [sys.executable, str(HOOK_SCRIPT)],
+            input=payload,
+            capture_output=True,
+            text=True,
+            env=env,
+            check=False,
+        )
+        samples.append((time.perf_counter() - t0) * 1000)
+    return samples
+
+
+def _summary(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (
+        f"mean {statistics.mean(samples):7.1f} ms  "
+        f"p50 {statistics.median(samples):7.1f} ms  p95 {p95:7.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    sock_dir = Path(tempfile.mkdtemp(prefix="sbhk", dir="/tmp"))
+    env = os.environ.copy()
+    env.update({
+        "PYTHONPATH": str(PROJECT_ROOT),
+        "SPELLBOOK_DIR": str(PROJECT_ROOT),
+        "SPELLBOOK_CONFIG_PATH": "/dev/null/nonexistent",
+        "SPELLBOOK_MCP_PORT": "1",
+    })
+    cold_env = dict(env, SPELLBOOK_HOOK_SOCKET="")
+    warm_env = dict(env, SPELLBOOK_HOOK_SOCKET=str(sock_dir / "hook.sock"))
+
+    os.environ["SPELLBOOK_MCP_PORT"] = "1"
+    dispatcher = HookDispatcher(socket_path=sock_dir / "hook.sock", script=HOOK_SCRIPT)
+    dispatcher.start()
+    try:
+        for name, payload in PAYLOADS.items():
+            raw = json.dumps(payload)
+            _time_runs(raw, warm_env, 2)  # load the warm module once
+            cold = _time_runs(raw, cold_env, args.runs)
+            warm = _time_runs(raw, warm_env, args.runs)
+            speedup = statistics.median(cold) / statistics.median(warm)
+            print(f"{name}")
+            print(f"  cold  {_summary(cold)}")
+            print(f"  warm  {_summary(warm)}  ({speedup:.1f}x p50)")
+    finally:
+        dispatcher.stop()
+        shutil.rmtree(sock_dir, ignore_errors=True)
+
+    print(f"warm requests served: {dispatcher.served}, fallbacks: {dispatcher.fallbacks}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark hook-event recording with and without the batched writer.
+
+Calls ``record_hook_event`` from several threads, as concurrent hook
+invocations do inside the daemon, first with one transaction per row and
+then with ``start_ingestion()`` running. Reports caller-side latency and
+end-to-end throughput (until every row is committed).
+
+HOME points at a temporary directory so the real databases are left alone.
+
+Usage: uv run python scripts/bench_ingest.py [--events 2000] [--threads 8]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def _record(_: int) -> float:
+    from spellbook.hooks.observability import record_hook_event
+
+    t0 = time.perf_counter()
+    record_hook_event(
+        hook_name="spellbook_hook",
+        event_name="PreToolUse",
+        duration_ms=3,
+        exit_code=0,
+        tool_name="Bash",
+    )
+    return time.perf_counter() - t0
+
+
+def _run(label: str, events: int, threads: int, batched: bool) -> None:
+    from spellbook.db.ingest import start_ingestion, stop_ingestion
+
+    if batched:
+        start_ingestion()
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        samples = list(pool.map(_record, range(events)))
+    if batched:
+        stop_ingestion()
+    elapsed = time.perf_counter() - t0
+
+    ms = sorted(s * 1000 for s in samples)
+    p95 = ms[max(int(len(ms) * 0.95) - 1, 0)]
+    print(
+        f"{label:10s} caller p50 {statistics.median(ms):7.3f} ms  p95 {p95:7.3f} ms  "
+        f"throughput {events / elapsed:9.0f} rows/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        os.environ["HOME"] = home
+        from sqlalchemy import create_engine
+
+        from spellbook.db.engines import DB_DIR
+        from spellbook.db.spellbook_models import SpellbookBase
+
+        DB_DIR.mkdir(parents=True, exist_ok=True)
+        engine = create_engine(f"sqlite:///{DB_DIR / 'spellbook.db'}")
+        SpellbookBase.metadata.create_all(engine)
+        engine.dispose()
+        _run("per-row", args.events, args.threads, batched=False)
+        _run("batched", args.events, args.threads, batched=True)
+
+
+if __name__ == "__main__":
+    main()
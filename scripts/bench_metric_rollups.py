@@ -0,0 +1,105 @@
+"""Benchmark the admin hook / worker-LLM metrics endpoints.
+
+Seeds a temporary spellbook.db with ``--events`` hook events and as many
+worker-LLM calls, spread over the last ``--hours`` hours, through the same
+batched ``INSERT`` the ingest writer issues (so any per-row ingest cost,
+such as rollup triggers, is included in the reported insert time). Then
+calls the ``/api/hooks/metrics`` and ``/api/worker-llm/metrics`` handlers
+directly for a 1h and a 24h window and reports the median latency.
+
+Usage: uv run python scripts/bench_metric_rollups.py [--events 200000] [--hours 24]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+HOOKS = [("spellbook_hook", e) for e in ("PreToolUse", "PostToolUse", "Stop", "UserPromptSubmit")]
+TASKS = ("tool_safety", "transcript_harvest", "roundtable")
+
+
+def seed(db_path: str, events: int, hours: int) -> float:
+    from sqlalchemy import create_engine, insert
+    from spellbook.db.base import SpellbookBase
+    from spellbook.db.engines import get_sync_session
+    from spellbook.db.spellbook_models import HookEvent, WorkerLLMCall
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    SpellbookBase.metadata.create_all(engine)
+    engine.dispose()
+
+    rng = random.Random(0)
+    now = datetime.now(timezone.utc)
+    hook_rows, call_rows = [], []
+    for _ in range(events):
+        ts = (now - timedelta(seconds=rng.uniform(0, hours * 3600))).isoformat()
+        hook, event = rng.choice(HOOKS)
+        hook_rows.append({
+            "timestamp": ts, "hook_name": hook, "event_name": event,
+            "tool_name": "Bash", "duration_ms": int(rng.lognormvariate(3.5, 1.0)),
+            "exit_code": 1 if rng.random() < 0.02 else 0,
+        })
+        status = rng.choices(("success", "error", "timeout"), (95, 3, 2))[0]
+        call_rows.append({
+            "timestamp": ts, "task": rng.choice(TASKS), "model": "m",
+            "status": status, "latency_ms": int(rng.lognormvariate(6.0, 0.6)),
+            "prompt_len": 800, "response_len": 90,
+            "error": None if status == "success" else "ConnectionError",
+            "override_loaded": 0,
+        })
+
+    t0 = time.perf_counter()
+    for model, rows in ((HookEvent, hook_rows), (WorkerLLMCall, call_rows)):
+        for start in range(0, len(rows), 500):
+            with get_sync_session(db_path) as session:
+                session.execute(insert(model), rows[start:start + 500])
+    return time.perf_counter() - t0
+
+
+async def time_endpoints(db_path: str, repeat: int) -> dict:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from spellbook.admin.routes.hooks import hook_metrics
+    from spellbook.admin.routes.worker_llm import worker_llm_metrics
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    out = {}
+    for name, handler in (("hooks", hook_metrics), ("worker-llm", worker_llm_metrics)):
+        for window in (1, 24):
+            samples = []
+            for _ in range(repeat):
+                async with factory() as session:
+                    t0 = time.perf_counter()
+                    await handler(window_hours=window, _session="bench", db=session)
+                    samples.append((time.perf_counter() - t0) * 1000)
+            out[f"{name} {window}h"] = statistics.median(samples)
+    await engine.dispose()
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--hours", type=int, default=24)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    db_path = str(Path(tempfile.mkdtemp()) / "spellbook.db")
+    insert_s = seed(db_path, args.events, args.hours)
+    print(f"{args.events} hook events + {args.events} worker-LLM calls over {args.hours}h")
+    print(f"insert (batches of 500)   {insert_s / (2 * args.events) * 1e6:8.1f} us/row")
+    for label, ms in asyncio.run(time_endpoints(db_path, args.repeat)).items():
+        print(f"{label + ' metrics':25s} median {ms:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark duplicate worker-LLM calls: coalescing and the response cache.
+
+Points ``client.call`` at an in-process fake endpoint (``httpx.MockTransport``)
+that takes ``--latency-ms`` per request. Two workloads:
+
+* burst: ``--burst`` identical calls issued at once (e.g. the same tool call
+  checked by several hooks), repeated ``--rounds`` times;
+* repeat: the same prompt called ``--rounds`` times back to back with
+  ``worker_llm_response_cache_ttl_s`` set.
+
+Reports requests that reached the endpoint and wall time per workload.
+
+Usage: uv run python scripts/bench_response_cache.py [--burst 8] [--rounds 20]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+async def _run(burst: int, rounds: int, latency_s: float) -> None:
+    import httpx
+
+    from spellbook.worker_llm import client
+    from spellbook.worker_llm import config as wcfg
+
+    settings = {
+        "worker_llm_base_url": "http://bench.invalid/v1",
+        "worker_llm_model": "bench",
+        "worker_llm_timeout_s": 30.0,
+        "worker_llm_response_cache_ttl_s": 0,
+    }
+    wcfg.config_get = settings.get
+    client.publish_call = lambda **kw: None
+    requests = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal requests
+        requests += 1
+        await asyncio.sleep(latency_s)
+        return httpx.Response(200, json={"choices": [{"message": {"content": "OK"}}]})
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._get_shared_client = lambda: http
+
+    t0 = time.perf_counter()
+    for i in range(rounds):
+        await asyncio.gather(*(client.call("sys", f"burst {i}") for _ in range(burst)))
+    burst_s = time.perf_counter() - t0
+    burst_requests, requests = requests, 0
+
+    settings["worker_llm_response_cache_ttl_s"] = 60
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        await client.call("sys", "repeat")
+    repeat_s = time.perf_counter() - t0
+    await http.aclose()
+
+    print(
+        f"burst  {rounds}x{burst:<3d} calls: {burst_requests:4d} requests  {burst_s * 1000:8.1f} ms"
+    )
+    print(f"repeat {rounds:<6d} calls: {requests:4d} requests  {repeat_s * 1000:8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--burst", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    args = parser.parse_args()
+    asyncio.run(_run(args.burst, args.rounds, args.latency_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
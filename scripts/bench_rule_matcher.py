@@ -0,0 +1,125 @@
+"""Benchmark check_patterns: per-rule re.search vs. the compiled RuleMatcher.
+
+Feeds every line of the repo's skills/ and commands/ markdown (the
+pre-commit scanner's hot path) through each rule set, once with the
+original loop (``re.search(pattern, line)`` per rule, relying on the ``re``
+module cache) and once with ``check_patterns``, which uses a precompiled
+``RuleMatcher`` with a literal prefilter. Both modes are timed in standard
+and paranoid security modes, and the script exits non-zero if any line
+produces a different finding list.
+
+Usage: uv run python scripts/bench_rule_matcher.py [--repeat 3]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from spellbook.gates.rules import (  # noqa: E402
+    ESCALATION_RULES,
+    EXFILTRATION_RULES,
+    INJECTION_RULES,
+    MCP_RULES,
+    OBFUSCATION_RULES,
+    Severity,
+    check_patterns,
+)
+
+RULE_SETS = {
+    "injection": INJECTION_RULES,
+    "exfiltration": EXFILTRATION_RULES,
+    "escalation": ESCALATION_RULES,
+    "obfuscation": OBFUSCATION_RULES,
+    "mcp": MCP_RULES,
+}
+
+THRESHOLDS = {"standard": Severity.HIGH, "paranoid": Severity.MEDIUM}
+
+
+def _reference(text: str, patterns, threshold: Severity) -> list[tuple[str, str]]:
+    """The pre-RuleMatcher check_patterns loop, minus the entropy signal."""
+    results = []
+    for pattern, severity, rule_id, _message in patterns:
+        if severity.value < threshold.value:
+            continue
+        match = re.search(pattern, text)
+        if match:
+            results.append((rule_id, match.group()))
+    return results
+
+
+def _compiled(text: str, patterns, mode: str) -> list[tuple[str, str]]:
+    return [
+        (r["rule_id"], r["matched_text"])
+        for r in check_patterns(text, patterns, mode, include_entropy=False)
+    ]
+
+
+def _load_lines() -> list[str]:
+    lines: list[str] = []
+    for tree in ("skills", "commands"):
+        for path in sorted((PROJECT_ROOT / tree).rglob("*.md")):
+            lines.extend(path.read_text(encoding="utf-8", errors="replace").split("\n"))
+    return lines
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    lines = _load_lines()
+    print(f"{len(lines)} lines from skills/ and commands/")
+
+    mismatches = 0
+    for mode, threshold in THRESHOLDS.items():
+        findings = 0
+        for name, rules in RULE_SETS.items():
+            for line in lines:
+                expected = _reference(line, rules, threshold)
+                got = _compiled(line, rules, mode)
+                findings += len(got)
+                if got != expected:
+                    mismatches += 1
+                    print(f"MISMATCH [{mode}/{name}] {line[:80]!r}: {expected} != {got}")
+
+        def run_reference():
+            for rules in RULE_SETS.values():
+                for line in lines:
+                    _reference(line, rules, threshold)
+
+        def run_compiled():
+            for rules in RULE_SETS.values():
+                for line in lines:
+                    _compiled(line, rules, mode)
+
+        before = _time(run_reference, args.repeat)
+        after = _time(run_compiled, args.repeat)
+        print(
+            f"{mode:9s} re.search {before * 1000:8.1f} ms  "
+            f"RuleMatcher {after * 1000:8.1f} ms  "
+            f"({before / after:.1f}x)  findings {findings}"
+        )
+
+    if mismatches:
+        print(f"FAILED: {mismatches} lines produced different findings")
+        sys.exit(1)
+    print("findings identical")
+
+
+if __name__ == "__main__":
+    main()
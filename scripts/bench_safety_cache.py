@@ -0,0 +1,86 @@
+"""Benchmark the tool_safety verdict cache on the PreToolUse hook path.
+
+Fills the cache to ``MAX_CACHE_ENTRIES`` verdicts, then times the calls a
+hook makes: ``should_bypass`` + ``get_cached_verdict`` for a cache hit,
+and ``cache_verdict`` for a miss that stores a fresh verdict. A separate
+measurement starts a new interpreter per lookup, as each Claude Code hook
+invocation does, and reports the median wall time of import + one hit.
+
+HOME points at a temporary directory so the real cache is left alone.
+
+Usage: uv run python scripts/bench_safety_cache.py [--ops 2000] [--cold 10]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+_COLD_LOOKUP = """
+import sys
+sys.path.insert(0, {root!r})
+from spellbook.worker_llm import safety_cache as sc
+key = sc.make_key("Bash", {{"command": "echo 0"}})
+sc.should_bypass(key)
+assert sc.get_cached_verdict(key) is not None
+"""
+
+
+def _median_us(fn, ops: int) -> float:
+    samples = []
+    for i in range(ops):
+        t0 = time.perf_counter()
+        fn(i)
+        samples.append((time.perf_counter() - t0) * 1e6)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=2000)
+    parser.add_argument("--cold", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        os.environ["HOME"] = home
+        from spellbook.core import config
+
+        config.config_get = lambda key: 300.0 if key.endswith("ttl_s") else None
+        from spellbook.worker_llm import safety_cache as sc
+        from spellbook.worker_llm.tasks.tool_safety import SafetyVerdict
+
+        verdict = SafetyVerdict(verdict="OK", reasoning="listing is safe")
+        keys = [sc.make_key("Bash", {"command": f"echo {i}"}) for i in range(sc.MAX_CACHE_ENTRIES)]
+        for key in keys:
+            sc.cache_verdict(key, verdict)
+
+        def hit(i: int) -> None:
+            key = keys[i % len(keys)]
+            sc.should_bypass(key)
+            sc.get_cached_verdict(key)
+
+        def store(i: int) -> None:
+            sc.cache_verdict(sc.make_key("Bash", {"command": f"new {i}"}), verdict)
+
+        print(f"cache: {sc.MAX_CACHE_ENTRIES} verdicts at {sc.CACHE_PATH.name}")
+        print(f"{'hit (bypass check + lookup)':32s} median {_median_us(hit, args.ops):9.1f} us")
+
+        script = _COLD_LOOKUP.format(root=str(PROJECT_ROOT))
+        cold = []
+        for _ in range(args.cold):
+            t0 = time.perf_counter()
+            subprocess.run([sys.executable, "-c", script], check=True, env=os.environ)
+            cold.append((time.perf_counter() - t0) * 1000)
+        print(f"{'new process + hit':32s} median {statistics.median(cold):9.1f} ms")
+        print(f"{'store (evicting)':32s} median {_median_us(store, args.ops):9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark scan_directory / scan_mcp_directory with and without the scan cache.
+
+Scans the repo's skills/ and commands/ markdown and spellbook/ Python the
+way the pre-commit hook and ``--mode`` CLI do: once uncached, once cold
+(empty cache, filling it) and then warm. The cache lives in a temporary
+config directory so the real one is left alone. Exits non-zero if a warm
+run returns different results from the uncached scan.
+
+Usage: uv run python scripts/bench_scan_cache.py [--repeat 3] [--workers N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from spellbook.gates.scanner import scan_directory, scan_mcp_directory  # noqa: E402
+
+TARGETS = [
+    ("skills/", scan_directory),
+    ("commands/", scan_directory),
+    ("spellbook/", scan_mcp_directory),
+]
+
+
+def _time(fn, repeat: int) -> tuple[float, object]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="process pool size for cold scans (default: automatic)",
+    )
+    args = parser.parse_args()
+
+    mismatches = 0
+    with tempfile.TemporaryDirectory() as config_dir:
+        os.environ["SPELLBOOK_CONFIG_DIR"] = config_dir
+        for rel, scan in TARGETS:
+            target = str(PROJECT_ROOT / rel)
+            uncached, expected = _time(
+                lambda: scan(target, use_cache=False, workers=1), args.repeat
+            )
+            t0 = time.perf_counter()
+            scan(target, workers=args.workers)
+            cold = time.perf_counter() - t0
+            warm, got = _time(lambda: scan(target), args.repeat)
+            if got != expected:
+                mismatches += 1
+                print(f"MISMATCH in {rel}")
+            print(
+                f"{rel:11s} {len(expected):5d} files  uncached {uncached * 1000:8.1f} ms  "
+                f"cold {cold * 1000:8.1f} ms  warm {warm * 1000:8.1f} ms  "
+                f"({uncached / warm:.1f}x)"
+            )
+
+    if mismatches:
+        print(f"FAILED: {mismatches} targets returned different results when cached")
+        sys.exit(1)
+    print("results identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Benchmark session-file watching: idle CPU and detection latency.
+
+Creates ``--projects`` fake Claude Code projects (HOME points at a temporary
+directory), each with a session transcript of ``--file-mb`` MB, and runs a
+``SessionWatcher`` and a ``CompactionWatcher`` per project, as a daemon
+watching several projects would. Reports:
+
+- idle CPU: process CPU seconds per wall second while no file changes;
+- detection latency: time from appending a compaction summary to a busy
+  transcript (one that was just analyzed) until ``CompactionWatcher``
+  records it, and until that project's ``SessionWatcher`` runs its next
+  analysis pass.
+
+Usage: uv run python scripts/bench_session_watch.py [--projects 10] [--idle-s 10]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def _line(i: int) -> str:
+    return json.dumps({"type": "assistant", "message": {"content": f"turn {i} " + "x" * 200}})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=10)
+    parser.add_argument("--file-mb", type=float, default=1.0)
+    parser.add_argument("--idle-s", type=float, default=10.0)
+    parser.add_argument("--probes", type=int, default=5)
+    args = parser.parse_args()
+
+    home = tempfile.mkdtemp()
+    os.environ["HOME"] = home
+    from spellbook.core.db import init_db
+    from spellbook.sessions import compaction
+    from spellbook.sessions.watcher import SessionWatcher
+
+    db_path = str(Path(home) / "spellbook.db")
+    init_db(db_path)
+    body = "\n".join(_line(i) for i in range(int(args.file_mb * 1024 * 1024 / 240))) + "\n"
+
+    projects = []
+    for p in range(args.projects):
+        project = str(Path(home) / "work" / f"proj{p}")
+        session_dir = compaction._get_claude_session_dir(project)
+        session_dir.mkdir(parents=True)
+        session_file = session_dir / "session.jsonl"
+        session_file.write_text(body)
+        projects.append((project, session_file))
+
+    passes: dict[str, threading.Event] = {}
+    watchers = []
+    for project, _ in projects:
+        sw = SessionWatcher(db_path, project_path=project)
+        passes[project] = threading.Event()
+        original = sw._analyze_skills
+
+        def analyze(original=original, done=passes[project]):
+            original()
+            done.set()
+
+        sw._analyze_skills = analyze
+        sw.start()
+        cw = compaction.CompactionWatcher(project)
+        cw.start()
+        watchers.append((sw, cw))
+
+    time.sleep(3.0)  # let every watcher finish its first full pass
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    time.sleep(args.idle_s)
+    idle_cpu = (time.process_time() - cpu0) / (time.perf_counter() - wall0)
+
+    compact_ms, session_ms = [], []
+    for i in range(args.probes):
+        project, session_file = projects[i % len(projects)]
+        # A busy session: the probe lands right after a pass triggered by
+        # the previous line.
+        passes[project].clear()
+        with open(session_file, "a") as f:
+            f.write(_line(-1) + "\n")
+        passes[project].wait(30)
+        passes[project].clear()
+        t0 = time.perf_counter()
+        with open(session_file, "a") as f:
+            f.write(json.dumps({
+                "type": "user", "isCompactSummary": True,
+                "summary": f"probe {i}", "leafUuid": f"leaf-{i}",
+            }) + "\n")
+        seen_compact = seen_session = None
+        while seen_compact is None or seen_session is None:
+            now = time.perf_counter()
+            if now - t0 > 30:
+                break
+            if seen_session is None and passes[project].is_set():
+                seen_session = now
+            if seen_compact is None and any(
+                e["summary"] == f"probe {i}" for e in compaction.load_state()["pending_events"]
+            ):
+                seen_compact = now
+            time.sleep(0.005)
+        compact_ms.append(((seen_compact or now) - t0) * 1000)
+        session_ms.append(((seen_session or now) - t0) * 1000)
+        time.sleep(0.5)
+
+    for sw, cw in watchers:
+        sw.stop()
+        cw.stop()
+
+    print(f"{args.projects} projects, {args.file_mb:g} MB transcripts")
+    print(f"idle CPU                      {idle_cpu * 100:6.2f} % of one core")
+    print(f"compaction detected           median {statistics.median(compact_ms):7.0f} ms")
+    print(f"session analysis pass         median {statistics.median(session_ms):7.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Benchmark tool_safety time-to-verdict, buffered vs streamed.
+
+Starts a fake OpenAI-compatible ``/v1/chat/completions`` server on
+localhost that models a slow local worker: ``--prefill-ms`` before the
+first token, then one token every ``--token-ms``. Without ``stream`` it
+answers once the whole completion is generated; with ``stream: true`` it
+sends each token as an SSE chunk. Times ``tool_safety`` end to end (cache
+miss each call) with ``worker_llm_tool_safety_stream`` off and on, for an
+OK verdict and a BLOCK verdict.
+
+HOME points at a temporary directory so the real verdict cache is left alone.
+
+Usage: uv run python scripts/bench_tool_safety_stream.py [--calls 20] [--token-ms 20]
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+COMPLETIONS = {
+    "OK": '{"verdict":"OK","reasoning":"Listing a directory is read-only and '
+    'consistent with the current debugging context."}',
+    "BLOCK": '{"verdict":"BLOCK","reasoning":"rm -rf / would wipe the '
+    'filesystem and was not requested by the user."}',
+}
+
+
+def _tokens(text: str) -> list[str]:
+    return re.findall(r".{1,4}", text, flags=re.S)
+
+
+def _make_handler(prefill_s: float, token_s: float):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args) -> None:
+            pass
+
+        def do_POST(self) -> None:
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            verdict = "BLOCK" if "rm -rf" in body["messages"][1]["content"] else "OK"
+            tokens = _tokens(COMPLETIONS[verdict])
+            time.sleep(prefill_s)
+            if not body.get("stream"):
+                time.sleep(token_s * len(tokens))
+                payload = json.dumps(
+                    {"choices": [{"message": {"content": COMPLETIONS[verdict]}}]}
+                ).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            try:
+                for tok in tokens:
+                    time.sleep(token_s)
+                    chunk = {"choices": [{"delta": {"content": tok}}]}
+                    self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                    self.wfile.flush()
+                self.wfile.write(b"data: [DONE]\n\n")
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # client stopped reading once the verdict was decided
+
+    return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--prefill-ms", type=float, default=100.0)
+    parser.add_argument("--token-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), _make_handler(args.prefill_ms / 1000, args.token_ms / 1000)
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    with tempfile.TemporaryDirectory() as home:
+        os.environ["HOME"] = home
+        settings = {
+            "worker_llm_base_url": f"http://127.0.0.1:{server.server_port}/v1",
+            "worker_llm_model": "bench",
+            "worker_llm_tool_safety_timeout_s": 30.0,
+            "worker_llm_safety_cache_ttl_s": 300,
+            "worker_llm_tool_safety_stream": False,
+        }
+        from spellbook.core import config
+
+        config.config_get = settings.get
+        from spellbook.worker_llm import client
+        from spellbook.worker_llm import config as wcfg
+        from spellbook.worker_llm.tasks.tool_safety import tool_safety
+
+        wcfg.config_get = settings.get
+        client.publish_call = lambda **kw: None
+
+        n = 0
+        for stream in (False, True):
+            settings["worker_llm_tool_safety_stream"] = stream
+            for verdict, command in (("OK", "ls"), ("BLOCK", "rm -rf /")):
+                samples = []
+                for _ in range(args.calls):
+                    n += 1
+                    t0 = time.perf_counter()
+                    got = tool_safety("Bash", {"command": f"{command} # {n}"}, "")
+                    samples.append((time.perf_counter() - t0) * 1000)
+                    assert got.verdict == verdict, got
+                samples.sort()
+                p95 = samples[max(0, int(len(samples) * 0.95) - 1)]
+                print(
+                    f"stream={str(stream):5s} {verdict:5s} "
+                    f"median {statistics.median(samples):7.1f} ms  p95 {p95:7.1f} ms"
+                )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
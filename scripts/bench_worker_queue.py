@@ -0,0 +1,96 @@
+"""Benchmark the worker-LLM async queue against a parallel-slot endpoint.
+
+Replaces ``client.call`` with a fake endpoint that serves ``--slots``
+requests at once, each taking ``--latency-ms``. Enqueues a backlog of
+``roundtable_voice`` jobs, then trickles in ``tool_safety`` calls, and
+reports total throughput plus the interactive calls' time-to-completion.
+Runs once per ``--workers`` value (ignored by the single-consumer queue).
+
+Usage: uv run python scripts/bench_worker_queue.py [--backlog 64] [--slots 4] [--workers 1,4]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+async def _run(workers: int, backlog: int, slots: int, latency_s: float, interactive: int) -> None:
+    from spellbook.worker_llm import client, prompts
+    from spellbook.worker_llm import queue as wq
+
+    settings = {
+        "worker_llm_queue_max_depth": 1024,
+        "worker_llm_queue_workers": workers,
+        "worker_llm_queue_lanes": "tool_safety=interactive,roundtable_voice=background",
+        "worker_llm_queue_task_concurrency": "",
+    }
+    wq.config_get = settings.get
+    wq.publish_call = lambda **kw: None
+    if hasattr(wq, "publish_queue_stats"):
+        wq.publish_queue_stats = lambda **kw: None
+    prompts.load = lambda task: ("system", False)
+    endpoint = asyncio.Semaphore(slots)
+
+    async def fake_call(**kwargs) -> str:
+        async with endpoint:
+            await asyncio.sleep(latency_s)
+        return "ok"
+
+    client.call = fake_call
+
+    done = asyncio.Event()
+    remaining = backlog + interactive
+    fg_latency: list[float] = []
+
+    def _callback(started: float, track: bool):
+        async def cb(_result) -> None:
+            nonlocal remaining
+            if track:
+                fg_latency.append((time.perf_counter() - started) * 1000)
+            remaining -= 1
+            if remaining == 0:
+                done.set()
+
+        return cb
+
+    await wq.start_queue()
+    t0 = time.perf_counter()
+    for _ in range(backlog):
+        await wq.enqueue("roundtable_voice", "voice", callback=_callback(t0, False))
+    for _ in range(interactive):
+        await asyncio.sleep(latency_s)
+        await wq.enqueue("tool_safety", "check", callback=_callback(time.perf_counter(), True))
+    await done.wait()
+    elapsed = time.perf_counter() - t0
+    await wq.stop_queue()
+
+    print(
+        f"workers={workers:<3d} throughput {(backlog + interactive) / elapsed:7.1f} calls/s  "
+        f"interactive median {statistics.median(fg_latency):8.1f} ms  "
+        f"max {max(fg_latency):8.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backlog", type=int, default=64)
+    parser.add_argument("--interactive", type=int, default=8)
+    parser.add_argument("--slots", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--workers", default="1,4")
+    args = parser.parse_args()
+
+    for workers in (int(w) for w in args.workers.split(",")):
+        asyncio.run(
+            _run(workers, args.backlog, args.slots, args.latency_ms / 1000, args.interactive)
+        )
+
+
+if __name__ == "__main__":
+    main()
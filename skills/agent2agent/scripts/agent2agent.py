@@ -28,6 +28,7 @@ import re
 import select
 import shutil
 import signal
+import struct
 import subprocess
 import sys
 import tempfile
@@ -58,6 +59,93 @@ except ImportError:
 _HEARTBEAT_INTERVAL_S = 30.0
 _HEARTBEAT_STALE_S = 90.0
 
+# ---------------------------------------------------------------------------
+# inotify (Linux) wake source for `watch` (stdlib ctypes only)
+# ---------------------------------------------------------------------------
+# Mirrors spellbook/core/inotify.py; this helper cannot import spellbook.
+# `send` lands messages with tempfile + rename (IN_MOVED_TO); IN_CLOSE_WRITE
+# covers writers that create the final path directly. IN_DELETE_SELF /
+# IN_MOVE_SELF wake the loop when the inbox itself goes away; the watch is
+# then dead (IN_IGNORED) or follows the moved directory, so it is re-armed.
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_INOTIFY_WATCH_MASK = (
+    _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR
+)
+# Events that say "rescan" regardless of the file name they carry.
+_INOTIFY_RESCAN_MASK = _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_Q_OVERFLOW | _IN_IGNORED
+# Events after which the watch no longer covers the inbox path.
+_INOTIFY_LOST_MASK = _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_IGNORED
+_INOTIFY_EVENT_HEADER = struct.Struct("iIII")
+# With inotify the wake is event-driven; the poll only backstops filesystems
+# that do not deliver events (e.g. network mounts written from another host).
+_INOTIFY_BACKSTOP_S = 5.0
+
+
+def _inotify_open(path: Path) -> int | None:
+    """Return a non-blocking inotify fd watching ``path``, or ``None`` when
+    inotify is unavailable (non-Linux, no libc symbol, instance/watch limits)."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [
+            ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32,
+        ]
+    except (OSError, AttributeError, ImportError):
+        return None
+    fd = libc.inotify_init1(os.O_NONBLOCK | getattr(os, "O_CLOEXEC", 0))
+    if fd < 0:
+        return None
+    if libc.inotify_add_watch(fd, os.fsencode(str(path)), _INOTIFY_WATCH_MASK) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _inotify_drain(fd: int) -> tuple[bool, bool]:
+    """Consume every queued event on ``fd``; return ``(relevant, lost)``.
+
+    ``relevant`` is True if any event can mean a new message (a non-dotfile
+    ``*.json`` landed, or the watch itself changed/overflowed). Dotfile
+    events (``send``'s ``.tmp-*`` tempfile, the watcher's own lockfile) are
+    spurious wakes. ``lost`` is True once the watch no longer covers the
+    inbox path (deleted, moved away, or removed by the kernel)."""
+    relevant = False
+    lost = False
+    while True:
+        try:
+            buf = os.read(fd, 64 * 1024)
+        except (BlockingIOError, InterruptedError):
+            break
+        except OSError:
+            return True, True
+        if not buf:
+            break
+        offset = 0
+        while offset + _INOTIFY_EVENT_HEADER.size <= len(buf):
+            _wd, mask, _cookie, length = _INOTIFY_EVENT_HEADER.unpack_from(buf, offset)
+            offset += _INOTIFY_EVENT_HEADER.size
+            name = buf[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if mask & _INOTIFY_LOST_MASK:
+                lost = True
+            if mask & _INOTIFY_RESCAN_MASK:
+                relevant = True
+            elif name.endswith(b".json") and not name.startswith(b"."):
+                relevant = True
+    return relevant, lost
+
+
 # ---------------------------------------------------------------------------
 # Paths
 # ---------------------------------------------------------------------------
@@ -263,6 +351,12 @@ def cmd_close(args: argparse.Namespace) -> int:
     inbox_existed = target.exists()
     if inbox_existed:
         shutil.rmtree(target, ignore_errors=True)
+    # The UserPromptSubmit hook's cached message counts (stat-validated, so
+    # a leftover is harmless; removed to keep the bus tidy).
+    try:
+        (bus_dir() / ".counts" / args.name).unlink(missing_ok=True)
+    except OSError:
+        pass
     binding_cleared = False
     sid = _current_session_id()
     if sid and _SESSION_ID_RE.match(sid):
@@ -622,19 +716,25 @@ def cmd_watch(args: argparse.Namespace) -> int:
       * RECOVER: if any non-empty batch dir exists in ``pending/``, print
         ``PENDING_BATCH <batch-id> count=<n>`` for the lex-oldest batch and
         exit 0 immediately.
-      * WAIT/DRAIN: spawn ``fswatch -0 -l 0.1 <inbox>`` if available; in
-        either case run a 500ms polling backstop. On message arrival,
-        atomically claim up to ``--max-batch`` files into
+      * WAIT/DRAIN: wake source by ``--backend`` (default ``auto``): on Linux
+        an inotify watch on the inbox (IN_MOVED_TO / IN_CLOSE_WRITE) with a
+        5s polling backstop; otherwise spawn ``fswatch -0 -l 0.1 <inbox>`` if
+        available, with a 500ms polling backstop. ``--backend fswatch`` skips
+        inotify; ``--backend poll`` uses the polling backstop only. On message
+        arrival, atomically claim up to ``--max-batch`` files into
         ``pending/<batch-id>/`` via ``os.replace``, then print
         ``PENDING_BATCH <batch-id> count=<n>`` and exit 0.
-      * Spurious fswatch wake (no real messages after filtering): drain the
-        fswatch buffer, do NOT exit, do NOT emit a zero-count batch.
+      * Spurious wake (no real messages after filtering): drain the
+        fswatch buffer / inotify queue, do NOT exit, do NOT emit a zero-count
+        batch. inotify events for dotfiles (``send``'s tempfile) do not even
+        trigger an inbox rescan.
       * Concurrent claim: if every candidate vanishes mid-claim (a parallel
         ``read`` won the race for all of them), tear down the empty batch
         dir and re-enter WAIT.
       * Recycle: when ``elapsed >= max_elapsed`` print
         ``WATCH_RECYCLE elapsed=<N>s`` and exit 0.
-      * fswatch unavailable: log ``watch: fswatch unavailable, polling-only``
+      * Neither inotify nor fswatch available (or ``--backend fswatch``
+        without fswatch): log ``watch: fswatch unavailable, polling-only``
         ONCE to stderr and continue with polling-only.
       * Lockfile path persists across cycles; the mutex is enforced by
         ``flock`` + kernel fd cleanup, not by unlinking the lockfile.
@@ -759,9 +859,11 @@ def cmd_watch(args: argparse.Namespace) -> int:
             print(f"PENDING_BATCH {batch.name} count={len(files)}")
             return 0
 
-    # WAIT/DRAIN: spawn fswatch (if available) for low-latency wake; ALWAYS
-    # run a `poll_interval` polling backstop so a wedged or absent fswatch
-    # cannot stall delivery beyond the polling cadence. Spurious wakes
+    # WAIT/DRAIN: prefer an inotify watch (Linux), else spawn fswatch (if
+    # available) for low-latency wake; ALWAYS run a polling backstop so a
+    # wedged or absent wake source cannot stall delivery beyond the polling
+    # cadence (`poll_interval`, or _INOTIFY_BACKSTOP_S under inotify, whose
+    # in-kernel queue cannot wedge like a child process). Spurious wakes
     # (events for filtered files like dotfiles or our own pending/ writes)
     # re-enter the loop without emitting a zero-count batch. Concurrent
     # readers that drain every candidate file mid-claim cause us to tear
@@ -771,7 +873,13 @@ def cmd_watch(args: argparse.Namespace) -> int:
     # sweeps) and before our own spawn (so we never kill our own child).
     _sweep_stray_fswatch(inbox)
 
-    fswatch_path = shutil.which("fswatch")
+    backend = getattr(args, "backend", None) or "auto"
+    inotify_fd = _inotify_open(inbox) if backend == "auto" else None
+    fswatch_path = (
+        shutil.which("fswatch")
+        if inotify_fd is None and backend in ("auto", "fswatch")
+        else None
+    )
     fswatch_proc: subprocess.Popen | None = None
     if fswatch_path:
         try:
@@ -784,10 +892,12 @@ def cmd_watch(args: argparse.Namespace) -> int:
             )
         except OSError:
             fswatch_proc = None
-    if fswatch_proc is None:
+    if inotify_fd is None and fswatch_proc is None:
         print("watch: fswatch unavailable, polling-only", file=sys.stderr)
 
     poll_interval = args.poll_interval
+    if inotify_fd is not None:
+        poll_interval = max(poll_interval, _INOTIFY_BACKSTOP_S)
     max_elapsed = args.max_elapsed
     max_batch = args.max_batch
 
@@ -806,6 +916,7 @@ def cmd_watch(args: argparse.Namespace) -> int:
         pass
 
     start = time.monotonic()
+    rescan = True
     try:
         while True:
             elapsed = time.monotonic() - start
@@ -826,7 +937,8 @@ def cmd_watch(args: argparse.Namespace) -> int:
             # (concurrent reader took all of them), tear down the empty
             # batch dir and re-enter WAIT. Per-message ENOENT is benign:
             # skip that file and continue claiming the rest.
-            msgs = _list_inbox(name)
+            msgs = _list_inbox(name) if rescan else []
+            rescan = True
             if msgs:
                 msgs = msgs[:max_batch]
                 batch_id = (
@@ -868,7 +980,37 @@ def cmd_watch(args: argparse.Namespace) -> int:
                 if max_elapsed is None
                 else min(poll_interval, max_elapsed - elapsed)
             )
-            if fswatch_proc is not None and fswatch_proc.poll() is None:
+            # Wake in time for the next heartbeat touch even when the wait
+            # slice (the inotify backstop) is longer than its interval.
+            wait_slice = max(
+                0.0,
+                min(
+                    wait_slice,
+                    heartbeat_interval - (time.monotonic() - last_heartbeat),
+                ),
+            )
+            if inotify_fd is not None:
+                try:
+                    rlist, _, _ = select.select([inotify_fd], [], [], wait_slice)
+                except (OSError, ValueError):
+                    rlist = []
+                    time.sleep(wait_slice)
+                if rlist:
+                    # Only message-shaped events (or a changed/overflowed
+                    # watch) warrant rescanning the inbox.
+                    rescan, lost = _inotify_drain(inotify_fd)
+                    if lost:
+                        # Re-arm on the (recreated) inbox; if that fails,
+                        # fall back to polling at the caller's cadence rather
+                        # than selecting on a dead watch at the backstop rate.
+                        try:
+                            os.close(inotify_fd)
+                        except OSError:
+                            pass
+                        inotify_fd = _inotify_open(inbox)
+                        if inotify_fd is None:
+                            poll_interval = args.poll_interval
+            elif fswatch_proc is not None and fswatch_proc.poll() is None:
                 try:
                     rlist, _, _ = select.select(
                         [fswatch_proc.stdout], [], [], wait_slice
@@ -890,6 +1032,11 @@ def cmd_watch(args: argparse.Namespace) -> int:
             else:
                 time.sleep(wait_slice)
     finally:
+        if inotify_fd is not None:
+            try:
+                os.close(inotify_fd)
+            except OSError:
+                pass
         if fswatch_proc is not None and fswatch_proc.poll() is None:
             try:
                 fswatch_proc.terminate()
@@ -1207,6 +1354,7 @@ SUBCOMMANDS
                                   from pending/<batch-id>/ to processed/ and
                                   emit them as JSON. Used by the watch-chain.
   watch <name> [--max-elapsed <sec>] [--poll-interval <sec>] [--max-batch <n>]
+        [--backend auto|fswatch|poll]
                                   Protocol-internal: block until a new message
                                   lands (atomically staged into pending/) or
                                   the recycle budget elapses. Holds an
@@ -1289,6 +1437,12 @@ def _build_parser() -> argparse.ArgumentParser:
     sp_watch.add_argument("name")
     sp_watch.add_argument("--poll-interval", dest="poll_interval", type=float, default=0.5)
     sp_watch.add_argument("--max-batch", dest="max_batch", type=int, default=50)
+    sp_watch.add_argument(
+        "--backend",
+        dest="backend",
+        choices=("auto", "fswatch", "poll"),
+        default="auto",
+    )
     sp_watch.add_argument(
         "--max-elapsed", dest="max_elapsed", type=_max_elapsed, default=None
     )
@@ -1,8 +1,17 @@
 """Spellbook: AI assistant enhancement toolkit."""
 
-from importlib.metadata import PackageNotFoundError, version
 
-try:
-    __version__ = version("spellbook")
-except PackageNotFoundError:
-    __version__ = "dev"
+def __getattr__(name: str):
+    # ``__version__`` is resolved on first access: importlib.metadata is
+    # slow to import and every ``spellbook`` CLI invocation imports this
+    # package.
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            value = version("spellbook")
+        except PackageNotFoundError:
+            value = "dev"
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
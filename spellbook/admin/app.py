@@ -11,6 +11,8 @@ import logging
 from spellbook.admin.events import event_bus
 from spellbook.admin.middleware import HostValidatorMiddleware, OriginCheckMiddleware
 from spellbook.core.config import config_get, get_env
+from spellbook.db import disable_pooling, enable_pooling
+from spellbook.db.ingest import start_ingestion, stop_ingestion
 from spellbook.hooks.observability import purge_loop as hook_purge_loop
 from spellbook.worker_llm.observability import purge_loop, threshold_eval_loop
 from spellbook.worker_llm.queue import start_queue, stop_queue
@@ -38,6 +40,17 @@ async def _lifespan(app: FastAPI):
     lightweight stubs without patching the observability module itself.
     """
     event_bus._in_daemon = True
+    # Pooled DB connections are daemon-only: idle aiosqlite threads would
+    # block a short-lived process from exiting. Disabled again (and every
+    # pooled connection closed) in the finally branch below, while this
+    # loop is still running.
+    if config_get("db_pooling") is not False:
+        enable_pooling()
+    # Hook and worker-LLM observability rows go through one batched writer
+    # thread instead of a transaction per event. Stopped (and drained) in
+    # the finally branch; ``spellbook.mcp.server.shutdown`` drains again.
+    if config_get("event_ingest_batching") is not False:
+        start_ingestion()
     purge_task = asyncio.create_task(
         purge_loop(), name="spellbook-worker-llm-purge"
     )
@@ -89,6 +102,14 @@ async def _lifespan(app: FastAPI):
                     "worker_llm queue failed to stop cleanly",
                     exc_info=True,
                 )
+        try:
+            await asyncio.to_thread(stop_ingestion)
+        except Exception:
+            logger.debug("failed to flush the ingest queue", exc_info=True)
+        try:
+            await disable_pooling()
+        except Exception:
+            logger.debug("failed to close pooled DB connections", exc_info=True)
 
 
 def create_admin_app() -> FastAPI:
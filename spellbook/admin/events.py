@@ -3,12 +3,21 @@
 In-process asyncio pub/sub with per-subscriber bounded queues.
 When a subscriber's queue is full, the oldest event is dropped
 to prevent unbounded memory growth.
+
+Publishing never takes a lock: the subscriber table is copy-on-write
+(subscribe/unsubscribe swap in a new dict), so ``publish_nowait`` walks a
+stable snapshot and only does ``put_nowait`` per matching subscriber. Each
+subscriber may restrict delivery to a set of subsystems. An event's wire
+frame is JSON-encoded once (:meth:`Event.frame`) and the same string is
+sent to every WebSocket client; :meth:`EventBus.next_batch` coalesces
+bursts from high-volume subsystems into one batch frame.
 """
 
 import asyncio
+import json
 import logging
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterable, Optional
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -47,17 +56,55 @@ class Event:
     )
     namespace: Optional[str] = None  # For namespace-scoped routing
     session_id: Optional[str] = None  # For session-specific routing
+    _frame: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def frame(self) -> str:
+        """Return the WebSocket ``event`` frame, encoding it on first use.
+
+        The same ``Event`` object sits in every subscriber's queue, so the
+        first sender pays for ``json.dumps`` and the rest reuse the string.
+        Raises ``TypeError``/``ValueError`` if ``data`` is not JSON-serializable.
+        """
+        if self._frame is None:
+            self._frame = json.dumps(
+                {
+                    "type": "event",
+                    "subsystem": _subsystem_value(self.subsystem),
+                    "event": self.event_type,
+                    "data": self.data,
+                    "timestamp": self.timestamp,
+                }
+            )
+        return self._frame
+
+
+def _subsystem_value(subsystem) -> str:
+    return subsystem.value if isinstance(subsystem, Subsystem) else str(subsystem)
+
+
+def batch_frame(events: list[Event]) -> str:
+    """Join already-encoded event frames into one ``batch`` frame."""
+    return '{"type": "batch", "events": [' + ", ".join(e.frame() for e in events) + "]}"
 
 
 class EventBus:
     """In-process asyncio pub/sub with per-subscriber bounded queues."""
 
     QUEUE_SIZE = 1000
+    # Subsystems whose bursts are coalesced by ``next_batch``: after the
+    # first event, wait this long and send whatever queued up as one frame.
+    COALESCE_WINDOWS: dict[Subsystem, float] = {Subsystem.WORKER_LLM: 0.05}
+    MAX_BATCH = 500
 
     def __init__(self):
+        # Copy-on-write: replaced, never mutated, by subscribe/unsubscribe so
+        # publish can iterate without a lock.
         self._subscribers: dict[str, asyncio.Queue] = {}
+        # subscriber_id -> subsystem values to deliver; absent means all.
+        self._filters: dict[str, frozenset[str]] = {}
         self._dropped_counts: dict[str, int] = {}
         self._total_dropped: int = 0
+        # Serializes subscribe/unsubscribe; publish never takes it.
         self._lock = asyncio.Lock()
         # Daemon-vs-subprocess marker. Set to True in the FastAPI lifespan
         # handler when the admin app boots; remains False in hook subprocesses,
@@ -66,49 +113,118 @@ class EventBus:
         # in-process ``publish_sync`` and the HTTP fallback.
         self._in_daemon: bool = False
 
-    async def subscribe(self, subscriber_id: str) -> asyncio.Queue:
-        """Register a subscriber and return their event queue."""
+    async def subscribe(
+        self,
+        subscriber_id: str,
+        subsystems: Optional[Iterable[Subsystem | str]] = None,
+    ) -> asyncio.Queue:
+        """Register a subscriber and return their event queue.
+
+        ``subsystems`` limits delivery to those subsystems; None means all.
+        """
         async with self._lock:
             queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
-            self._subscribers[subscriber_id] = queue
+            self._subscribers = {**self._subscribers, subscriber_id: queue}
+            self._set_filter(subscriber_id, subsystems)
             self._dropped_counts[subscriber_id] = 0
             return queue
 
     async def unsubscribe(self, subscriber_id: str) -> None:
         """Remove a subscriber."""
         async with self._lock:
-            self._subscribers.pop(subscriber_id, None)
-            self._dropped_counts.pop(subscriber_id, None)
+            self._remove(subscriber_id)
+
+    def set_filter(
+        self,
+        subscriber_id: str,
+        subsystems: Optional[Iterable[Subsystem | str]],
+    ) -> None:
+        """Replace a subscriber's subsystem filter (None delivers everything)."""
+        if subscriber_id in self._subscribers:
+            self._set_filter(subscriber_id, subsystems)
+
+    def get_filter(self, subscriber_id: str) -> Optional[frozenset[str]]:
+        """Return the subscriber's subsystem filter, or None if unfiltered."""
+        return self._filters.get(subscriber_id)
+
+    def _set_filter(self, subscriber_id, subsystems) -> None:
+        filters = dict(self._filters)
+        if subsystems is None:
+            filters.pop(subscriber_id, None)
+        else:
+            filters[subscriber_id] = frozenset(_subsystem_value(s) for s in subsystems)
+        self._filters = filters
+
+    def _remove(self, subscriber_id: str) -> None:
+        if subscriber_id in self._subscribers:
+            subscribers = dict(self._subscribers)
+            del subscribers[subscriber_id]
+            self._subscribers = subscribers
+        if subscriber_id in self._filters:
+            self._set_filter(subscriber_id, None)
+        self._dropped_counts.pop(subscriber_id, None)
 
     async def publish(self, event: Event) -> None:
-        """Publish an event to all subscribers.
+        """Publish an event to all subscribers (see ``publish_nowait``)."""
+        self.publish_nowait(event)
+
+    def publish_nowait(self, event: Event) -> None:
+        """Publish an event to every subscriber whose filter matches.
 
-        If a subscriber's queue is full, the oldest event is dropped.
-        Subscriber exceptions cause removal (error isolation).
+        Must run on the bus's event loop. If a subscriber's queue is full,
+        the oldest event is dropped. Subscriber exceptions cause removal
+        (error isolation).
         """
-        async with self._lock:
-            dead_subscribers = []
-            for sub_id, queue in self._subscribers.items():
-                try:
-                    if queue.full():
-                        try:
-                            queue.get_nowait()  # Drop oldest
-                        except asyncio.QueueEmpty:
-                            pass
-                        self._dropped_counts[sub_id] = (
-                            self._dropped_counts.get(sub_id, 0) + 1
-                        )
-                        self._total_dropped += 1
-                    queue.put_nowait(event)
-                except Exception:
-                    logger.error(
-                        f"Subscriber {sub_id} error, removing", exc_info=True
+        subscribers = self._subscribers
+        if not subscribers:
+            return
+        filters = self._filters
+        subsystem = _subsystem_value(event.subsystem) if filters else None
+        dead_subscribers = []
+        for sub_id, queue in subscribers.items():
+            wanted = filters.get(sub_id) if filters else None
+            if wanted is not None and subsystem not in wanted:
+                continue
+            try:
+                if queue.full():
+                    try:
+                        queue.get_nowait()  # Drop oldest
+                    except asyncio.QueueEmpty:
+                        pass
+                    self._dropped_counts[sub_id] = (
+                        self._dropped_counts.get(sub_id, 0) + 1
                     )
-                    dead_subscribers.append(sub_id)
+                    self._total_dropped += 1
+                queue.put_nowait(event)
+            except Exception:
+                logger.error(
+                    f"Subscriber {sub_id} error, removing", exc_info=True
+                )
+                dead_subscribers.append(sub_id)
+
+        for sub_id in dead_subscribers:
+            self._remove(sub_id)
 
-            for sub_id in dead_subscribers:
-                self._subscribers.pop(sub_id, None)
-                self._dropped_counts.pop(sub_id, None)
+    async def next_batch(self, queue: asyncio.Queue) -> list[Event]:
+        """Wait for the next event and return it with any burst behind it.
+
+        Events from subsystems in ``COALESCE_WINDOWS`` hold the batch open
+        for that window (unless a full batch is already queued), then take
+        everything queued by then, in order, up to ``MAX_BATCH``. Other
+        events return immediately, together with whatever was already
+        queued behind them.
+        """
+        first: Event = await queue.get()
+        window = self.COALESCE_WINDOWS.get(first.subsystem)
+        if window and queue.qsize() < self.MAX_BATCH - 1:
+            await asyncio.sleep(window)
+        batch = [first]
+        while len(batch) < self.MAX_BATCH:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
 
     @property
     def subscriber_count(self) -> int:
@@ -145,8 +261,8 @@ def publish_sync(
             return
 
     if target_loop.is_running():
-        # Schedule from another thread
-        asyncio.run_coroutine_threadsafe(target_bus.publish(event), target_loop)
+        # Schedule from another thread; a plain callback, no task needed.
+        target_loop.call_soon_threadsafe(target_bus.publish_nowait, event)
     else:
         # Loop exists but isn't running (unusual, but handle gracefully)
         logger.warning("Event loop not running for publish_sync, dropping event")
@@ -188,6 +188,12 @@ export interface WSEvent {
   timestamp: string
 }
 
+/** Burst of events coalesced by the server into one frame, in order. */
+export interface WSBatch {
+  type: 'batch'
+  events: WSEvent[]
+}
+
 export interface WSControl {
   type: 'ping' | 'pong' | 'subscribe' | 'unsubscribe'
   subsystems?: string[]
@@ -247,8 +253,45 @@ export interface SubsystemHealth {
   tables: TableHealth[]
 }
 
+export interface PoolRoleStats {
+  size: number
+  checked_in: number
+  checked_out: number
+  overflow: number
+  connects: number
+  checkouts: number
+  invalidations: number
+}
+
+export interface DatabasePool {
+  pooled: boolean
+  writer?: PoolRoleStats
+  reader?: PoolRoleStats
+}
+
+export interface IngestStats {
+  running: boolean
+  enqueued?: number
+  written?: number
+  dropped?: number
+  failed?: number
+  batches?: number
+  queued?: number
+}
+
+export interface CacheStats {
+  hits: number
+  misses: number
+  invalidations: number
+  size: number
+  max_size: number
+}
+
 export interface HealthMatrixResponse {
   databases: SubsystemHealth[]
+  pools: Record<string, DatabasePool>
+  ingest: IngestStats
+  caches: Record<string, CacheStats>
   generated_at: string
 }
 
@@ -1,6 +1,6 @@
 import { useEffect, useRef, useCallback, useState } from 'react'
 import { fetchApi } from '../api/client'
-import type { WSEvent, WSControl } from '../api/types'
+import type { WSEvent, WSBatch, WSControl } from '../api/types'
 
 type ConnectionState = 'connecting' | 'connected' | 'disconnected' | 'error'
 
@@ -77,6 +77,10 @@ export function useWebSocket({ onEvent, onReconnect, enabled = true }: UseWebSoc
           }
           if (data.type === 'event' && onEvent) {
             onEvent(data as WSEvent)
+          } else if (data.type === 'batch' && onEvent) {
+            for (const event of (data as WSBatch).events) {
+              onEvent(event)
+            }
           }
         } catch {
           // Ignore malformed messages
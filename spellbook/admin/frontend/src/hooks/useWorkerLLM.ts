@@ -15,6 +15,15 @@ export interface WorkerLLMCall {
   override_loaded: boolean
 }
 
+export interface ResponseCacheStats {
+  hits: number
+  misses: number
+  hit_rate: number | null
+  coalesced: number
+  size: number
+  bytes: number
+}
+
 export interface WorkerLLMMetrics {
   success_rate: number | null
   p95_latency_ms: number | null
@@ -22,6 +31,7 @@ export interface WorkerLLMMetrics {
   error_breakdown: Record<string, number>
   total_calls: number
   window_hours: number
+  response_cache?: ResponseCacheStats
 }
 
 export function useWorkerLLMCalls(
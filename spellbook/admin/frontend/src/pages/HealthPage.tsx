@@ -2,7 +2,14 @@ import { useHealthMatrix } from '../hooks/useHealth'
 import { LoadingSpinner } from '../components/shared/LoadingSpinner'
 import { EmptyState } from '../components/shared/EmptyState'
 import { PageLayout } from '../components/layout/PageLayout'
-import type { SubsystemHealth, TableHealth } from '../api/types'
+import type {
+  CacheStats,
+  DatabasePool,
+  IngestStats,
+  PoolRoleStats,
+  SubsystemHealth,
+  TableHealth,
+} from '../api/types'
 
 const STATUS_COLORS: Record<string, string> = {
   healthy: 'text-accent-green border-accent-green',
@@ -54,7 +61,28 @@ function TableRow({ table }: { table: TableHealth }) {
   )
 }
 
-function DatabaseCard({ db }: { db: SubsystemHealth }) {
+function formatPoolRole(label: string, stats: PoolRoleStats): string {
+  return `${label} ${stats.checked_out}/${stats.size + stats.overflow}`
+}
+
+function PoolSummary({ pool }: { pool?: DatabasePool }) {
+  if (!pool) return null
+  if (!pool.pooled || !pool.writer || !pool.reader) {
+    return <span className="font-mono text-xs text-text-dim">unpooled</span>
+  }
+  return (
+    <span
+      className="font-mono text-xs text-text-dim"
+      title={`connects ${pool.writer.connects + pool.reader.connects}, checkouts ${
+        pool.writer.checkouts + pool.reader.checkouts
+      }`}
+    >
+      {formatPoolRole('writer', pool.writer)} · {formatPoolRole('readers', pool.reader)}
+    </span>
+  )
+}
+
+function DatabaseCard({ db, pool }: { db: SubsystemHealth; pool?: DatabasePool }) {
   return (
     <div className="card mb-4">
       <div className="flex items-center justify-between mb-3">
@@ -62,9 +90,12 @@ function DatabaseCard({ db }: { db: SubsystemHealth }) {
           <span className="font-mono text-sm text-text-primary">{db.name}</span>
           <StatusBadge status={db.status} />
         </div>
-        <span className="font-mono text-xs text-text-dim">
-          {formatSize(db.size_bytes)}
-        </span>
+        <div className="flex items-center gap-4">
+          <PoolSummary pool={pool} />
+          <span className="font-mono text-xs text-text-dim">
+            {formatSize(db.size_bytes)}
+          </span>
+        </div>
       </div>
 
       {db.tables.length > 0 && (
@@ -91,6 +122,81 @@ function DatabaseCard({ db }: { db: SubsystemHealth }) {
   )
 }
 
+function IngestCard({ ingest }: { ingest: IngestStats }) {
+  const fields: [string, number | undefined][] = [
+    ['written', ingest.written],
+    ['batches', ingest.batches],
+    ['queued', ingest.queued],
+    ['dropped', ingest.dropped],
+    ['failed', ingest.failed],
+  ]
+  return (
+    <div className="card mb-4">
+      <div className="flex items-center justify-between mb-3">
+        <div className="flex items-center gap-3">
+          <span className="font-mono text-sm text-text-primary">event ingestion</span>
+          <StatusBadge status={ingest.running ? 'healthy' : 'idle'} />
+        </div>
+      </div>
+      {ingest.running && (
+        <div className="flex gap-6 pl-8">
+          {fields.map(([label, value]) => (
+            <span key={label} className="font-mono text-xs text-text-secondary">
+              {label} <span className="text-text-primary">{(value ?? 0).toLocaleString()}</span>
+            </span>
+          ))}
+        </div>
+      )}
+    </div>
+  )
+}
+
+function CacheCard({ caches }: { caches: Record<string, CacheStats> }) {
+  return (
+    <div className="card mb-4">
+      <div className="flex items-center justify-between mb-3">
+        <span className="font-mono text-sm text-text-primary">caches</span>
+      </div>
+      <table className="w-full text-sm">
+        <thead className="font-mono text-xs uppercase tracking-widest text-text-dim border-b border-bg-border">
+          <tr>
+            <th className="px-3 py-1.5 text-left pl-8">Cache</th>
+            <th className="px-3 py-1.5 text-right w-28">Hits</th>
+            <th className="px-3 py-1.5 text-right w-28">Misses</th>
+            <th className="px-3 py-1.5 text-right w-28">Hit Rate</th>
+            <th className="px-3 py-1.5 text-right w-28">Entries</th>
+          </tr>
+        </thead>
+        <tbody>
+          {Object.entries(caches).map(([name, stats]) => {
+            const total = stats.hits + stats.misses
+            return (
+              <tr
+                key={name}
+                className="border-b border-bg-border hover:bg-bg-elevated transition-colors"
+              >
+                <td className="px-3 py-1.5 font-mono text-xs text-text-secondary pl-8">{name}</td>
+                <td className="px-3 py-1.5 font-mono text-xs text-text-secondary text-right">
+                  {stats.hits.toLocaleString()}
+                </td>
+                <td className="px-3 py-1.5 font-mono text-xs text-text-secondary text-right">
+                  {stats.misses.toLocaleString()}
+                </td>
+                <td className="px-3 py-1.5 font-mono text-xs text-text-secondary text-right">
+                  {total > 0 ? `${((stats.hits / total) * 100).toFixed(1)}%` : '--'}
+                </td>
+                <td className="px-3 py-1.5 font-mono text-xs text-text-dim text-right">
+                  {stats.size.toLocaleString()} / {stats.max_size.toLocaleString()}
+                </td>
+              </tr>
+            )
+          })}
+        </tbody>
+      </table>
+    </div>
+  )
+}
+
 export function HealthPage() {
   const { data, isLoading, isError } = useHealthMatrix()
 
@@ -108,7 +214,15 @@ export function HealthPage() {
       )}
 
       {data &&
-        data.databases.map((db) => <DatabaseCard key={db.name} db={db} />)}
+        data.databases.map((db) => (
+          <DatabaseCard key={db.name} db={db} pool={data.pools?.[db.name]} />
+        ))}
+
+      {data?.ingest && <IngestCard ingest={data.ingest} />}
+
+      {data?.caches && Object.keys(data.caches).length > 0 && (
+        <CacheCard caches={data.caches} />
+      )}
     </PageLayout>
   )
 }
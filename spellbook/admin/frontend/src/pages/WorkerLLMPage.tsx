@@ -171,7 +171,7 @@ export function WorkerLLMPage() {
           className="bg-bg-surface border border-bg-border px-3 py-1 font-mono text-xs text-text-primary focus:border-accent-green outline-none"
         />
       </div>
-      <div className="grid grid-cols-3 gap-3 mb-4">
+      <div className="grid grid-cols-4 gap-3 mb-4">
         <MetricCard
           label="Success Rate"
           value={formatPercent(successRate)}
@@ -188,6 +188,11 @@ export function WorkerLLMPage() {
           value={formatNumber(metrics?.p99_latency_ms ?? null)}
           unit="ms"
         />
+        <MetricCard
+          label="Cache Hit Rate"
+          value={formatPercent(metrics?.response_cache?.hit_rate ?? null)}
+          unit="%"
+        />
       </div>
       <div className="mb-4">
         <ErrorBreakdownCard breakdown={metrics?.error_breakdown ?? null} />
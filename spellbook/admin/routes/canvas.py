@@ -3,7 +3,10 @@
 Two endpoints mounted at ``/api/canvas`` by ``spellbook.admin.app``:
 
 - ``GET /api/canvas`` — list all canvases (read-only).
-- ``GET /api/canvas/{name}`` — fetch a single canvas detail.
+- ``GET /api/canvas/{name}`` — fetch a single canvas detail. Responses
+  carry an ``ETag``; a request whose ``If-None-Match`` matches gets
+  ``304 Not Modified`` with no body, so clients refetching after a
+  ``canvas.*`` event only transfer canvases that actually changed.
 
 Writes go through MCP tools, not these routes. Both endpoints share
 the existing HMAC-cookie auth dependency (``require_admin_auth``); no
@@ -16,7 +19,7 @@ import logging
 from datetime import datetime, timezone
 from typing import Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
@@ -128,9 +131,16 @@ async def list_canvases(
 )
 async def get_canvas(
     name: str,
+    request: Request,
+    response: Response,
     _session: str = Depends(require_admin_auth),
 ):
-    """Get a single canvas by name with its page content."""
+    """Get a single canvas by name with its page content.
+
+    Conditional: answers ``304`` when ``If-None-Match`` names the current
+    ETag. ``Cache-Control: no-cache`` makes browsers revalidate every time
+    instead of serving a stored copy.
+    """
     # Use the store's regex as the single source of truth (per impl plan
     # P2-8 fix) — prevents drift from the design §5.2 inlined regex.
     if not canvas_store.NAME_RE.match(name):
@@ -143,7 +153,7 @@ async def get_canvas(
             },
             status_code=400,
         )
-    result = canvas_store.read_canvas(name)
+    result = canvas_store.read_canvas_with_etag(name)
     if result is None:
         return JSONResponse(
             {
@@ -154,7 +164,22 @@ async def get_canvas(
             },
             status_code=404,
         )
-    return CanvasDetailResponse(**result)
+    payload, etag = result
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return CanvasDetailResponse(**payload)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """RFC 9110 weak comparison of an ``If-None-Match`` header against ``etag``."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (c.strip() for c in if_none_match.split(","))
+    return etag in (c[2:] if c.startswith("W/") else c for c in candidates)
 
 
 # ---------------------------------------------------------------------------
@@ -22,6 +22,7 @@ from spellbook.admin.routes.schemas import (
     ErrorDetail,
 )
 from spellbook.core.config import SESSION_MODES
+from spellbook.worker_llm.config import parse_queue_caps, parse_queue_lanes
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +60,33 @@ CONFIG_SCHEMA = [
         "description": "Whether the admin web interface is mounted on server startup",
         "default": True,
     },
+    {
+        "key": "hook_warm_dispatch",
+        "type": "boolean",
+        "description": (
+            "Serve hook events from the daemon over a Unix socket instead of "
+            "a cold Python process per event (hooks fall back automatically)"
+        ),
+        "default": True,
+    },
+    {
+        "key": "db_pooling",
+        "type": "boolean",
+        "description": (
+            "Keep pooled connections to the daemon databases (one writer plus "
+            "read-only readers each) instead of reconnecting per session"
+        ),
+        "default": True,
+    },
+    {
+        "key": "event_ingest_batching",
+        "type": "boolean",
+        "description": (
+            "Write hook and worker-LLM observability rows from one batched "
+            "writer in the daemon instead of one transaction per event"
+        ),
+        "default": True,
+    },
     {
         "key": "profile.default",
         "type": "string",
@@ -130,6 +158,32 @@ CONFIG_SCHEMA = [
         "description": "Tool-safety verdict cache TTL (seconds)",
         "default": 300,
     },
+    # Worker LLM response cache: in-process, daemon-side, opt-in. Identical
+    # concurrent calls are always coalesced regardless of these keys.
+    {
+        "key": "worker_llm_response_cache_ttl_s",
+        "type": "number",
+        "description": (
+            "Keep successful worker-LLM responses for this many seconds and "
+            "answer byte-identical requests from memory. 0 disables the cache."
+        ),
+        "default": 0,
+    },
+    {
+        "key": "worker_llm_response_cache_max_entries",
+        "type": "number",
+        "description": "Maximum number of cached worker-LLM responses (LRU)",
+        "default": 256,
+    },
+    {
+        "key": "worker_llm_response_cache_max_bytes",
+        "type": "number",
+        "description": (
+            "Maximum total size (bytes) of cached worker-LLM responses; "
+            "larger responses are never cached"
+        ),
+        "default": 1048576,
+    },
     # Worker LLM observability — design §7. The purge loop and threshold
     # notifier read these via config_get; schema entries surface them to the
     # admin UI.
@@ -216,13 +270,47 @@ CONFIG_SCHEMA = [
         "key": "worker_llm_queue_max_depth",
         "type": "number",
         "description": (
-            "Bound on the async queue depth. When full, the OLDEST task is "
-            "dropped (the incoming task is the most recent signal); each "
-            "drop publishes a call event with status='dropped' so overflow "
-            "is observable."
+            "Bound on the async queue depth. When full, the OLDEST task of "
+            "the lowest-priority lane is dropped (the incoming task when "
+            "everything queued outranks it); each drop publishes a call "
+            "event with status='dropped' so overflow is observable."
         ),
         "default": 256,
     },
+    {
+        "key": "worker_llm_queue_workers",
+        "type": "number",
+        "description": (
+            "Number of queue consumers calling the worker endpoint "
+            "concurrently. Keep 1 for a single-slot server; match the "
+            "server's parallel slots for vLLM or llama.cpp --parallel. "
+            "Read at daemon start."
+        ),
+        "default": 1,
+    },
+    {
+        "key": "worker_llm_queue_lanes",
+        "type": "string",
+        "description": (
+            "Comma-separated task=lane routing for the async queue. Lanes, "
+            "highest priority first: interactive, warmup, background. "
+            "Unlisted tasks use background. Read at daemon start."
+        ),
+        "default": (
+            "tool_safety=interactive,tool_safety_warmup=warmup,"
+            "roundtable_voice=background"
+        ),
+    },
+    {
+        "key": "worker_llm_queue_task_concurrency",
+        "type": "string",
+        "description": (
+            "Comma-separated task=N caps on concurrent in-flight calls per "
+            "task name (e.g. roundtable_voice=1). Unlisted tasks are "
+            "limited only by worker_llm_queue_workers. Read at daemon start."
+        ),
+        "default": "",
+    },
     {
         "key": "worker_llm_tool_safety_cold_threshold_s",
         "type": "number",
@@ -233,6 +321,16 @@ CONFIG_SCHEMA = [
         ),
         "default": 45.0,
     },
+    {
+        "key": "worker_llm_tool_safety_stream",
+        "type": "boolean",
+        "description": (
+            "Stream PreToolUse tool_safety responses and stop reading as "
+            "soon as the verdict is decided (requires an endpoint that "
+            "supports stream=true)"
+        ),
+        "default": False,
+    },
     # Hook observability. The purge loop reads these via config_get; schema
     # entries surface them to the admin UI.
     {
@@ -477,6 +575,30 @@ def _validate_enum(allowed: tuple[str, ...]):
     return _check
 
 
+def _validate_parsed(parse):
+    """Build a validator for a string parsed by ``parse`` (raises ValueError)."""
+
+    def _check(key: str, value: Any) -> str | None:
+        if not isinstance(value, str):
+            return f"{key} must be a string; got {type(value).__name__}"
+        try:
+            parse(value)
+        except ValueError as e:
+            return f"{key}={value!r} is invalid: {e}"
+        return None
+
+    return _check
+
+
+def _validate_non_negative_number(key: str, value: Any) -> str | None:
+    """Require a float/int >= 0 (0 conventionally means disabled)."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return f"{key} must be a number; got {type(value).__name__}"
+    if float(value) < 0:
+        return f"{key}={value!r} must be >= 0"
+    return None
+
+
 def _validate_unit_interval(key: str, value: Any) -> str | None:
     """Require a float/int in the closed range [0.0, 1.0]."""
     # ``bool`` is a subclass of ``int`` in Python; reject it explicitly so
@@ -513,9 +635,12 @@ def _validate_positive_number(key: str, value: Any) -> str | None:
 # Categories:
 #   * Enum string keys (session mode).
 #   * Unit-interval floats: success-rate floor in [0.0, 1.0].
-#   * Positive integers: row caps, windowed sample counts, token ceilings.
+#   * Positive integers: row caps, windowed sample counts, token ceilings,
+#     queue worker count.
+#   * task=value maps: queue lane routing and per-task concurrency caps.
 #   * Positive numbers (int or float, > 0): retention hours, timeouts,
 #     cache TTLs, purge/eval intervals.
+#   * Non-negative numbers (>= 0): opt-in TTLs where 0 disables.
 _VALIDATORS: dict[str, Any] = {
     "session_mode": _validate_enum(_ALLOWED_SESSION_MODES),
     # Unit-interval floats.
@@ -526,6 +651,12 @@ _VALIDATORS: dict[str, Any] = {
     "worker_llm_observability_notify_window": _validate_positive_int,
     "worker_llm_max_tokens": _validate_positive_int,
     "worker_llm_queue_max_depth": _validate_positive_int,
+    "worker_llm_queue_workers": _validate_positive_int,
+    "worker_llm_response_cache_max_entries": _validate_positive_int,
+    "worker_llm_response_cache_max_bytes": _validate_positive_int,
+    # task=value maps.
+    "worker_llm_queue_lanes": _validate_parsed(parse_queue_lanes),
+    "worker_llm_queue_task_concurrency": _validate_parsed(parse_queue_caps),
     # Positive numbers (int or float, > 0).
     "worker_llm_observability_retention_hours": _validate_positive_number,
     "hook_observability_retention_hours": _validate_positive_number,
@@ -538,6 +669,8 @@ _VALIDATORS: dict[str, Any] = {
     "worker_llm_tool_safety_timeout_s": _validate_positive_number,
     "worker_llm_tool_safety_cold_threshold_s": _validate_positive_number,
     "worker_llm_safety_cache_ttl_s": _validate_positive_number,
+    # Non-negative numbers (0 disables).
+    "worker_llm_response_cache_ttl_s": _validate_non_negative_number,
 }
 
 
@@ -12,8 +12,8 @@ from spellbook.admin.auth import require_admin_auth
 from spellbook.admin.events import event_bus
 from spellbook.admin.routes.schemas import DashboardResponse
 from spellbook.db import (
-    get_fractal_session,
-    get_spellbook_session,
+    get_fractal_read_session,
+    get_spellbook_read_session,
 )
 from spellbook.db.fractal_models import FractalGraph
 from spellbook.db.spellbook_models import Experiment
@@ -59,7 +59,7 @@ async def _query_spellbook_counts() -> int:
 
     Returns the count of running/paused experiments.
     """
-    async with get_spellbook_session() as session:
+    async with get_spellbook_read_session() as session:
         # Count running/paused experiments
         result = await session.execute(
             select(func.count()).select_from(Experiment).where(
@@ -73,7 +73,7 @@ async def _query_spellbook_counts() -> int:
 
 async def _query_fractal_counts() -> int:
     """Query fractal.db for total graph count."""
-    async with get_fractal_session() as session:
+    async with get_fractal_read_session() as session:
         result = await session.execute(
             select(func.count()).select_from(FractalGraph)
         )
@@ -9,8 +9,11 @@ dependency.
 
 import asyncio
 import json
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import JSONResponse
@@ -25,6 +28,7 @@ from spellbook.db import fractal_db
 from spellbook.db.fractal_models import FractalEdge, FractalGraph, FractalNode
 from spellbook.db.helpers import apply_sorting
 from spellbook.fractal.graph_ops import delete_graph, update_graph_status
+from spellbook.sessions.line_index import LineIndex, open_line_index
 
 router = APIRouter(prefix="/fractal", tags=["fractal"])
 
@@ -469,100 +473,223 @@ def _find_jsonl_file(session_id: str) -> Path | None:
     return None
 
 
+_CHAT_LOG_BATCH_LINES = 256
+
+
+def _decode_line(raw: bytes) -> dict | None:
+    try:
+        entry = json.loads(raw)
+    except ValueError:
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+class _TimeOrder(NamedTuple):
+    """How far a transcript has been checked for timestamp order."""
+
+    dev: int
+    ino: int
+    checked: int  # lines checked
+    last_line: bytes  # raw line ``checked - 1``, to detect a rewrite
+    last_timestamp: Optional[str]
+    ordered: bool
+
+
+_TIME_ORDER_CACHE_MAX = 64
+_time_order: "OrderedDict[str, _TimeOrder]" = OrderedDict()
+_time_order_lock = threading.Lock()
+
+
+def _timestamps_ordered(jsonl_path: Path, index: LineIndex) -> bool:
+    """Return True if the transcript's timestamps never go backwards.
+
+    Lines without a timestamp are ignored. The answer is cached per
+    transcript and extended over appended lines only, so after the first
+    request for a transcript the check costs the new lines alone.
+    """
+    key = str(jsonl_path)
+    st = os.stat(jsonl_path)
+    with _time_order_lock:
+        state = _time_order.get(key)
+    checked, last_line, last_timestamp, ordered = 0, b"", None, True
+    if (
+        state is not None
+        and (state.dev, state.ino) == (st.st_dev, st.st_ino)
+        and 0 < state.checked <= len(index)
+        and index.line(state.checked - 1) == state.last_line
+    ):
+        checked, last_line = state.checked, state.last_line
+        last_timestamp, ordered = state.last_timestamp, state.ordered
+    if ordered and checked < len(index):
+        for batch_start in range(checked, len(index), _CHAT_LOG_BATCH_LINES):
+            for raw in index.lines(batch_start, batch_start + _CHAT_LOG_BATCH_LINES):
+                entry = _decode_line(raw)
+                timestamp = entry.get("timestamp") if entry else None
+                if not timestamp:
+                    continue
+                if last_timestamp is not None and timestamp < last_timestamp:
+                    ordered = False
+                    break
+                last_timestamp = timestamp
+            if not ordered:
+                break
+        checked = len(index)
+        last_line = index.line(checked - 1)
+    with _time_order_lock:
+        _time_order[key] = _TimeOrder(
+            st.st_dev, st.st_ino, checked, last_line, last_timestamp, ordered,
+        )
+        _time_order.move_to_end(key)
+        while len(_time_order) > _TIME_ORDER_CACHE_MAX:
+            _time_order.popitem(last=False)
+    return ordered
+
+
+def _first_line_at_or_after(index: LineIndex, start_time: str) -> int:
+    """Binary-search the first line whose timestamp is >= ``start_time``.
+
+    Lines without a timestamp take the timestamp of the next line that has
+    one. Only valid when :func:`_timestamps_ordered` holds.
+    """
+    lo, hi = 0, len(index)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        probe = mid
+        timestamp = None
+        while probe < hi and timestamp is None:
+            entry = _decode_line(index.line(probe))
+            timestamp = entry.get("timestamp") if entry else None
+            probe += 1
+        if timestamp is not None and timestamp < start_time:
+            lo = probe
+        else:
+            hi = mid
+    return lo
+
+
 def _parse_jsonl_messages(
     jsonl_path: Path,
     start_time: str | None,
     end_time: str | None,
 ) -> list[dict]:
-    """Parse JSONL file and extract user/assistant messages within a time window."""
-    messages = []
-    with open(jsonl_path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-            entry_type = entry.get("type")
-            if entry_type not in ("user", "assistant"):
-                continue
-
-            timestamp = entry.get("timestamp")
-            if not timestamp:
-                continue
+    """Parse JSONL file and extract user/assistant messages within a time window.
 
-            # Filter by time window
-            if start_time and timestamp < start_time:
-                continue
-            if end_time and timestamp > end_time:
-                continue
+    When the transcript's timestamps are in order, its line index is used
+    to seek straight to ``start_time`` and reading stops at the first entry
+    past ``end_time``, so only the window itself is decoded. Otherwise (an
+    entry written out of order) every line is filtered, as seeking or
+    stopping early could skip in-window entries.
+    """
+    messages = []
+    with open_line_index(jsonl_path) as index:
+        ordered = (
+            _timestamps_ordered(jsonl_path, index)
+            if (start_time or end_time) and len(index)
+            else True
+        )
+        first = _first_line_at_or_after(index, start_time) if start_time and ordered else 0
+        for batch_start in range(first, len(index), _CHAT_LOG_BATCH_LINES):
+            past_window = _collect_chat_messages(
+                index.lines(batch_start, batch_start + _CHAT_LOG_BATCH_LINES),
+                start_time,
+                end_time,
+                messages,
+            )
+            if past_window and ordered:
+                break
+    return messages
 
-            message = entry.get("message", {})
-            content = message.get("content")
-            if content is None:
-                continue
 
-            if entry_type == "user":
-                # User messages: content is a string or list of tool_result blocks
-                if isinstance(content, str):
-                    messages.append({
-                        "role": "user",
-                        "content": content,
-                        "timestamp": timestamp,
-                    })
-                elif isinstance(content, list):
-                    # User messages can contain tool_result blocks
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "tool_result":
-                            tool_content = block.get("content", "")
-                            if isinstance(tool_content, list):
-                                tool_content = "\n".join(
-                                    b.get("text", "") for b in tool_content
-                                    if isinstance(b, dict) and b.get("type") == "text"
-                                )
-                            if tool_content:
-                                messages.append({
-                                    "role": "tool_result",
-                                    "content": tool_content[:2000],
-                                    "tool_use_id": block.get("tool_use_id", ""),
-                                    "timestamp": timestamp,
-                                })
-            else:
-                # Assistant messages: content is a list of blocks
-                if not isinstance(content, list):
-                    continue
+def _collect_chat_messages(
+    raw_lines: list[bytes],
+    start_time: str | None,
+    end_time: str | None,
+    messages: list[dict],
+) -> bool:
+    """Append chat messages from ``raw_lines``; True if any was past ``end_time``."""
+    past_window = False
+    for raw in raw_lines:
+        entry = _decode_line(raw)
+        if entry is None:
+            continue
+
+        timestamp = entry.get("timestamp")
+        if not timestamp:
+            continue
+
+        # Filter by time window
+        if end_time and timestamp > end_time:
+            past_window = True
+            continue
+        if start_time and timestamp < start_time:
+            continue
+
+        entry_type = entry.get("type")
+        if entry_type not in ("user", "assistant"):
+            continue
+
+        message = entry.get("message", {})
+        content = message.get("content")
+        if content is None:
+            continue
+
+        if entry_type == "user":
+            # User messages: content is a string or list of tool_result blocks
+            if isinstance(content, str):
+                messages.append({
+                    "role": "user",
+                    "content": content,
+                    "timestamp": timestamp,
+                })
+            elif isinstance(content, list):
+                # User messages can contain tool_result blocks
                 for block in content:
-                    if not isinstance(block, dict):
-                        continue
-                    block_type = block.get("type")
-                    if block_type == "thinking":
-                        thinking = block.get("thinking", "")
-                        if thinking:
+                    if isinstance(block, dict) and block.get("type") == "tool_result":
+                        tool_content = block.get("content", "")
+                        if isinstance(tool_content, list):
+                            tool_content = "\n".join(
+                                b.get("text", "") for b in tool_content
+                                if isinstance(b, dict) and b.get("type") == "text"
+                            )
+                        if tool_content:
                             messages.append({
-                                "role": "thinking",
-                                "content": thinking,
+                                "role": "tool_result",
+                                "content": tool_content[:2000],
+                                "tool_use_id": block.get("tool_use_id", ""),
                                 "timestamp": timestamp,
                             })
-                    elif block_type == "text":
-                        text = block.get("text", "")
-                        if text:
-                            messages.append({
-                                "role": "assistant",
-                                "content": text,
-                                "timestamp": timestamp,
-                            })
-                    elif block_type == "tool_use":
+        else:
+            # Assistant messages: content is a list of blocks
+            if not isinstance(content, list):
+                continue
+            for block in content:
+                if not isinstance(block, dict):
+                    continue
+                block_type = block.get("type")
+                if block_type == "thinking":
+                    thinking = block.get("thinking", "")
+                    if thinking:
                         messages.append({
-                            "role": "tool_use",
-                            "content": block.get("name", "unknown_tool"),
-                            "tool_use_id": block.get("id", ""),
+                            "role": "thinking",
+                            "content": thinking,
                             "timestamp": timestamp,
                         })
-
-    return messages
+                elif block_type == "text":
+                    text = block.get("text", "")
+                    if text:
+                        messages.append({
+                            "role": "assistant",
+                            "content": text,
+                            "timestamp": timestamp,
+                        })
+                elif block_type == "tool_use":
+                    messages.append({
+                        "role": "tool_use",
+                        "content": block.get("name", "unknown_tool"),
+                        "tool_use_id": block.get("id", ""),
+                        "timestamp": timestamp,
+                    })
+    return past_window
 
 
 @router.get("/graphs/{graph_id}/nodes/{node_id}/chat-log")
@@ -1,7 +1,9 @@
 """Subsystem health matrix API routes.
 
 Probes all four SQLite databases and reports table counts,
-last activity, file sizes, and overall status.
+last activity, file sizes, and overall status, plus connection-pool
+occupancy, batched-ingestion counters and hit/miss counters for the
+daemon's in-process caches.
 """
 
 import asyncio
@@ -16,11 +18,14 @@ from sqlalchemy import text
 
 from spellbook.admin.auth import require_admin_auth
 from spellbook.db import (
-    get_coordination_session,
-    get_forged_session,
-    get_fractal_session,
-    get_spellbook_session,
+    get_coordination_read_session,
+    get_forged_read_session,
+    get_fractal_read_session,
+    get_spellbook_read_session,
+    pool_stats,
 )
+from spellbook.db.ingest import ingestion_stats
+from spellbook.gates.bash_parser import parse_cache_info
 
 logger = logging.getLogger(__name__)
 
@@ -43,15 +48,15 @@ def _get_db_paths() -> dict[str, str]:
 
 
 def _get_session_factory(db_name: str) -> Any:
-    """Get the async session context manager factory for a database by name.
+    """Get the read-only session context manager factory for a database by name.
 
     Uses module-level references so patching works in tests.
     """
     return {
-        "spellbook.db": get_spellbook_session,
-        "fractal.db": get_fractal_session,
-        "forged.db": get_forged_session,
-        "coordination.db": get_coordination_session,
+        "spellbook.db": get_spellbook_read_session,
+        "fractal.db": get_fractal_read_session,
+        "forged.db": get_forged_read_session,
+        "coordination.db": get_coordination_read_session,
     }[db_name]
 
 
@@ -162,5 +167,8 @@ async def health_matrix(
 
     return {
         "databases": list(databases),
+        "pools": pool_stats(),
+        "ingest": ingestion_stats(),
+        "caches": {"bash_parser": parse_cache_info()},
         "generated_at": datetime.now(timezone.utc).isoformat(),
     }
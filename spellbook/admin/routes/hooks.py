@@ -11,10 +11,12 @@ Query shapes
 whitelisted against the ``HookEvent`` ORM columns; unknown sort falls
 back to ``timestamp``.
 
-``GET /api/hooks/metrics`` groups the rows from the trailing
-``window_hours`` by (hook_name, event_name) and returns count,
-avg/p50/p95 duration_ms, and error_rate per group, plus a top-level
-summary. The window is time-based (hours) to match
+``GET /api/hooks/metrics`` groups the trailing ``window_hours`` by
+(hook_name, event_name) and returns count, avg/p50/p95 duration_ms, and
+error_rate per group, plus a top-level summary. It reads the per-minute /
+per-hour rollups (``spellbook.db.rollups``), never the raw rows, so its
+cost does not grow with traffic; percentiles come from the rollups'
+duration histograms. The window is time-based (hours) to match
 ``/api/worker-llm/metrics`` so the admin UI presents a consistent
 "1h / 6h / 24h" control across both observability pages. The background
 retention + notifier loops still express their caps as row counts
@@ -27,18 +29,23 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import case, func, select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from spellbook.admin.auth import require_admin_auth
 from spellbook.admin.routes.list_helpers import (
     build_list_response,
-    percentile,
+    histogram_percentile,
     validate_sort_order,
 )
 from spellbook.db import spellbook_db
 from spellbook.db.helpers import apply_pagination
-from spellbook.db.spellbook_models import HookEvent
+from spellbook.db.rollups import window_rows
+from spellbook.db.spellbook_models import (
+    HookEvent,
+    HookEventRollupHour,
+    HookEventRollupMinute,
+)
 
 router = APIRouter(prefix="/hooks", tags=["hooks"])
 
@@ -149,37 +156,44 @@ async def hook_metrics(
         }
 
     A row counts as an error when ``exit_code != 0`` OR ``error`` is set.
+    The window starts at the minute containing the cutoff (rollup
+    granularity), and percentiles are histogram estimates: exact when a
+    duration bucket holds a single distinct value, otherwise interpolated
+    within the bucket's observed min/max.
     """
     cutoff = (
         datetime.now(timezone.utc) - timedelta(hours=window_hours)
     ).isoformat()
 
-    # An "error" is ``exit_code != 0`` OR a non-empty ``error`` string.
-    # SQL cannot portably express "non-empty" with a single idiom (SQLite
-    # treats NULL as falsy in CASE, so the COALESCE-to-empty-string lets us
-    # push the whole is_error flag into SQL).
-    is_error = case(
-        (HookEvent.exit_code != 0, 1),
-        (func.coalesce(HookEvent.error, "") != "", 1),
-        else_=0,
+    # One row per (hook_name, event_name, duration bucket) in the window,
+    # summed across the minute/hour rollups -- O(buckets), not O(events).
+    # Ordered so groups arrive contiguous and each group's buckets ascend,
+    # the order ``histogram_percentile`` expects.
+    window = window_rows(
+        HookEventRollupMinute.__table__,
+        HookEventRollupHour.__table__,
+        cutoff,
+        "hook_name", "event_name", "duration_bucket", "event_count",
+        "error_count", "duration_sum", "duration_min", "duration_max",
     )
-
-    # Single narrow fetch: every ``(hook_name, event_name, duration_ms,
-    # is_error)`` tuple in the window, ordered so Python-side grouping and
-    # percentile work on pre-sorted slices. Replaces the previous N+1
-    # pattern (one aggregate query + one duration query per group).
     rows_q = (
         select(
-            HookEvent.hook_name,
-            HookEvent.event_name,
-            HookEvent.duration_ms,
-            is_error.label("is_err"),
+            window.c.hook_name,
+            window.c.event_name,
+            window.c.duration_bucket,
+            func.sum(window.c.event_count).label("count"),
+            func.sum(window.c.error_count).label("errors"),
+            func.sum(window.c.duration_sum).label("duration_sum"),
+            func.min(window.c.duration_min).label("duration_min"),
+            func.max(window.c.duration_max).label("duration_max"),
+        )
+        .group_by(
+            window.c.hook_name, window.c.event_name, window.c.duration_bucket,
         )
-        .where(HookEvent.timestamp >= cutoff)
         .order_by(
-            HookEvent.hook_name.asc(),
-            HookEvent.event_name.asc(),
-            HookEvent.duration_ms.asc(),
+            window.c.hook_name.asc(),
+            window.c.event_name.asc(),
+            window.c.duration_bucket.asc(),
         )
     )
     rows = (await db.execute(rows_q)).all()
@@ -196,77 +210,52 @@ async def hook_metrics(
             },
         }
 
-    # Group in Python. Query ``order_by`` gives us sorted durations per
-    # group (for percentile) and a stable group iteration order for the
-    # response. ``None`` durations are excluded from percentile/avg so a
-    # hook that never recorded a duration does not skew stats, but still
-    # counts toward totals and error rate.
+    # Per-group histograms, plus one merged across groups (keyed by bucket
+    # so it can be re-sorted) for the top-level summary.
+    groups: dict[tuple[str, str], list] = {}
+    merged: dict[int, list[int]] = {}
+    for r in rows:
+        count = int(r.count)
+        lo, hi = int(r.duration_min), int(r.duration_max)
+        groups.setdefault((r.hook_name, r.event_name), []).append(
+            (count, int(r.errors or 0), int(r.duration_sum or 0), lo, hi),
+        )
+        m = merged.setdefault(r.duration_bucket, [0, lo, hi])
+        m[0] += count
+        m[1] = min(m[1], lo)
+        m[2] = max(m[2], hi)
+
     group_out = []
-    all_durations: list[int] = []
     total = 0
     all_errors = 0
-    current_key: Optional[tuple[str, str]] = None
-    durations: list[int] = []
-    count = 0
-    errors = 0
-    duration_sum = 0
-    duration_count = 0
-
-    def _flush(key: tuple[str, str]) -> None:
-        avg = (duration_sum / duration_count) if duration_count else None
+    all_duration_sum = 0
+    for (hook_name, event_name), buckets in groups.items():
+        count = sum(b[0] for b in buckets)
+        errors = sum(b[1] for b in buckets)
+        duration_sum = sum(b[2] for b in buckets)
+        hist = [(b[0], b[3], b[4]) for b in buckets]
         group_out.append({
-            "hook_name": key[0],
-            "event_name": key[1],
+            "hook_name": hook_name,
+            "event_name": event_name,
             "count": count,
-            "avg_duration_ms": avg,
-            "p50_duration_ms": percentile(durations, 50),
-            "p95_duration_ms": percentile(durations, 95),
+            "avg_duration_ms": duration_sum / count if count else None,
+            "p50_duration_ms": histogram_percentile(hist, 50),
+            "p95_duration_ms": histogram_percentile(hist, 95),
             "error_rate": errors / count if count else 0.0,
         })
+        total += count
+        all_errors += errors
+        all_duration_sum += duration_sum
 
-    for r in rows:
-        key = (r.hook_name, r.event_name)
-        if current_key is None:
-            current_key = key
-        elif key != current_key:
-            _flush(current_key)
-            current_key = key
-            durations = []
-            count = 0
-            errors = 0
-            duration_sum = 0
-            duration_count = 0
-
-        count += 1
-        total += 1
-        if int(r.is_err or 0):
-            errors += 1
-            all_errors += 1
-        if r.duration_ms is not None:
-            d = int(r.duration_ms)
-            durations.append(d)
-            duration_sum += d
-            duration_count += 1
-            all_durations.append(d)
-
-    if current_key is not None:
-        _flush(current_key)
-
-    # Top-level summary. ``all_durations`` accumulates row-by-row in per-
-    # group ascending order so it is NOT globally sorted; sort once here
-    # for the top-level p95.
-    all_durations.sort()
-    all_avg = (
-        sum(all_durations) / len(all_durations) if all_durations else None
-    )
+    summary_hist = [tuple(merged[b]) for b in sorted(merged)]
 
     return {
         "total": total,
         "window_hours": window_hours,
         "groups": group_out,
         "summary": {
-            "avg_duration_ms": all_avg,
-            "p95_duration_ms": percentile(all_durations, 95),
+            "avg_duration_ms": all_duration_sum / total if total else None,
+            "p95_duration_ms": histogram_percentile(summary_hist, 95),
             "error_rate": all_errors / total if total else 0.0,
         },
     }
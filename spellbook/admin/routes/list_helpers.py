@@ -6,7 +6,7 @@ the admin-specific response envelope {items, total, page, per_page, pages}.
 
 import math
 import statistics
-from typing import Optional
+from typing import Optional, Sequence
 
 
 def validate_sort_order(order: str) -> str:
@@ -71,3 +71,35 @@ def percentile(sorted_xs: list[int], pct: int) -> Optional[int]:
     quantiles = statistics.quantiles(sorted_xs, n=100, method="inclusive")
     idx = int(pct) - 1
     return int(quantiles[idx])
+
+
+def histogram_percentile(
+    buckets: Sequence[tuple[int, int, int]], pct: int,
+) -> Optional[int]:
+    """Nearest-rank percentile over a histogram of ``(count, min, max)``.
+
+    ``buckets`` must be ordered by value (non-overlapping, ascending) --
+    the shape of the metric rollup rows in ``spellbook.db.rollups``. The
+    target rank is ``ceil(pct / 100 * n)``; inside the bucket holding that
+    rank the value is interpolated linearly between the bucket's observed
+    min and max, which is exact when the bucket holds one distinct value.
+    ``pct <= 0`` / ``pct >= 100`` return the overall min / max, and an
+    empty histogram returns ``None``, as in ``percentile``.
+    """
+    buckets = [b for b in buckets if b[0] > 0]
+    if not buckets:
+        return None
+    if pct <= 0:
+        return int(buckets[0][1])
+    if pct >= 100:
+        return int(buckets[-1][2])
+    total = sum(b[0] for b in buckets)
+    rank = max(1, math.ceil(pct / 100 * total))
+    seen = 0
+    for count, lo, hi in buckets:
+        if seen + count >= rank:
+            if count == 1:
+                return int(lo)
+            return int(round(lo + (hi - lo) * (rank - seen - 1) / (count - 1)))
+        seen += count
+    return int(buckets[-1][2])
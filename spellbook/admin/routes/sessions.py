@@ -1,8 +1,8 @@
 """Session list API routes.
 
-Scans ~/.claude/projects/ for JSONL session files and returns lightweight
-metadata (timestamps, message count, first user message) without loading
-full file contents.
+Lists ~/.claude/projects/ JSONL session files with lightweight metadata
+(timestamps, message count, first user message) served from the session
+catalog, and pages through individual session transcripts.
 """
 
 import asyncio
@@ -16,6 +16,8 @@ from fastapi.responses import JSONResponse
 
 from spellbook.admin.auth import require_admin_auth
 from spellbook.admin.routes.list_helpers import build_list_response, validate_sort_order
+from spellbook.sessions.catalog import get_session_catalog
+from spellbook.sessions.line_index import open_line_index
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
@@ -28,122 +30,60 @@ def _scan_sessions(
     search: Optional[str] = None,
     sort: str = "last_activity",
     order: str = "desc",
-) -> list[dict]:
-    """Scan ~/.claude/projects/ for session JSONL files.
-
-    Returns lightweight metadata by reading only the first and last few
-    lines of each file, avoiding full-file reads for large sessions.
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> tuple[list[dict], int]:
+    """List session JSONL files under ~/.claude/projects/.
+
+    Metadata comes from the session catalog, which re-reads only the bytes
+    appended since the previous request; search, sort and pagination run as
+    a single SQLite query. Returns ``(page, total)``.
     """
     projects_dir = Path.home() / ".claude" / "projects"
     if not projects_dir.exists():
-        return []
-
-    sessions: list[dict] = []
+        return [], 0
 
     # Parse comma-separated project filters (OR logic)
     project_filters: list[str] = []
     if project_filter:
         project_filters = [p.strip() for p in project_filter.split(",") if p.strip()]
 
-    # Iterate project directories
+    catalog = get_session_catalog()
+    project_dirs: list[Path] = []
+    # Iterate project directories (top-level JSONL only, skip subagents/)
     for project_dir in sorted(projects_dir.iterdir()):
         if not project_dir.is_dir():
             continue
-
-        project_path = str(project_dir.name)
-
-        if project_filters and not any(pf in project_path for pf in project_filters):
+        if project_filters and not any(pf in project_dir.name for pf in project_filters):
             continue
+        catalog.sync_directory(project_dir)
+        project_dirs.append(project_dir)
+    catalog.prune_missing_directories()
 
-        # Find JSONL files (top-level only, skip subagents/)
-        for jsonl_file in project_dir.glob("*.jsonl"):
-            try:
-                stat = jsonl_file.stat()
-                if stat.st_size == 0:
-                    continue
-
-                session_id = jsonl_file.stem
-                first_user_msg = None
-                first_timestamp = None
-                last_timestamp = None
-                message_count = 0
-                slug = None
-                custom_title = None
-
-                with open(jsonl_file, "r") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            entry = json.loads(line)
-                        except json.JSONDecodeError:
-                            continue
-
-                        message_count += 1
-
-                        if entry.get("slug") and not slug:
-                            slug = entry["slug"]
-
-                        ts = entry.get("timestamp")
-                        if ts:
-                            if first_timestamp is None:
-                                first_timestamp = ts
-                            last_timestamp = ts
-
-                        if entry.get("customTitle"):
-                            custom_title = entry["customTitle"]
-
-                        if (
-                            first_user_msg is None
-                            and entry.get("type") == "user"
-                        ):
-                            content = entry.get("message", {}).get("content", "")
-                            if isinstance(content, str):
-                                first_user_msg = content[:200]
-                            elif isinstance(content, list):
-                                # Extract text from content blocks
-                                for block in content:
-                                    if isinstance(block, dict) and block.get("type") == "text":
-                                        first_user_msg = block.get("text", "")[:200]
-                                        break
-
-                sessions.append({
-                    "id": session_id,
-                    "project": project_path,
-                    "slug": slug,
-                    "custom_title": custom_title,
-                    "first_user_message": first_user_msg,
-                    "created_at": first_timestamp,
-                    "last_activity": last_timestamp,
-                    "message_count": message_count,
-                    "size_bytes": stat.st_size,
-                })
-            except (OSError, PermissionError):
-                continue
-
-    # Apply free-text search filter (case-insensitive substring match)
-    if search:
-        search_lower = search.lower()
-        sessions = [
-            s for s in sessions
-            if search_lower in (s.get("first_user_message") or "").lower()
-            or search_lower in (s.get("slug") or "").lower()
-            or search_lower in (s.get("custom_title") or "").lower()
-        ]
-
-    # Validate and apply sort
     sort_field = sort if sort in _SORT_WHITELIST else "last_activity"
-    sort_order = validate_sort_order(order)
-    reverse = sort_order == "desc"
-
-    # Use appropriate default for missing values based on field type
-    if sort_field in ("message_count", "size_bytes"):
-        sessions.sort(key=lambda s: s.get(sort_field) or 0, reverse=reverse)
-    else:
-        sessions.sort(key=lambda s: s.get(sort_field) or "", reverse=reverse)
-
-    return sessions
+    entries, total = catalog.query(
+        project_dirs,
+        search=search,
+        sort=sort_field,
+        descending=validate_sort_order(order) == "desc",
+        limit=limit,
+        offset=offset,
+    )
+    sessions = [
+        {
+            "id": entry.session_id,
+            "project": entry.project,
+            "slug": entry.stats.first_slug,
+            "custom_title": entry.stats.any_custom_title,
+            "first_user_message": entry.stats.first_user_message,
+            "created_at": entry.stats.created_at,
+            "last_activity": entry.stats.last_activity,
+            "message_count": entry.stats.message_count,
+            "size_bytes": entry.size,
+        }
+        for entry in entries
+    ]
+    return sessions, total
 
 
 @router.get("")
@@ -156,15 +96,11 @@ async def list_sessions(
     per_page: int = Query(50, ge=1, le=200),
     _session: str = Depends(require_admin_auth),
 ):
-    """List sessions by scanning JSONL session files."""
-    all_sessions = await asyncio.to_thread(
-        _scan_sessions, project, search, sort, order
+    """List sessions from the session metadata catalog."""
+    page_sessions, total = await asyncio.to_thread(
+        _scan_sessions, project, search, sort, order, per_page, (page - 1) * per_page
     )
 
-    total = len(all_sessions)
-    offset = (page - 1) * per_page
-    page_sessions = all_sessions[offset : offset + per_page]
-
     return build_list_response(page_sessions, total, page, per_page)
 
 
@@ -305,39 +241,31 @@ def _read_session_metadata(file_path: Path) -> dict:
 
 
 def _read_messages_page(file_path: Path, page: int, per_page: int) -> dict:
-    """Read a page of messages using sequential enumeration."""
+    """Read a page of messages via the transcript's byte-offset line index.
+
+    Only the requested lines are read and decoded; the total comes from the
+    index rather than a scan.
+    """
     offset = (page - 1) * per_page
     messages: list[dict] = []
-    total_lines = 0
-
-    with open(file_path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            total_lines += 1
 
-            # Past the target page -- just count remaining lines
-            if len(messages) >= per_page:
-                continue
-
-            # Before the target page -- skip
-            if total_lines <= offset:
-                continue
-
-            # Within the target page -- parse and collect
-            try:
-                entry = json.loads(line)
-                messages.append(_normalize_message(entry, total_lines))
-            except json.JSONDecodeError:
-                messages.append({
-                    "line_number": total_lines,
-                    "type": "error",
-                    "timestamp": None,
-                    "content": "[Malformed JSONL line]",
-                    "is_compact_summary": False,
-                    "raw": None,
-                })
+    with open_line_index(file_path) as index:
+        total_lines = len(index)
+        raw_lines = index.lines(offset, offset + per_page)
+
+    for line_number, line in enumerate(raw_lines, offset + 1):
+        try:
+            entry = json.loads(line)
+            messages.append(_normalize_message(entry, line_number))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            messages.append({
+                "line_number": line_number,
+                "type": "error",
+                "timestamp": None,
+                "content": "[Malformed JSONL line]",
+                "is_compact_summary": False,
+                "raw": None,
+            })
 
     pages = max(1, math.ceil(total_lines / per_page))
     return {
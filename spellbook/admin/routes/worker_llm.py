@@ -13,11 +13,15 @@ arbitrary garbage and silently return an empty result set). Sort columns
 are whitelisted against the ``WorkerLLMCall`` ORM columns.
 
 ``GET /api/worker-llm/metrics`` computes success_rate and percentile
-latencies over the trailing ``window_hours``. Percentiles are computed
-in Python (``statistics.quantiles(n=100, method='inclusive')``) over the
-raw rows -- portability over microseconds, per design §5. When there are
-zero successful rows in the window, ``p95_latency_ms`` / ``p99_latency_ms``
-are ``None``; the frontend renders null as an em-dash.
+latencies over the trailing ``window_hours`` from the per-minute /
+per-hour rollups (``spellbook.db.rollups``), so its cost does not grow
+with traffic. Percentiles are nearest-rank estimates over the rollups'
+latency histograms (``histogram_percentile``). When there are zero
+successful rows in the window, ``p95_latency_ms`` / ``p99_latency_ms``
+are ``None``; the frontend renders null as an em-dash. The
+``response_cache`` block is the daemon's in-process coalescing / response
+cache counters since start, not windowed -- cache hits never reach the
+``worker_llm_calls`` table.
 """
 
 from __future__ import annotations
@@ -27,18 +31,24 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import case, func, select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from spellbook.admin.auth import require_admin_auth
 from spellbook.admin.routes.list_helpers import (
     build_list_response,
-    percentile,
+    histogram_percentile,
     validate_sort_order,
 )
 from spellbook.db import spellbook_db
 from spellbook.db.helpers import apply_pagination
-from spellbook.db.spellbook_models import WorkerLLMCall
+from spellbook.db.rollups import window_rows
+from spellbook.db.spellbook_models import (
+    WorkerLLMCall,
+    WorkerLLMCallRollupHour,
+    WorkerLLMCallRollupMinute,
+)
+from spellbook.worker_llm.response_cache import response_cache_info
 
 router = APIRouter(prefix="/worker-llm", tags=["worker-llm"])
 
@@ -121,9 +131,9 @@ async def worker_llm_metrics(
 ):
     """Aggregate metrics over the trailing ``window_hours``.
 
-    Returns a six-key envelope:
+    Returns a seven-key envelope:
     ``{success_rate, p95_latency_ms, p99_latency_ms, error_breakdown,
-    total_calls, window_hours}``.
+    total_calls, window_hours, response_cache}``.
 
     When the window is empty (``total_calls == 0``), ``success_rate``,
     ``p95_latency_ms``, and ``p99_latency_ms`` are ``None`` and
@@ -135,17 +145,30 @@ async def worker_llm_metrics(
         datetime.now(timezone.utc) - timedelta(hours=window_hours)
     ).isoformat()
 
-    # SQL-side: total + success count via a single aggregate query. Pulling
-    # full ORM objects just to tally these two numbers was the original
-    # waste.
-    totals_q = select(
-        func.count().label("total"),
-        func.sum(
-            case((WorkerLLMCall.status == "success", 1), else_=0)
-        ).label("successes"),
-    ).where(WorkerLLMCall.timestamp >= cutoff)
-    totals_row = (await db.execute(totals_q)).one()
-    total = int(totals_row.total)
+    # One row per (status, error_key, latency bucket) in the window,
+    # summed across the minute/hour rollups -- O(buckets), not O(calls).
+    window = window_rows(
+        WorkerLLMCallRollupMinute.__table__,
+        WorkerLLMCallRollupHour.__table__,
+        cutoff,
+        "status", "error_key", "latency_bucket", "call_count",
+        "latency_min", "latency_max",
+    )
+    rows_q = (
+        select(
+            window.c.status,
+            window.c.error_key,
+            func.sum(window.c.call_count).label("count"),
+            func.min(window.c.latency_min).label("latency_min"),
+            func.max(window.c.latency_max).label("latency_max"),
+        )
+        .group_by(
+            window.c.status, window.c.error_key, window.c.latency_bucket,
+        )
+        .order_by(window.c.latency_bucket.asc())
+    )
+    rows = (await db.execute(rows_q)).all()
+    total = sum(int(r.count) for r in rows)
 
     if total == 0:
         return {
@@ -155,41 +178,27 @@ async def worker_llm_metrics(
             "error_breakdown": {},
             "total_calls": 0,
             "window_hours": window_hours,
+            "response_cache": response_cache_info(),
         }
 
-    successes = int(totals_row.successes or 0)
-
-    # Narrow single-column fetch for the success latencies that feed the
-    # percentile helper. Ordered on the DB so the helper can skip a Python
-    # sort.
-    lat_q = (
-        select(WorkerLLMCall.latency_ms)
-        .where(
-            WorkerLLMCall.timestamp >= cutoff,
-            WorkerLLMCall.status == "success",
-        )
-        .order_by(WorkerLLMCall.latency_ms.asc())
-    )
-    latencies = [int(latency) for latency in (await db.execute(lat_q)).scalars().all()]
-
-    # Error breakdown: fetch only (error, status) for non-success rows and
-    # apply the same Counter.most_common logic. Full-row SELECT avoided.
-    err_q = select(
-        WorkerLLMCall.error, WorkerLLMCall.status
-    ).where(
-        WorkerLLMCall.timestamp >= cutoff,
-        WorkerLLMCall.status != "success",
-    )
-    errors = Counter(
-        (err or status)
-        for (err, status) in (await db.execute(err_q)).all()
-    )
+    # Success rows form the latency histogram (ascending by bucket); the
+    # rest tally into the error breakdown, keyed ``error or status`` by
+    # the rollup trigger.
+    latencies = []
+    errors: Counter = Counter()
+    for r in rows:
+        if r.status == "success":
+            latencies.append((int(r.count), int(r.latency_min), int(r.latency_max)))
+        else:
+            errors[r.error_key] += int(r.count)
+    successes = sum(c for c, _, _ in latencies)
 
     return {
         "success_rate": successes / total,
-        "p95_latency_ms": percentile(latencies, 95),
-        "p99_latency_ms": percentile(latencies, 99),
+        "p95_latency_ms": histogram_percentile(latencies, 95),
+        "p99_latency_ms": histogram_percentile(latencies, 99),
         "error_breakdown": dict(errors.most_common(10)),
         "total_calls": total,
         "window_hours": window_hours,
+        "response_cache": response_cache_info(),
     }
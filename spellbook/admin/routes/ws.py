@@ -3,6 +3,12 @@
 Authenticates via short-lived WS ticket (from POST /api/auth/ws-ticket),
 subscribes to the event bus, and forwards events as JSON frames.
 Ping/pong keepalive every 30 seconds.
+
+Clients narrow the stream with ``{"type": "subscribe", "subsystems": [...]}``
+and ``{"type": "unsubscribe", "subsystems": [...]}``; the filter is applied
+by the bus, so unwanted events never reach the connection's queue. Bursts
+from high-volume subsystems arrive as ``{"type": "batch", "events": [...]}``
+frames whose entries are ordinary ``event`` frames.
 """
 
 import asyncio
@@ -13,7 +19,7 @@ import uuid
 from starlette.websockets import WebSocket, WebSocketDisconnect
 
 from spellbook.admin.auth import validate_ws_ticket
-from spellbook.admin.events import Event, Subsystem, event_bus
+from spellbook.admin.events import Subsystem, batch_frame, event_bus
 
 logger = logging.getLogger(__name__)
 
@@ -23,21 +29,50 @@ PING_INTERVAL = 30  # seconds
 async def _send_loop(ws: WebSocket, queue: asyncio.Queue) -> None:
     """Forward events from the subscriber queue to the WebSocket client."""
     while True:
-        event: Event = await queue.get()
+        batch = []
+        for event in await event_bus.next_batch(queue):
+            try:
+                event.frame()
+            except (TypeError, ValueError):
+                logger.warning(
+                    f"Dropping unserializable {event.subsystem}/{event.event_type} event"
+                )
+                continue
+            batch.append(event)
+        if not batch:
+            continue
         try:
-            payload = {
-                "type": "event",
-                "subsystem": event.subsystem.value if isinstance(event.subsystem, Subsystem) else str(event.subsystem),
-                "event": event.event_type,
-                "data": event.data,
-                "timestamp": event.timestamp,
-            }
-            await ws.send_json(payload)
+            if len(batch) == 1:
+                await ws.send_text(batch[0].frame())
+            else:
+                await ws.send_text(batch_frame(batch))
         except Exception:
             return  # Connection closed
 
 
-async def _receive_loop(ws: WebSocket) -> None:
+def _apply_filter(subscriber_id: str, msg_type: str, subsystems) -> None:
+    """Update the subscriber's subsystem filter from a control message.
+
+    ``subscribe`` adds subsystems (narrowing an unfiltered connection to
+    exactly those); ``unsubscribe`` removes them. Without a ``subsystems``
+    list, ``subscribe`` restores everything and ``unsubscribe`` mutes all.
+    Unknown subsystem names are ignored.
+    """
+    if subsystems is None:
+        event_bus.set_filter(subscriber_id, None if msg_type == "subscribe" else ())
+        return
+    if not isinstance(subsystems, list):
+        return
+    known = {s.value for s in Subsystem}
+    names = {s for s in subsystems if isinstance(s, str) and s in known}
+    current = event_bus.get_filter(subscriber_id)
+    if msg_type == "subscribe":
+        event_bus.set_filter(subscriber_id, names if current is None else current | names)
+    else:
+        event_bus.set_filter(subscriber_id, (current if current is not None else known) - names)
+
+
+async def _receive_loop(ws: WebSocket, subscriber_id: str) -> None:
     """Handle incoming WebSocket messages (pong, subscribe/unsubscribe)."""
     while True:
         try:
@@ -46,8 +81,7 @@ async def _receive_loop(ws: WebSocket) -> None:
             if msg_type == "pong":
                 pass  # Keepalive acknowledged
             elif msg_type in ("subscribe", "unsubscribe"):
-                # Future: subsystem-level filtering
-                pass
+                _apply_filter(subscriber_id, msg_type, data.get("subsystems"))
         except (WebSocketDisconnect, json.JSONDecodeError):
             return
         except Exception:
@@ -103,7 +137,7 @@ async def websocket_handler(ws: WebSocket) -> None:
     try:
         async with asyncio.TaskGroup() as tg:
             tg.create_task(_send_loop(ws, queue))
-            tg.create_task(_receive_loop(ws))
+            tg.create_task(_receive_loop(ws, subscriber_id))
             tg.create_task(_ping_loop(ws))
     except* (WebSocketDisconnect, Exception):
         pass  # Any task failure cancels the group
@@ -14,6 +14,13 @@ Writes are atomic (tempfile + ``os.replace``) mirroring the
 with default-derived metadata so a canvas always surfaces in
 ``canvas_list`` with at least an inferred title + timestamps.
 
+Reads go through an in-memory catalog: parsed ``meta.json`` files, page
+bodies and the canvas root listing are cached and revalidated on every
+read by ``stat`` (mtime, size, inode). Atomic writes always produce a new
+inode, and files modified within :data:`_RACY_WINDOW_NS` are never cached
+(git's "racily clean" rule), so an in-place edit landing inside the
+filesystem's timestamp granularity cannot be served stale.
+
 Threat model: canvas content is TRUSTED-LOCAL-AGENT output only. Agents
 MUST NOT write unsanitized external content (chat transcripts, fetched
 web pages, untrusted MCP tool outputs, user-pasted strings) into a
@@ -24,11 +31,15 @@ primitive.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 import re
 import tempfile
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Callable, NamedTuple, Optional
 
@@ -217,6 +228,121 @@ def _mtime_dt(path: str) -> Optional[datetime]:
     return datetime.fromtimestamp(ts, tz=timezone.utc)
 
 
+# ---------------------------------------------------------------------------
+# Catalog: stat-validated caches of meta.json, page bodies and the root listing
+# ---------------------------------------------------------------------------
+
+# Files modified this recently are re-read on every access instead of cached:
+# two writes within one timestamp tick (coarse on some filesystems) can leave
+# mtime and size unchanged, so only settled files are trusted by signature.
+_RACY_WINDOW_NS = 2_000_000_000
+# Page bodies are up to _max_page_bytes() each; keep the most recent few.
+_PAGE_CACHE_MAX = 32
+
+_catalog_lock = threading.Lock()
+_meta_cache: dict[str, tuple[tuple, CanvasMeta]] = {}
+_page_cache: "OrderedDict[str, tuple[tuple, str, bytes]]" = OrderedDict()
+_listing_cache: dict[str, tuple[tuple, tuple[str, ...]]] = {}
+
+
+def _file_signature(path: str) -> Optional[tuple[int, int, int]]:
+    """``(mtime_ns, size, inode)`` of ``path``, or ``None`` if it is missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _settled(signature: tuple) -> bool:
+    return time.time_ns() - signature[0] > _RACY_WINDOW_NS
+
+
+def _clear_catalog() -> None:
+    """Drop every cached meta, page and listing. Test-only seam."""
+    with _catalog_lock:
+        _meta_cache.clear()
+        _page_cache.clear()
+        _listing_cache.clear()
+
+
+def _load_meta_file(meta_p: str) -> tuple[Optional[tuple], Optional[CanvasMeta]]:
+    """Return ``(signature, meta)`` for ``meta_p``.
+
+    ``signature`` is ``None`` when the file is missing; ``meta`` is ``None``
+    when it is missing or corrupt.
+    """
+    sig = _file_signature(meta_p)
+    if sig is None:
+        return None, None
+    with _catalog_lock:
+        cached = _meta_cache.get(meta_p)
+    if cached is not None and cached[0] == sig:
+        return sig, cached[1]
+    try:
+        with open(meta_p, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        meta = CanvasMeta.model_validate(raw)
+    except (OSError, ValueError):
+        return sig, None
+    if _settled(sig):
+        with _catalog_lock:
+            _meta_cache[meta_p] = (sig, meta)
+    return sig, meta
+
+
+def _load_page(page_p: str) -> tuple[str, bytes]:
+    """Return ``(content, digest)`` of a page; ``("", digest-of-empty)`` if missing."""
+    sig = _file_signature(page_p)
+    if sig is None:
+        return "", hashlib.blake2b(b"", digest_size=16).digest()
+    with _catalog_lock:
+        cached = _page_cache.get(page_p)
+        if cached is not None and cached[0] == sig:
+            _page_cache.move_to_end(page_p)
+            return cached[1], cached[2]
+    with open(page_p, "r", encoding="utf-8") as f:
+        content = f.read()
+    digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+    if _settled(sig):
+        with _catalog_lock:
+            _page_cache[page_p] = (sig, content, digest)
+            _page_cache.move_to_end(page_p)
+            while len(_page_cache) > _PAGE_CACHE_MAX:
+                _page_cache.popitem(last=False)
+    return content, digest
+
+
+def _canvas_names(root: str) -> tuple[str, ...]:
+    """Names of the canvas directories directly under ``root``.
+
+    Cached against the root directory's own signature, which changes
+    whenever an entry is added, removed or renamed.
+    """
+    sig = _file_signature(root)
+    if sig is None:
+        return ()
+    with _catalog_lock:
+        cached = _listing_cache.get(root)
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    names = []
+    for entry in os.listdir(root):
+        if not NAME_RE.match(entry):
+            continue
+        try:
+            path = _canvas_dir(entry)
+        except ValueError:
+            continue
+        if os.path.isdir(path):
+            names.append(entry)
+    result = tuple(sorted(names))
+    if _settled(sig):
+        with _catalog_lock:
+            _listing_cache[root] = (sig, result)
+    return result
+
+
 def _regenerate_meta(name: str, canvas_dir: str) -> CanvasMeta:
     """Build default metadata for a canvas whose ``meta.json`` is
     missing or corrupt.
@@ -249,15 +375,10 @@ def read_meta(name: str) -> Optional[CanvasMeta]:
         return None
     if not os.path.isdir(canvas_dir):
         return None
-    meta_p = _meta_path(canvas_dir)
-    if os.path.isfile(meta_p):
-        try:
-            with open(meta_p, "r", encoding="utf-8") as f:
-                raw = json.load(f)
-            return CanvasMeta.model_validate(raw)
-        except (OSError, ValueError):
-            # Corrupt — fall through to regenerate.
-            pass
+    _sig, meta = _load_meta_file(_meta_path(canvas_dir))
+    if meta is not None:
+        return meta
+    # Missing or corrupt — regenerate.
     return _regenerate_meta(name, canvas_dir)
 
 
@@ -321,6 +442,17 @@ def read_canvas(name: str) -> Optional[dict]:
     Path-traversal and other invalid names are rejected at the
     ``_canvas_dir`` boundary and surface here as ``None``.
     """
+    result = read_canvas_with_etag(name)
+    return None if result is None else result[0]
+
+
+def read_canvas_with_etag(name: str) -> Optional[tuple[dict, str]]:
+    """Return ``(payload, etag)`` for ``name`` or ``None`` when not found.
+
+    ``payload`` is exactly what :func:`read_canvas` returns. ``etag`` is a
+    quoted strong validator derived from the canvas metadata and page
+    bytes, so it changes exactly when the payload does.
+    """
     try:
         canvas_dir = _canvas_dir(name)
     except ValueError:
@@ -330,16 +462,11 @@ def read_canvas(name: str) -> Optional[dict]:
     meta = read_meta(name)
     if meta is None:
         return None
-    page = _page_path(canvas_dir)
-    if os.path.isfile(page):
-        with open(page, "r", encoding="utf-8") as f:
-            content = f.read()
-    else:
-        content = ""
+    content, page_digest = _load_page(_page_path(canvas_dir))
     # Persist regenerated meta if it wasn't there (symmetric recovery).
     if not os.path.isfile(_meta_path(canvas_dir)):
         write_meta(name, meta)
-    return {
+    payload = {
         "name": meta.name,
         "title": meta.title,
         "created_at": meta.created_at.isoformat(),
@@ -350,6 +477,16 @@ def read_canvas(name: str) -> Optional[dict]:
         "bytes": len(content.encode("utf-8")),
         "decision": project_decision_for_detail(meta.decision),
     }
+    tag = hashlib.blake2b(digest_size=16)
+    tag.update(meta.model_dump_json().encode("utf-8"))
+    tag.update(page_digest)
+    return payload, f'"{tag.hexdigest()}"'
+
+
+def canvas_etag(name: str) -> Optional[str]:
+    """Return the current ETag of ``name`` (see :func:`read_canvas_with_etag`)."""
+    result = read_canvas_with_etag(name)
+    return None if result is None else result[1]
 
 
 def list_canvases() -> list[dict]:
@@ -362,22 +499,21 @@ def list_canvases() -> list[dict]:
     root = _resolve_canvas_root()
     if not os.path.isdir(root):
         return []
+    real_root = os.path.realpath(root)
     items: list[dict] = []
-    for entry in os.listdir(root):
-        path = os.path.join(root, entry)
-        if not os.path.isdir(path):
-            continue
-        if not NAME_RE.match(entry):
-            continue
-        meta = read_meta(entry)
+    for entry in _canvas_names(real_root):
+        path = os.path.join(real_root, entry)
+        sig, meta = _load_meta_file(_meta_path(path))
         if meta is None:
-            continue
-        # Persist regenerated meta if it wasn't there.
-        if not os.path.isfile(_meta_path(path)):
-            try:
-                write_meta(entry, meta)
-            except OSError:
-                pass
+            if not os.path.isdir(path):
+                continue
+            meta = _regenerate_meta(entry, path)
+            # Persist regenerated meta if it wasn't there.
+            if sig is None:
+                try:
+                    write_meta(entry, meta)
+                except OSError:
+                    pass
         items.append(
             {
                 "name": meta.name,
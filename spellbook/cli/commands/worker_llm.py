@@ -20,6 +20,7 @@ from __future__ import annotations
 import argparse
 import asyncio
 import json
+import sqlite3
 import sys
 import time
 from typing import Any
@@ -162,17 +163,15 @@ def _safety_cache_report() -> dict:
         return {"exists": False, "path": str(path)}
     try:
         size = path.stat().st_size
-        raw = json.loads(path.read_text(encoding="utf-8"))
-        verdicts = len(raw.get("verdicts") or {})
-        blocks = len(raw.get("blocks") or {})
+        stats = safety_cache.cache_stats()
         return {
             "exists": True,
             "path": str(path),
             "size_bytes": size,
-            "verdicts": verdicts,
-            "blocks": blocks,
+            "verdicts": stats["verdicts"],
+            "blocks": stats["blocks"],
         }
-    except (OSError, json.JSONDecodeError) as e:
+    except (OSError, sqlite3.Error) as e:
         return {
             "exists": True,
             "path": str(path),
@@ -2,25 +2,91 @@
 
 Provides the root argument parser, subcommand registration, and main()
 entry point for the ``spellbook`` console script.
+
+Subcommands are registered lazily. ``_COMMANDS`` lists each one's name,
+module and one-line help statically, which is all ``spellbook --help``
+needs; a command's module (and everything it imports: the daemon client,
+SQLAlchemy, the admin app, ...) is only imported once argparse dispatches
+to it. The package version is likewise only looked up for ``--version``.
 """
 
 from __future__ import annotations
 
 import argparse
 import sys
-from importlib.metadata import version
 
-_COMMAND_MODULES = (
-    "doctor",
-    "server",
-    "install",
-    "update",
-    "admin",
-    "config",
-    "session",
-    "events",
-    "worker_llm",
-)
+# Subcommand name -> (module under ``spellbook.cli.commands``, help text).
+# The help text must match the module's own ``add_parser(help=...)``;
+# tests/test_cli/test_main.py checks that they agree.
+_COMMANDS: dict[str, tuple[str, str]] = {
+    "doctor": ("doctor", "Run diagnostic checks"),
+    "server": ("server", "Manage the spellbook MCP server daemon"),
+    "install": ("install", "Install spellbook for AI-assistant platforms"),
+    "update": ("update", "Check for and apply spellbook updates"),
+    "admin": ("admin", "Manage the spellbook web admin interface"),
+    "config": ("config", "Read or write spellbook configuration values"),
+    "session": ("session", "List and export Claude Code sessions"),
+    "events": ("events", "Stream real-time events from the spellbook daemon"),
+    "worker-llm": ("worker_llm", "Worker LLM utilities"),
+}
+
+
+class _LazySubParsersAction(argparse._SubParsersAction):
+    """Subparsers whose commands are placeholders until dispatched.
+
+    ``add_lazy`` registers a help-only placeholder. When argparse selects
+    that command, the placeholder is dropped and the command module's
+    ``register`` adds the real subparser before parsing continues.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._lazy: dict[str, str] = {}
+
+    def add_lazy(self, name: str, module: str, help: str) -> None:
+        self.add_parser(name, help=help, add_help=False)
+        self._lazy[name] = module
+
+    def load(self, name: str) -> None:
+        """Replace the placeholder for ``name`` with the real subparser."""
+        module_name = self._lazy.pop(name)
+        del self._name_parser_map[name]
+        self._choices_actions = [
+            a for a in self._choices_actions if a.dest != name
+        ]
+        try:
+            # ``__import__`` rather than ``importlib.import_module`` so the
+            # command shows up under ``python -X importtime``.
+            module = __import__(
+                f"spellbook.cli.commands.{module_name}",
+                fromlist=["register"],
+            )
+            module.register(self)
+        except (ImportError, AttributeError) as exc:
+            raise argparse.ArgumentError(
+                self, f"command {name!r} is unavailable: {exc}",
+            ) from exc
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        if values and values[0] in self._lazy:
+            self.load(values[0])
+        super().__call__(parser, namespace, values, option_string)
+
+
+class _VersionAction(argparse.Action):
+    """``--version`` that resolves the installed version only when used."""
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, **kwargs) -> None:
+        super().__init__(
+            option_strings, dest=dest, default=argparse.SUPPRESS, nargs=0,
+            **kwargs,
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        from importlib.metadata import version
+
+        print(f"spellbook {version('spellbook')}")
+        parser.exit()
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -31,8 +97,8 @@ def create_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--version",
-        action="version",
-        version=f"spellbook {version('spellbook')}",
+        action=_VersionAction,
+        help="show program's version number and exit",
     )
     parser.add_argument(
         "--json",
@@ -41,19 +107,11 @@ def create_parser() -> argparse.ArgumentParser:
         help="Output in JSON format",
     )
 
-    subparsers = parser.add_subparsers(dest="command")
-
-    # Register subcommands from spellbook.cli.commands.*
-    # Use try/except so the CLI works before all command modules exist.
-    for module_name in _COMMAND_MODULES:
-        try:
-            mod = __import__(
-                f"spellbook.cli.commands.{module_name}",
-                fromlist=["register"],
-            )
-            mod.register(subparsers)
-        except (ImportError, AttributeError):
-            pass
+    subparsers = parser.add_subparsers(
+        dest="command", action=_LazySubParsersAction,
+    )
+    for name, (module_name, help_text) in _COMMANDS.items():
+        subparsers.add_lazy(name, module_name, help_text)
 
     return parser
 
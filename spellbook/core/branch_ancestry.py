@@ -1,7 +1,9 @@
 """Git branch ancestry checks with LRU caching.
 
-All git operations are subprocess calls with timeouts to prevent
-hanging on broken git repos or network-mounted filesystems.
+The current branch is read from disk through the shared git context
+service where possible. All other git operations are subprocess calls
+with timeouts to prevent hanging on broken git repos or network-mounted
+filesystems.
 """
 
 import subprocess
@@ -9,6 +11,8 @@ from enum import Enum
 from functools import lru_cache
 from typing import Dict
 
+from spellbook.core.git_context import get_git_context_service
+
 
 class BranchRelationship(Enum):
     """Relationship between two git branches."""
@@ -37,6 +41,20 @@ def get_current_branch(repo_path: str) -> str:
         Branch name (e.g., "main"), or "detached:<sha8>" for detached HEAD,
         or "" if not in a git repo.
     """
+    state = get_git_context_service().lookup(repo_path)
+    if state is not None:
+        if state.branch is not None:
+            return state.branch
+        if state.detached_sha is None:
+            # Unborn branch: no commits yet
+            return ""
+        short = state.memo.get("short_head_8")
+        if short is None:
+            short = _short_sha(repo_path)
+            if short:
+                state.memo["short_head_8"] = short
+        return f"detached:{short}" if short else ""
+
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--abbrev-ref", "HEAD"],
@@ -50,21 +68,30 @@ def get_current_branch(repo_path: str) -> str:
         branch = result.stdout.strip()
         if branch == "HEAD":
             # Detached HEAD: get short SHA
-            sha_result = subprocess.run(
-                ["git", "rev-parse", "--short=8", "HEAD"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if sha_result.returncode == 0:
-                return f"detached:{sha_result.stdout.strip()}"
-            return ""
+            short = _short_sha(repo_path)
+            return f"detached:{short}" if short else ""
         return branch
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
         return ""
 
 
+def _short_sha(repo_path: str) -> str:
+    """Return the 8-character abbreviated HEAD commit id, or "" on failure."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short=8", "HEAD"],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return ""
+    if result.returncode == 0:
+        return result.stdout.strip()
+    return ""
+
+
 @lru_cache(maxsize=512)
 def is_ancestor(repo_path: str, potential_ancestor: str, branch: str) -> bool:
     """Check if potential_ancestor is an ancestor of branch.
@@ -4,15 +4,19 @@ Canonical location for configuration utilities. This module was migrated from
 spellbook.core.config as part of the three-layer architecture reorganization.
 """
 
+import copy
 import json
 import logging
 import os
 import random
 import tempfile
+import threading
 import warnings
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Optional
 
 from spellbook.core.compat import CrossPlatformLock, LockHeldError, get_config_dir
 
@@ -46,6 +50,9 @@ CONFIG_DEFAULTS: dict[str, Any] = {
     "worker_llm_feature_roundtable": False,
     "worker_llm_feature_tool_safety": False,
     "worker_llm_safety_cache_ttl_s": 300,
+    "worker_llm_response_cache_ttl_s": 0,
+    "worker_llm_response_cache_max_entries": 256,
+    "worker_llm_response_cache_max_bytes": 1048576,
     # worker_llm observability (design §7). Consumed by the purge loop and
     # edge-triggered threshold notifier via single-arg config_get(key); missing
     # defaults would make config_get return None and crash the int/float casts
@@ -64,7 +71,13 @@ CONFIG_DEFAULTS: dict[str, Any] = {
     # float-casts.
     "worker_llm_queue_enabled": False,
     "worker_llm_queue_max_depth": 256,
+    "worker_llm_queue_workers": 1,
+    "worker_llm_queue_lanes": (
+        "tool_safety=interactive,tool_safety_warmup=warmup,roundtable_voice=background"
+    ),
+    "worker_llm_queue_task_concurrency": "",
     "worker_llm_tool_safety_cold_threshold_s": 45.0,
+    "worker_llm_tool_safety_stream": False,
     # Hook observability. Consumed by the purge loop via single-arg
     # config_get(key); missing defaults would make config_get return None and
     # crash the int casts in spellbook/hooks/observability.py.
@@ -290,38 +303,134 @@ def get_spellbook_dir() -> Path:
     return Path.home() / ".local" / "spellbook"
 
 
-def config_get(key: str) -> Optional[Any]:
-    """Read a config value from spellbook.json with file-level locking.
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Immutable view of spellbook.json as of one reload.
 
-    Uses CrossPlatformLock for thread-safe and cross-process-safe reads.
-    Falls back to unlocked read if lock acquisition fails (preserves existing
-    error contract: returns None on failure).
+    ``generation`` increases by one each time a reload finds different
+    contents, so long-lived callers can cheaply tell whether anything they
+    derived from the config is stale.
+    """
 
-    Args:
-        key: The config key to read
+    generation: int
+    values: Mapping[str, Any]
 
-    Returns:
-        The value for the key, built-in default from CONFIG_DEFAULTS, or None
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value for ``key`` with the CONFIG_DEFAULTS fallback.
+
+        Containers are copied so callers can mutate the result without
+        corrupting the shared snapshot.
+        """
+        value = self.values.get(key, CONFIG_DEFAULTS.get(key))
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+        return value
+
+
+_snapshot: ConfigSnapshot = ConfigSnapshot(generation=0, values=MappingProxyType({}))
+_snapshot_fingerprint: Optional[tuple] = None
+_snapshot_lock = threading.Lock()
+
+
+def _config_fingerprint(config_path: Path) -> tuple:
+    """Identify the config file's current version without reading it.
+
+    ``config_set`` replaces the file atomically, so every write changes the
+    inode even when mtime and size collide.
     """
-    default = CONFIG_DEFAULTS.get(key)
-    config_path = get_config_path()
-    if not config_path.exists():
-        return default
+    try:
+        st = os.stat(config_path)
+    except OSError:
+        return (str(config_path), None)
+    return (str(config_path), st.st_mtime_ns, st.st_size, st.st_ino)
+
 
+def _read_config_file(config_path: Path) -> dict:
+    """Parse spellbook.json under the shared lock; {} if missing or malformed."""
     try:
         with CrossPlatformLock(CONFIG_LOCK_PATH, shared=True, blocking=True):
             config = json.loads(config_path.read_text(encoding="utf-8"))
-            return config.get(key, default)
     except LockHeldError:
         # Fall back to unlocked read
         logger.warning("Could not acquire config read lock. Falling back to unlocked read.")
         try:
             config = json.loads(config_path.read_text(encoding="utf-8"))
-            return config.get(key, default)
         except (json.JSONDecodeError, OSError):
-            return default
+            return {}
     except (json.JSONDecodeError, OSError):
-        return default
+        return {}
+    return config if isinstance(config, dict) else {}
+
+
+def config_snapshot() -> ConfigSnapshot:
+    """Return the current config snapshot, reloading only if the file changed.
+
+    A lookup costs one ``stat`` of spellbook.json. The file is re-read and
+    re-parsed (under the shared config lock) only when its (mtime, size,
+    inode) fingerprint differs from the one the snapshot was built from.
+
+    Returns:
+        The current ConfigSnapshot
+    """
+    global _snapshot, _snapshot_fingerprint
+    config_path = get_config_path()
+    fingerprint = _config_fingerprint(config_path)
+    if fingerprint == _snapshot_fingerprint:
+        return _snapshot
+
+    with _snapshot_lock:
+        if fingerprint == _snapshot_fingerprint:
+            return _snapshot
+        # Stat before read: a write racing this reload leaves a newer
+        # fingerprint on disk, so the next lookup reloads again.
+        values = _read_config_file(config_path) if fingerprint[1] is not None else {}
+        if values != _snapshot.values:
+            _snapshot = ConfigSnapshot(
+                generation=_snapshot.generation + 1,
+                values=MappingProxyType(values),
+            )
+        _snapshot_fingerprint = fingerprint
+        return _snapshot
+
+
+def config_generation() -> int:
+    """Return the generation of the current config snapshot."""
+    return config_snapshot().generation
+
+
+def _invalidate_config_snapshot() -> None:
+    """Force the next lookup to re-read spellbook.json."""
+    global _snapshot_fingerprint
+    with _snapshot_lock:
+        _snapshot_fingerprint = None
+
+
+def config_get(key: str) -> Optional[Any]:
+    """Read a config value from the in-memory spellbook.json snapshot.
+
+    See :func:`config_snapshot`: the file is re-read (under the shared
+    config lock) only when it has changed since the last lookup.
+
+    Args:
+        key: The config key to read
+
+    Returns:
+        The value for the key, built-in default from CONFIG_DEFAULTS, or None
+    """
+    return config_snapshot().get(key)
+
+
+def config_get_many(keys: Iterable[str]) -> dict[str, Any]:
+    """Read several config values from one consistent snapshot.
+
+    Args:
+        keys: The config keys to read
+
+    Returns:
+        Dict mapping each key to its value, CONFIG_DEFAULTS entry, or None
+    """
+    snapshot = config_snapshot()
+    return {key: snapshot.get(key) for key in keys}
 
 
 def config_set(key: str, value: Any) -> dict:
@@ -373,6 +482,7 @@ def config_set(key: str, value: Any) -> dict:
                     pass
                 raise
 
+            _invalidate_config_snapshot()
             return {"status": "ok", "config": config}
     except LockHeldError:
         logger.warning("Could not acquire config write lock. Falling back to unlocked write.")
@@ -402,6 +512,7 @@ def config_set(key: str, value: Any) -> dict:
             except OSError:
                 pass
             raise
+        _invalidate_config_snapshot()
         return {"status": "ok", "config": config}
 
 
@@ -463,6 +574,7 @@ def config_set_many(updates: dict[str, Any]) -> dict:
         config = _read_config()
         config.update(updates)
         _atomic_write(config, config_path)
+        _invalidate_config_snapshot()
         return {"status": "ok", "config": config}
 
     try:
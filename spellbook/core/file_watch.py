@@ -0,0 +1,351 @@
+"""Shared file-change notification service.
+
+One background thread per process watches every directory that a consumer
+has subscribed to and dispatches per-file events to the subscribers'
+callbacks. On Linux it sleeps in a single inotify instance until a watched
+file is created or written; elsewhere (or when inotify is unavailable) it
+falls back to one stat scan of the subscribed directories every
+``poll_interval`` seconds, shared by all consumers.
+
+Events:
+
+- ``CREATED``: a matching file appeared (created or moved into the directory).
+- ``MODIFIED``: a matching file was written (appended, for session JSONL).
+- ``RESCAN``: the directory itself changed in a way that may have hidden
+  per-file events (it was created or recreated after the subscription, or
+  the kernel event queue overflowed). ``path`` is the directory; consumers
+  should re-list it.
+
+Events are de-duplicated within one wake-up, so a burst of appends to the
+same file is delivered once. Callbacks run on the service thread and must
+be quick; an exception in one callback is logged and does not affect the
+others. Directories that do not exist yet are retried every
+``poll_interval`` until they appear.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+CREATED = "created"
+MODIFIED = "modified"
+RESCAN = "rescan"
+
+DEFAULT_POLL_INTERVAL = 2.0
+
+
+@dataclass(frozen=True)
+class FileEvent:
+    """A change to one file (or, for ``RESCAN``, to the directory)."""
+
+    kind: str
+    path: Path
+
+
+class Subscription:
+    """Handle returned by :meth:`FileWatchService.subscribe`."""
+
+    def __init__(
+        self,
+        service: "FileWatchService",
+        directory: Path,
+        callback: Callable[[FileEvent], None],
+        suffix: str,
+    ) -> None:
+        self.service = service
+        self.directory = directory
+        self.callback = callback
+        self.suffix = suffix
+
+    def matches(self, name: str) -> bool:
+        return name.endswith(self.suffix)
+
+    def cancel(self) -> None:
+        """Stop delivering events to this subscription."""
+        self.service.unsubscribe(self)
+
+
+class FileWatchService:
+    """One watcher thread dispatching file events to many subscribers.
+
+    Args:
+        poll_interval: Seconds between directory scans in polling mode, and
+            between retries for subscribed directories that do not exist.
+        use_inotify: Set False to force the polling fallback.
+    """
+
+    def __init__(
+        self, poll_interval: float = DEFAULT_POLL_INTERVAL, use_inotify: bool = True,
+    ) -> None:
+        self.poll_interval = poll_interval
+        self._use_inotify = use_inotify
+        self._lock = threading.Lock()
+        self._subs: dict[Path, list[Subscription]] = {}
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._notifier = None
+        # inotify mode: watch descriptors, plus directories still to arm
+        # (value True once an attempt failed, so arming later means RESCAN).
+        self._wd_dirs: dict[int, Path] = {}
+        self._dir_wds: dict[Path, int] = {}
+        self._unarmed: dict[Path, bool] = {}
+        # polling mode: directory -> {name: (st_ino, st_size, st_mtime_ns)}
+        self._snapshots: dict[Path, dict[str, tuple[int, int, int]]] = {}
+
+    @property
+    def mode(self) -> str:
+        """``"inotify"`` or ``"polling"`` once started."""
+        return "inotify" if self._notifier is not None else "polling"
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the watcher thread (idempotent)."""
+        if self.is_running():
+            return
+        self._stop.clear()
+        if self._use_inotify:
+            from spellbook.core.inotify import Inotify
+
+            try:
+                self._notifier = Inotify()
+            except OSError as e:
+                logger.debug(f"inotify unavailable, polling watched files: {e}")
+        self._thread = threading.Thread(
+            target=self._run, name="spellbook-file-watch", daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watcher thread and release the inotify instance."""
+        self._stop.set()
+        self._interrupt()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        notifier, self._notifier = self._notifier, None
+        if notifier is not None:
+            notifier.close()
+        with self._lock:
+            self._wd_dirs.clear()
+            self._dir_wds.clear()
+            self._unarmed = {d: False for d in self._subs}
+
+    def subscribe(
+        self,
+        directory: str | os.PathLike,
+        callback: Callable[[FileEvent], None],
+        *,
+        suffix: str = "",
+    ) -> Subscription:
+        """Deliver events for files in ``directory`` ending in ``suffix``.
+
+        Existing files produce no events; only changes after this call do.
+        ``directory`` need not exist yet.
+        """
+        directory = Path(directory)
+        sub = Subscription(self, directory, callback, suffix)
+        with self._lock:
+            subs = self._subs.setdefault(directory, [])
+            if not subs:
+                self._snapshots[directory] = _scan(directory)
+                # Arm now so writes right after subscribe() are not missed;
+                # a missing directory is retried by the watcher thread.
+                if self._notifier is None or not self._arm(directory):
+                    self._unarmed[directory] = self._notifier is not None
+            subs.append(sub)
+        self._interrupt()
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            subs = self._subs.get(sub.directory, [])
+            if sub in subs:
+                subs.remove(sub)
+            if subs:
+                return
+            self._subs.pop(sub.directory, None)
+            self._unarmed.pop(sub.directory, None)
+            self._snapshots.pop(sub.directory, None)
+            wd = self._dir_wds.pop(sub.directory, None)
+            if wd is not None:
+                self._wd_dirs.pop(wd, None)
+                if self._notifier is not None:
+                    self._notifier.rm_watch(wd)
+
+    # ------------------------------------------------------------------
+    # Watcher thread
+    # ------------------------------------------------------------------
+
+    def _interrupt(self) -> None:
+        self._wake.set()
+        notifier = self._notifier
+        if notifier is not None:
+            notifier.wake()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                if self._notifier is not None:
+                    events = self._wait_inotify()
+                else:
+                    self._wake.wait(self.poll_interval)
+                    self._wake.clear()
+                    events = self._scan_changes()
+            except Exception:
+                logger.exception("File watch iteration failed")
+                self._stop.wait(self.poll_interval)
+                continue
+            if events and not self._stop.is_set():
+                self._dispatch(events)
+
+    def _arm(self, directory: Path) -> bool:
+        """Add the inotify watch for ``directory``. Caller holds ``_lock``."""
+        from spellbook.core.inotify import (
+            IN_CLOSE_WRITE, IN_CREATE, IN_DELETE_SELF, IN_MODIFY,
+            IN_MOVE_SELF, IN_MOVED_TO, IN_ONLYDIR,
+        )
+
+        try:
+            wd = self._notifier.add_watch(
+                directory,
+                IN_MODIFY | IN_CLOSE_WRITE | IN_CREATE | IN_MOVED_TO
+                | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR,
+            )
+        except OSError:
+            return False
+        self._unarmed.pop(directory, None)
+        self._wd_dirs[wd] = directory
+        self._dir_wds[directory] = wd
+        return True
+
+    def _wait_inotify(self) -> list[tuple[Path, FileEvent]]:
+        from spellbook.core.inotify import (
+            IN_CREATE, IN_DELETE_SELF, IN_IGNORED, IN_MOVE_SELF, IN_MOVED_TO,
+            IN_Q_OVERFLOW,
+        )
+
+        out: list[tuple[Path, FileEvent]] = []
+        with self._lock:
+            for directory, missed in list(self._unarmed.items()):
+                if not self._arm(directory):
+                    self._unarmed[directory] = True
+                elif missed:
+                    out.append((directory, FileEvent(RESCAN, directory)))
+            timeout = self.poll_interval if self._unarmed else None
+        if out:
+            return out
+
+        for ev in self._notifier.wait(timeout):
+            if ev.mask & IN_Q_OVERFLOW:
+                with self._lock:
+                    dirs = list(self._subs)
+                out.extend((d, FileEvent(RESCAN, d)) for d in dirs)
+                continue
+            with self._lock:
+                directory = self._wd_dirs.get(ev.wd)
+                if directory is None:
+                    continue
+                if ev.mask & (IN_IGNORED | IN_DELETE_SELF | IN_MOVE_SELF):
+                    # Directory gone: re-arm (and RESCAN) once it is back.
+                    self._wd_dirs.pop(ev.wd, None)
+                    if self._dir_wds.get(directory) == ev.wd:
+                        del self._dir_wds[directory]
+                        if directory in self._subs:
+                            self._unarmed[directory] = True
+                    continue
+            if not ev.name:
+                continue
+            kind = CREATED if ev.mask & (IN_CREATE | IN_MOVED_TO) else MODIFIED
+            out.append((directory, FileEvent(kind, directory / ev.name)))
+        return out
+
+    def _scan_changes(self) -> list[tuple[Path, FileEvent]]:
+        out: list[tuple[Path, FileEvent]] = []
+        with self._lock:
+            dirs = list(self._subs)
+        for directory in dirs:
+            current = _scan(directory)
+            with self._lock:
+                if directory not in self._subs:
+                    continue
+                previous = self._snapshots.get(directory, {})
+                self._snapshots[directory] = current
+            for name, sig in current.items():
+                old = previous.get(name)
+                if old is None or old[0] != sig[0]:
+                    out.append((directory, FileEvent(CREATED, directory / name)))
+                elif old != sig:
+                    out.append((directory, FileEvent(MODIFIED, directory / name)))
+        return out
+
+    def _dispatch(self, events: list[tuple[Path, FileEvent]]) -> None:
+        seen: set[FileEvent] = set()
+        for directory, event in events:
+            if event in seen:
+                continue
+            seen.add(event)
+            with self._lock:
+                subs = list(self._subs.get(directory, ()))
+            for sub in subs:
+                if event.kind != RESCAN and not sub.matches(event.path.name):
+                    continue
+                try:
+                    sub.callback(event)
+                except Exception:
+                    logger.exception(f"File watch callback failed for {event.path}")
+
+
+def _scan(directory: Path) -> dict[str, tuple[int, int, int]]:
+    """Stat every regular file in ``directory`` (empty if it is missing)."""
+    out: dict[str, tuple[int, int, int]] = {}
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    if entry.is_file():
+                        st = entry.stat()
+                        out[entry.name] = (st.st_ino, st.st_size, st.st_mtime_ns)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return out
+
+
+_service: Optional[FileWatchService] = None
+_service_lock = threading.Lock()
+
+
+def get_file_watch_service(
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+) -> FileWatchService:
+    """Return the process-wide service, starting it on first use.
+
+    ``poll_interval`` only applies to the call that creates the service.
+    """
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = FileWatchService(poll_interval)
+        if not _service.is_running():
+            _service.start()
+        return _service
+
+
+def stop_file_watch_service() -> None:
+    """Stop the process-wide service, if one was started."""
+    global _service
+    with _service_lock:
+        service, _service = _service, None
+    if service is not None:
+        service.stop()
@@ -0,0 +1,240 @@
+"""Shared, stat-validated cache of per-worktree git state.
+
+``detect_git_context``, ``resolve_repo_root`` and ``get_current_branch``
+used to spawn two to four ``git`` subprocesses on every call, and the MCP
+server resolves the project directory (and so the repo root) on every
+tool call. This service answers the same questions from the files git
+itself keeps: ``HEAD`` names the branch, ``commondir`` in a linked
+worktree's git dir leads back to the main repository, and the branch is
+born once its loose ref or a ``packed-refs`` line exists.
+
+Results are cached per working tree, keyed by its ``.git`` entry, and
+revalidated on every lookup by re-stating the files they were read from:
+``.git``, ``HEAD``, the common dir's ``packed-refs`` and ``worktrees/``,
+and the current branch's loose ref. A checkout, commit on an unborn
+branch, ``git pack-refs`` or ``git worktree add``/``prune`` changes one of
+those stats, so the next lookup re-reads the files; otherwise a lookup is
+a handful of ``stat`` calls.
+
+Only layouts whose meaning is unambiguous from the filesystem are
+answered: a ``.git`` directory, or a ``.git`` file pointing at a linked
+worktree of a repository whose common dir is ``<main worktree>/.git``.
+For anything else (no ``.git`` found, bare repositories,
+``--separate-git-dir``, reftable ref storage, unusual ``HEAD`` contents)
+``lookup`` returns ``None`` and callers fall back to running ``git``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKTREES = 256
+
+_HEX = frozenset("0123456789abcdef")
+
+
+@dataclass
+class GitState:
+    """Git state of one working tree, as of the last validated lookup.
+
+    Attributes:
+        toplevel: Root of the working tree (``git rev-parse --show-toplevel``).
+        main_worktree: Root of the repository's main working tree (the
+            first entry of ``git worktree list``).
+        branch: Checked-out branch, or ``None`` when HEAD is detached or
+            the branch has no commits yet.
+        detached_sha: Full commit id when HEAD is detached, else ``None``.
+        memo: Scratch space for values derived from this state (e.g. an
+            abbreviated commit id that needed ``git`` to compute). Dropped
+            with the state when any watched file changes.
+    """
+
+    toplevel: str
+    main_worktree: str
+    branch: Optional[str]
+    detached_sha: Optional[str]
+    memo: dict = field(default_factory=dict, compare=False, repr=False)
+
+
+@dataclass
+class _Entry:
+    watched: tuple[str, ...]
+    signature: tuple
+    state: GitState
+
+
+def _stat_key(path: str) -> Optional[tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read().strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _find_dot_git(path: str) -> Optional[str]:
+    """Walk up from ``path`` to the nearest ``.git`` entry, like git does."""
+    current = path
+    while True:
+        candidate = os.path.join(current, ".git")
+        if os.path.lexists(candidate):
+            return candidate
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def _packed_ref_exists(common_dir: str, ref: str) -> bool:
+    try:
+        with open(os.path.join(common_dir, "packed-refs"), encoding="utf-8") as f:
+            for line in f:
+                if line.rstrip("\n").endswith(" " + ref):
+                    return True
+    except (OSError, UnicodeDecodeError):
+        pass
+    return False
+
+
+def _read_state(dot_git: str) -> Optional[tuple[tuple[str, ...], GitState]]:
+    """Read the state behind ``dot_git``; ``None`` if the layout is not understood.
+
+    Returns the paths whose stats validate the result along with it.
+    """
+    if os.path.isdir(dot_git):
+        git_dir = common_dir = dot_git
+    else:
+        pointer = _read(dot_git)
+        if pointer is None or not pointer.startswith("gitdir:"):
+            return None
+        git_dir = os.path.realpath(
+            os.path.join(os.path.dirname(dot_git), pointer[len("gitdir:"):].strip())
+        )
+        common = _read(os.path.join(git_dir, "commondir"))
+        if common is None:
+            # A .git file without commondir is --separate-git-dir
+            return None
+        common_dir = os.path.realpath(os.path.join(git_dir, common))
+    if os.path.basename(common_dir) != ".git":
+        return None
+
+    head = _read(os.path.join(git_dir, "HEAD"))
+    if head is None:
+        return None
+    watched = [
+        dot_git,
+        os.path.join(git_dir, "HEAD"),
+        os.path.join(common_dir, "packed-refs"),
+        os.path.join(common_dir, "worktrees"),
+    ]
+    branch = detached_sha = None
+    if head.startswith("ref: refs/heads/"):
+        name = head[len("ref: refs/heads/"):]
+        if not name or name == ".invalid":
+            # reftable stores the real HEAD elsewhere
+            return None
+        loose = os.path.join(common_dir, "refs", "heads", name)
+        watched.append(loose)
+        if os.path.isfile(loose) or _packed_ref_exists(common_dir, "refs/heads/" + name):
+            branch = name
+    elif len(head) in (40, 64) and set(head) <= _HEX:
+        detached_sha = head
+    else:
+        return None
+
+    state = GitState(
+        toplevel=os.path.dirname(dot_git),
+        main_worktree=os.path.dirname(common_dir),
+        branch=branch,
+        detached_sha=detached_sha,
+    )
+    return tuple(watched), state
+
+
+class GitContextService:
+    """Per-process cache of :class:`GitState`, revalidated by ``stat``.
+
+    Args:
+        max_worktrees: Working trees kept before the least recently used
+            one is evicted.
+    """
+
+    def __init__(self, max_worktrees: int = DEFAULT_MAX_WORKTREES) -> None:
+        self._max = max_worktrees
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, path: str) -> Optional[GitState]:
+        """Return the git state of the working tree containing ``path``.
+
+        Returns ``None`` when ``path`` is not an existing directory inside
+        a working tree whose layout this service understands; the caller
+        should ask ``git`` instead.
+        """
+        try:
+            path = os.path.realpath(path)
+        except OSError:
+            return None
+        if not os.path.isdir(path):
+            return None
+        dot_git = _find_dot_git(path)
+        if dot_git is None:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(dot_git)
+            if entry is not None:
+                self._entries.move_to_end(dot_git)
+        if entry is not None:
+            if tuple(_stat_key(p) for p in entry.watched) == entry.signature:
+                return entry.state
+
+        read = _read_state(dot_git)
+        if read is None:
+            with self._lock:
+                self._entries.pop(dot_git, None)
+            return None
+        watched, state = read
+        signature = tuple(_stat_key(p) for p in watched)
+        # A write between the read and the stats would pair old contents
+        # with new stats; read again and only cache when both reads agree.
+        if _read_state(dot_git) != read:
+            return state
+        with self._lock:
+            self._entries[dot_git] = _Entry(watched, signature, state)
+            self._entries.move_to_end(dot_git)
+            while len(self._entries) > self._max:
+                self._entries.popitem(last=False)
+        return state
+
+    def clear(self) -> None:
+        """Forget every cached working tree."""
+        with self._lock:
+            self._entries.clear()
+
+
+_service: Optional[GitContextService] = None
+_service_lock = threading.Lock()
+
+
+def get_git_context_service() -> GitContextService:
+    """Return the process-wide :class:`GitContextService`, creating it on first use."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = GitContextService()
+        return _service
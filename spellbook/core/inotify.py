@@ -0,0 +1,176 @@
+"""Minimal ctypes binding for Linux inotify.
+
+Stdlib only. Used by background watchers to sleep until a watched directory
+actually changes instead of waking on a fixed poll interval. Callers must
+check :func:`inotify_available` (or catch ``OSError`` from the constructor)
+and keep a polling fallback for macOS, Windows, and restricted sandboxes.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+from dataclasses import dataclass
+
+# Event masks (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0o2000000)
+
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+_libc = None
+
+
+def _load_libc():
+    global _libc
+    if _libc is None:
+        _libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        _libc.inotify_init1.argtypes = [ctypes.c_int]
+        _libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        _libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    return _libc
+
+
+def inotify_available() -> bool:
+    """Return True when this platform's libc exposes inotify."""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        return hasattr(_load_libc(), "inotify_init1")
+    except OSError:
+        return False
+
+
+@dataclass(frozen=True)
+class InotifyEvent:
+    """One decoded ``struct inotify_event``."""
+
+    wd: int
+    mask: int
+    cookie: int
+    name: str
+
+
+class Inotify:
+    """An inotify instance plus a self-pipe so :meth:`wait` can be interrupted.
+
+    Raises:
+        OSError: inotify is unavailable or the per-user instance limit is hit.
+    """
+
+    def __init__(self) -> None:
+        if not inotify_available():
+            raise OSError(errno.ENOSYS, "inotify is not available on this platform")
+        libc = _load_libc()
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._fd = fd
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._poller = select.poll()
+        self._poller.register(self._fd, select.POLLIN)
+        self._poller.register(self._wake_r, select.POLLIN)
+        self._closed = False
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def add_watch(self, path: str | os.PathLike, mask: int) -> int:
+        """Watch ``path`` for ``mask`` events; returns the watch descriptor."""
+        wd = _load_libc().inotify_add_watch(self._fd, os.fsencode(path), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), str(path))
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        """Remove a watch. Already-removed watches are ignored."""
+        _load_libc().inotify_rm_watch(self._fd, wd)
+
+    def wait(self, timeout: float | None) -> list[InotifyEvent]:
+        """Block until events arrive, :meth:`wake` is called, or ``timeout``.
+
+        Returns the (possibly empty) list of pending events. Never raises for
+        an interrupted or closed instance; it just returns ``[]``.
+        """
+        if self._closed:
+            return []
+        ms = None if timeout is None else max(0, int(timeout * 1000))
+        try:
+            ready = self._poller.poll(ms)
+        except (OSError, ValueError):
+            return []
+        for fd, _ in ready:
+            if fd == self._wake_r:
+                self._drain_wake_pipe()
+        return self.read_events()
+
+    def read_events(self) -> list[InotifyEvent]:
+        """Decode every event currently queued (non-blocking)."""
+        events: list[InotifyEvent] = []
+        while not self._closed:
+            try:
+                buf = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            except OSError:
+                break
+            if not buf:
+                break
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(buf):
+                wd, mask, cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                raw_name = buf[offset:offset + length].rstrip(b"\0")
+                offset += length
+                events.append(InotifyEvent(wd, mask, cookie, os.fsdecode(raw_name)))
+        return events
+
+    def wake(self) -> None:
+        """Make a concurrent or the next :meth:`wait` return immediately."""
+        if self._closed:
+            return
+        try:
+            os.write(self._wake_w, b"\0")
+        except (BlockingIOError, OSError):
+            pass
+
+    def _drain_wake_pipe(self) -> None:
+        try:
+            while os.read(self._wake_r, 4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
@@ -8,6 +8,8 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 from urllib.parse import urlparse
 
+from spellbook.core.git_context import get_git_context_service
+
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
@@ -26,8 +28,10 @@ class GitContext:
 def detect_git_context(project_path: str, timeout: float = 5.0) -> GitContext:
     """Detect git branch and worktree context for alias derivation.
 
-    Uses subprocess calls with timeout to extract git state.
-    Returns GitContext with all-None fields on any failure.
+    Reads git's own files through the shared git context service and only
+    runs git (subprocess calls with timeout) for detached HEADs and for
+    layouts the service cannot read. Returns GitContext with all-None
+    fields on any failure.
 
     Args:
         project_path: Absolute path to the project directory.
@@ -37,6 +41,48 @@ def detect_git_context(project_path: str, timeout: float = 5.0) -> GitContext:
         GitContext with branch/worktree info. All fields may be None
         if git is unavailable or the path is not a git repo.
     """
+    state = get_git_context_service().lookup(project_path)
+    if state is None:
+        return _detect_git_context_subprocess(project_path, timeout)
+
+    branch = state.branch
+    if state.detached_sha is not None:
+        branch = state.memo.get("short_head")
+        if branch is None:
+            branch = _short_head(project_path, timeout)
+            if branch not in (None, "head"):
+                state.memo["short_head"] = branch
+
+    worktree_name: Optional[str] = None
+    is_worktree = os.path.normpath(project_path) != state.main_worktree
+    if is_worktree:
+        worktree_name = os.path.basename(os.path.normpath(project_path))
+
+    return GitContext(
+        branch=branch,
+        worktree_name=worktree_name,
+        is_worktree=is_worktree,
+        repo_root=state.main_worktree,
+    )
+
+
+def _short_head(project_path: str, timeout: float) -> Optional[str]:
+    """Abbreviated HEAD commit id from ``git rev-parse --short HEAD``."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=project_path,
+            capture_output=True, text=True, timeout=timeout,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return "head"
+    if result.returncode == 0:
+        return result.stdout.strip()
+    return None
+
+
+def _detect_git_context_subprocess(project_path: str, timeout: float) -> GitContext:
+    """detect_git_context by running git, for paths the service cannot read."""
     branch: Optional[str] = None
     worktree_name: Optional[str] = None
     is_worktree = False
@@ -52,16 +98,7 @@ def detect_git_context(project_path: str, timeout: float = 5.0) -> GitContext:
             raw_branch = result.stdout.strip()
             if raw_branch == "HEAD":
                 # Detached HEAD: use short commit hash instead
-                try:
-                    hash_result = subprocess.run(
-                        ["git", "rev-parse", "--short", "HEAD"],
-                        cwd=project_path,
-                        capture_output=True, text=True, timeout=timeout,
-                    )
-                    if hash_result.returncode == 0:
-                        branch = hash_result.stdout.strip()
-                except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-                    branch = "head"
+                branch = _short_head(project_path, timeout)
             else:
                 branch = raw_branch
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
@@ -128,6 +165,10 @@ def resolve_repo_root(path: str) -> str:
     Returns:
         Absolute path to the git repository root, or the input path.
     """
+    state = get_git_context_service().lookup(path)
+    if state is not None:
+        return state.main_worktree
+
     try:
         # git worktree list --porcelain gives the main worktree first
         result = subprocess.run(
@@ -0,0 +1,85 @@
+"""Per-run environment and working directory for code shared with the hook.
+
+A standalone hook process reads ``os.environ`` and resolves relative paths
+against its own working directory. When the daemon's warm dispatcher
+(``spellbook.hooks.dispatcher``) runs the same event, both belong to the
+daemon, not to the hook shim that submitted it: a session-scoped
+``SPELLBOOK_BASH_DENY_COMPOUND=1`` or a relative redirect target would be
+judged against the wrong process. The dispatcher therefore binds the shim's
+environment and cwd here for the duration of the request, and gate code
+reads them through :func:`getenv`, :func:`getcwd` and :func:`resolve_path`.
+
+Bindings are thread-local (the dispatcher serves each request on its own
+thread). With nothing bound every accessor falls through to the process
+itself, so cold hook runs and the MCP server behave exactly as before.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+_local = threading.local()
+
+
+@contextmanager
+def bind(env: Mapping[str, str], cwd: Optional[str] = None) -> Iterator[None]:
+    """Use ``env`` and ``cwd`` for this thread's reads until the block exits.
+
+    Args:
+        env: Complete environment of the run (replaces, not overlays,
+            ``os.environ``).
+        cwd: Working directory of the run; ``None`` keeps the process cwd.
+    """
+    previous = (getattr(_local, "env", None), getattr(_local, "cwd", None))
+    _local.env = env
+    _local.cwd = cwd
+    try:
+        yield
+    finally:
+        _local.env, _local.cwd = previous
+
+
+def getenv(key: str, default: Optional[str] = None) -> Optional[str]:
+    """Read an environment variable from the active run's environment."""
+    env = getattr(_local, "env", None)
+    if env is None:
+        return os.environ.get(key, default)
+    return env.get(key, default)
+
+
+def getcwd() -> str:
+    """Return the active run's working directory."""
+    return getattr(_local, "cwd", None) or os.getcwd()
+
+
+def expanduser(path: str) -> str:
+    """``os.path.expanduser`` using the active run's ``HOME``."""
+    env = getattr(_local, "env", None)
+    if env is not None and (path == "~" or path.startswith("~/")):
+        home = env.get("HOME")
+        if home:
+            return (home.rstrip("/") + path[1:]) or "/"
+    return os.path.expanduser(path)
+
+
+def home() -> Path:
+    """Return the active run's home directory."""
+    if getattr(_local, "env", None) is None:
+        return Path.home()
+    return Path(expanduser("~"))
+
+
+def resolve_path(path: str) -> Path:
+    """Expand ``~``, anchor relative paths at :func:`getcwd`, then resolve.
+
+    Equivalent to ``Path(path).expanduser().resolve(strict=False)`` in the
+    run's own process.
+    """
+    if getattr(_local, "env", None) is None and getattr(_local, "cwd", None) is None:
+        return Path(path).expanduser().resolve(strict=False)
+    return (Path(getcwd()) / expanduser(path)).resolve(strict=False)
@@ -3,6 +3,10 @@
 Public API:
 - get_spellbook_session(), get_fractal_session(), get_forged_session(),
   get_coordination_session(): async context managers for database sessions.
+- get_spellbook_read_session() and friends: read-only variants served by
+  the reader pools once the daemon has called enable_pooling().
+- enable_pooling(), disable_pooling(), pool_stats(): daemon connection
+  pooling lifecycle and metrics.
 - spellbook_db(), fractal_db(), forged_db(), coordination_db():
   FastAPI dependency functions for route injection.
 - Engine and session factory objects for direct access.
@@ -14,16 +18,23 @@ from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from spellbook.db.engines import (
+    CoordinationReadSession,
     CoordinationSession,
+    ForgedReadSession,
     ForgedSession,
+    FractalReadSession,
     FractalSession,
+    SpellbookReadSession,
     SpellbookSession,
     coordination_engine,
+    disable_pooling,
     dispose_sync_engines,
+    enable_pooling,
     forged_engine,
     fractal_engine,
     get_spellbook_sync_session,
     get_sync_session,
+    pool_stats,
     spellbook_engine,
 )
 
@@ -76,6 +87,34 @@ async def get_coordination_session() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+@asynccontextmanager
+async def get_spellbook_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Async context manager for read-only spellbook.db sessions."""
+    async with SpellbookReadSession() as session:
+        yield session
+
+
+@asynccontextmanager
+async def get_fractal_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Async context manager for read-only fractal.db sessions."""
+    async with FractalReadSession() as session:
+        yield session
+
+
+@asynccontextmanager
+async def get_forged_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Async context manager for read-only forged.db sessions."""
+    async with ForgedReadSession() as session:
+        yield session
+
+
+@asynccontextmanager
+async def get_coordination_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Async context manager for read-only coordination.db sessions."""
+    async with CoordinationReadSession() as session:
+        yield session
+
+
 # FastAPI dependency functions
 async def spellbook_db() -> AsyncGenerator[AsyncSession, None]:
     """FastAPI dependency: yields a spellbook.db session."""
@@ -103,6 +142,7 @@ async def coordination_db() -> AsyncGenerator[AsyncSession, None]:
 
 async def dispose_all_engines() -> None:
     """Dispose all database engines on shutdown."""
+    await disable_pooling()
     await spellbook_engine.dispose()
     await fractal_engine.dispose()
     await forged_engine.dispose()
@@ -114,6 +154,10 @@ __all__ = [
     "get_fractal_session",
     "get_forged_session",
     "get_coordination_session",
+    "get_spellbook_read_session",
+    "get_fractal_read_session",
+    "get_forged_read_session",
+    "get_coordination_read_session",
     "get_sync_session",
     "get_spellbook_sync_session",
     "dispose_sync_engines",
@@ -122,6 +166,9 @@ __all__ = [
     "forged_db",
     "coordination_db",
     "dispose_all_engines",
+    "enable_pooling",
+    "disable_pooling",
+    "pool_stats",
     "spellbook_engine",
     "fractal_engine",
     "forged_engine",
@@ -130,4 +177,8 @@ __all__ = [
     "FractalSession",
     "ForgedSession",
     "CoordinationSession",
+    "SpellbookReadSession",
+    "FractalReadSession",
+    "ForgedReadSession",
+    "CoordinationReadSession",
 ]
@@ -5,6 +5,15 @@ pooled connections, appropriate for SQLite) and a 5-second busy timeout
 to mitigate "database is locked" contention under concurrent writes.
 WAL mode and recommended PRAGMAs are applied on each new connection.
 
+NullPool is the right default for short-lived processes (CLI, hooks):
+every aiosqlite connection owns a non-daemon thread, so an idle pooled
+connection would keep the interpreter from exiting. The long-lived daemon
+calls ``enable_pooling()`` at startup and ``disable_pooling()`` on
+shutdown; in between, each database is served by a writer pool (one warm
+connection, short-lived overflow for bursts) behind the ``*Session``
+factories and a ``query_only`` reader pool behind the ``*ReadSession``
+factories. ``pool_stats()`` reports occupancy and checkout counters.
+
 Sync engine support is provided for modules that cannot use async
 (security tools, CLI hooks, config). Use ``get_sync_session()`` for
 arbitrary database paths or ``get_spellbook_sync_session()`` for the
@@ -15,15 +24,16 @@ import os
 import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator
+from typing import Any, Generator
 
 from sqlalchemy import create_engine, event
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 DB_DIR = Path.home() / ".local" / "spellbook"
 DB_DIR.mkdir(parents=True, exist_ok=True)
@@ -82,6 +92,150 @@ FractalSession = async_sessionmaker(fractal_engine, expire_on_commit=False)
 ForgedSession = async_sessionmaker(forged_engine, expire_on_commit=False)
 CoordinationSession = async_sessionmaker(coordination_engine, expire_on_commit=False)
 
+# Read-only session factories. Until enable_pooling() runs they share the
+# NullPool engines above; afterwards they are bound to the reader pools.
+SpellbookReadSession = async_sessionmaker(spellbook_engine, expire_on_commit=False)
+FractalReadSession = async_sessionmaker(fractal_engine, expire_on_commit=False)
+ForgedReadSession = async_sessionmaker(forged_engine, expire_on_commit=False)
+CoordinationReadSession = async_sessionmaker(coordination_engine, expire_on_commit=False)
+
+# ---------------------------------------------------------------------------
+# Connection pooling for the long-lived daemon
+# ---------------------------------------------------------------------------
+
+#: Default number of persistent reader connections per database.
+READER_POOL_SIZE = 4
+
+#: Extra short-lived writer connections allowed beyond the warm one. SQLite
+#: serializes writers itself (busy_timeout), so bursts overflow instead of
+#: queueing, and a session opened while another is held on the same
+#: database cannot deadlock the pool.
+WRITER_MAX_OVERFLOW = 4
+
+#: Seconds before a pooled connection is replaced.
+POOL_RECYCLE_SECONDS = 1800
+
+# name -> (default engine, writer factory, reader factory)
+_DATABASES: dict[str, tuple[AsyncEngine, async_sessionmaker, async_sessionmaker]] = {
+    "spellbook.db": (spellbook_engine, SpellbookSession, SpellbookReadSession),
+    "fractal.db": (fractal_engine, FractalSession, FractalReadSession),
+    "forged.db": (forged_engine, ForgedSession, ForgedReadSession),
+    "coordination.db": (coordination_engine, CoordinationSession, CoordinationReadSession),
+}
+
+# name -> {"writer": engine, "reader": engine} while pooling is enabled
+_pooled_engines: dict[str, dict[str, AsyncEngine]] = {}
+# id(pool) -> event counters, populated by _track_pool listeners
+_pool_counters: dict[int, dict[str, int]] = {}
+_pooling_lock = threading.Lock()
+
+
+def _setup_reader_pragmas(dbapi_conn, connection_record):
+    """Apply the shared PRAGMAs, then refuse writes on this connection."""
+    _setup_pragmas(dbapi_conn, connection_record)
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA query_only=ON")
+    cursor.close()
+
+
+def _track_pool(engine: AsyncEngine) -> None:
+    """Count connects, checkouts and invalidations on ``engine``'s pool."""
+    counters = {"connects": 0, "checkouts": 0, "invalidations": 0}
+    _pool_counters[id(engine.sync_engine.pool)] = counters
+
+    def _on(name: str):
+        def _bump(*_args: Any) -> None:
+            counters[name] += 1
+
+        return _bump
+
+    event.listen(engine.sync_engine, "connect", _on("connects"))
+    event.listen(engine.sync_engine, "checkout", _on("checkouts"))
+    event.listen(engine.sync_engine, "invalidate", _on("invalidations"))
+
+
+def _pooled_engine(name: str, *, pool_size: int, max_overflow: int, reader: bool) -> AsyncEngine:
+    """Build a pooled engine for ``name`` with pre-ping health checks."""
+    engine = create_async_engine(
+        _sqlite_url(name),
+        connect_args={"timeout": 5},
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_pre_ping=True,
+        pool_recycle=POOL_RECYCLE_SECONDS,
+    )
+    event.listen(
+        engine.sync_engine,
+        "connect",
+        _setup_reader_pragmas if reader else _setup_pragmas,
+    )
+    _track_pool(engine)
+    return engine
+
+
+def enable_pooling(reader_pool_size: int = READER_POOL_SIZE) -> None:
+    """Rebind the session factories to pooled engines. Idempotent.
+
+    Only the daemon should call this, from inside its event loop, and it
+    must pair it with ``disable_pooling()`` before the loop stops so no
+    idle aiosqlite thread outlives the process.
+    """
+    with _pooling_lock:
+        if _pooled_engines:
+            return
+        for name, (_engine, factory, read_factory) in _DATABASES.items():
+            writer = _pooled_engine(
+                name, pool_size=1, max_overflow=WRITER_MAX_OVERFLOW, reader=False
+            )
+            reader = _pooled_engine(
+                name, pool_size=reader_pool_size, max_overflow=0, reader=True
+            )
+            factory.configure(bind=writer)
+            read_factory.configure(bind=reader)
+            _pooled_engines[name] = {"writer": writer, "reader": reader}
+
+
+async def disable_pooling() -> None:
+    """Rebind the session factories to NullPool and close pooled connections."""
+    with _pooling_lock:
+        pooled = dict(_pooled_engines)
+        _pooled_engines.clear()
+        for name, (engine, factory, read_factory) in _DATABASES.items():
+            factory.configure(bind=engine)
+            read_factory.configure(bind=engine)
+    for engines in pooled.values():
+        for engine in engines.values():
+            _pool_counters.pop(id(engine.sync_engine.pool), None)
+            await engine.dispose()
+
+
+def pool_stats() -> dict[str, dict[str, Any]]:
+    """Return per-database pool occupancy and counters.
+
+    Databases report ``{"pooled": False}`` while pooling is disabled.
+    """
+    with _pooling_lock:
+        pooled = dict(_pooled_engines)
+    stats: dict[str, dict[str, Any]] = {}
+    for name in _DATABASES:
+        engines = pooled.get(name)
+        if engines is None:
+            stats[name] = {"pooled": False}
+            continue
+        entry: dict[str, Any] = {"pooled": True}
+        for role, engine in engines.items():
+            pool = engine.sync_engine.pool
+            entry[role] = {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(pool.overflow(), 0),
+                **_pool_counters.get(id(pool), {}),
+            }
+        stats[name] = entry
+    return stats
+
 # ---------------------------------------------------------------------------
 # Sync engine support for synchronous callers (security tools, CLI, config)
 # ---------------------------------------------------------------------------
@@ -1,7 +1,7 @@
 """SQLAlchemy ORM models for fractal.db tables.
 
 Maps to the schema defined in spellbook/fractal/schema.py:init_fractal_schema().
-Tables: graphs, nodes, edges.
+Tables: graphs, nodes, edges, convergence_clusters, node_closure.
 """
 
 import json
@@ -9,6 +9,7 @@ import json
 from sqlalchemy import (
     Column,
     ForeignKey,
+    Index,
     Integer,
     Text,
     UniqueConstraint,
@@ -133,3 +134,58 @@ class FractalEdge(FractalBase):
             "metadata": _parse_metadata(self.metadata_json),
             "created_at": self.created_at,
         }
+
+
+class FractalConvergenceMember(FractalBase):
+    """A node's membership in a convergence cluster.
+
+    Materialized connected components of the convergence edges, kept
+    up to date by ``update_node``. ``cluster_id`` is the ID of one member
+    node and only identifies the cluster; it carries no other meaning.
+    """
+
+    __tablename__ = "convergence_clusters"
+
+    node_id = Column(Text, ForeignKey("nodes.id", ondelete="CASCADE"), primary_key=True)
+    graph_id = Column(Text, ForeignKey("graphs.id", ondelete="CASCADE"), nullable=False)
+    cluster_id = Column(Text, nullable=False)
+
+    __table_args__ = (
+        Index("idx_convergence_clusters_graph_cluster", "graph_id", "cluster_id"),
+    )
+
+    def to_dict(self) -> dict:
+        return {
+            "node_id": self.node_id,
+            "graph_id": self.graph_id,
+            "cluster_id": self.cluster_id,
+        }
+
+
+class FractalNodeClosure(FractalBase):
+    """One ancestor/descendant pair of the node tree (a closure table).
+
+    Every node has a row pairing it with itself (``distance`` 0) and one
+    per ancestor, ``distance`` being the number of parent links between
+    them. Written by ``create_graph`` and ``add_node`` so subtree queries
+    are a single indexed lookup instead of a recursive walk.
+    """
+
+    __tablename__ = "node_closure"
+
+    ancestor_id = Column(Text, ForeignKey("nodes.id", ondelete="CASCADE"), primary_key=True)
+    descendant_id = Column(Text, ForeignKey("nodes.id", ondelete="CASCADE"), primary_key=True)
+    graph_id = Column(Text, ForeignKey("graphs.id", ondelete="CASCADE"), nullable=False)
+    distance = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("idx_node_closure_descendant", "descendant_id"),
+    )
+
+    def to_dict(self) -> dict:
+        return {
+            "ancestor_id": self.ancestor_id,
+            "descendant_id": self.descendant_id,
+            "graph_id": self.graph_id,
+            "distance": self.distance,
+        }
@@ -0,0 +1,238 @@
+"""Single-writer batched ingestion for high-rate observability rows.
+
+``record_hook_event`` and ``record_call`` fire on every hook invocation and
+every worker-LLM call. Committing each row in its own transaction makes
+every event contend for the SQLite writer lock. Inside the daemon those
+rows are handed to one :class:`BatchWriter` thread instead, which
+coalesces them into multi-row INSERTs, one transaction per flush.
+
+A flush happens when ``max_batch`` rows are pending or ``flush_interval``
+seconds after the first pending row, whichever comes first. The queue is
+bounded: when it is full, new rows are dropped and counted instead of
+blocking the caller (observability must never stall a hook or an LLM
+call). ``stop()`` drains everything still queued before returning; the
+daemon calls it from its lifespan shutdown and again from the ``atexit``
+shutdown hook.
+
+Outside the daemon no writer is running, :func:`enqueue` returns False and
+callers keep their direct one-row write.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, ContextManager
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+log = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], ContextManager[Session]]
+
+DEFAULT_MAX_BATCH: int = 200
+DEFAULT_FLUSH_INTERVAL: float = 0.5
+DEFAULT_MAX_QUEUE: int = 10_000
+
+_STOP = object()
+
+
+class BatchWriter:
+    """Drain queued rows on one thread into batched INSERTs.
+
+    Rows are grouped by ``(session_factory, model)``: each group becomes one
+    ``INSERT ... VALUES (...), (...)`` statement, and each session factory
+    (i.e. each target database) gets its own transaction per flush.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+    ) -> None:
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._flush_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "enqueued": 0,
+            "written": 0,
+            "dropped": 0,
+            "failed": 0,
+            "batches": 0,
+        }
+
+    # -- producer side -----------------------------------------------------
+
+    def submit(self, session_factory: SessionFactory, model: type, row: dict) -> bool:
+        """Queue one row. Never blocks; a full queue drops the row.
+
+        Returns False only once the writer is stopping, so the caller can
+        write the row itself rather than lose it.
+        """
+        if self._closed:
+            return False
+        try:
+            self._queue.put_nowait((session_factory, model, row))
+        except queue.Full:
+            self._bump("dropped")
+            if self._stats["dropped"] == 1:
+                log.warning(
+                    "ingest queue full (%d rows); dropping rows until it drains",
+                    self._queue.maxsize,
+                )
+            return True
+        self._bump("enqueued")
+        return True
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def start(self) -> "BatchWriter":
+        """Start the writer thread."""
+        self._thread = threading.Thread(
+            target=self._run, name="spellbook-ingest-writer", daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the writer thread and flush every row still queued."""
+        self._closed = True
+        thread = self._thread
+        self._thread = None
+        if thread is not None and thread.is_alive():
+            # Blocking put: the sentinel must land even if the queue is full.
+            self._queue.put(_STOP)
+            thread.join(timeout)
+        # Whatever the thread did not get to (it died, or timed out) is
+        # written here on the caller's thread.
+        self._write(self._drain())
+
+    def stats(self) -> dict[str, Any]:
+        """Return counters plus the current queue depth."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["queued"] = self._queue.qsize()
+        stats["running"] = self._thread is not None and self._thread.is_alive()
+        return stats
+
+    # -- writer side -------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            stopping = False
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._write(batch)
+            if stopping:
+                return
+
+    def _drain(self) -> list:
+        items = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return items
+            if item is not _STOP:
+                items.append(item)
+
+    def _write(self, batch: list) -> None:
+        if not batch:
+            return
+        groups: dict[SessionFactory, dict[type, list[dict]]] = {}
+        for session_factory, model, row in batch:
+            groups.setdefault(session_factory, {}).setdefault(model, []).append(row)
+        with self._flush_lock:
+            for session_factory, by_model in groups.items():
+                count = sum(len(rows) for rows in by_model.values())
+                try:
+                    with session_factory() as session:
+                        for model, rows in by_model.items():
+                            session.execute(insert(model), rows)
+                except Exception as exc:
+                    self._bump("failed", count)
+                    if self._stats["failed"] == count:
+                        log.warning(
+                            "ingest batch of %d rows failed: %s: %s. "
+                            "Further failures will be logged at DEBUG.",
+                            count,
+                            type(exc).__name__,
+                            exc,
+                            exc_info=True,
+                        )
+                    else:
+                        log.debug("ingest batch failed", exc_info=True)
+                    continue
+                self._bump("written", count)
+                self._bump("batches")
+
+    def _bump(self, key: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += n
+
+
+_writer: BatchWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def start_ingestion(**kwargs: Any) -> BatchWriter:
+    """Start the process-wide writer (idempotent). Daemon only."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = BatchWriter(**kwargs).start()
+        return _writer
+
+
+def stop_ingestion(timeout: float = 5.0) -> None:
+    """Stop the process-wide writer, flushing queued rows. Idempotent."""
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.stop(timeout)
+
+
+def enqueue(session_factory: SessionFactory, model: type, row: dict) -> bool:
+    """Hand ``row`` to the daemon writer.
+
+    Returns True when the writer took ownership of the row (queued, or
+    dropped under backpressure), False when no writer is running and the
+    caller should write the row itself.
+    """
+    writer = _writer
+    if writer is None:
+        return False
+    return writer.submit(session_factory, model, row)
+
+
+def ingestion_stats() -> dict[str, Any]:
+    """Return the writer's counters, or ``{"running": False}``."""
+    writer = _writer
+    if writer is None:
+        return {"running": False}
+    return writer.stats()
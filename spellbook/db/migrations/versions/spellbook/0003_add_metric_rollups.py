@@ -0,0 +1,86 @@
+"""add metric rollups
+
+Revision ID: 0003_metric_rollups
+Revises: 0002_hook_events
+Create Date: 2026-10-16
+
+Per-minute and per-hour rollups of ``hook_events`` and
+``worker_llm_calls`` for the admin metrics endpoints. Mirrors the rollup
+models in ``spellbook.db.spellbook_models``: 4 tables keyed by
+(bucket_start, group columns, duration bucket), the ``AFTER INSERT``
+triggers that maintain them, and a backfill from the existing raw rows so
+the dashboards do not start empty after the upgrade.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from spellbook.db.rollups import (
+    backfill_rollups,
+    drop_rollup_triggers,
+    install_rollup_triggers,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_metric_rollups"
+down_revision: Union[str, None] = "0002_hook_events"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _hook_rollup(name: str) -> None:
+    op.create_table(
+        name,
+        sa.Column("bucket_start", sa.Text(), nullable=False),
+        sa.Column("hook_name", sa.Text(), nullable=False),
+        sa.Column("event_name", sa.Text(), nullable=False),
+        sa.Column("duration_bucket", sa.Integer(), nullable=False),
+        sa.Column("event_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("error_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("duration_sum", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("duration_min", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("duration_max", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint(
+            "bucket_start", "hook_name", "event_name", "duration_bucket",
+        ),
+    )
+
+
+def _worker_rollup(name: str) -> None:
+    op.create_table(
+        name,
+        sa.Column("bucket_start", sa.Text(), nullable=False),
+        sa.Column("task", sa.Text(), nullable=False),
+        sa.Column("status", sa.Text(), nullable=False),
+        sa.Column("error_key", sa.Text(), nullable=False),
+        sa.Column("latency_bucket", sa.Integer(), nullable=False),
+        sa.Column("call_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("latency_sum", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("latency_min", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("latency_max", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint(
+            "bucket_start", "task", "status", "error_key", "latency_bucket",
+        ),
+    )
+
+
+def upgrade() -> None:
+    _hook_rollup("hook_event_rollup_minute")
+    _hook_rollup("hook_event_rollup_hour")
+    _worker_rollup("worker_llm_call_rollup_minute")
+    _worker_rollup("worker_llm_call_rollup_hour")
+    # Backfill before the triggers exist so no row is counted twice; both
+    # run in the migration's transaction.
+    conn = op.get_bind()
+    backfill_rollups(conn)
+    install_rollup_triggers(conn)
+
+
+def downgrade() -> None:
+    drop_rollup_triggers(op.get_bind())
+    op.drop_table("worker_llm_call_rollup_hour")
+    op.drop_table("worker_llm_call_rollup_minute")
+    op.drop_table("hook_event_rollup_hour")
+    op.drop_table("hook_event_rollup_minute")
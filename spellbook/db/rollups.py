@@ -0,0 +1,274 @@
+"""Pre-aggregated per-minute / per-hour rollups for the observability tables.
+
+The admin metrics endpoints (``/api/hooks/metrics``,
+``/api/worker-llm/metrics``) used to fetch every ``hook_events`` /
+``worker_llm_calls`` row in the window and compute counts and percentiles
+in Python, so a 24h window over a busy daemon cost O(events). They now read
+rollup rows instead: one row per (time bucket, group, duration bucket),
+so a window costs O(buckets) regardless of traffic.
+
+Rollups are maintained at ingest time by SQLite ``AFTER INSERT`` triggers
+on the raw tables. A trigger catches every write path -- the batched
+writer in ``spellbook.db.ingest``, the one-row fallback, and ORM inserts
+in tests -- without each of them having to remember a second statement,
+and it runs inside the inserting transaction so the raw rows and the
+rollups cannot drift apart.
+
+Each rollup row carries a count plus the ``sum``/``min``/``max`` of the
+durations that landed in its fixed-width ``*_bucket`` (see
+``DURATION_BUCKETS_MS``). Percentiles are read back from the merged
+histogram with ``histogram_percentile`` in
+``spellbook.admin.routes.list_helpers``; within a bucket the value is
+interpolated between the observed min and max, so a bucket holding a
+single distinct value is exact.
+
+Bucket keys are prefixes of the ISO-8601 UTC ``timestamp`` column:
+``YYYY-MM-DDTHH:MM`` for minutes, ``YYYY-MM-DDTHH`` for hours. A window
+reads minute rows for its leading partial hour and hour rows after that
+(see ``window_rows``), so the window start is rounded down to the minute.
+
+This module deliberately does not import the ORM models (they import it
+to install the triggers from ``after_create``); callers pass tables in.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import Table, delete, select, union_all
+
+# Lower edges of the duration histogram buckets, in milliseconds. Roughly
+# logarithmic (1-1.25-1.5-2-2.5-3-4-5-6-8 steps per decade) so relative
+# resolution is ~20% from 10 ms up to 10 minutes; below 10 ms every
+# millisecond is its own bucket.
+DURATION_BUCKETS_MS: tuple[int, ...] = (
+    0, 1, 2, 3, 4, 5, 6, 8,
+    10, 12, 15, 20, 25, 30, 40, 50, 60, 80,
+    100, 120, 150, 200, 250, 300, 400, 500, 600, 800,
+    1000, 1200, 1500, 2000, 2500, 3000, 4000, 5000, 6000, 8000,
+    10000, 12000, 15000, 20000, 25000, 30000, 40000, 50000, 60000, 80000,
+    100000, 120000, 150000, 200000, 300000, 600000,
+)
+
+# (grain, length of the timestamp prefix used as bucket key)
+_GRAINS: tuple[tuple[str, int], ...] = (("minute", 16), ("hour", 13))
+
+_HOOK_RAW = "hook_events"
+_HOOK_ROLLUP = "hook_event_rollup"
+_WORKER_RAW = "worker_llm_calls"
+_WORKER_ROLLUP = "worker_llm_call_rollup"
+
+ROLLUP_TABLES: tuple[str, ...] = tuple(
+    f"{prefix}_{grain}"
+    for prefix in (_HOOK_ROLLUP, _WORKER_ROLLUP)
+    for grain, _ in _GRAINS
+)
+
+
+def bucket_sql(expr: str) -> str:
+    """SQL ``CASE`` mapping the integer ``expr`` to its bucket's lower edge."""
+    whens = " ".join(
+        f"WHEN {expr} >= {edge} THEN {edge}"
+        for edge in reversed(DURATION_BUCKETS_MS[1:])
+    )
+    return f"CASE {whens} ELSE 0 END"
+
+
+# Per-table shape: raw table, rollup prefix, key columns and their SQL
+# expressions over a raw row (``{r}`` is ``NEW.`` in the trigger body and
+# empty in the backfill), then the measured column and the counters.
+_SPECS = {
+    _HOOK_RAW: {
+        "rollup": _HOOK_ROLLUP,
+        "keys": (
+            ("hook_name", "{r}hook_name"),
+            ("event_name", "{r}event_name"),
+            ("duration_bucket", bucket_sql("{r}duration_ms")),
+        ),
+        "value": "{r}duration_ms",
+        "value_prefix": "duration",
+        "count": "event_count",
+        # Same definition as the route: nonzero exit OR a non-empty error.
+        "extra": (
+            (
+                "error_count",
+                "CASE WHEN {r}exit_code != 0 OR coalesce({r}error, '') != '' "
+                "THEN 1 ELSE 0 END",
+            ),
+        ),
+    },
+    _WORKER_RAW: {
+        "rollup": _WORKER_ROLLUP,
+        "keys": (
+            ("task", "{r}task"),
+            ("status", "{r}status"),
+            # ``error or status`` for failures, as in the error breakdown;
+            # '' (not NULL) for successes so it can sit in the primary key.
+            (
+                "error_key",
+                "CASE WHEN {r}status = 'success' THEN '' "
+                "ELSE coalesce(nullif({r}error, ''), {r}status) END",
+            ),
+            ("latency_bucket", bucket_sql("{r}latency_ms")),
+        ),
+        "value": "{r}latency_ms",
+        "value_prefix": "latency",
+        "count": "call_count",
+        "extra": (),
+    },
+}
+
+
+def _trigger_name(raw: str) -> str:
+    return f"{raw}_rollup_ai"
+
+
+def _columns(spec: dict) -> list[str]:
+    vp = spec["value_prefix"]
+    return (
+        ["bucket_start"]
+        + [name for name, _ in spec["keys"]]
+        + [spec["count"]]
+        + [name for name, _ in spec["extra"]]
+        + [f"{vp}_sum", f"{vp}_min", f"{vp}_max"]
+    )
+
+
+def _upsert_sql(spec: dict, grain: str, width: int) -> str:
+    r = "NEW."
+    vp = spec["value_prefix"]
+    value = spec["value"].format(r=r)
+    exprs = (
+        [f"substr({r}timestamp, 1, {width})"]
+        + [expr.format(r=r) for _, expr in spec["keys"]]
+        + ["1"]
+        + [expr.format(r=r) for _, expr in spec["extra"]]
+        + [value, value, value]
+    )
+    key_cols = ["bucket_start"] + [name for name, _ in spec["keys"]]
+    sums = [spec["count"]] + [name for name, _ in spec["extra"]] + [f"{vp}_sum"]
+    updates = (
+        [f"{c} = {c} + excluded.{c}" for c in sums]
+        + [
+            f"{vp}_min = min({vp}_min, excluded.{vp}_min)",
+            f"{vp}_max = max({vp}_max, excluded.{vp}_max)",
+        ]
+    )
+    return (
+        f"INSERT INTO {spec['rollup']}_{grain} ({', '.join(_columns(spec))}) "
+        f"VALUES ({', '.join(exprs)}) "
+        f"ON CONFLICT ({', '.join(key_cols)}) DO UPDATE SET {', '.join(updates)};"
+    )
+
+
+def _backfill_sql(raw: str, spec: dict, grain: str, width: int) -> str:
+    r = ""
+    value = spec["value"].format(r=r)
+    exprs = (
+        [f"substr(timestamp, 1, {width})"]
+        + [expr.format(r=r) for _, expr in spec["keys"]]
+        + ["count(*)"]
+        + [f"sum({expr.format(r=r)})" for _, expr in spec["extra"]]
+        + [f"sum({value})", f"min({value})", f"max({value})"]
+    )
+    group_by = ", ".join(str(i) for i in range(1, len(spec["keys"]) + 2))
+    return (
+        f"INSERT INTO {spec['rollup']}_{grain} ({', '.join(_columns(spec))}) "
+        f"SELECT {', '.join(exprs)} FROM {raw} GROUP BY {group_by}"
+    )
+
+
+def _existing_tables(conn) -> set[str]:
+    rows = conn.exec_driver_sql(
+        "SELECT name FROM sqlite_master WHERE type = 'table'"
+    ).fetchall()
+    return {row[0] for row in rows}
+
+
+def _ready(raw: str, spec: dict, tables: set[str]) -> bool:
+    return raw in tables and all(
+        f"{spec['rollup']}_{grain}" in tables for grain, _ in _GRAINS
+    )
+
+
+def install_rollup_triggers(conn) -> None:
+    """Create the rollup triggers for every raw table whose rollups exist.
+
+    Idempotent (``CREATE TRIGGER IF NOT EXISTS``) and a no-op on anything
+    but SQLite. Safe to call after any subset of the tables was created:
+    a trigger is only installed once its raw table and both rollup tables
+    are present.
+    """
+    if conn.dialect.name != "sqlite":
+        return
+    tables = _existing_tables(conn)
+    for raw, spec in _SPECS.items():
+        if not _ready(raw, spec, tables):
+            continue
+        body = "\n".join(_upsert_sql(spec, g, w) for g, w in _GRAINS)
+        conn.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS {_trigger_name(raw)} "
+            f"AFTER INSERT ON {raw} BEGIN\n{body}\nEND"
+        )
+
+
+def drop_rollup_triggers(conn) -> None:
+    """Drop the rollup triggers (migration downgrade)."""
+    for raw in _SPECS:
+        conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {_trigger_name(raw)}")
+
+
+def backfill_rollups(conn) -> None:
+    """Rebuild every rollup table from its raw table.
+
+    Run before the triggers exist (or in the same transaction that creates
+    them) so no row is counted twice.
+    """
+    tables = _existing_tables(conn)
+    for raw, spec in _SPECS.items():
+        if not _ready(raw, spec, tables):
+            continue
+        for grain, width in _GRAINS:
+            conn.exec_driver_sql(f"DELETE FROM {spec['rollup']}_{grain}")
+            conn.exec_driver_sql(_backfill_sql(raw, spec, grain, width))
+
+
+def window_keys(cutoff: str) -> tuple[str, str]:
+    """Bucket keys splitting a window that starts at ISO ``cutoff``.
+
+    Returns ``(first_minute, first_hour)``: the window is the minute rows
+    in ``[first_minute, first_hour:00)`` plus the hour rows from
+    ``first_hour`` on.
+    """
+    start = datetime.fromisoformat(cutoff)
+    next_hour = start.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    return cutoff[:16], next_hour.isoformat()[:13]
+
+
+def window_rows(minute: Table, hour: Table, cutoff: str, *columns: str):
+    """Subquery of the rollup rows covering the window starting at ``cutoff``.
+
+    Callers aggregate over the result (``sum`` the counters, ``min``/``max``
+    the extrema) grouped by whatever keys they need.
+    """
+    first_minute, first_hour = window_keys(cutoff)
+    return union_all(
+        select(*(minute.c[c] for c in columns)).where(
+            minute.c.bucket_start >= first_minute,
+            minute.c.bucket_start < f"{first_hour}:00",
+        ),
+        select(*(hour.c[c] for c in columns)).where(
+            hour.c.bucket_start >= first_hour,
+        ),
+    ).subquery()
+
+
+def purge_rollups(session, minute: Table, hour: Table, cutoff: str) -> None:
+    """Delete rollup rows whose whole bucket is older than ``cutoff``.
+
+    Only the time cap applies: rollups are a few rows per minute however
+    busy the daemon is, so the raw tables' row-count cap has nothing to
+    bound here.
+    """
+    session.execute(delete(minute).where(minute.c.bucket_start < cutoff[:16]))
+    session.execute(delete(hour).where(hour.c.bucket_start < cutoff[:13]))
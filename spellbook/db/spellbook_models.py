@@ -9,6 +9,7 @@ from typing import Optional
 
 from sqlalchemy import (
     CheckConstraint,
+    event,
     Float,
     ForeignKey,
     Index,
@@ -19,6 +20,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from spellbook.db.base import SpellbookBase
+from spellbook.db.rollups import install_rollup_triggers
 
 
 def _parse_json(value: Optional[str]):
@@ -490,3 +492,73 @@ class HookEvent(SpellbookBase):
         }
 
 
+
+
+# ---- 28-31. metric rollups ----
+#
+# Per-minute and per-hour aggregates of hook_events / worker_llm_calls,
+# maintained by AFTER INSERT triggers (see ``spellbook.db.rollups``). One
+# row per (bucket_start, group, duration bucket); the admin metrics routes
+# read these instead of the raw rows.
+
+class _HookEventRollupColumns:
+    bucket_start: Mapped[str] = mapped_column(Text, primary_key=True)
+    hook_name: Mapped[str] = mapped_column(Text, primary_key=True)
+    event_name: Mapped[str] = mapped_column(Text, primary_key=True)
+    duration_bucket: Mapped[int] = mapped_column(Integer, primary_key=True)
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    duration_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    duration_min: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    duration_max: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class HookEventRollupMinute(_HookEventRollupColumns, SpellbookBase):
+    """hook_events aggregated per minute (bucket_start ``YYYY-MM-DDTHH:MM``)."""
+
+    __tablename__ = "hook_event_rollup_minute"
+
+
+class HookEventRollupHour(_HookEventRollupColumns, SpellbookBase):
+    """hook_events aggregated per hour (bucket_start ``YYYY-MM-DDTHH``)."""
+
+    __tablename__ = "hook_event_rollup_hour"
+
+
+class _WorkerLLMCallRollupColumns:
+    bucket_start: Mapped[str] = mapped_column(Text, primary_key=True)
+    task: Mapped[str] = mapped_column(Text, primary_key=True)
+    status: Mapped[str] = mapped_column(Text, primary_key=True)
+    error_key: Mapped[str] = mapped_column(
+        Text, primary_key=True,
+    )  # '' on success, else ``error or status``
+    latency_bucket: Mapped[int] = mapped_column(Integer, primary_key=True)
+    call_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    latency_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    latency_min: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    latency_max: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class WorkerLLMCallRollupMinute(_WorkerLLMCallRollupColumns, SpellbookBase):
+    """worker_llm_calls aggregated per minute."""
+
+    __tablename__ = "worker_llm_call_rollup_minute"
+
+
+class WorkerLLMCallRollupHour(_WorkerLLMCallRollupColumns, SpellbookBase):
+    """worker_llm_calls aggregated per hour."""
+
+    __tablename__ = "worker_llm_call_rollup_hour"
+
+
+def _install_rollup_triggers(target, connection, **kw) -> None:
+    install_rollup_triggers(connection)
+
+
+# Tables are also created one at a time (``Table.create``), so hook every
+# table involved; the installer waits until all of a trigger's tables exist.
+for _table in (
+    HookEvent, HookEventRollupMinute, HookEventRollupHour,
+    WorkerLLMCall, WorkerLLMCallRollupMinute, WorkerLLMCallRollupHour,
+):
+    event.listen(_table.__table__, "after_create", _install_rollup_triggers)
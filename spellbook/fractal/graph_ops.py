@@ -9,7 +9,12 @@ import uuid
 
 from sqlalchemy import delete, select, func
 
-from spellbook.db.fractal_models import FractalEdge, FractalGraph, FractalNode
+from spellbook.db.fractal_models import (
+    FractalEdge,
+    FractalGraph,
+    FractalNode,
+    FractalNodeClosure,
+)
 from spellbook.fractal.models import (
     INTENSITY_BUDGETS,
     VALID_CHECKPOINT_MODES,
@@ -82,6 +87,12 @@ async def create_graph(seed, intensity, checkpoint_mode, metadata_json=None, pro
             status="open",
         )
         session.add(root_node)
+        # Flush to persist the root before its closure row references it
+        await session.flush()
+        session.add(FractalNodeClosure(
+            ancestor_id=root_node_id, descendant_id=root_node_id,
+            graph_id=graph_id, distance=0,
+        ))
 
     return {
         "graph_id": graph_id,
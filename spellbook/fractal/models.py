@@ -9,7 +9,7 @@ from typing import Optional
 
 
 # Constants
-SCHEMA_VERSION = 4
+SCHEMA_VERSION = 6
 
 VALID_INTENSITIES = ["pulse", "explore", "deep"]
 
@@ -7,17 +7,65 @@ fractal exploration graphs using SQLAlchemy ORM models.
 import json
 import uuid
 
-from sqlalchemy import select, func, and_, text
-
-from spellbook.db.fractal_models import FractalEdge, FractalGraph, FractalNode
+from sqlalchemy import select, func, and_, insert, literal, update
+
+from spellbook.db.fractal_models import (
+    FractalConvergenceMember,
+    FractalEdge,
+    FractalGraph,
+    FractalNode,
+    FractalNodeClosure,
+)
 from spellbook.fractal.models import (
     INTENSITY_BUDGETS,
     VALID_NODE_TYPES,
     VALID_SATURATION_REASONS,
 )
+from spellbook.fractal.query_ops import affinity_parents
 from spellbook.fractal.schema import get_async_fractal_session
 
 
+async def _link_convergence_cluster(session, graph_id, node_a, node_b):
+    """Record a convergence edge in the materialized cluster table.
+
+    Adds whichever endpoints are not yet in a cluster and, when the two
+    endpoints already belong to different clusters, relabels the members
+    of one so the clusters merge.
+
+    Args:
+        session: Open async session (the caller's transaction)
+        graph_id: ID of the graph containing both nodes
+        node_a: ID of one endpoint of the new convergence edge
+        node_b: ID of the other endpoint
+    """
+    result = await session.execute(
+        select(FractalConvergenceMember.node_id, FractalConvergenceMember.cluster_id).where(
+            FractalConvergenceMember.node_id.in_([node_a, node_b])
+        )
+    )
+    clusters = dict(result.all())
+
+    existing = sorted(set(clusters.values()))
+    cluster_id = existing[0] if existing else node_a
+    for other in existing[1:]:
+        await session.execute(
+            update(FractalConvergenceMember)
+            .where(
+                and_(
+                    FractalConvergenceMember.graph_id == graph_id,
+                    FractalConvergenceMember.cluster_id == other,
+                )
+            )
+            .values(cluster_id=cluster_id)
+        )
+
+    for nid in dict.fromkeys((node_a, node_b)):
+        if nid not in clusters:
+            session.add(
+                FractalConvergenceMember(node_id=nid, graph_id=graph_id, cluster_id=cluster_id)
+            )
+
+
 async def add_node(graph_id, parent_id, node_type, text, owner=None, metadata_json=None, db_path=None):
     """Add a new node to a fractal graph.
 
@@ -103,6 +151,24 @@ async def add_node(graph_id, parent_id, node_type, text, owner=None, metadata_js
         # Flush to persist the node before adding edges that reference it
         await session.flush()
 
+        # Closure rows: the node paired with itself, plus one per ancestor
+        # of the parent (the parent's own pairs, one step further away)
+        session.add(FractalNodeClosure(
+            ancestor_id=node_id, descendant_id=node_id, graph_id=graph_id, distance=0,
+        ))
+        if parent_id is not None:
+            await session.execute(
+                insert(FractalNodeClosure).from_select(
+                    ["ancestor_id", "descendant_id", "graph_id", "distance"],
+                    select(
+                        FractalNodeClosure.ancestor_id,
+                        literal(node_id),
+                        literal(graph_id),
+                        FractalNodeClosure.distance + 1,
+                    ).where(FractalNodeClosure.descendant_id == parent_id),
+                )
+            )
+
         # Create parent_child edge if parent_id provided
         if parent_id is not None:
             edge = FractalEdge(
@@ -138,7 +204,8 @@ async def update_node(graph_id, node_id, metadata_json, db_path=None):
 
     Shallow-merges new metadata into existing metadata (top-level key overwrite, not deep merge).
     If metadata contains "convergence_with" or "contradiction_with" keys
-    (lists of node_ids), creates the corresponding edges.
+    (lists of node_ids), creates the corresponding edges. New convergence
+    edges also merge the endpoints' clusters in ``convergence_clusters``.
 
     Args:
         graph_id: ID of the graph containing the node
@@ -197,6 +264,7 @@ async def update_node(graph_id, node_id, metadata_json, db_path=None):
                 edge_type="convergence",
             )
             session.add(edge)
+            await _link_convergence_cluster(session, graph_id, node_id, target_id)
             edges_created += 1
 
         # Handle contradiction_with side effect
@@ -290,6 +358,121 @@ async def mark_saturated(graph_id, node_id, reason, db_path=None):
     }
 
 
+async def _claim_open_questions(session, graph_id, worker_id, limit, session_id):
+    """Claim up to ``limit`` open question nodes for a worker.
+
+    Each pass is a single ``UPDATE ... RETURNING`` whose candidate subquery
+    and ``status = 'open'`` check run under SQLite's write lock, so
+    concurrent claimers can neither pick the same node nor fail to upgrade
+    a read snapshot. The first pass takes siblings of nodes the worker
+    already owns (branch affinity), the second tops up from the rest of the
+    graph; both walk idx_nodes_claim_order, shallowest then oldest.
+
+    Issue this before any read in the transaction: a read would start a
+    snapshot that a concurrent claimer's commit invalidates.
+
+    Args:
+        session: Open async session (the caller's transaction)
+        graph_id: ID of the graph to claim work from
+        worker_id: ID of the worker claiming work
+        limit: Maximum number of nodes to claim
+        session_id: Optional Claude Code session ID for chat log linking
+
+    Returns:
+        List of claimed node dicts, affine ones first, each pass ordered
+        by depth then creation time
+    """
+    graph_active = (
+        select(FractalGraph.id)
+        .where(and_(FractalGraph.id == graph_id, FractalGraph.status == "active"))
+        .exists()
+    )
+    claimed = []
+    for affine in (True, False):
+        if len(claimed) >= limit:
+            break
+        conditions = [
+            FractalNode.graph_id == graph_id,
+            FractalNode.node_type == "question",
+            FractalNode.status == "open",
+        ]
+        if affine:
+            conditions.append(FractalNode.parent_id.in_(affinity_parents(graph_id, worker_id)))
+        candidates = (
+            select(FractalNode.id)
+            .where(and_(*conditions))
+            .order_by(FractalNode.depth.asc(), FractalNode.created_at.asc())
+            .limit(limit - len(claimed))
+        )
+        result = await session.execute(
+            update(FractalNode)
+            .where(
+                and_(
+                    FractalNode.id.in_(candidates),
+                    FractalNode.status == "open",
+                    graph_active,
+                )
+            )
+            .values(
+                owner=worker_id,
+                status="claimed",
+                claimed_at=func.datetime("now"),
+                session_id=session_id,
+            )
+            .returning(
+                FractalNode.id,
+                FractalNode.text,
+                FractalNode.depth,
+                FractalNode.parent_id,
+                FractalNode.metadata_json,
+                FractalNode.created_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        # RETURNING order is unspecified; restore the candidate order
+        for row in sorted(result.all(), key=lambda r: (r.depth, r.created_at)):
+            claimed.append({
+                "node_id": row.id,
+                "text": row.text,
+                "depth": row.depth,
+                "parent_id": row.parent_id,
+                "metadata": json.loads(row.metadata_json) if row.metadata_json else {},
+            })
+    return claimed
+
+
+async def _no_work_status(session, graph_id):
+    """Validate the graph after an empty claim and report whether it is done.
+
+    Raises:
+        ValueError: If graph doesn't exist or is not active
+    """
+    graph_result = await session.execute(
+        select(FractalGraph.status).where(FractalGraph.id == graph_id)
+    )
+    row = graph_result.one_or_none()
+    if row is None:
+        raise ValueError(f"Graph '{graph_id}' not found.")
+
+    graph_status = row[0]
+    if graph_status != "active":
+        raise ValueError(
+            f"Cannot claim work from graph with status '{graph_status}'. "
+            f"Graph must be 'active'."
+        )
+
+    # No open question nodes available -- check if there is in-flight work
+    claimed_result = await session.execute(
+        select(func.count()).select_from(FractalNode).where(
+            and_(
+                FractalNode.graph_id == graph_id,
+                FractalNode.status == "claimed",
+            )
+        )
+    )
+    return claimed_result.scalar() == 0
+
+
 async def claim_work(graph_id, worker_id, db_path=None, session_id=None):
     """Atomically claim the next available open question node for a worker.
 
@@ -312,80 +495,47 @@ async def claim_work(graph_id, worker_id, db_path=None, session_id=None):
         ValueError: If graph doesn't exist or is not active
     """
     async with get_async_fractal_session(db_path) as session:
-        # Validate graph exists and is active
-        graph_result = await session.execute(
-            select(FractalGraph.status).where(FractalGraph.id == graph_id)
-        )
-        row = graph_result.one_or_none()
-        if row is None:
-            raise ValueError(f"Graph '{graph_id}' not found.")
+        claimed = await _claim_open_questions(session, graph_id, worker_id, 1, session_id)
+        if not claimed:
+            graph_done = await _no_work_status(session, graph_id)
+            return {"node_id": None, "graph_done": graph_done}
 
-        graph_status = row[0]
-        if graph_status != "active":
-            raise ValueError(
-                f"Cannot claim work from graph with status '{graph_status}'. "
-                f"Graph must be 'active'."
-            )
+        return {**claimed[0], "graph_done": False}
 
-        # Find the best candidate node to claim using raw SQL for the complex ORDER BY
-        candidate_result = await session.execute(
-            text("""
-                SELECT n.id FROM nodes n
-                WHERE n.graph_id = :graph_id AND n.node_type = 'question' AND n.status = 'open'
-                ORDER BY
-                    CASE WHEN EXISTS (
-                        SELECT 1 FROM nodes sibling
-                        WHERE sibling.parent_id = n.parent_id
-                        AND sibling.owner = :worker_id
-                    ) THEN 0 ELSE 1 END,
-                    n.depth ASC,
-                    n.created_at ASC
-                LIMIT 1
-            """),
-            {"worker_id": worker_id, "graph_id": graph_id},
-        )
-        candidate = candidate_result.one_or_none()
-
-        if candidate is None:
-            # No open question nodes available -- check if there is in-flight work
-            claimed_result = await session.execute(
-                select(func.count()).select_from(FractalNode).where(
-                    and_(
-                        FractalNode.graph_id == graph_id,
-                        FractalNode.status == "claimed",
-                    )
-                )
-            )
-            claimed_count = claimed_result.scalar()
 
-            if claimed_count > 0:
-                return {"node_id": None, "graph_done": False}
-            else:
-                return {"node_id": None, "graph_done": True}
+async def claim_work_batch(graph_id, worker_id, max_nodes, db_path=None, session_id=None):
+    """Atomically claim up to max_nodes open question nodes for a worker.
 
-        candidate_id = candidate[0]
+    Same ordering as claim_work (branch affinity, then shallower, then
+    older), all claimed in one transaction.
 
-        # Atomically claim the node
-        node_result = await session.execute(
-            select(FractalNode).where(FractalNode.id == candidate_id)
-        )
-        node = node_result.scalar_one()
-        node.owner = worker_id
-        node.status = "claimed"
-        node.claimed_at = func.datetime("now")
-        node.session_id = session_id
+    Args:
+        graph_id: ID of the graph to claim work from
+        worker_id: ID of the worker claiming work
+        max_nodes: Maximum number of nodes to claim (at least 1)
+        db_path: Path to database file (defaults to standard location)
+        session_id: Optional Claude Code session ID for chat log linking
 
-        # We need to flush to persist the changes before reading back
-        await session.flush()
+    Returns:
+        dict with nodes (list of node_id, text, depth, parent_id, metadata)
+        and graph_done, which is True only when nothing was claimed and no
+        claimed work remains in flight
+
+    Raises:
+        ValueError: If max_nodes < 1, or graph doesn't exist or is not active
+    """
+    if max_nodes < 1:
+        raise ValueError(f"max_nodes must be at least 1, got {max_nodes}.")
+
+    async with get_async_fractal_session(db_path) as session:
+        claimed = await _claim_open_questions(
+            session, graph_id, worker_id, max_nodes, session_id
+        )
+        if not claimed:
+            graph_done = await _no_work_status(session, graph_id)
+            return {"nodes": [], "graph_done": graph_done}
 
-        return {
-            "node_id": node.id,
-            "text": node.text,
-            "depth": node.depth,
-            "parent_id": node.parent_id,
-            "metadata": json.loads(node.metadata_json) if node.metadata_json else {},
-            "graph_done": False,
-        }
+        return {"nodes": claimed, "graph_done": False}
 
 
 async def synthesize_node(graph_id, node_id, synthesis_text, db_path=None):
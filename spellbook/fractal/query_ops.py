@@ -7,14 +7,21 @@ points, contradictions, and saturation status. Uses SQLAlchemy ORM models.
 
 import json
 
-from sqlalchemy import select, and_, text
-
-from spellbook.db.fractal_models import FractalEdge, FractalGraph, FractalNode
+from sqlalchemy import select, and_, case, func, text
+from sqlalchemy.orm import aliased
+
+from spellbook.db.fractal_models import (
+    FractalConvergenceMember,
+    FractalEdge,
+    FractalGraph,
+    FractalNode,
+    FractalNodeClosure,
+)
 from spellbook.fractal.schema import get_async_fractal_session
 
 
 def _row_to_node(node):
-    """Convert a FractalNode ORM instance to a dict with parsed metadata."""
+    """Convert a FractalNode ORM instance or row to a dict with parsed metadata."""
     return {
         "node_id": node.id,
         "parent_id": node.parent_id,
@@ -28,8 +35,25 @@ def _row_to_node(node):
     }
 
 
+def affinity_parents(graph_id, worker_id):
+    """Select the parents of the nodes ``worker_id`` owns in ``graph_id``.
+
+    Open questions under these parents are siblings of the worker's earlier
+    claims, which branch affinity prefers. Used as an uncorrelated ``IN``
+    subquery, so SQLite evaluates it once per statement (a range scan of
+    idx_nodes_graph_owner) rather than once per candidate node.
+    """
+    return select(FractalNode.parent_id).where(
+        and_(
+            FractalNode.graph_id == graph_id,
+            FractalNode.owner == worker_id,
+            FractalNode.parent_id.is_not(None),
+        )
+    )
+
+
 def _edge_to_dict(edge):
-    """Convert a FractalEdge ORM instance to a dict with parsed metadata."""
+    """Convert a FractalEdge ORM instance or row to a dict with parsed metadata."""
     return {
         "from_node": edge.from_node,
         "to_node": edge.to_node,
@@ -79,7 +103,7 @@ async def get_snapshot(graph_id, db_path=None):
 
 
 async def get_branch(graph_id, node_id, db_path=None):
-    """Return subtree rooted at node_id using recursive CTE.
+    """Return subtree rooted at node_id, read from the node closure table.
 
     Args:
         graph_id: ID of the graph containing the node
@@ -107,51 +131,35 @@ async def get_branch(graph_id, node_id, db_path=None):
         if node_check.scalar_one_or_none() is None:
             return {"error": f"Node '{node_id}' not found in graph '{graph_id}'."}
 
-        # Recursive CTE to get subtree - use raw SQL for the recursive query
-        subtree_result = await session.execute(
-            text("""
-                WITH RECURSIVE subtree AS (
-                    SELECT id, parent_id, node_type, text, owner, depth, status,
-                           metadata_json, created_at
-                    FROM nodes
-                    WHERE id = :node_id AND graph_id = :graph_id
-                    UNION ALL
-                    SELECT n.id, n.parent_id, n.node_type, n.text, n.owner, n.depth,
-                           n.status, n.metadata_json, n.created_at
-                    FROM nodes n
-                    JOIN subtree s ON n.parent_id = s.id
-                    WHERE n.graph_id = :graph_id
-                )
-                SELECT * FROM subtree
-            """),
-            {"node_id": node_id, "graph_id": graph_id},
+        # Subtree members come straight from the closure table: every
+        # descendant of node_id (itself included), nearest first. Plain rows
+        # rather than ORM instances, since a subtree can be most of a graph.
+        node_result = await session.execute(
+            select(FractalNode.__table__)
+            .join(FractalNodeClosure, FractalNodeClosure.descendant_id == FractalNode.id)
+            .where(FractalNodeClosure.ancestor_id == node_id)
+            .order_by(FractalNodeClosure.distance, FractalNode.created_at)
         )
-
-        nodes = []
-        node_ids = set()
-        for row in subtree_result.all():
-            node_ids.add(row[0])
-            nodes.append({
-                "node_id": row[0],
-                "parent_id": row[1],
-                "node_type": row[2],
-                "text": row[3],
-                "owner": row[4],
-                "depth": row[5],
-                "status": row[6],
-                "metadata": json.loads(row[7]) if row[7] else {},
-                "created_at": row[8],
-            })
-
-        # Fetch all edges for the graph, then filter to subtree
+        nodes = [_row_to_node(n) for n in node_result.all()]
+
+        # Edges with both endpoints inside the subtree: walk out of each
+        # member via idx_edges_from_node, then probe the closure primary key
+        # for the target. Two IN-subqueries instead would let SQLite try
+        # every (from, to) pair of members.
+        from_member = aliased(FractalNodeClosure)
+        to_member = aliased(FractalNodeClosure)
         edge_result = await session.execute(
-            select(FractalEdge).where(FractalEdge.graph_id == graph_id)
+            select(FractalEdge.__table__)
+            .join(from_member, from_member.descendant_id == FractalEdge.from_node)
+            .join(to_member, to_member.descendant_id == FractalEdge.to_node)
+            .where(
+                and_(
+                    from_member.ancestor_id == node_id,
+                    to_member.ancestor_id == node_id,
+                )
+            )
         )
-        all_edges = [_edge_to_dict(e) for e in edge_result.scalars().all()]
-        subtree_edges = [
-            e for e in all_edges
-            if e["from_node"] in node_ids and e["to_node"] in node_ids
-        ]
+        subtree_edges = [_edge_to_dict(e) for e in edge_result.all()]
 
         return {
             "graph_id": graph_id,
@@ -197,7 +205,10 @@ async def get_open_questions(graph_id, db_path=None):
 
 
 async def query_convergence(graph_id, db_path=None):
-    """Find all convergence edges and group by convergence cluster.
+    """Return the graph's convergence clusters and their insights.
+
+    Clusters are the connected components of the convergence edges, read
+    from the ``convergence_clusters`` table that ``update_node`` maintains.
 
     Args:
         graph_id: ID of the graph to query
@@ -214,64 +225,30 @@ async def query_convergence(graph_id, db_path=None):
         if graph_result.scalar_one_or_none() is None:
             return {"error": f"Graph '{graph_id}' not found."}
 
-        edge_result = await session.execute(
-            select(FractalEdge).where(
-                and_(
-                    FractalEdge.graph_id == graph_id,
-                    FractalEdge.edge_type == "convergence",
-                )
+        # One query: every cluster member with its metadata. Clusters are
+        # materialized in convergence_clusters by update_node.
+        member_result = await session.execute(
+            select(
+                FractalConvergenceMember.cluster_id,
+                FractalConvergenceMember.node_id,
+                FractalNode.metadata_json,
             )
+            .join(FractalNode, FractalNode.id == FractalConvergenceMember.node_id)
+            .where(FractalConvergenceMember.graph_id == graph_id)
+            .order_by(FractalConvergenceMember.cluster_id, FractalConvergenceMember.node_id)
         )
-        edges = edge_result.scalars().all()
-
-        # Build convergence clusters using union-find approach
-        parent_map = {}
-
-        def find(x):
-            while parent_map.get(x, x) != x:
-                parent_map[x] = parent_map.get(parent_map[x], parent_map[x])
-                x = parent_map[x]
-            return x
-
-        def union(a, b):
-            ra, rb = find(a), find(b)
-            if ra != rb:
-                parent_map[ra] = rb
-
-        edge_node_ids = set()
-        for edge in edges:
-            from_node, to_node = edge.from_node, edge.to_node
-            edge_node_ids.add(from_node)
-            edge_node_ids.add(to_node)
-            union(from_node, to_node)
-
-        # Group nodes by cluster root
+
         clusters = {}
-        for nid in edge_node_ids:
-            root = find(nid)
-            if root not in clusters:
-                clusters[root] = set()
-            clusters[root].add(nid)
-
-        # For each cluster, find the convergence_insight from any member's metadata
-        convergence_points = []
-        for cluster_nodes in clusters.values():
-            insight = None
-            for nid in cluster_nodes:
-                node_result = await session.execute(
-                    select(FractalNode.metadata_json).where(FractalNode.id == nid)
-                )
-                node_row = node_result.scalar_one_or_none()
-                if node_row:
-                    meta = json.loads(node_row)
-                    if "convergence_insight" in meta:
-                        insight = meta["convergence_insight"]
-                        break
+        for cluster_id, node_id, metadata_json in member_result.all():
+            cluster = clusters.setdefault(cluster_id, {"nodes": [], "insight": None})
+            cluster["nodes"].append(node_id)
+            # The first member (by node ID) carrying an insight names the cluster
+            if cluster["insight"] is None and metadata_json:
+                meta = json.loads(metadata_json)
+                if "convergence_insight" in meta:
+                    cluster["insight"] = meta["convergence_insight"]
 
-            convergence_points.append({
-                "nodes": sorted(cluster_nodes),
-                "insight": insight,
-            })
+        convergence_points = list(clusters.values())
 
         return {
             "graph_id": graph_id,
@@ -298,36 +275,39 @@ async def query_contradictions(graph_id, db_path=None):
         if graph_result.scalar_one_or_none() is None:
             return {"error": f"Graph '{graph_id}' not found."}
 
+        # One query: each contradiction edge with both endpoints' metadata
+        from_meta = aliased(FractalNode)
+        to_meta = aliased(FractalNode)
         edge_result = await session.execute(
-            select(FractalEdge).where(
+            select(
+                FractalEdge.from_node,
+                FractalEdge.to_node,
+                from_meta.metadata_json,
+                to_meta.metadata_json,
+            )
+            .outerjoin(from_meta, from_meta.id == FractalEdge.from_node)
+            .outerjoin(to_meta, to_meta.id == FractalEdge.to_node)
+            .where(
                 and_(
                     FractalEdge.graph_id == graph_id,
                     FractalEdge.edge_type == "contradiction",
                 )
             )
         )
-        edges = edge_result.scalars().all()
 
         contradictions = []
-        for edge in edges:
-            from_node, to_node = edge.from_node, edge.to_node
-            nodes = sorted([from_node, to_node])
-
+        for from_node, to_node, from_json, to_json in edge_result.all():
             # Look for contradiction_tension in either node's metadata
             tension = None
-            for nid in [from_node, to_node]:
-                node_result = await session.execute(
-                    select(FractalNode.metadata_json).where(FractalNode.id == nid)
-                )
-                node_row = node_result.scalar_one_or_none()
-                if node_row:
-                    meta = json.loads(node_row)
+            for raw in (from_json, to_json):
+                if raw:
+                    meta = json.loads(raw)
                     if "contradiction_tension" in meta:
                         tension = meta["contradiction_tension"]
                         break
 
             contradictions.append({
-                "nodes": nodes,
+                "nodes": sorted([from_node, to_node]),
                 "tension": tension,
             })
 
@@ -368,39 +348,33 @@ async def get_saturation_status(graph_id, db_path=None):
         )
         branch_nodes = branch_result.scalars().all()
 
+        # Count open questions under every branch in one query: each open
+        # question's closure rows name its depth-1 ancestor
+        open_count_result = await session.execute(
+            select(FractalNodeClosure.ancestor_id, func.count())
+            .join(FractalNode, FractalNode.id == FractalNodeClosure.descendant_id)
+            .where(
+                and_(
+                    FractalNode.graph_id == graph_id,
+                    FractalNode.node_type == "question",
+                    FractalNode.status == "open",
+                    FractalNodeClosure.ancestor_id.in_([b.id for b in branch_nodes]),
+                )
+            )
+            .group_by(FractalNodeClosure.ancestor_id)
+        )
+        open_counts = dict(open_count_result.all())
+
         branches = []
         for branch in branch_nodes:
             branch_meta = json.loads(branch.metadata_json) if branch.metadata_json else {}
 
-            saturated = branch.status in ("saturated", "synthesized")
-            saturation_reason = branch_meta.get("saturation_reason")
-
-            # Count open questions in this branch's subtree using recursive CTE
-            open_count_result = await session.execute(
-                text("""
-                    WITH RECURSIVE subtree AS (
-                        SELECT id, node_type, status
-                        FROM nodes
-                        WHERE id = :branch_id AND graph_id = :graph_id
-                        UNION ALL
-                        SELECT n.id, n.node_type, n.status
-                        FROM nodes n
-                        JOIN subtree s ON n.parent_id = s.id
-                        WHERE n.graph_id = :graph_id
-                    )
-                    SELECT COUNT(*) FROM subtree
-                    WHERE node_type = 'question' AND status = 'open'
-                """),
-                {"branch_id": branch.id, "graph_id": graph_id},
-            )
-            open_count = open_count_result.scalar()
-
             branches.append({
                 "node_id": branch.id,
                 "text": branch.text,
-                "saturated": saturated,
-                "saturation_reason": saturation_reason,
-                "open_questions": open_count,
+                "saturated": branch.status in ("saturated", "synthesized"),
+                "saturation_reason": branch_meta.get("saturation_reason"),
+                "open_questions": open_counts.get(branch.id, 0),
             })
 
         all_saturated = len(branches) > 0 and all(b["saturated"] for b in branches)
@@ -436,49 +410,24 @@ async def get_claimable_work(graph_id, worker_id=None, db_path=None):
         if graph_result.scalar_one_or_none() is None:
             return {"error": f"Graph '{graph_id}' not found."}
 
-        if worker_id is not None:
-            # Use raw SQL for the complex ORDER BY with subquery
-            node_result = await session.execute(
-                text("""
-                    SELECT id, parent_id, node_type, text, owner, depth, status,
-                           metadata_json, created_at
-                    FROM nodes n
-                    WHERE n.graph_id = :graph_id AND n.node_type = 'question' AND n.status = 'open'
-                    ORDER BY
-                        CASE WHEN EXISTS (
-                            SELECT 1 FROM nodes sibling
-                            WHERE sibling.parent_id = n.parent_id
-                            AND sibling.owner = :worker_id
-                        ) THEN 0 ELSE 1 END,
-                        n.depth ASC,
-                        n.created_at ASC
-                """),
-                {"worker_id": worker_id, "graph_id": graph_id},
+        query = select(FractalNode.__table__).where(
+            and_(
+                FractalNode.graph_id == graph_id,
+                FractalNode.node_type == "question",
+                FractalNode.status == "open",
             )
-            claimable = []
-            for row in node_result.all():
-                claimable.append({
-                    "node_id": row[0],
-                    "parent_id": row[1],
-                    "node_type": row[2],
-                    "text": row[3],
-                    "owner": row[4],
-                    "depth": row[5],
-                    "status": row[6],
-                    "metadata": json.loads(row[7]) if row[7] else {},
-                    "created_at": row[8],
-                })
-        else:
-            node_result = await session.execute(
-                select(FractalNode).where(
-                    and_(
-                        FractalNode.graph_id == graph_id,
-                        FractalNode.node_type == "question",
-                        FractalNode.status == "open",
-                    )
-                ).order_by(FractalNode.depth.asc(), FractalNode.created_at.asc())
+        )
+        if worker_id is not None:
+            query = query.order_by(
+                case(
+                    (FractalNode.parent_id.in_(affinity_parents(graph_id, worker_id)), 0),
+                    else_=1,
+                )
             )
-            claimable = [_row_to_node(n) for n in node_result.scalars().all()]
+        node_result = await session.execute(
+            query.order_by(FractalNode.depth.asc(), FractalNode.created_at.asc())
+        )
+        claimable = [_row_to_node(n) for n in node_result.all()]
 
         return {
             "graph_id": graph_id,
@@ -149,6 +149,29 @@ def init_fractal_schema(db_path: Optional[str] = None) -> None:
         )
     """)
 
+    # Convergence clusters - connected components of the convergence edges,
+    # maintained by update_node so queries need not rebuild them
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS convergence_clusters (
+            node_id TEXT PRIMARY KEY REFERENCES nodes(id) ON DELETE CASCADE,
+            graph_id TEXT NOT NULL REFERENCES graphs(id) ON DELETE CASCADE,
+            cluster_id TEXT NOT NULL
+        )
+    """)
+
+    # Node closure - one row per (ancestor, descendant) pair, including each
+    # node paired with itself, maintained by create_graph and add_node so
+    # subtree queries need not walk parent links
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS node_closure (
+            ancestor_id TEXT NOT NULL REFERENCES nodes(id) ON DELETE CASCADE,
+            descendant_id TEXT NOT NULL REFERENCES nodes(id) ON DELETE CASCADE,
+            graph_id TEXT NOT NULL REFERENCES graphs(id) ON DELETE CASCADE,
+            distance INTEGER NOT NULL,
+            PRIMARY KEY (ancestor_id, descendant_id)
+        )
+    """)
+
     # Check current schema version and apply migrations
     cursor.execute("SELECT MAX(version) FROM schema_version")
     row = cursor.fetchone()
@@ -233,6 +256,22 @@ def init_fractal_schema(db_path: Optional[str] = None) -> None:
             "INSERT INTO schema_version (version, applied_at) VALUES (4, datetime('now'))"
         )
 
+    if current_version < 5:
+        # v4 -> v5 migration: backfill convergence_clusters from existing edges
+        _rebuild_convergence_clusters(cursor)
+
+        cursor.execute(
+            "INSERT INTO schema_version (version, applied_at) VALUES (5, datetime('now'))"
+        )
+
+    if current_version < 6:
+        # v5 -> v6 migration: backfill node_closure from existing parent links
+        _rebuild_node_closure(cursor)
+
+        cursor.execute(
+            "INSERT INTO schema_version (version, applied_at) VALUES (6, datetime('now'))"
+        )
+
     if current_version >= SCHEMA_VERSION:
         # Already at current version, nothing to do
         pass
@@ -247,6 +286,15 @@ def init_fractal_schema(db_path: Optional[str] = None) -> None:
     cursor.execute("""
         CREATE INDEX IF NOT EXISTS idx_nodes_graph_type_status ON nodes(graph_id, node_type, status)
     """)
+    # claim_work: open questions of a graph in claim order (covers the
+    # candidate subquery), and the parents of a worker's nodes (affinity)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_nodes_claim_order
+        ON nodes(graph_id, node_type, status, depth, created_at, id)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_nodes_graph_owner ON nodes(graph_id, owner, parent_id)
+    """)
 
     # Indexes on edges
     cursor.execute("""
@@ -259,9 +307,81 @@ def init_fractal_schema(db_path: Optional[str] = None) -> None:
         CREATE INDEX IF NOT EXISTS idx_edges_to_node ON edges(to_node)
     """)
 
+    # Index on convergence clusters
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_convergence_clusters_graph_cluster
+        ON convergence_clusters(graph_id, cluster_id)
+    """)
+
+    # Index on node closure (the primary key covers ancestor lookups)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_node_closure_descendant
+        ON node_closure(descendant_id)
+    """)
+
     conn.commit()
 
 
+def _rebuild_node_closure(cursor: sqlite3.Cursor) -> None:
+    """Recompute node_closure from the nodes' parent links.
+
+    Walks every node up to its root once with a recursive CTE, emitting
+    the node's self pair and one pair per ancestor.
+
+    Args:
+        cursor: Cursor on the fractal database
+    """
+    cursor.execute("DELETE FROM node_closure")
+    cursor.execute("""
+        INSERT INTO node_closure (ancestor_id, descendant_id, graph_id, distance)
+        WITH RECURSIVE ancestry(ancestor_id, descendant_id, graph_id, distance) AS (
+            SELECT id, id, graph_id, 0 FROM nodes
+            UNION ALL
+            SELECT n.parent_id, a.descendant_id, a.graph_id, a.distance + 1
+            FROM ancestry a
+            JOIN nodes n ON n.id = a.ancestor_id
+            WHERE n.parent_id IS NOT NULL
+        )
+        SELECT ancestor_id, descendant_id, graph_id, distance FROM ancestry
+    """)
+
+
+def _rebuild_convergence_clusters(cursor: sqlite3.Cursor) -> None:
+    """Recompute convergence_clusters from the convergence edges.
+
+    Groups the endpoints of each graph's convergence edges into connected
+    components with union-find and labels every member with its
+    component's root node ID.
+
+    Args:
+        cursor: Cursor on the fractal database
+    """
+    parent_map: dict = {}
+
+    def find(x):
+        while parent_map.get(x, x) != x:
+            parent_map[x] = parent_map.get(parent_map[x], parent_map[x])
+            x = parent_map[x]
+        return x
+
+    graph_of: dict = {}
+    cursor.execute(
+        "SELECT graph_id, from_node, to_node FROM edges WHERE edge_type = 'convergence'"
+    )
+    for graph_id, from_node, to_node in cursor.fetchall():
+        graph_of[from_node] = graph_id
+        graph_of[to_node] = graph_id
+        ra, rb = find(from_node), find(to_node)
+        if ra != rb:
+            parent_map[ra] = rb
+
+    cursor.execute("DELETE FROM convergence_clusters")
+    cursor.executemany(
+        "INSERT INTO convergence_clusters (node_id, graph_id, cluster_id) VALUES (?, ?, ?)",
+        [(nid, graph_id, find(nid)) for nid, graph_id in graph_of.items()],
+    )
+
+
 # Async session factory cache for test databases
 _async_session_factories: dict = {}
 _async_session_lock: threading.Lock = threading.Lock()
@@ -17,6 +17,7 @@ from spellbook.gates.rules import (
     OBFUSCATION_RULES,
     Category,
     Finding,
+    RuleMatcher,
     ScanResult,
     Severity,
     check_patterns,
@@ -47,6 +48,7 @@ __all__ = [
     "INVISIBLE_CHARS",
     "MCP_RULES",
     "OBFUSCATION_RULES",
+    "RuleMatcher",
     "ScanResult",
     "Severity",
     "bucket_and_classify",
@@ -23,7 +23,9 @@ log so the operator can decide whether to opt the kind in via
 The public entry point is :func:`parse_and_check`, which returns a list of
 finding dicts in the same shape produced by
 :func:`spellbook.gates.rules.check_patterns`. Empty list means the parser
-had no objection (later layers in ``check.py`` still run).
+had no objection (later layers in ``check.py`` still run). Results are
+memoized per ``(command, security_mode)`` in a bounded process-local LRU;
+see :func:`parse_cache_info`.
 """
 
 from __future__ import annotations
@@ -32,11 +34,13 @@ import json
 import logging
 import os
 import sys
+import threading
 import time
-from collections import deque
+from collections import OrderedDict, deque
 from datetime import datetime, timezone
 from pathlib import Path
 
+from spellbook.core import run_context
 from spellbook.core.compat import CrossPlatformLock, LockHeldError
 
 try:
@@ -389,10 +393,21 @@ def parse_and_check(command: str, security_mode: str = "standard") -> list[dict]
             )
         ]
 
+    key = (
+        command,
+        security_mode,
+        run_context.getenv("SPELLBOOK_BASH_PARSER_ALLOW", ""),
+        run_context.getenv("SPELLBOOK_BASH_DENY_COMPOUND", ""),
+    )
+    cached = _parse_cache_get(key, _policy_fingerprint())
+    if cached is not None:
+        return [dict(f) for f in cached]
+
+    _walk_state.uncacheable = False
     try:
         trees = bashlex.parse(command)
     except Exception as exc:  # noqa: BLE001 — bashlex raises a family of errors
-        return [
+        findings = [
             _finding(
                 "BASH-PARSER-PARSE-ERROR",
                 "CRITICAL",
@@ -400,13 +415,124 @@ def parse_and_check(command: str, security_mode: str = "standard") -> list[dict]
                 command,
             )
         ]
-
-    findings: list[dict] = []
-    for tree in trees:
-        findings.extend(_walk(tree, command, security_mode))
+    else:
+        findings = []
+        for tree in trees:
+            findings.extend(_walk(tree, command, security_mode))
+
+    # Unknown node kinds write an audit-log entry per occurrence; caching
+    # their verdict would silently drop every entry after the first.
+    # Redirect verdicts depend on the cwd, HOME and the symlinks on disk
+    # at check time, none of which are in the key.
+    if not _walk_state.uncacheable:
+        _parse_cache_set(key, tuple(dict(f) for f in findings))
     return findings
 
 
+# ---------------------------------------------------------------------------
+# Parse cache
+# ---------------------------------------------------------------------------
+
+
+#: Per-process LRU: (command, security_mode, allow env, compound env) ->
+#: findings, for commands whose verdict depends on nothing else (i.e. no
+#: redirects; see ``_walk_state``). Agents re-run the same handful of
+#: commands (``git status``, ``pytest -x``, ``ls``) constantly; inside the hook daemon a hit skips
+#: ``bashlex.parse`` and the walk entirely. Bounded via
+#: ``_PARSE_CACHE_MAX`` with LRU eviction (see ``_parse_cache_set``).
+#:
+#: The whole cache is dropped when ``_policy_fingerprint`` changes, i.e.
+#: when ``tiers.toml`` or ``hooks/bash-policy.toml`` is edited, added or
+#: removed.
+_PARSE_CACHE_MAX: int = 1024
+_PARSE_CACHE: OrderedDict[tuple[str, str, str, str], tuple[dict, ...]] = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+_parse_cache_fingerprint: tuple | None = None
+_parse_cache_hits = 0
+_parse_cache_misses = 0
+_parse_cache_invalidations = 0
+
+#: Per-thread flag for the walk in progress. ``parse_and_check`` clears
+#: ``uncacheable`` before walking; ``_handle_unknown_kind`` (audit-logs each
+#: occurrence) and ``_classify_redirect`` (resolves the target against the
+#: filesystem) set it, and a result walked with it set is never cached.
+_walk_state = threading.local()
+
+
+def _stat_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _policy_fingerprint() -> tuple:
+    """Return a cheap signature of the policy files the gate depends on.
+
+    Imported lazily: ``check`` imports this module at load time.
+    """
+    from spellbook.gates.check import _tiers_toml_path
+    from spellbook.gates.rules import _supplemental_bash_policy_path
+
+    return (
+        _stat_signature(_tiers_toml_path()),
+        _stat_signature(_supplemental_bash_policy_path()),
+    )
+
+
+def _parse_cache_get(key: tuple, fingerprint: tuple) -> tuple[dict, ...] | None:
+    """Look up ``key``, dropping every entry first if ``fingerprint`` moved."""
+    global _parse_cache_fingerprint, _parse_cache_hits, _parse_cache_misses
+    global _parse_cache_invalidations
+    with _PARSE_CACHE_LOCK:
+        if fingerprint != _parse_cache_fingerprint:
+            if _parse_cache_fingerprint is not None:
+                _parse_cache_invalidations += 1
+            _PARSE_CACHE.clear()
+            _parse_cache_fingerprint = fingerprint
+        val = _PARSE_CACHE.get(key)
+        if val is None:
+            _parse_cache_misses += 1
+            return None
+        _PARSE_CACHE.move_to_end(key)
+        _parse_cache_hits += 1
+        return val
+
+
+def _parse_cache_set(key: tuple, findings: tuple[dict, ...]) -> None:
+    """Insert into _PARSE_CACHE with LRU eviction past _PARSE_CACHE_MAX."""
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[key] = findings
+        _PARSE_CACHE.move_to_end(key)
+        while len(_PARSE_CACHE) > _PARSE_CACHE_MAX:
+            _PARSE_CACHE.popitem(last=False)
+
+
+def parse_cache_info() -> dict:
+    """Return hit/miss counters and occupancy of the parse cache."""
+    with _PARSE_CACHE_LOCK:
+        return {
+            "hits": _parse_cache_hits,
+            "misses": _parse_cache_misses,
+            "invalidations": _parse_cache_invalidations,
+            "size": len(_PARSE_CACHE),
+            "max_size": _PARSE_CACHE_MAX,
+        }
+
+
+def parse_cache_clear() -> None:
+    """Drop every cached result and reset the counters."""
+    global _parse_cache_fingerprint, _parse_cache_hits, _parse_cache_misses
+    global _parse_cache_invalidations
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE.clear()
+        _parse_cache_fingerprint = None
+        _parse_cache_hits = 0
+        _parse_cache_misses = 0
+        _parse_cache_invalidations = 0
+
+
 # ---------------------------------------------------------------------------
 # Walker
 # ---------------------------------------------------------------------------
@@ -1004,6 +1130,7 @@ def _detect_shellout(head: str, rest: list[str]) -> dict | None:
 
 
 def _classify_redirect(node: object) -> list[dict]:
+    _walk_state.uncacheable = True
     output = getattr(node, "output", None)
     target = getattr(output, "word", "") if output is not None else ""
     if not target:
@@ -1027,11 +1154,11 @@ def _classify_redirect(node: object) -> list[dict]:
     #     differs from the resolved form in the attacker's favor.
     candidates: list[str] = [target]
 
-    expanded = os.path.expanduser(target)
+    expanded = run_context.expanduser(target)
     candidates.append(os.path.normpath(expanded))
 
     try:
-        resolved = str(Path(target).expanduser().resolve(strict=False))
+        resolved = str(run_context.resolve_path(target))
     except (OSError, RuntimeError, ValueError):
         # Pathological input (e.g., NUL byte). The raw + normpath candidates
         # are still in play.
@@ -1116,6 +1243,7 @@ def _classify_assignment(node: object) -> list[dict]:
 
 def _handle_unknown_kind(node: object, kind: object) -> list[dict]:
     """Either fail-closed with audit-log entry, or honor the env escape hatch."""
+    _walk_state.uncacheable = True
     allowlist = _env_allowlist()
     record_base = {
         "ts": datetime.now(timezone.utc).isoformat(),
@@ -1171,7 +1299,7 @@ def _handle_unknown_kind(node: object, kind: object) -> list[dict]:
 
 
 def _env_allowlist() -> frozenset[str]:
-    raw = os.environ.get("SPELLBOOK_BASH_PARSER_ALLOW", "")
+    raw = run_context.getenv("SPELLBOOK_BASH_PARSER_ALLOW", "")
     return frozenset(s.strip() for s in raw.split(",") if s.strip())
 
 
@@ -1186,7 +1314,7 @@ def _compound_deny_enabled(security_mode: str) -> bool:
     """
     if security_mode == "paranoid":
         return True
-    return os.environ.get("SPELLBOOK_BASH_DENY_COMPOUND", "").strip().lower() in {
+    return run_context.getenv("SPELLBOOK_BASH_DENY_COMPOUND", "").strip().lower() in {
         "1",
         "true",
         "yes",
@@ -35,6 +35,7 @@ import sys
 from functools import lru_cache
 from pathlib import Path
 
+from spellbook.core import run_context
 from spellbook.gates.bash_parser import parse_and_check as _bashlex_parse_and_check
 from spellbook.gates.rules import (
     DANGEROUS_BASH_PATTERNS,
@@ -290,7 +291,7 @@ def _check_read_path(tool_input: dict) -> list[dict]:
         return []
 
     try:
-        resolved = str(Path(file_path).expanduser().resolve(strict=False))
+        resolved = str(run_context.resolve_path(file_path))
     except (OSError, RuntimeError) as e:
         # Path resolution can fail on weird inputs (cyclic symlinks,
         # unreadable parents, recursion limits). Log and proceed with
@@ -20,6 +20,8 @@ from fnmatch import fnmatchcase
 from functools import lru_cache
 from pathlib import Path
 
+from spellbook.core import run_context
+
 try:
     import tomllib
 except ImportError:  # Python <3.11
@@ -85,7 +87,7 @@ def _parse_env_list(env_name: str) -> tuple[str, ...] | None:
     Raises:
         ValueError when ``__disable__`` is mixed with other tokens.
     """
-    raw = os.environ.get(env_name, "")
+    raw = run_context.getenv(env_name, "")
     if not raw.strip():
         return None
     parts = [p.strip() for p in raw.split(",") if p.strip()]
@@ -11,16 +11,25 @@ Also provides:
 - Finding and ScanResult dataclasses for structured results
 - INVISIBLE_CHARS set for Unicode-based steganography detection
 - shannon_entropy() for entropy-based obfuscation detection
+- RuleMatcher for precompiled, literal-prefiltered matching of a rule set
 - check_patterns() for matching text against rule sets
 """
 
 import logging
 import math
 import re
+import threading
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 
+try:  # Python 3.11+
+    from re import _constants as _sre_constants
+    from re import _parser as _sre_parse
+except ImportError:  # Python 3.10
+    import sre_constants as _sre_constants  # type: ignore[no-redef]
+    import sre_parse as _sre_parse  # type: ignore[no-redef]
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -372,6 +381,11 @@ def _toml_priority_to_severity(priority: int, decision: str) -> "Severity":
     return Severity.MEDIUM
 
 
+def _supplemental_bash_policy_path() -> Path:
+    """Return the path of hooks/bash-policy.toml (it may not exist)."""
+    return Path(__file__).parent.parent.parent / "hooks" / "bash-policy.toml"
+
+
 def _load_supplemental_bash_policy() -> tuple[
     list[tuple[str, "Severity", str, str]],
     list[tuple[str, "Severity", str, str]],
@@ -393,7 +407,7 @@ def _load_supplemental_bash_policy() -> tuple[
     <repo>/hooks/bash-policy.toml. For pip-installed deployments where the
     sibling hooks/ directory is absent, the loader returns empty lists.
     """
-    policy_path = Path(__file__).parent.parent.parent / "hooks" / "bash-policy.toml"
+    policy_path = _supplemental_bash_policy_path()
     if not policy_path.exists():
         return [], []
     try:
@@ -553,18 +567,251 @@ _MODE_SEVERITY_THRESHOLD: dict[str, Severity] = {
 }
 
 
+# =============================================================================
+# Compiled Matcher
+# =============================================================================
+
+# Literal prefilter limits: a rule's gate is a set of strings at least one of
+# which every match must contain. Larger or shorter sets are not selective
+# enough to be worth checking, so such rules are always confirmed.
+_MAX_LITERAL_ALTERNATIVES = 32
+_MIN_LITERAL_LENGTH = 2
+
+_ZERO_WIDTH_OPS = (_sre_constants.AT, _sre_constants.ASSERT, _sre_constants.ASSERT_NOT)
+_REPEAT_OPS = (_sre_constants.MAX_REPEAT, _sre_constants.MIN_REPEAT)
+
+
+def _product(left: set[str], right: set[str]) -> set[str]:
+    return {a + b for a in left for b in right}
+
+
+def _exact_item(op, av) -> set[str] | None:
+    """Strings a single parsed item matches exactly, or None if open-ended."""
+    if op is _sre_constants.LITERAL:
+        return {chr(av)}
+    if op in _ZERO_WIDTH_OPS:
+        return {""}
+    if op is _sre_constants.SUBPATTERN:
+        _group, add_flags, del_flags, sub = av
+        return None if add_flags or del_flags else _exact_sequence(sub)
+    if op is _sre_constants.BRANCH:
+        options: set[str] = set()
+        for seq in av[1]:
+            exact = _exact_sequence(seq)
+            if exact is None:
+                return None
+            options |= exact
+        return options if len(options) <= _MAX_LITERAL_ALTERNATIVES else None
+    if op is _sre_constants.IN and all(o is _sre_constants.LITERAL for o, _ in av):
+        return {chr(c) for _, c in av}
+    return None
+
+
+def _exact_sequence(items) -> set[str] | None:
+    result = {""}
+    for op, av in items:
+        options = _exact_item(op, av)
+        if options is None:
+            return None
+        result = _product(result, options)
+        if len(result) > _MAX_LITERAL_ALTERNATIVES:
+            return None
+    return result
+
+
+def _required_item(op, av) -> set[str] | None:
+    """Strings one of which any match of a non-exact item must contain."""
+    if op is _sre_constants.SUBPATTERN:
+        _group, add_flags, del_flags, sub = av
+        return None if add_flags or del_flags else _required_sequence(sub)
+    if op in _REPEAT_OPS:
+        low, _high, sub = av
+        return _required_sequence(sub) if low >= 1 else None
+    if op is _sre_constants.BRANCH:
+        options: set[str] = set()
+        for seq in av[1]:
+            required = _required_sequence(seq)
+            if required is None:
+                return None
+            options |= required
+        return options if len(options) <= _MAX_LITERAL_ALTERNATIVES else None
+    return None
+
+
+def _literal_score(options: set[str]) -> tuple[int, int]:
+    return min(len(o) for o in options), -len(options)
+
+
+def _required_sequence(items) -> set[str] | None:
+    """Most selective set of strings one of which every match contains."""
+    best: set[str] | None = None
+
+    def consider(options: set[str] | None) -> None:
+        nonlocal best
+        if not options or "" in options:
+            return
+        if best is None or _literal_score(options) > _literal_score(best):
+            best = options
+
+    run = {""}
+    for op, av in items:
+        options = _exact_item(op, av)
+        if options is None:
+            consider(run)
+            run = {""}
+            consider(_required_item(op, av))
+            continue
+        extended = _product(run, options)
+        if len(extended) > _MAX_LITERAL_ALTERNATIVES:
+            consider(run)
+            run = options
+        else:
+            run = extended
+    consider(run)
+    return best
+
+
+def _literal_gate(pattern: str) -> tuple[frozenset[str], bool] | None:
+    """Return ``(literals, ignore_case)`` gating ``pattern``, or None.
+
+    Every match of ``pattern`` contains at least one of ``literals``. For
+    case-insensitive patterns the literals are lower-cased and only ever
+    tested against ASCII text, where ``str.lower`` and ``re.IGNORECASE``
+    agree exactly.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern)
+        literals = _required_sequence(list(parsed))
+    except Exception:  # noqa: BLE001 - no gate just means "always confirm"
+        return None
+    if not literals or min(len(lit) for lit in literals) < _MIN_LITERAL_LENGTH:
+        return None
+    ignore_case = bool(parsed.state.flags & re.IGNORECASE)
+    if ignore_case:
+        if not all(lit.isascii() for lit in literals):
+            return None
+        literals = {lit.lower() for lit in literals}
+    return frozenset(literals), ignore_case
+
+
+class RuleMatcher:
+    """A rule list precompiled for repeated matching.
+
+    Produces exactly the per-rule ``re.search`` results of
+    :func:`check_patterns`, but each rule's regex is compiled once and only
+    run on lines that contain one of the literals every match of that rule
+    requires (e.g. ``curl``, ``.env``). Literal presence for all rules is
+    decided with one sweep of plain substring tests per line, so a line
+    that cannot match anything costs a handful of ``in`` checks instead of
+    one regex search per rule.
+    """
+
+    def __init__(self, patterns: list[tuple[str, Severity, str, str]]):
+        self.patterns = list(patterns)
+        self._compiled = [re.compile(p[0]) for p in self.patterns]
+        self._gates = [_literal_gate(p[0]) for p in self.patterns]
+        self._tables: dict[int, tuple] = {}
+
+    def _table(self, threshold: Severity) -> tuple:
+        """Literal tables for the rules at or above ``threshold`` (memoized)."""
+        table = self._tables.get(threshold.value)
+        if table is None:
+            always: list[int] = []
+            folded_rules: list[int] = []
+            exact: dict[str, list[int]] = {}
+            folded: dict[str, list[int]] = {}
+            for index, gate in enumerate(self._gates):
+                if self.patterns[index][1].value < threshold.value:
+                    continue
+                if gate is None:
+                    always.append(index)
+                    continue
+                literals, ignore_case = gate
+                target = folded if ignore_case else exact
+                for literal in literals:
+                    target.setdefault(literal, []).append(index)
+                if ignore_case:
+                    folded_rules.append(index)
+            table = (
+                tuple(always), tuple(folded_rules),
+                tuple(exact.items()), tuple(folded.items()),
+            )
+            self._tables[threshold.value] = table
+        return table
+
+    def search(self, text: str, threshold: Severity = Severity.LOW) -> list[tuple[int, re.Match]]:
+        """Return ``(rule index, first match)`` for each matching rule, in rule order.
+
+        Rules below ``threshold`` are skipped.
+        """
+        always, folded_rules, exact, folded = self._table(threshold)
+        candidates = set(always)
+        for literal, indexes in exact:
+            if literal in text:
+                candidates.update(indexes)
+        if folded:
+            if text.isascii():
+                lowered = text.lower()
+                for literal, indexes in folded:
+                    if literal in lowered:
+                        candidates.update(indexes)
+            else:
+                # Unicode case folding (e.g. U+017F matching "s") differs
+                # from str.lower(); let the regexes decide.
+                candidates.update(folded_rules)
+
+        results = []
+        for index in sorted(candidates):
+            match = self._compiled[index].search(text)
+            if match:
+                results.append((index, match))
+        return results
+
+
+_matcher_cache: dict[int, tuple[tuple, RuleMatcher]] = {}
+_matcher_cache_lock = threading.Lock()
+_MATCHER_CACHE_SIZE = 64
+
+
+def get_rule_matcher(patterns: list[tuple[str, Severity, str, str]]) -> RuleMatcher:
+    """Return a cached :class:`RuleMatcher` for ``patterns``.
+
+    Keyed by list identity and revalidated against a snapshot of its
+    contents, so rule lists extended or edited in place are recompiled.
+    """
+    snapshot = tuple(patterns)
+    cached = _matcher_cache.get(id(patterns))
+    if cached is not None and cached[0] == snapshot:
+        return cached[1]
+    matcher = RuleMatcher(patterns)
+    with _matcher_cache_lock:
+        if len(_matcher_cache) >= _MATCHER_CACHE_SIZE:
+            _matcher_cache.clear()
+        # The snapshot holds the rules, not the list, so a freed list whose
+        # id is reused by another list simply fails revalidation.
+        _matcher_cache[id(patterns)] = (snapshot, matcher)
+    return matcher
+
+
 def check_patterns(
     text: str,
     patterns: list[tuple[str, Severity, str, str]],
     security_mode: str = "standard",
+    include_entropy: bool = True,
 ) -> list[dict]:
     """Check text against a list of security patterns.
 
+    Patterns are matched through a cached :class:`RuleMatcher`, so each rule
+    list is compiled once per process.
+
     Args:
         text: The text to scan.
         patterns: List of (regex_pattern, severity, rule_id, message) tuples.
         security_mode: One of "standard" or "paranoid".
             Controls the minimum severity threshold for reporting findings.
+        include_entropy: Append the ENTROPY-001 signal for long high-entropy
+            text. Callers that discard it should pass False to skip the
+            entropy computation entirely.
 
     Returns:
         List of match dicts, each containing:
@@ -576,25 +823,22 @@ def check_patterns(
     threshold = _MODE_SEVERITY_THRESHOLD.get(security_mode, Severity.HIGH)
     results: list[dict] = []
 
-    for pattern, severity, rule_id, message in patterns:
-        if severity.value < threshold.value:
-            continue
-        match = re.search(pattern, text)
-        if match:
-            results.append(
-                {
-                    "rule_id": rule_id,
-                    "severity": severity.name,
-                    "message": message,
-                    "matched_text": match.group(),
-                }
-            )
+    for index, match in get_rule_matcher(patterns).search(text, threshold):
+        _pattern, severity, rule_id, message = patterns[index]
+        results.append(
+            {
+                "rule_id": rule_id,
+                "severity": severity.name,
+                "message": message,
+                "matched_text": match.group(),
+            }
+        )
 
     # Entropy check for potential encoded payloads (defense-in-depth signal).
     # Always runs regardless of security mode -- it's a supplementary signal,
     # not a blocking rule. Threshold of 5.0 bits/char avoids false positives
     # on normal English text and structured code (~4.5-4.9 bits/char).
-    if len(text) > 50:
+    if include_entropy and len(text) > 50:
         entropy = shannon_entropy(text)
         if entropy > 5.0:
             results.append(
@@ -0,0 +1,215 @@
+"""Persistent cache of scanner findings, keyed by file content.
+
+``scan_directory`` and ``scan_mcp_directory`` run on every pre-commit hook
+and ``--mode`` invocation, yet almost every file they see is unchanged since
+the last run. :class:`ScanCache` remembers the findings for each
+``(content sha256, kind, security_mode)`` under the current ruleset
+fingerprint, so a warm run only hashes files and rescans the ones whose
+bytes changed.
+
+Findings are stored without their ``file`` field (identical content yields
+identical findings wherever it lives) and re-stamped with the caller's path
+on a hit. Rows written under any other ruleset fingerprint are dropped when
+the cache is opened.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable
+
+from spellbook.core.path_utils import get_spellbook_config_dir
+from spellbook.gates.rules import Category, Finding, Severity
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = "scan-cache.db"
+
+# Bump when the cached row layout changes.
+_SCHEMA_VERSION = 1
+
+# Oldest rows beyond this many are evicted after each write batch.
+_MAX_ROWS = 50_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scan_cache (
+    digest TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    security_mode TEXT NOT NULL,
+    ruleset TEXT NOT NULL,
+    findings TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (digest, kind, security_mode, ruleset)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_scan_cache_stored_at ON scan_cache(stored_at);
+"""
+
+
+def content_digest(data: bytes) -> str:
+    """Return the cache key for a file's raw bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _encode(findings: Iterable[Finding]) -> str:
+    return json.dumps([
+        [f.line, f.category.name, f.severity.name, f.rule_id, f.message, f.evidence, f.remediation]
+        for f in findings
+    ])
+
+
+def _decode(raw: str, file_path: str) -> list[Finding]:
+    return [
+        Finding(
+            file=file_path,
+            line=line,
+            category=Category[category],
+            severity=Severity[severity],
+            rule_id=rule_id,
+            message=message,
+            evidence=evidence,
+            remediation=remediation,
+        )
+        for line, category, severity, rule_id, message, evidence, remediation in json.loads(raw)
+    ]
+
+
+class ScanCache:
+    """SQLite store of findings per file content for one ruleset.
+
+    Thread-safe: one connection shared behind a lock. Safe to share the
+    database file between processes (WAL mode; a lost write only costs a
+    rescan).
+    """
+
+    def __init__(self, ruleset: str, db_path: Path | str | None = None):
+        """Open (or create) the cache.
+
+        Args:
+            ruleset: Fingerprint of the rules and scanner logic that produced
+                the findings. Rows for any other fingerprint are discarded.
+            db_path: Cache database file. Defaults to
+                ``<config dir>/scan-cache.db``; ``":memory:"`` keeps it
+                in-process only.
+        """
+        if db_path is None:
+            db_path = get_spellbook_config_dir() / CACHE_FILENAME
+        self.ruleset = ruleset
+        self.db_path = str(db_path)
+        self._lock = threading.Lock()
+        try:
+            self._conn = self._open(self.db_path)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("scan cache unavailable at %s (%s); using memory", self.db_path, e)
+            self.db_path = ":memory:"
+            self._conn = self._open(self.db_path)
+        try:
+            with self._conn:
+                self._conn.execute("DELETE FROM scan_cache WHERE ruleset != ?", (ruleset,))
+        except sqlite3.Error as e:
+            logger.debug("scan cache prune failed: %s", e)
+
+    @staticmethod
+    def _open(db_path: str) -> sqlite3.Connection:
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(db_path, timeout=5.0, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != _SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS scan_cache")
+                conn.executescript(_SCHEMA)
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            conn.commit()
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def get_many(
+        self, kind: str, security_mode: str, digests: Iterable[str]
+    ) -> dict[str, str]:
+        """Return ``{digest: encoded findings}`` for the digests that are cached.
+
+        Decode a value with :meth:`findings_for`.
+        """
+        wanted = list(dict.fromkeys(digests))
+        found: dict[str, str] = {}
+        if not wanted:
+            return found
+        try:
+            with self._lock:
+                for start in range(0, len(wanted), 500):
+                    chunk = wanted[start:start + 500]
+                    marks = ",".join("?" * len(chunk))
+                    rows = self._conn.execute(
+                        f"SELECT digest, findings FROM scan_cache "
+                        f"WHERE kind = ? AND security_mode = ? AND ruleset = ? "
+                        f"AND digest IN ({marks})",
+                        (kind, security_mode, self.ruleset, *chunk),
+                    ).fetchall()
+                    found.update(rows)
+        except sqlite3.Error as e:
+            logger.debug("scan cache read failed: %s", e)
+        return found
+
+    @staticmethod
+    def findings_for(encoded: str, file_path: str) -> list[Finding]:
+        """Decode a value from :meth:`get_many`, stamping ``file_path`` on each finding."""
+        return _decode(encoded, file_path)
+
+    def put_many(
+        self,
+        kind: str,
+        security_mode: str,
+        entries: Iterable[tuple[str, list[Finding]]],
+    ) -> None:
+        """Store ``(digest, findings)`` pairs; failures are logged and ignored."""
+        now = time.time()
+        rows = [
+            (digest, kind, security_mode, self.ruleset, _encode(findings), now)
+            for digest, findings in entries
+        ]
+        if not rows:
+            return
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO scan_cache "
+                    "(digest, kind, security_mode, ruleset, findings, stored_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute(
+                    "DELETE FROM scan_cache WHERE stored_at < ("
+                    "SELECT stored_at FROM scan_cache ORDER BY stored_at DESC "
+                    "LIMIT 1 OFFSET ?)",
+                    (_MAX_ROWS - 1,),
+                )
+        except sqlite3.Error as e:
+            logger.debug("scan cache write failed: %s", e)
+
+
+_caches: dict[tuple[str, str], ScanCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_scan_cache(ruleset: str) -> ScanCache:
+    """Return the process-wide cache for ``ruleset``, opening it on first use."""
+    key = (str(get_spellbook_config_dir() / CACHE_FILENAME), ruleset)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = ScanCache(ruleset, key[0])
+        return cache
@@ -26,14 +26,25 @@ Provides six entry points:
 - scan_python_file(): Scan a single Python file against MCP rules
 - scan_mcp_directory(): Recursively scan a directory of Python files
 - analyze_consent_gap(): Check for tools used but not declared in description
+
+The two directory scans reuse findings for files whose content is unchanged
+(see spellbook.gates.scan_cache) and spread cold runs over a process pool.
 """
 
+import functools
+import hashlib
+import logging
+import multiprocessing
+import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from fnmatch import fnmatch
 from pathlib import Path
 
+from spellbook.gates import rules as _rules_module
 from spellbook.gates.rules import (
     ESCALATION_RULES,
     EXFILTRATION_RULES,
@@ -48,6 +59,9 @@ from spellbook.gates.rules import (
     check_patterns,
     shannon_entropy,
 )
+from spellbook.gates.scan_cache import content_digest, get_scan_cache
+
+logger = logging.getLogger(__name__)
 
 # All rule sets to scan against, paired with their category
 _ALL_RULE_SETS: list[tuple[list, Category]] = [
@@ -60,6 +74,15 @@ _ALL_RULE_SETS: list[tuple[list, Category]] = [
 # Entropy threshold for code blocks
 _ENTROPY_THRESHOLD = 4.5
 
+# Bump to invalidate every cached scan result regardless of rule changes.
+_SCAN_CACHE_VERSION = 1
+
+# Directory scans with fewer uncached files than this stay in-process. A
+# spawned worker costs ~0.5s to start while a typical skill scans in ~4ms,
+# so the pool only pays off for large cold runs.
+_PARALLEL_MIN_FILES = 256
+_MAX_SCAN_WORKERS = 8
+
 # Files excluded from security scanning entirely (path suffix match).
 # Prefer using _KNOWN_INSTRUCTION_TAGS over adding files here.
 # Only add files that reference platform-injected tags (e.g., <system-reminder>)
@@ -162,13 +185,13 @@ def _scan_line(
 
     # Check against all rule sets
     for rules, category in _ALL_RULE_SETS:
-        matches = check_patterns(line, rules, security_mode=security_mode)
+        # No ENTROPY-001 from per-line checks; entropy is handled
+        # separately via _extract_code_blocks to avoid false positives
+        # on non-code-block content.
+        matches = check_patterns(
+            line, rules, security_mode=security_mode, include_entropy=False
+        )
         for match in matches:
-            # Skip ENTROPY-001 from per-line checks; entropy is handled
-            # separately via _extract_code_blocks to avoid false positives
-            # on non-code-block content.
-            if match.get("rule_id") == "ENTROPY-001":
-                continue
             findings.append(
                 Finding(
                     file=file_path,
@@ -416,10 +439,18 @@ def scan_skill(
         )
 
     content = path.read_text(encoding="utf-8", errors="replace")
-    if not content:
-        return ScanResult(file=file_path)
+    findings = _scan_markdown_content(file_path, content, security_mode)
+    verdict = _determine_verdict(findings)
+    return ScanResult(file=file_path, findings=findings, verdict=verdict)
+
 
+def _scan_markdown_content(
+    file_path: str, content: str, security_mode: str
+) -> list[Finding]:
+    """Run every markdown check over ``content`` (the body of scan_skill)."""
     findings: list[Finding] = []
+    if not content:
+        return findings
     lines = content.split("\n")
 
     # Line-by-line scanning
@@ -449,9 +480,7 @@ def scan_skill(
 
     # Consent gap analysis (only applies to skill files with frontmatter)
     findings.extend(analyze_consent_gap(file_path, content))
-
-    verdict = _determine_verdict(findings)
-    return ScanResult(file=file_path, findings=findings, verdict=verdict)
+    return findings
 
 
 def scan_directory(
@@ -459,16 +488,24 @@ def scan_directory(
     security_mode: str = "standard",
     include_patterns: list[str] | None = None,
     exclude_patterns: list[str] | None = None,
+    use_cache: bool = True,
+    workers: int | None = None,
 ) -> list[ScanResult]:
     """Recursively scan a directory for security issues in markdown files.
 
-    Scans all SKILL.md and *.md files found recursively.
+    Scans all SKILL.md and *.md files found recursively. Files whose content
+    was already scanned under the current rules and security_mode return
+    their cached findings; the rest are scanned, across a process pool when
+    there are enough of them.
 
     Args:
         dir_path: Path to the directory to scan.
         security_mode: One of "standard" or "paranoid".
         include_patterns: If provided, only scan files matching these glob patterns.
         exclude_patterns: If provided, skip files matching these glob patterns.
+        use_cache: Read and update the persistent scan cache.
+        workers: Process pool size for uncached files; None sizes it
+            automatically, 1 scans in-process.
 
     Returns:
         List of ScanResult objects, one per scanned file.
@@ -477,7 +514,7 @@ def scan_directory(
     if not path.exists() or not path.is_dir():
         return []
 
-    results: list[ScanResult] = []
+    selected: list[Path] = []
 
     # Collect all .md files recursively
     md_files = sorted(path.rglob("*.md"))
@@ -495,9 +532,9 @@ def scan_directory(
             if any(fnmatch(rel_path, pat) for pat in exclude_patterns):
                 continue
 
-        results.append(scan_skill(str(md_file), security_mode=security_mode))
+        selected.append(md_file)
 
-    return results
+    return _scan_files("skill", selected, security_mode, use_cache, workers)
 
 
 def _parse_unified_diff(
@@ -655,13 +692,20 @@ def scan_python_file(
         )
 
     content = path.read_text(encoding="utf-8", errors="replace")
-    if not content:
-        return ScanResult(file=file_path)
+    findings = _scan_python_content(file_path, content, security_mode)
+    verdict = _determine_verdict(findings)
+    return ScanResult(file=file_path, findings=findings, verdict=verdict)
+
 
+def _scan_python_content(
+    file_path: str, content: str, security_mode: str
+) -> list[Finding]:
+    """Run MCP_RULES over ``content`` (the body of scan_python_file)."""
     findings: list[Finding] = []
-    lines = content.split("\n")
+    if not content:
+        return findings
 
-    for i, line in enumerate(lines, start=1):
+    for i, line in enumerate(content.split("\n"), start=1):
         matches = check_patterns(line, MCP_RULES, security_mode=security_mode)
         for match in matches:
             findings.append(
@@ -676,21 +720,158 @@ def scan_python_file(
                     remediation=f"Review and remediate pattern matching {match['rule_id']}",
                 )
             )
+    return findings
+
+
+@functools.lru_cache(maxsize=1)
+def _ruleset_fingerprint() -> str:
+    """Identify the rules and scanner logic that cached findings depend on.
+
+    Covers the rule tables plus the source of rules.py and this module, so
+    editing a pattern, a threshold or the scanning code invalidates the scan
+    cache without anyone remembering to bump a version.
+    """
+    digest = hashlib.sha256(f"v{_SCAN_CACHE_VERSION}".encode())
+    for rules, category in _ALL_RULE_SETS:
+        digest.update(repr((category.name, rules)).encode())
+    digest.update(repr(MCP_RULES).encode())
+    digest.update(repr(sorted(INVISIBLE_CHARS)).encode())
+    for module_file in (_rules_module.__file__, __file__):
+        try:
+            digest.update(Path(module_file).read_bytes())
+        except (OSError, TypeError):
+            digest.update(b"<no source>")
+    return digest.hexdigest()
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode file bytes the way ``Path.read_text(errors="replace")`` does."""
+    return data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+
+
+_CONTENT_SCANNERS = {
+    "skill": _scan_markdown_content,
+    "mcp": _scan_python_content,
+}
+
+_FILE_SCANNERS = {
+    "skill": scan_skill,
+    "mcp": scan_python_file,
+}
+
+
+def _scan_job(job: tuple[str, str, str, str]) -> list[Finding]:
+    """Process-pool entry point: ``(kind, file_path, content, security_mode)``."""
+    kind, file_path, content, security_mode = job
+    return _CONTENT_SCANNERS[kind](file_path, content, security_mode)
+
+
+def _run_scan_jobs(
+    jobs: list[tuple[str, str, str, str]], workers: int | None
+) -> list[list[Finding]]:
+    """Scan ``jobs`` serially or across a process pool.
+
+    ``workers=None`` picks a pool size from the CPU count once there are at
+    least ``_PARALLEL_MIN_FILES`` jobs; ``workers<=1`` forces serial. A
+    pool that cannot start or dies (no working ``sem_open``, sandbox process
+    limits, a killed worker) falls back to scanning in-process; errors
+    raised by the scanners themselves propagate.
+    """
+    if workers is None:
+        workers = min(os.cpu_count() or 1, _MAX_SCAN_WORKERS)
+        if len(jobs) < _PARALLEL_MIN_FILES:
+            workers = 1
+    workers = min(workers, len(jobs))
+    if workers > 1:
+        try:
+            # spawn, not fork: the scanner also runs inside the threaded daemon.
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                chunksize = max(1, len(jobs) // (workers * 4))
+                return list(pool.map(_scan_job, jobs, chunksize=chunksize))
+        except (BrokenProcessPool, OSError, NotImplementedError, ImportError):
+            logger.debug(
+                "scan process pool unavailable; scanning %d files in-process",
+                len(jobs),
+                exc_info=True,
+            )
+    return [_scan_job(job) for job in jobs]
 
-    verdict = _determine_verdict(findings)
-    return ScanResult(file=file_path, findings=findings, verdict=verdict)
+
+def _scan_files(
+    kind: str,
+    files: list[Path],
+    security_mode: str,
+    use_cache: bool,
+    workers: int | None,
+) -> list[ScanResult]:
+    """Scan ``files`` of one kind, reusing cached findings for unchanged content."""
+    slots: list[ScanResult | None] = [None] * len(files)
+    pending: list[tuple[int, str, str]] = []  # (slot, digest, content)
+    for slot, file in enumerate(files):
+        try:
+            data = file.read_bytes()
+        except OSError:
+            # Vanished or unreadable since the walk; the single-file scanner
+            # reports it exactly as an uncached scan would.
+            slots[slot] = _FILE_SCANNERS[kind](str(file), security_mode=security_mode)
+            continue
+        pending.append((slot, content_digest(data), _decode_text(data)))
+
+    cache = get_scan_cache(_ruleset_fingerprint()) if use_cache else None
+    cached = (
+        cache.get_many(kind, security_mode, (digest for _, digest, _ in pending))
+        if cache is not None
+        else {}
+    )
+
+    misses: list[tuple[int, str, str]] = []
+    for slot, digest, content in pending:
+        encoded = cached.get(digest)
+        if encoded is None:
+            misses.append((slot, digest, content))
+            continue
+        file_path = str(files[slot])
+        findings = cache.findings_for(encoded, file_path)
+        slots[slot] = ScanResult(
+            file=file_path, findings=findings, verdict=_determine_verdict(findings)
+        )
+
+    scanned = _run_scan_jobs(
+        [(kind, str(files[slot]), content, security_mode) for slot, _, content in misses],
+        workers,
+    )
+    for (slot, _, _), findings in zip(misses, scanned):
+        file_path = str(files[slot])
+        slots[slot] = ScanResult(
+            file=file_path, findings=findings, verdict=_determine_verdict(findings)
+        )
+    if cache is not None:
+        cache.put_many(
+            kind,
+            security_mode,
+            [(digest, findings) for (_, digest, _), findings in zip(misses, scanned)],
+        )
+    return slots
 
 
 def scan_mcp_directory(
-    dir_path: str, security_mode: str = "standard"
+    dir_path: str,
+    security_mode: str = "standard",
+    use_cache: bool = True,
+    workers: int | None = None,
 ) -> list[ScanResult]:
     """Recursively scan a directory for MCP security issues in Python files.
 
-    Scans all *.py files found recursively.
+    Scans all *.py files found recursively, reusing cached findings for
+    unchanged files the same way scan_directory does.
 
     Args:
         dir_path: Path to the directory to scan.
         security_mode: One of "standard" or "paranoid".
+        use_cache: Read and update the persistent scan cache.
+        workers: Process pool size for uncached files; None sizes it
+            automatically, 1 scans in-process.
 
     Returns:
         List of ScanResult objects, one per scanned Python file.
@@ -699,15 +880,8 @@ def scan_mcp_directory(
     if not path.exists() or not path.is_dir():
         return []
 
-    results: list[ScanResult] = []
     py_files = sorted(path.rglob("*.py"))
-
-    for py_file in py_files:
-        results.append(
-            scan_python_file(str(py_file), security_mode=security_mode)
-        )
-
-    return results
+    return _scan_files("mcp", py_files, security_mode, use_cache, workers)
 
 
 def _print_results(results: list[ScanResult]) -> bool:
@@ -773,6 +947,9 @@ def main(argv: list[str] | None = None) -> None:
         argv: Command-line arguments (defaults to sys.argv[1:]).
     """
     args = argv if argv is not None else sys.argv[1:]
+    use_cache = "--no-cache" not in args
+    if not use_cache:
+        args = [arg for arg in args if arg != "--no-cache"]
 
     if "--changeset" in args:
         diff_text = sys.stdin.read()
@@ -817,7 +994,7 @@ def main(argv: list[str] | None = None) -> None:
         sys.exit(1 if has_fail else 0)
 
     elif "--skills" in args:
-        results = scan_directory("skills/")
+        results = scan_directory("skills/", use_cache=use_cache)
         has_fail = _print_results(results)
         sys.exit(1 if has_fail else 0)
 
@@ -834,13 +1011,13 @@ def main(argv: list[str] | None = None) -> None:
         if mode == "mcp":
             # Directory argument follows mode
             dir_arg = args[idx + 2] if idx + 2 < len(args) else "."
-            results = scan_mcp_directory(dir_arg)
+            results = scan_mcp_directory(dir_arg, use_cache=use_cache)
             has_fail = _print_results(results)
             sys.exit(1 if has_fail else 0)
         elif mode == "skill":
             # Scan markdown files in directory (includes consent gap analysis)
             dir_arg = args[idx + 2] if idx + 2 < len(args) else "."
-            results = scan_directory(dir_arg)
+            results = scan_directory(dir_arg, use_cache=use_cache)
             has_fail = _print_results(results)
             sys.exit(1 if has_fail else 0)
         else:
@@ -854,7 +1031,7 @@ def main(argv: list[str] | None = None) -> None:
         print(
             "Usage: python -m spellbook.gates.scanner "
             "[--changeset | --staged | --base BRANCH | --commit RANGE "
-            "| --skills | --mode (mcp|skill) DIR]",
+            "| --skills | --mode (mcp|skill) DIR] [--no-cache]",
             file=sys.stderr,
         )
         sys.exit(2)
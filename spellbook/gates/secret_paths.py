@@ -37,10 +37,11 @@ there). No additional case folding is needed.
 from __future__ import annotations
 
 import logging
-import os
 from dataclasses import dataclass
 from pathlib import Path, PurePath
 
+from spellbook.core import run_context
+
 
 logger = logging.getLogger(__name__)
 
@@ -107,7 +108,7 @@ SECRET_PATH_RULES: tuple[object, ...] = (
 
 def _resolve(file_path: str) -> Path:
     """Expand ``~`` and resolve symlinks; tolerate non-existent tails."""
-    return Path(file_path).expanduser().resolve(strict=False)
+    return run_context.resolve_path(file_path)
 
 
 def _is_under(child: Path, parent: Path) -> bool:
@@ -148,7 +149,7 @@ def check_secret_path(file_path: str) -> str | None:
         )
         return None
 
-    home = Path.home().resolve()
+    home = run_context.home().resolve()
 
     for rule in SECRET_PATH_RULES:
         if isinstance(rule, HomeSubpath):
@@ -156,7 +157,7 @@ def check_secret_path(file_path: str) -> str | None:
             if _is_under(resolved, target):
                 return rule.rule_id
         elif isinstance(rule, EnvSubpath):
-            base = os.environ.get(rule.env_var)
+            base = run_context.getenv(rule.env_var)
             if not base:
                 continue
             target = (Path(base) / rule.rel).resolve(strict=False)
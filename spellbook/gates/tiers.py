@@ -43,6 +43,8 @@ from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Iterable
 
+from spellbook.core import run_context
+
 try:
     import tomllib
 except ImportError:  # Python <3.11
@@ -333,7 +335,6 @@ def classify_tool_call(
             # Local import to avoid pulling the subprocess + fnmatch deps
             # into install-time consumers that only need load_tiers /
             # derive_l2_deny_list.
-            import os as _os
             from spellbook.gates.git_push import (
                 classify_git_push,
                 load_protected_config,
@@ -344,7 +345,7 @@ def classify_tool_call(
             # Sharing _tiers_toml_path() ensures tests that override the
             # helper for _cached_tiers() also override the git-push pre-pass.
             from spellbook.gates.check import _tiers_toml_path
-            autonomous = _os.environ.get(
+            autonomous = run_context.getenv(
                 "SPELLBOOK_GIT_PUSH_AUTONOMOUS", ""
             ).strip().lower() in {"1", "true", "yes"}
             config = load_protected_config(_tiers_toml_path())
@@ -2,18 +2,26 @@
 
 Provides domain-specific health checks with status aggregation.
 Supports quick mode (liveness) and full mode (readiness).
+
+Domain checks run concurrently, each under its own deadline. With a
+:class:`HealthCache`, domains that have a TTL (``github_cli``, ``skills``,
+``coordination``) are served from the cache and refreshed in the background
+once stale, so a health check only waits for the cheap live domains.
 """
 
 import os
 import re
 import sqlite3
 import subprocess
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from spellbook.core.db import get_connection
 
@@ -31,6 +39,25 @@ MIN_GH_VERSION = "2.30.0"
 STARTUP_GRACE_SECONDS = 10.0
 MAX_HEARTBEAT_AGE_SECONDS = 30.0
 
+# Seconds a domain result stays fresh in a HealthCache. Zero means the domain
+# is checked on every call (the cheap liveness domains stay live).
+DOMAIN_TTL_SECONDS: dict[str, float] = {
+    "database": 0.0,
+    "filesystem": 0.0,
+    "watcher": 0.0,
+    "github_cli": 300.0,
+    "coordination": 300.0,
+    "skills": 60.0,
+}
+
+# Deadline for one domain check. A check still running at its deadline is
+# reported DEGRADED; with a HealthCache its eventual result is still cached.
+DEFAULT_DOMAIN_TIMEOUT_SECONDS = 5.0
+DOMAIN_TIMEOUT_SECONDS: dict[str, float] = {
+    # Two sequential gh invocations, each bounded by GH_TIMEOUT_SECONDS.
+    "github_cli": 2 * GH_TIMEOUT_SECONDS + 1.0,
+}
+
 
 class HealthStatus(str, Enum):
     """Health status levels for individual domains and overall status."""
@@ -52,6 +79,7 @@ class DomainCheck:
     message: str
     latency_ms: Optional[float] = None
     details: Optional[dict[str, Any]] = None
+    stale_after: Optional[str] = None  # ISO 8601; re-check after this time
 
 
 @dataclass
@@ -682,6 +710,135 @@ def _aggregate_status(domains: dict[str, DomainCheck]) -> HealthStatus:
     return HealthStatus.HEALTHY
 
 
+# =============================================================================
+# Concurrent Execution and Caching
+# =============================================================================
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=len(FULL_DOMAINS),
+                thread_name_prefix="spellbook-health",
+            )
+        return _executor
+
+
+def _utc_iso(dt: datetime) -> str:
+    return dt.isoformat().replace("+00:00", "Z")
+
+
+def _run_domain(domain: str, check: Callable[[], DomainCheck]) -> DomainCheck:
+    """Run one domain check and stamp when its result goes stale."""
+    result = check()
+    ttl = DOMAIN_TTL_SECONDS.get(domain, 0.0)
+    result.stale_after = _utc_iso(datetime.now(timezone.utc) + timedelta(seconds=ttl))
+    return result
+
+
+def _timed_out(domain: str, timeout: float) -> DomainCheck:
+    return DomainCheck(
+        domain=domain,
+        status=HealthStatus.DEGRADED,
+        message=f"{domain} check timed out (>{timeout}s)",
+        latency_ms=timeout * 1000,
+        details={"timeout_seconds": timeout},
+    )
+
+
+class HealthCache:
+    """Per-domain TTL cache for health results, refreshed in the background.
+
+    A fresh entry is returned as-is. A stale entry is also returned as-is
+    (its ``stale_after`` is in the past) while one background refresh
+    replaces it. Only a domain with no entry yet makes the caller wait.
+    Entries are keyed by domain plus the check's inputs (e.g. skills_dir).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[tuple, tuple[DomainCheck, float]] = {}
+        self._refreshing: dict[tuple, Future] = {}
+
+    def lookup(
+        self, domain: str, key: tuple, check: Callable[[], DomainCheck],
+    ) -> tuple[Optional[DomainCheck], Optional[Future]]:
+        """Return ``(cached, None)``, or ``(None, future)`` on a cold miss.
+
+        Starts a refresh when the entry is missing or past its TTL.
+        """
+        cache_key = (domain, *key)
+        started = None
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and time.monotonic() < entry[1]:
+                return entry[0], None
+            future = self._refreshing.get(cache_key)
+            if future is None:
+                future = started = _get_executor().submit(_run_domain, domain, check)
+                self._refreshing[cache_key] = future
+        if started is not None:
+            started.add_done_callback(lambda f: self._store(cache_key, f))
+        if entry is not None:
+            return entry[0], None
+        return None, future
+
+    def _store(self, cache_key: tuple, future: Future) -> None:
+        ttl = DOMAIN_TTL_SECONDS.get(cache_key[0], 0.0)
+        with self._lock:
+            self._refreshing.pop(cache_key, None)
+            if future.exception() is None:
+                self._entries[cache_key] = (future.result(), time.monotonic() + ttl)
+
+    def clear(self) -> None:
+        """Forget every cached result (in-flight refreshes still complete)."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared cache for the long-running server.
+health_cache = HealthCache()
+
+
+def _run_domains(
+    checks: dict[str, tuple[tuple, Callable[[], DomainCheck]]],
+    cache: Optional[HealthCache],
+) -> dict[str, DomainCheck]:
+    """Run domain checks concurrently, each bounded by its own timeout.
+
+    ``checks`` maps domain name to ``(cache key inputs, check callable)``.
+    Domains with a TTL are served through ``cache`` when one is given.
+    """
+    start = time.monotonic()
+    results: dict[str, DomainCheck] = {}
+    pending: dict[str, Future] = {}
+    for domain, (key, check) in checks.items():
+        if cache is not None and DOMAIN_TTL_SECONDS.get(domain, 0.0) > 0:
+            cached, future = cache.lookup(domain, key, check)
+            if cached is not None:
+                results[domain] = cached
+                continue
+        else:
+            future = _get_executor().submit(_run_domain, domain, check)
+        pending[domain] = future
+
+    for domain, future in pending.items():
+        timeout = DOMAIN_TIMEOUT_SECONDS.get(domain, DEFAULT_DOMAIN_TIMEOUT_SECONDS)
+        try:
+            results[domain] = future.result(
+                timeout=max(0.0, start + timeout - time.monotonic())
+            )
+        except FutureTimeoutError:
+            results[domain] = _timed_out(domain, timeout)
+
+    return {domain: results[domain] for domain in checks}
+
+
 # =============================================================================
 # Orchestration Function
 # =============================================================================
@@ -696,9 +853,14 @@ def run_health_check(
     version: str,
     tools_available: list[str],
     quick: bool = False,
+    cache: Optional[HealthCache] = None,
 ) -> HealthCheckResult:
     """Run health checks across domains.
 
+    Domains are checked concurrently; each gets ``DOMAIN_TIMEOUT_SECONDS``
+    (default ``DEFAULT_DOMAIN_TIMEOUT_SECONDS``) before it is reported
+    DEGRADED. Every domain result carries ``stale_after``.
+
     Args:
         db_path: Path to SQLite database file
         config_dir: Path to config directory (~/.config/spellbook/)
@@ -709,22 +871,30 @@ def run_health_check(
         tools_available: List of available tool names
         quick: If True, only check critical domains (liveness).
                If False, check all domains (readiness).
+        cache: Serve domains with a TTL from this cache (stale results are
+               returned while a background refresh runs). None checks
+               every domain afresh.
 
     Returns:
         HealthCheckResult with aggregated status and domain details
     """
-    domains: dict[str, DomainCheck] = {}
-
     # Always check critical domains
-    domains["database"] = _check_database(db_path)
-    domains["filesystem"] = _check_filesystem(config_dir, data_dir, skills_dir)
+    checks: dict[str, tuple[tuple, Callable[[], DomainCheck]]] = {
+        "database": ((db_path,), lambda: _check_database(db_path)),
+        "filesystem": (
+            (config_dir, data_dir, skills_dir),
+            lambda: _check_filesystem(config_dir, data_dir, skills_dir),
+        ),
+    }
 
     # Full mode: check all optional domains
     if not quick:
-        domains["watcher"] = _check_watcher(db_path, server_uptime)
-        domains["github_cli"] = _check_github_cli()
-        domains["coordination"] = _check_coordination()
-        domains["skills"] = _check_skills(skills_dir)
+        checks["watcher"] = ((db_path,), lambda: _check_watcher(db_path, server_uptime))
+        checks["github_cli"] = ((), _check_github_cli)
+        checks["coordination"] = ((), _check_coordination)
+        checks["skills"] = ((skills_dir,), lambda: _check_skills(skills_dir))
+
+    domains = _run_domains(checks, cache)
 
     # Aggregate status
     overall_status = _aggregate_status(domains)
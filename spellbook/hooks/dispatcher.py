@@ -0,0 +1,229 @@
+"""Warm hook dispatcher: run ``hooks/spellbook_hook.py`` events in the daemon.
+
+Each hook event used to cost a fresh interpreter plus the gates, bashlex and
+worker-LLM imports. The daemon keeps the hook module loaded and listens on a
+Unix domain socket; the hook script forwards its raw stdin (and environment)
+and relays the ``(exit_code, stdout, stderr)`` triple this dispatcher returns.
+
+Wire protocol (one request per connection, client half-closes after
+sending):
+
+    request:  {"script": "<abs path>", "stdin": "<raw>", "env": {...},
+               "cwd": "<abs path>"}
+    response: {"exit_code": int, "stdout": str, "stderr": str}
+              or {"fallback": true} when the request should run in-process
+
+The client treats ANY failure (missing socket, refused connection, timeout,
+malformed reply, ``fallback``) as "run in-process", so the security gates
+remain FAIL-CLOSED when the daemon is down. The socket is created with mode
+0600; only the daemon's own user can submit events.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+from pathlib import Path
+from types import ModuleType
+
+from spellbook.core.config import get_spellbook_dir
+from spellbook.core.path_utils import get_spellbook_config_dir
+
+logger = logging.getLogger(__name__)
+
+SOCKET_NAME = "hook-dispatch.sock"
+
+# Upper bound on one request. Write/Edit payloads carry whole file bodies, so
+# this is generous; anything larger is answered with ``fallback``.
+_MAX_REQUEST_BYTES = 32 * 1024 * 1024
+
+
+def get_socket_path() -> Path:
+    """Return the dispatcher socket path (mirrors the hook's resolution)."""
+    override = os.environ.get("SPELLBOOK_HOOK_SOCKET")
+    if override:
+        return Path(override)
+    return get_spellbook_config_dir() / SOCKET_NAME
+
+
+def get_hook_script_path() -> Path:
+    """Return the hook script this daemon is willing to run warm."""
+    return (get_spellbook_dir() / "hooks" / "spellbook_hook.py").resolve()
+
+
+class _HookModuleCache:
+    """Load the hook script once; reload it when the file changes on disk.
+
+    A standalone hook process always ran the current file, so edits (e.g. an
+    in-place ``spellbook update``) must take effect without a daemon restart.
+    """
+
+    def __init__(self, script: Path) -> None:
+        self.script = script
+        self._lock = threading.Lock()
+        self._module: ModuleType | None = None
+        self._stamp: tuple[int, int] | None = None
+
+    def get(self) -> ModuleType:
+        st = self.script.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            if self._module is None or stamp != self._stamp:
+                spec = importlib.util.spec_from_file_location(
+                    "spellbook_hook_warm", self.script,
+                )
+                if spec is None or spec.loader is None:
+                    raise ImportError(f"cannot load hook script {self.script}")
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                self._module = module
+                self._stamp = stamp
+            return self._module
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Serve one hook event per connection."""
+
+    server: "_DispatchServer"
+
+    def handle(self) -> None:
+        reply = self.server.dispatcher.handle_request(self._read_request())
+        try:
+            self.wfile.write(json.dumps(reply).encode())
+        except OSError:
+            # Client gave up (timeout) and is already running in-process.
+            logger.debug("hook dispatcher: client went away before reply")
+
+    def _read_request(self) -> bytes | None:
+        chunks = []
+        total = 0
+        while True:
+            chunk = self.rfile.read1(65536)
+            if not chunk:
+                return b"".join(chunks)
+            total += len(chunk)
+            if total > _MAX_REQUEST_BYTES:
+                return None
+            chunks.append(chunk)
+
+
+class _DispatchServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, dispatcher: "HookDispatcher") -> None:
+        self.dispatcher = dispatcher
+        super().__init__(path, _Handler)
+
+
+class HookDispatcher:
+    """Unix-socket server that runs hook events against a warm hook module."""
+
+    def __init__(self, socket_path: Path | None = None, script: Path | None = None):
+        """Initialize dispatcher.
+
+        Args:
+            socket_path: Where to listen (defaults to :func:`get_socket_path`).
+            script: Hook script to serve (defaults to
+                :func:`get_hook_script_path`). Requests naming any other
+                script are answered with ``fallback``.
+        """
+        self.socket_path = socket_path or get_socket_path()
+        self.script = (script or get_hook_script_path()).resolve()
+        self._modules = _HookModuleCache(self.script)
+        self._server: _DispatchServer | None = None
+        self._thread: threading.Thread | None = None
+        self._stats_lock = threading.Lock()
+        self.served = 0
+        self.fallbacks = 0
+
+    def is_running(self) -> bool:
+        """Check if the dispatcher is accepting connections."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "HookDispatcher":
+        """Bind the socket (mode 0600) and serve on a daemon thread.
+
+        Raises:
+            OSError: The socket could not be bound.
+        """
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        # A previous daemon that died without cleanup leaves a stale socket
+        # file behind; binding over it fails with EADDRINUSE.
+        self.socket_path.unlink(missing_ok=True)
+        old_umask = os.umask(0o177)
+        try:
+            self._server = _DispatchServer(str(self.socket_path), self)
+        finally:
+            os.umask(old_umask)
+        os.chmod(self.socket_path, 0o600)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="spellbook-hook-dispatcher",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info("hook dispatcher listening on %s", self.socket_path)
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and remove the socket file."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        try:
+            self.socket_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    def handle_request(self, payload: bytes | None) -> dict:
+        """Run one encoded request and return the reply object."""
+        try:
+            if payload is None:
+                return self._fallback("request too large")
+            request = json.loads(payload.decode())
+            script = request.get("script")
+            raw = request.get("stdin")
+            env = request.get("env")
+            cwd = request.get("cwd")
+            if not isinstance(raw, str) or not isinstance(env, dict):
+                return self._fallback("malformed request")
+            # Relative paths in the event (redirect targets, file_path)
+            # must resolve against the shim's directory; without one the
+            # daemon's cwd would be used, so run in-process instead.
+            if not isinstance(cwd, str) or not os.path.isabs(cwd):
+                return self._fallback("missing cwd")
+            # Only serve the hook file this daemon was installed with: a
+            # different checkout (dev tree, test run) must execute its own
+            # code, not ours.
+            if not script or Path(script).resolve() != self.script:
+                return self._fallback("foreign hook script")
+            module = self._modules.get()
+            exit_code, stdout, stderr = module.run_captured(
+                raw, {str(k): str(v) for k, v in env.items()}, cwd,
+            )
+        except Exception:
+            logger.warning("hook dispatcher: request failed", exc_info=True)
+            return self._fallback("dispatch error")
+        with self._stats_lock:
+            self.served += 1
+        return {"exit_code": exit_code, "stdout": stdout, "stderr": stderr}
+
+    def _fallback(self, reason: str) -> dict:
+        logger.debug("hook dispatcher: falling back (%s)", reason)
+        with self._stats_lock:
+            self.fallbacks += 1
+        return {"fallback": True}
+
+
+def warm_dispatch_supported() -> bool:
+    """Unix domain sockets are required; Windows hooks stay in-process."""
+    return hasattr(socket, "AF_UNIX") and os.name == "posix"
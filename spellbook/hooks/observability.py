@@ -2,7 +2,8 @@
 
 Invoked fire-and-forget from the daemon-side ``/api/hooks/record`` route
 handler (subprocess path). All failures are swallowed -- the hook must
-never be blocked by observability.
+never be blocked by observability. Inside the daemon rows are queued to
+the batched writer in ``spellbook.db.ingest``.
 
 Mirrors ``spellbook.worker_llm.observability`` in structure: a best-effort
 synchronous writer with first-failure-warn/rest-debug log policy, plus a
@@ -27,7 +28,13 @@ from sqlalchemy import delete, select
 from spellbook.core.command_utils import atomic_replace
 from spellbook.core.config import config_get
 from spellbook.db.engines import get_spellbook_sync_session
-from spellbook.db.spellbook_models import HookEvent
+from spellbook.db.ingest import enqueue
+from spellbook.db.rollups import purge_rollups
+from spellbook.db.spellbook_models import (
+    HookEvent,
+    HookEventRollupHour,
+    HookEventRollupMinute,
+)
 
 log = logging.getLogger(__name__)
 
@@ -73,20 +80,22 @@ def record_hook_event(
     """
     global _record_event_failures
     try:
-        ts = timestamp or datetime.now(timezone.utc).isoformat()
+        row = {
+            "timestamp": timestamp or datetime.now(timezone.utc).isoformat(),
+            "hook_name": hook_name,
+            "event_name": event_name,
+            "tool_name": tool_name,
+            "duration_ms": int(duration_ms),
+            "exit_code": int(exit_code),
+            "error": error,
+            "notes": notes,
+        }
+        # In the daemon the batched writer owns the INSERT; elsewhere (or
+        # while it is shutting down) fall through to a one-row write.
+        if enqueue(get_spellbook_sync_session, HookEvent, row):
+            return
         with get_spellbook_sync_session() as session:
-            session.add(
-                HookEvent(
-                    timestamp=ts,
-                    hook_name=hook_name,
-                    event_name=event_name,
-                    tool_name=tool_name,
-                    duration_ms=int(duration_ms),
-                    exit_code=int(exit_code),
-                    error=error,
-                    notes=notes,
-                ),
-            )
+            session.add(HookEvent(**row))
             # ``get_spellbook_sync_session`` commits on clean exit and rolls
             # back on exception, so no explicit flush/commit is needed here.
     except Exception as exc:
@@ -176,7 +185,10 @@ def _run_purge_once() -> None:
        ``hook_observability_retention_hours``. Batched at
        ``_PURGE_BATCH_LIMIT`` rows per transaction, each batch in a fresh
        ``get_spellbook_sync_session()`` context so the writer lock is
-       released between batches. Breaks when a DELETE returns 0 rows.
+       released between batches. Breaks when a DELETE returns 0 rows;
+       that last session also drops metric rollup buckets older than the
+       cutoff. The count cap does not apply to rollups (their size is
+       bounded by time, not traffic).
 
     2. **Count cap:** delete the oldest rows beyond the
        ``hook_observability_max_rows`` cap. Same batched-fresh-session
@@ -205,6 +217,14 @@ def _run_purge_once() -> None:
                 .all()
             )
             if not victim_ids:
+                # Raw rows are done; the rollups get the same time cap in
+                # this last (otherwise idle) session.
+                purge_rollups(
+                    session,
+                    HookEventRollupMinute.__table__,
+                    HookEventRollupHour.__table__,
+                    cutoff,
+                )
                 break
             session.execute(
                 delete(HookEvent).where(HookEvent.id.in_(victim_ids)),
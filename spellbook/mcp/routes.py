@@ -153,7 +153,9 @@ async def api_worker_llm_enqueue(request: Request) -> JSONResponse:
 
     Returns:
         - 202 ``{"ok": true, "dropped": false}`` when queued.
-        - 202 ``{"ok": true, "dropped": true}`` when queued with drop-oldest.
+        - 202 ``{"ok": true, "dropped": true}`` when the queue was full and
+          a task was dropped (the oldest lower-priority one, or this task
+          when everything queued outranks it).
         - 503 when ``worker_llm_queue_enabled`` is False or the queue is
           not running in this process.
         - 400 on missing/invalid fields.
@@ -210,7 +212,7 @@ async def api_worker_llm_enqueue(request: Request) -> JSONResponse:
         return JSONResponse({"error": str(e)}, status_code=503)
 
     # 202 Accepted: queued, not yet processed. ``dropped`` reflects the
-    # drop-oldest eviction; callers may log it.
+    # overflow eviction; callers may log it.
     return JSONResponse(
         {"ok": True, "dropped": not queued}, status_code=202
     )
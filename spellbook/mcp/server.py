@@ -154,6 +154,10 @@ def startup() -> None:
         _timed("update_watcher_start", update_watcher.start)
         state.update_watcher = update_watcher
 
+    # Serve hook events warm over a Unix socket unless explicitly disabled
+    if config_get("hook_warm_dispatch") is not False:
+        _timed("hook_dispatcher_start", _start_hook_dispatcher)
+
     # Mount admin web interface
     _timed("mount_admin", _mount_admin_app)
 
@@ -166,6 +170,21 @@ def shutdown() -> None:
         state.watcher.stop()
     if state.update_watcher is not None:
         state.update_watcher.stop()
+    try:
+        from spellbook.core.file_watch import stop_file_watch_service
+
+        stop_file_watch_service()
+    except Exception:
+        pass
+    if state.hook_dispatcher is not None:
+        state.hook_dispatcher.stop()
+        state.hook_dispatcher = None
+    try:
+        from spellbook.db.ingest import stop_ingestion
+
+        stop_ingestion()
+    except Exception:
+        pass
 
     try:
         from spellbook.core.db import close_all_connections
@@ -196,6 +215,19 @@ def shutdown() -> None:
 atexit.register(shutdown)
 
 
+def _start_hook_dispatcher() -> None:
+    """Start the warm hook dispatcher. Hooks fall back to in-process on failure."""
+    from spellbook.hooks.dispatcher import HookDispatcher, warm_dispatch_supported
+
+    if not warm_dispatch_supported():
+        logger.debug("Warm hook dispatch unsupported on this platform")
+        return
+    try:
+        state.hook_dispatcher = HookDispatcher().start()
+    except OSError:
+        logger.warning("Failed to start warm hook dispatcher", exc_info=True)
+
+
 def _mount_admin_app() -> None:
     """Mount the admin web interface if admin_enabled config is true."""
     try:
@@ -4,6 +4,7 @@ import time
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from spellbook.hooks.dispatcher import HookDispatcher
     from spellbook.sessions.watcher import SessionWatcher
     from spellbook.updates.watcher import UpdateWatcher
 
@@ -13,3 +14,4 @@ last_full_health_check_time: float = 0.0
 FULL_HEALTH_CHECK_INTERVAL_SECONDS: float = 300.0
 watcher: Optional["SessionWatcher"] = None
 update_watcher: Optional["UpdateWatcher"] = None
+hook_dispatcher: Optional["HookDispatcher"] = None
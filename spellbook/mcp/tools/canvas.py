@@ -227,7 +227,12 @@ async def canvas_write(
 
     await _publish_canvas_event(
         "canvas.updated",
-        {"canvas": canvas, "page": page, "bytes": nbytes},
+        {
+            "canvas": canvas,
+            "page": page,
+            "bytes": nbytes,
+            "etag": canvas_store.canvas_etag(canvas),
+        },
     )
     return {
         "status": "written",
@@ -387,7 +392,12 @@ async def canvas_decision_open(
     url = _canvas_url(canvas)
     await _publish_canvas_event(
         CANVAS_DECISION_OPENED,
-        {"canvas": canvas, "decision_id": decision_id, "kind": kind},
+        {
+            "canvas": canvas,
+            "decision_id": decision_id,
+            "kind": kind,
+            "etag": canvas_store.canvas_etag(canvas),
+        },
     )
     await _notify_decision_ready(prompt, url, sid)
     return {
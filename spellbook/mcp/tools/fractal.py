@@ -15,6 +15,7 @@ __all__ = [
     "fractal_query_contradictions",
     "fractal_get_saturation_status",
     "fractal_claim_work",
+    "fractal_claim_work_batch",
     "fractal_synthesize_node",
     "fractal_get_claimable_work",
     "fractal_get_ready_to_synthesize",
@@ -30,6 +31,7 @@ from spellbook.fractal.graph_ops import (
 from spellbook.fractal.node_ops import (
     add_node as do_fractal_add_node,
     claim_work as do_fractal_claim_work,
+    claim_work_batch as do_fractal_claim_work_batch,
     mark_saturated as do_fractal_mark_saturated,
     synthesize_node as do_fractal_synthesize_node,
     update_node as do_fractal_update_node,
@@ -210,6 +212,18 @@ async def fractal_claim_work(graph_id: str, worker_id: str, session_id: str = ""
         return {"error": str(e)}
 
 
+@mcp.tool()
+async def fractal_claim_work_batch(graph_id: str, worker_id: str, max_nodes: int = 5, session_id: str = ""):
+    """Atomically claim up to max_nodes question nodes for a worker, in fractal_claim_work order. Returns {nodes, graph_done}."""
+    try:
+        return await do_fractal_claim_work_batch(
+            graph_id=graph_id, worker_id=worker_id, max_nodes=max_nodes,
+            session_id=session_id or None,
+        )
+    except ValueError as e:
+        return {"error": str(e)}
+
+
 @mcp.tool()
 async def fractal_synthesize_node(graph_id: str, node_id: str, synthesis_text: str):
     """Mark a node as synthesized with synthesis text. Validates all child questions are complete."""
@@ -14,7 +14,7 @@ from spellbook.mcp.server import mcp
 from spellbook.mcp import state as _state
 from spellbook.core.config import get_spellbook_dir
 from spellbook.core.db import get_db_path
-from spellbook.health.checker import run_health_check
+from spellbook.health.checker import health_cache, run_health_check
 from spellbook.core.path_utils import get_spellbook_config_dir
 
 # Use shared state from spellbook.mcp.state for health check tracking
@@ -91,7 +91,7 @@ def spellbook_health_check(full: bool = False) -> dict:
             "version": "0.2.1",
             "tools_available": ["spellbook_session_init", ...],
             "uptime_seconds": 123.4,
-            "domains": {...},  # Present when full check runs
+            "domains": {...},  # Per-domain results, each with stale_after
             "checked_at": "2026-02-09T12:00:00Z"
         }
     """
@@ -134,6 +134,7 @@ def spellbook_health_check(full: bool = False) -> dict:
             version=_get_version(),
             tools_available=get_tool_names(),
             quick=not run_full,  # run_full=True means quick=False
+            cache=health_cache,
         )
 
         # Update tracking state if we ran a full check
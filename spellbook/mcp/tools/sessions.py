@@ -20,7 +20,11 @@ from spellbook.core.path_utils import (
     get_project_dir_from_context,
     get_project_path_from_context,
 )
-from spellbook.sessions.parser import list_sessions_with_samples, split_by_char_limit
+from spellbook.sessions.parser import (
+    find_sessions_by_name,
+    list_sessions_with_samples,
+    split_by_char_limit,
+)
 from spellbook.sdk.unified import get_agent_client, AgentOptions
 
 
@@ -45,26 +49,9 @@ async def find_session(ctx: Context, name: str, limit: int = 10) -> List[Dict[st
     if not project_dir.exists():
         return []
 
-    # Load all sessions using list_sessions_with_samples
-    # Use a high limit to get all sessions, then filter
-    all_sessions = list_sessions_with_samples(str(project_dir), limit=1000)
-
-    # Normalize search query
-    name_lower = name.strip().lower()
-
-    # Filter by name match in slug or custom_title
-    # Empty string matches all (as per design doc)
-    if not name_lower:
-        matches = all_sessions
-    else:
-        matches = [
-            s for s in all_sessions
-            if (s.get('slug') and name_lower in s['slug'].lower())
-            or (s.get('custom_title') and name_lower in s['custom_title'].lower())
-        ]
-
-    # Already sorted by last_activity in list_sessions_with_samples
-    return matches[:limit]
+    # Matched against the session catalog rather than re-parsing every file.
+    # Empty string matches all (as per design doc).
+    return find_sessions_by_name(str(project_dir), name, limit)
 
 
 @mcp.tool()
@@ -0,0 +1,482 @@
+"""Persistent session metadata catalog.
+
+Listing sessions used to open and JSON-parse every line of every
+``*.jsonl`` file under ``~/.claude/projects`` on each request, just to get
+counts, timestamps, slug and first message. The catalog keeps one SQLite
+row per session file, keyed by ``(size, mtime_ns, dev, inode)``:
+
+- an unchanged file costs one ``stat()``;
+- a file that grew is parsed from the last consumed byte offset only;
+- a truncated, rewritten or rotated file is re-parsed from the start.
+
+Listing, search and sort are then served from indexed columns instead of
+re-reading session files. The catalog lives next to ``spellbook.db`` in
+``session-catalog.db``; it is a pure cache and is rebuilt on schema change
+or if the file cannot be opened.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from spellbook.core.path_utils import get_spellbook_config_dir
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILENAME = "session-catalog.db"
+
+# Bump when the stats layout or the per-message extraction changes; older
+# catalogs are dropped and rebuilt from the session files.
+_SCHEMA_VERSION = 1
+
+# Number of trailing messages kept for ``recent_messages`` samples.
+_RECENT_MESSAGES = 5
+
+# Bytes immediately before the parsed offset that must still match for an
+# append to be trusted (catches in-place rewrites that keep the inode).
+_ANCHOR_BYTES = 64
+
+# Rows for project directories that no longer exist are garbage-collected
+# at most this often.
+_PRUNE_INTERVAL_SECONDS = 3600.0
+
+SORT_COLUMNS = {
+    "last_activity": "last_activity",
+    "created_at": "created_at",
+    "message_count": "message_count",
+    "size_bytes": "size",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    path TEXT PRIMARY KEY,
+    project_dir TEXT NOT NULL,
+    dev INTEGER NOT NULL,
+    ino INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    parsed_offset INTEGER NOT NULL,
+    anchor BLOB NOT NULL,
+    state TEXT NOT NULL,
+    stats TEXT NOT NULL,
+    message_count INTEGER NOT NULL,
+    parse_errors INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    last_activity TEXT NOT NULL,
+    listing_search TEXT NOT NULL,
+    name_search TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_dir_activity ON sessions(project_dir, last_activity);
+CREATE INDEX IF NOT EXISTS idx_sessions_activity ON sessions(last_activity);
+CREATE INDEX IF NOT EXISTS idx_sessions_created ON sessions(created_at);
+CREATE INDEX IF NOT EXISTS idx_sessions_messages ON sessions(message_count);
+CREATE INDEX IF NOT EXISTS idx_sessions_size ON sessions(size);
+"""
+
+
+def _content_of(entry: dict) -> Any:
+    message = entry.get("message")
+    return message.get("content", "") if isinstance(message, dict) else ""
+
+
+@dataclass
+class SessionStats:
+    """Running metadata for one session file, fed one message at a time.
+
+    Field semantics match the two historical full-file scanners exactly:
+    the admin listing (first slug, any ``customTitle``, first *text* of the
+    first user message, 200 chars) and ``list_sessions_with_samples``
+    (last slug, ``custom-title`` entries only, 500-char samples).
+    """
+
+    message_count: int = 0
+    parse_errors: int = 0
+    created_at: Optional[str] = None
+    last_activity: Optional[str] = None
+    first_slug: Optional[str] = None
+    last_slug: Optional[str] = None
+    any_custom_title: Optional[str] = None
+    custom_title: Optional[str] = None
+    first_user_message: Optional[str] = None
+    first_user_sample: Optional[str] = None
+    seen_user: bool = False
+    char_count: int = 0
+    compact_count: int = 0
+    last_compact_line: Optional[int] = None
+    last_compact_summary: Any = None
+    awaiting_compact_summary: bool = False
+    recent: list = field(default_factory=list)
+
+    def feed_line(self, line: bytes) -> None:
+        """Consume one raw JSONL line (blank lines are ignored)."""
+        line = line.strip()
+        if not line:
+            return
+        try:
+            entry = json.loads(line.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            self.parse_errors += 1
+            return
+        if not isinstance(entry, dict):
+            self.parse_errors += 1
+            return
+        self._feed(entry)
+
+    def _feed(self, entry: dict) -> None:
+        index = self.message_count
+        self.message_count += 1
+        self.char_count += len(json.dumps(entry))
+
+        if self.awaiting_compact_summary:
+            self.awaiting_compact_summary = False
+            if entry.get("isCompactSummary"):
+                self.last_compact_summary = _content_of(entry)
+
+        slug = entry.get("slug")
+        if slug:
+            if self.first_slug is None:
+                self.first_slug = slug
+            self.last_slug = slug
+
+        ts = entry.get("timestamp")
+        if ts:
+            if self.created_at is None:
+                self.created_at = ts
+            self.last_activity = ts
+
+        if entry.get("customTitle"):
+            self.any_custom_title = entry["customTitle"]
+
+        msg_type = entry.get("type")
+        if msg_type == "custom-title":
+            self.custom_title = entry.get("customTitle")
+
+        if msg_type == "system" and entry.get("subtype") == "compact_boundary":
+            self.compact_count += 1
+            self.last_compact_line = index
+            self.last_compact_summary = None
+            self.awaiting_compact_summary = True
+
+        if msg_type == "user":
+            content = _content_of(entry)
+            if not self.seen_user:
+                self.seen_user = True
+                self.first_user_sample = (
+                    content[:500] if isinstance(content, str) else str(content)[:500]
+                )
+            if self.first_user_message is None:
+                if isinstance(content, str):
+                    self.first_user_message = content[:200]
+                elif isinstance(content, list):
+                    for block in content:
+                        if isinstance(block, dict) and block.get("type") == "text":
+                            self.first_user_message = block.get("text", "")[:200]
+                            break
+
+        sample = None
+        if msg_type in ("user", "assistant"):
+            content = _content_of(entry)
+            if isinstance(content, list):
+                content = json.dumps(content)
+            sample = str(content)[:500]
+        self.recent.append(sample)
+        del self.recent[:-_RECENT_MESSAGES]
+
+    def copy(self) -> "SessionStats":
+        return SessionStats.from_json(self.to_json())
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, raw: str) -> "SessionStats":
+        data = json.loads(raw)
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+    @property
+    def listing_search(self) -> str:
+        """Lower-cased haystack for the admin listing's free-text search."""
+        parts = (self.first_user_message, self.first_slug, self.any_custom_title)
+        return "\x00".join((p or "").lower() for p in parts)
+
+    @property
+    def name_search(self) -> str:
+        """Lower-cased haystack for name lookups (slug and custom title)."""
+        parts = (self.last_slug, self.custom_title)
+        return "\x00".join((p or "").lower() for p in parts)
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """One catalog row as returned by :meth:`SessionCatalog.query`."""
+
+    path: str
+    project_dir: str
+    size: int
+    stats: SessionStats
+
+    @property
+    def session_id(self) -> str:
+        return Path(self.path).stem
+
+    @property
+    def project(self) -> str:
+        return Path(self.project_dir).name
+
+
+def _read_appended(
+    path: str, st: os.stat_result, offset: int, anchor: bytes,
+) -> tuple[bytes, bytes] | None:
+    """Return ``(complete_lines, unterminated_tail)`` from ``offset`` to EOF.
+
+    Returns None when the bytes just before ``offset`` no longer equal
+    ``anchor``, i.e. the file was rewritten in place and the stored state
+    no longer applies.
+    """
+    with open(path, "rb") as f:
+        if offset > 0:
+            f.seek(offset - len(anchor))
+            if f.read(len(anchor)) != anchor:
+                return None
+        data = f.read(max(0, st.st_size - offset))
+    cut = data.rfind(b"\n") + 1
+    return data[:cut], data[cut:]
+
+
+class SessionCatalog:
+    """SQLite-backed index of session JSONL metadata.
+
+    Thread-safe: one connection shared behind a lock. Callers first
+    :meth:`sync_directory` each project directory they are about to list,
+    then :meth:`query` it.
+    """
+
+    def __init__(self, db_path: Path | str | None = None):
+        """Open (or create) the catalog.
+
+        Args:
+            db_path: Catalog database file. Defaults to
+                ``<config dir>/session-catalog.db``; ``":memory:"`` keeps it
+                in-process only.
+        """
+        if db_path is None:
+            db_path = get_spellbook_config_dir() / CATALOG_FILENAME
+        self.db_path = str(db_path)
+        self._lock = threading.Lock()
+        self._last_prune = 0.0
+        try:
+            self._conn = self._open(self.db_path)
+        except (OSError, sqlite3.Error) as e:
+            # Read-only home, corrupt file, ...: stay correct, lose persistence.
+            logger.warning("session catalog unavailable at %s (%s); using memory", self.db_path, e)
+            self.db_path = ":memory:"
+            self._conn = self._open(self.db_path)
+
+    @staticmethod
+    def _open(db_path: str) -> sqlite3.Connection:
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(db_path, timeout=5.0, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != _SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS sessions")
+                conn.executescript(_SCHEMA)
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            conn.commit()
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # -- maintenance ---------------------------------------------------
+
+    def sync_directory(self, project_dir: Path | str) -> None:
+        """Bring the rows for ``project_dir/*.jsonl`` up to date.
+
+        Unchanged files cost one ``stat()``; grown files are parsed from
+        their stored offset; vanished files are dropped.
+        """
+        project_dir = str(project_dir)
+        current: dict[str, os.stat_result] = {}
+        try:
+            with os.scandir(project_dir) as it:
+                for dirent in it:
+                    if not dirent.name.endswith(".jsonl"):
+                        continue
+                    try:
+                        if dirent.is_file():
+                            current[dirent.path] = dirent.stat()
+                    except OSError:
+                        continue
+        except OSError:
+            current = {}
+
+        with self._lock:
+            known = {
+                row[0]: row[1:]
+                for row in self._conn.execute(
+                    "SELECT path, dev, ino, size, mtime_ns, parsed_offset "
+                    "FROM sessions WHERE project_dir = ?",
+                    (project_dir,),
+                )
+            }
+            with self._conn:
+                gone = [(p,) for p in known if p not in current]
+                if gone:
+                    self._conn.executemany("DELETE FROM sessions WHERE path = ?", gone)
+                for path, st in current.items():
+                    prev = known.get(path)
+                    key = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+                    if prev is not None and tuple(prev[:4]) == key:
+                        continue
+                    try:
+                        self._update_file(path, project_dir, st, prev)
+                    except OSError:
+                        self._conn.execute("DELETE FROM sessions WHERE path = ?", (path,))
+
+    def _update_file(self, path: str, project_dir: str, st: os.stat_result, prev) -> None:
+        state = SessionStats()
+        offset = 0
+        anchor = b""
+        if prev is not None:
+            dev, ino, _size, _mtime, prev_offset = prev
+            if (dev, ino) == (st.st_dev, st.st_ino) and st.st_size >= prev_offset:
+                row = self._conn.execute(
+                    "SELECT state, anchor FROM sessions WHERE path = ?", (path,),
+                ).fetchone()
+                state = SessionStats.from_json(row[0])
+                anchor = bytes(row[1])
+                offset = prev_offset
+
+        chunk = _read_appended(path, st, offset, anchor)
+        if chunk is None:
+            state, offset, anchor = SessionStats(), 0, b""
+            chunk = _read_appended(path, st, 0, anchor)
+        complete, tail = chunk
+        for line in complete.split(b"\n"):
+            state.feed_line(line)
+        offset += len(complete)
+        anchor = (anchor + complete)[-_ANCHOR_BYTES:]
+
+        # A trailing line without its newline yet (writer mid-append, or a
+        # file that simply lacks the final newline) counts toward what callers
+        # see, but is not committed: the next sync re-reads it.
+        stats = state
+        if tail.strip():
+            stats = state.copy()
+            stats.feed_line(tail)
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO sessions (path, project_dir, dev, ino, size, "
+            "mtime_ns, parsed_offset, anchor, state, stats, message_count, "
+            "parse_errors, created_at, last_activity, listing_search, name_search) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                path, project_dir, st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns,
+                offset, anchor, state.to_json(), stats.to_json(), stats.message_count,
+                stats.parse_errors, stats.created_at or "", stats.last_activity or "",
+                stats.listing_search, stats.name_search,
+            ),
+        )
+
+    def prune_missing_directories(self, force: bool = False) -> int:
+        """Drop rows whose project directory no longer exists.
+
+        Rate-limited to once per ``_PRUNE_INTERVAL_SECONDS`` unless ``force``.
+        Returns the number of directories dropped.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_prune < _PRUNE_INTERVAL_SECONDS:
+            return 0
+        self._last_prune = now
+        with self._lock:
+            dirs = [r[0] for r in self._conn.execute("SELECT DISTINCT project_dir FROM sessions")]
+            missing = [(d,) for d in dirs if not os.path.isdir(d)]
+            if missing:
+                with self._conn:
+                    self._conn.executemany("DELETE FROM sessions WHERE project_dir = ?", missing)
+        return len(missing)
+
+    # -- queries -------------------------------------------------------
+
+    def query(
+        self,
+        project_dirs: Iterable[Path | str],
+        *,
+        search: Optional[str] = None,
+        search_in: str = "listing",
+        sort: str = "last_activity",
+        descending: bool = True,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        parsed_only: bool = False,
+    ) -> tuple[list[CatalogEntry], int]:
+        """Return one page of sessions plus the total match count.
+
+        Args:
+            project_dirs: Directories to list (already synced by the caller).
+            search: Case-insensitive substring; empty/None matches everything.
+            search_in: ``"listing"`` (first message, slug, title) or
+                ``"name"`` (slug and ``custom-title`` only).
+            sort: Key of :data:`SORT_COLUMNS`; unknown keys sort by activity.
+            descending: Sort direction.
+            limit: Page size (None for all).
+            offset: Rows to skip.
+            parsed_only: Exclude empty sessions and sessions with any
+                malformed line (``list_sessions_with_samples`` semantics).
+        """
+        where = ["project_dir IN (SELECT value FROM json_each(?))", "size > 0"]
+        params: list[Any] = [json.dumps([str(d) for d in project_dirs])]
+        if parsed_only:
+            where.append("message_count > 0 AND parse_errors = 0")
+        if search:
+            column = "name_search" if search_in == "name" else "listing_search"
+            where.append(f"instr({column}, ?) > 0")
+            params.append(search.lower())
+        clause = " AND ".join(where)
+        column = SORT_COLUMNS.get(sort, "last_activity")
+        direction = "DESC" if descending else "ASC"
+
+        with self._lock:
+            total = self._conn.execute(
+                f"SELECT COUNT(*) FROM sessions WHERE {clause}", params,
+            ).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT path, project_dir, size, stats FROM sessions WHERE {clause} "
+                f"ORDER BY {column} {direction}, path LIMIT ? OFFSET ?",
+                [*params, -1 if limit is None else limit, offset],
+            ).fetchall()
+        entries = [
+            CatalogEntry(path=p, project_dir=d, size=s, stats=SessionStats.from_json(raw))
+            for p, d, s, raw in rows
+        ]
+        return entries, total
+
+
+_catalog: SessionCatalog | None = None
+_catalog_lock = threading.Lock()
+
+
+def get_session_catalog() -> SessionCatalog:
+    """Return the process-wide catalog, opening it on first use."""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = SessionCatalog()
+        return _catalog
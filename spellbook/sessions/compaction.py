@@ -6,12 +6,15 @@ that can be injected into subsequent tool responses.
 """
 
 import json
+import logging
 import os
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 from dataclasses import dataclass, asdict
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class CompactionEvent:
@@ -86,12 +89,20 @@ def save_state(state: Dict[str, Any]) -> None:
         json.dump(state, f, indent=2)
 
 
-def check_for_compaction(project_path: str = None) -> Optional[CompactionEvent]:
+def check_for_compaction(
+    project_path: str = None, session_file: Optional[Path] = None,
+) -> Optional[CompactionEvent]:
     """
     Check for new compaction events in the current project's session.
 
+    Reads only the complete lines appended since the last check (the byte
+    offset is kept in the state file), and rewrites the state file only
+    when something changed.
+
     Args:
         project_path: Project path to check (defaults to cwd)
+        session_file: Session file to check (defaults to the most recently
+            modified one in the project's session directory)
 
     Returns:
         CompactionEvent if new compaction detected, None otherwise
@@ -99,7 +110,8 @@ def check_for_compaction(project_path: str = None) -> Optional[CompactionEvent]:
     if project_path is None:
         project_path = os.getcwd()
 
-    session_file = _get_current_session_file(project_path)
+    if session_file is None:
+        session_file = _get_current_session_file(project_path)
     if not session_file:
         return None
 
@@ -108,25 +120,45 @@ def check_for_compaction(project_path: str = None) -> Optional[CompactionEvent]:
 
     # Get last check info for this project
     last_check = state['last_check'].get(project_path, {})
-    last_session_id = last_check.get('session_id')
-    last_line_count = last_check.get('line_count', 0)
-
-    # Read session file
+    if session_id != last_check.get('session_id'):
+        # Different session: start fresh
+        offset, line_count = 0, 0
+    else:
+        offset = last_check.get('offset')
+        line_count = last_check.get('line_count', 0)
+
+    # Read the lines appended since the last check
     try:
-        with open(session_file, 'r') as f:
-            lines = f.readlines()
+        with open(session_file, 'rb') as f:
+            if offset is None:
+                # State written before offsets were tracked: skip the
+                # lines already checked.
+                for _ in range(line_count):
+                    if not f.readline():
+                        break
+                offset = f.tell()
+            elif offset > os.fstat(f.fileno()).st_size:
+                # Truncated (session reset): start fresh
+                offset, line_count = 0, 0
+            f.seek(offset)
+            chunk = f.read()
     except OSError:
         return None
 
-    current_line_count = len(lines)
-
-    # If different session or fewer lines (session reset), start fresh
-    if session_id != last_session_id:
-        last_line_count = 0
+    # A trailing line without its newline may still be mid-write
+    complete = chunk[:chunk.rfind(b'\n') + 1]
+    if (
+        not complete
+        and last_check.get('session_id') == session_id
+        and last_check.get('offset') == offset
+    ):
+        # Nothing new since the last check
+        return None
 
     # Check new lines for compaction events
     compaction_event = None
-    for line in lines[last_line_count:]:
+    lines = complete.splitlines()
+    for line in lines:
         line = line.strip()
         if not line:
             continue
@@ -142,13 +174,14 @@ def check_for_compaction(project_path: str = None) -> Optional[CompactionEvent]:
                     project_path=project_path,
                     injected=False,
                 )
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, UnicodeDecodeError):
             continue
 
     # Update state
     state['last_check'][project_path] = {
         'session_id': session_id,
-        'line_count': current_line_count,
+        'line_count': line_count + len(lines),
+        'offset': offset + len(complete),
     }
 
     if compaction_event:
@@ -273,35 +306,57 @@ class CompactionWatcher:
     """
     Background watcher for compaction events.
 
-    Can be run in a separate thread to continuously monitor for compaction.
+    Subscribes to the shared file-watch service
+    (``spellbook.core.file_watch``) and checks a session file only when it
+    is created or appended to; there is no polling thread of its own.
     """
 
-    def __init__(self, project_path: str = None, poll_interval: float = 2.0):
+    def __init__(
+        self,
+        project_path: str = None,
+        poll_interval: float = 2.0,
+        on_compaction: Optional[Callable[[CompactionEvent], None]] = None,
+    ):
+        """
+        Args:
+            project_path: Project to watch (defaults to cwd)
+            poll_interval: Scan interval for the shared file-watch service
+                when inotify is unavailable; only applies if this watcher
+                is the first to start the service.
+            on_compaction: Called (on the service thread) with each
+                detected CompactionEvent.
+        """
         self.project_path = project_path or os.getcwd()
         self.poll_interval = poll_interval
-        self._running = False
+        self.on_compaction = on_compaction
+        self._subscription = None
 
     def start(self):
-        """Start watching in a background thread."""
-        import threading
-        self._running = True
-        thread = threading.Thread(target=self._watch_loop, daemon=True)
-        thread.start()
-        return thread
+        """Start watching; returns the file-watch subscription."""
+        from spellbook.core.file_watch import get_file_watch_service
+
+        self._subscription = get_file_watch_service(self.poll_interval).subscribe(
+            _get_claude_session_dir(self.project_path),
+            self._on_file_event,
+            suffix='.jsonl',
+        )
+        return self._subscription
 
     def stop(self):
         """Stop the watcher."""
-        self._running = False
-
-    def _watch_loop(self):
-        """Main watch loop."""
-        while self._running:
-            try:
-                event = check_for_compaction(self.project_path)
-                if event:
-                    # Could trigger callback here
-                    pass
-            except Exception:
-                pass
-
-            time.sleep(self.poll_interval)
+        subscription, self._subscription = self._subscription, None
+        if subscription is not None:
+            subscription.cancel()
+
+    def _on_file_event(self, event):
+        """Check the changed session file (or rescan the directory)."""
+        from spellbook.core.file_watch import RESCAN
+
+        session_file = None if event.kind == RESCAN else event.path
+        try:
+            compaction = check_for_compaction(self.project_path, session_file)
+        except Exception:
+            logger.debug("Compaction check failed", exc_info=True)
+            return
+        if compaction and self.on_compaction is not None:
+            self.on_compaction(compaction)
@@ -0,0 +1,317 @@
+"""Byte-offset line index for session transcripts.
+
+Paging through a transcript used to mean reading it from the top to reach
+page N and to count its lines. :class:`LineIndex` keeps a sidecar file per
+transcript holding the byte offset of every non-blank line as a packed
+``array('Q')``. The sidecar is built once, extended from the previously
+indexed byte on append, and memory-mapped on read, so a page request seeks
+straight to its lines, decodes only those, and gets the total for free.
+
+Sidecar layout (``<config dir>/line-index/<sha256(path)[:32]>.idx``)::
+
+    header  _HEADER, padded to _DATA_START bytes
+    data    little-endian uint64 line start offsets, ``count`` entries
+
+The header records the transcript's ``(dev, inode)``, how many bytes are
+indexed, and the bytes just before that point; if any of them stop matching
+(rotation, truncation, in-place rewrite) the sidecar is rebuilt.
+
+Next to each sidecar, ``<digest>.src`` holds the transcript's path so
+:func:`prune_sidecars` can drop sidecars whose transcript has been deleted.
+It runs at most once per ``_PRUNE_INTERVAL_S`` from :func:`open_line_index`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+from pathlib import Path
+
+from spellbook.core.path_utils import get_spellbook_config_dir
+
+INDEX_DIRNAME = "line-index"
+
+_MAGIC = b"SBLX"
+_VERSION = 1
+_ANCHOR_BYTES = 64
+# magic, version, anchor_len, dev, ino, indexed_bytes, count, anchor
+_HEADER = struct.Struct("<4sHHQQQQ64s")
+_DATA_START = 128
+_READ_CHUNK = 1 << 20
+
+_SOURCE_SUFFIX = ".src"
+_PRUNE_INTERVAL_S = 3600.0
+_STALE_TMP_S = 3600.0
+
+# Striped locks: a fixed pool shared by hash, so memory stays bounded no
+# matter how many transcripts get indexed over the process lifetime.
+_LOCK_STRIPES = 64
+_locks = tuple(threading.Lock() for _ in range(_LOCK_STRIPES))
+
+_last_prune = 0.0
+_prune_guard = threading.Lock()
+
+
+def _lock_for(key: str) -> threading.Lock:
+    return _locks[hash(key) % _LOCK_STRIPES]
+
+
+def get_index_path(transcript: Path | str) -> Path:
+    """Return the sidecar path for ``transcript``."""
+    digest = hashlib.sha256(os.fsencode(os.path.abspath(transcript))).hexdigest()[:32]
+    return get_spellbook_config_dir() / INDEX_DIRNAME / f"{digest}.idx"
+
+
+def _scan_offsets(f, start: int, end: int, offsets: array) -> bytes:
+    """Append start offsets of non-blank complete lines in ``[start, end)``.
+
+    Returns the bytes after the last newline (the unterminated tail).
+    """
+    f.seek(start)
+    pos = start
+    carry = b""
+    while pos < end:
+        chunk = f.read(min(_READ_CHUNK, end - pos))
+        if not chunk:
+            break
+        data = carry + chunk
+        base = pos - len(carry)
+        pos += len(chunk)
+        line_start = 0
+        while True:
+            nl = data.find(b"\n", line_start)
+            if nl < 0:
+                break
+            if data[line_start:nl].strip():
+                offsets.append(base + line_start)
+            line_start = nl + 1
+        carry = data[line_start:]
+    return carry
+
+
+class LineIndex:
+    """Line offsets for one transcript; use :meth:`open` as a context manager.
+
+    Line numbers are 0-based positions among non-blank lines, matching how
+    the readers have always counted (blank lines are skipped). A final line
+    without a trailing newline is counted but never written to the sidecar.
+    """
+
+    def __init__(self, transcript: Path, offsets, indexed_bytes: int, tail: bytes, mapped=None):
+        self.transcript = transcript
+        self._offsets = offsets
+        self._indexed_bytes = indexed_bytes
+        self._tail = tail if tail.strip() else b""
+        self._mapped = mapped
+
+    @classmethod
+    def open(cls, transcript: Path | str, index_path: Path | None = None) -> "LineIndex":
+        """Build or extend the sidecar for ``transcript`` and map it.
+
+        Falls back to an in-memory index when the sidecar cannot be
+        written (read-only home directory, full disk).
+
+        Raises:
+            OSError: The transcript itself cannot be read.
+        """
+        transcript = Path(transcript)
+        index_path = index_path or get_index_path(transcript)
+        with _lock_for(str(index_path)), open(transcript, "rb") as f:
+            st = os.fstat(f.fileno())
+            try:
+                indexed, count, tail = _refresh_sidecar(f, st, index_path)
+                fd = os.open(index_path, os.O_RDONLY)
+            except OSError:
+                offsets = array("Q")
+                tail = _scan_offsets(f, 0, st.st_size, offsets)
+                return cls(transcript, offsets, st.st_size - len(tail), tail)
+        try:
+            mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        view = memoryview(mapped)[_DATA_START:_DATA_START + 8 * count].cast("Q")
+        if sys.byteorder != "little":
+            view = array("Q", view)
+            view.byteswap()
+        return cls(transcript, view, indexed, tail, mapped)
+
+    def __enter__(self) -> "LineIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._mapped is not None:
+            if isinstance(self._offsets, memoryview):
+                self._offsets.release()
+            self._mapped.close()
+            self._mapped = None
+
+    def __len__(self) -> int:
+        return len(self._offsets) + (1 if self._tail else 0)
+
+    def lines(self, start: int, stop: int) -> list[bytes]:
+        """Return raw (stripped) lines ``[start, stop)``; out-of-range is clipped."""
+        count = len(self._offsets)
+        start = max(0, start)
+        stop = min(stop, len(self))
+        if start >= stop:
+            return []
+        result: list[bytes] = []
+        if start < count:
+            begin = self._offsets[start]
+            end = self._offsets[stop] if stop < count else self._indexed_bytes
+            with open(self.transcript, "rb") as f:
+                f.seek(begin)
+                data = f.read(end - begin)
+            result = [line.strip() for line in data.split(b"\n") if line.strip()]
+        if stop > count:
+            result.append(self._tail.strip())
+        return result
+
+    def line(self, n: int) -> bytes:
+        """Return raw line ``n``."""
+        found = self.lines(n, n + 1)
+        if not found:
+            raise IndexError(n)
+        return found[0]
+
+
+def _refresh_sidecar(f, st: os.stat_result, index_path: Path) -> tuple[int, int, bytes]:
+    """Bring the sidecar up to date; return ``(indexed_bytes, count, tail)``."""
+    header = None
+    try:
+        with open(index_path, "rb") as idx:
+            raw = idx.read(_HEADER.size)
+            sidecar_size = os.fstat(idx.fileno()).st_size
+        if len(raw) == _HEADER.size:
+            header = _HEADER.unpack(raw)
+    except FileNotFoundError:
+        pass
+
+    if header is not None:
+        magic, version, anchor_len, dev, ino, indexed, count, anchor = header
+        anchor = anchor[:anchor_len]
+        if (
+            magic == _MAGIC
+            and version == _VERSION
+            and sidecar_size >= _DATA_START + 8 * count
+            and (dev, ino) == (st.st_dev, st.st_ino)
+            and indexed <= st.st_size
+            and _anchor_matches(f, indexed, anchor)
+        ):
+            if indexed == st.st_size:
+                return indexed, count, b""
+            new = array("Q")
+            tail = _scan_offsets(f, indexed, st.st_size, new)
+            new_indexed = st.st_size - len(tail)
+            if new_indexed == indexed:
+                return indexed, count, tail
+            new_anchor = _read_anchor(f, new_indexed)
+            if sys.byteorder != "little":
+                new.byteswap()
+            with open(index_path, "r+b") as idx:
+                # Offsets first, header last: a concurrent reader only ever
+                # sees a count whose entries are already on disk.
+                idx.seek(_DATA_START + 8 * count)
+                idx.write(new.tobytes())
+                idx.flush()
+                idx.seek(0)
+                idx.write(_pack_header(st, new_indexed, count + len(new), new_anchor))
+            return new_indexed, count + len(new), tail
+
+    offsets = array("Q")
+    tail = _scan_offsets(f, 0, st.st_size, offsets)
+    indexed = st.st_size - len(tail)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    if sys.byteorder != "little":
+        offsets.byteswap()
+    # Source path first, so a sidecar on disk always has one to prune by.
+    index_path.with_suffix(_SOURCE_SUFFIX).write_bytes(os.fsencode(os.path.abspath(f.name)))
+    tmp = index_path.with_suffix(f".tmp{os.getpid()}.{threading.get_ident()}")
+    with open(tmp, "wb") as idx:
+        idx.write(_pack_header(st, indexed, len(offsets), _read_anchor(f, indexed)))
+        idx.write(offsets.tobytes())
+    os.replace(tmp, index_path)
+    return indexed, len(offsets), tail
+
+
+def _pack_header(st: os.stat_result, indexed: int, count: int, anchor: bytes) -> bytes:
+    header = _HEADER.pack(
+        _MAGIC, _VERSION, len(anchor), st.st_dev, st.st_ino, indexed, count, anchor,
+    )
+    return header.ljust(_DATA_START, b"\0")
+
+
+def _read_anchor(f, indexed: int) -> bytes:
+    start = max(0, indexed - _ANCHOR_BYTES)
+    f.seek(start)
+    return f.read(indexed - start)
+
+
+def _anchor_matches(f, indexed: int, anchor: bytes) -> bool:
+    return _read_anchor(f, indexed) == anchor
+
+
+def prune_sidecars(index_dir: Path | None = None) -> int:
+    """Delete sidecars whose transcript no longer exists; return how many.
+
+    Sidecars without a ``.src`` record (written before it existed) are
+    dropped too; they are rebuilt on the next open. Temp files left by a
+    crashed rebuild are removed once they are ``_STALE_TMP_S`` old.
+    """
+    index_dir = index_dir or get_spellbook_config_dir() / INDEX_DIRNAME
+    try:
+        entries = list(os.scandir(index_dir))
+    except OSError:
+        return 0
+    now = time.time()
+    removed = 0
+    for entry in entries:
+        path = Path(entry.path)
+        try:
+            if path.suffix == ".idx":
+                try:
+                    source = os.fsdecode(path.with_suffix(_SOURCE_SUFFIX).read_bytes())
+                except FileNotFoundError:
+                    source = None
+                if source is not None and os.path.exists(source):
+                    continue
+                with _lock_for(str(path)):
+                    path.unlink(missing_ok=True)
+                    path.with_suffix(_SOURCE_SUFFIX).unlink(missing_ok=True)
+                removed += 1
+            elif path.suffix == _SOURCE_SUFFIX:
+                if not path.with_suffix(".idx").exists() and now - entry.stat().st_mtime > _STALE_TMP_S:
+                    path.unlink(missing_ok=True)
+            elif ".tmp" in path.name and now - entry.stat().st_mtime > _STALE_TMP_S:
+                path.unlink(missing_ok=True)
+        except OSError:
+            continue
+    return removed
+
+
+def _maybe_prune() -> None:
+    global _last_prune
+    now = time.monotonic()
+    with _prune_guard:
+        if _last_prune and now - _last_prune < _PRUNE_INTERVAL_S:
+            return
+        _last_prune = now
+    prune_sidecars()
+
+
+def open_line_index(transcript: Path | str) -> LineIndex:
+    """Shorthand for :meth:`LineIndex.open` with the default sidecar path.
+
+    Also prunes orphaned sidecars, at most once per ``_PRUNE_INTERVAL_S``.
+    """
+    _maybe_prune()
+    return LineIndex.open(transcript)
@@ -2,9 +2,10 @@
 
 import json
 import os
-import glob
 from typing import Dict, List, Any, Optional
 
+from spellbook.sessions.catalog import get_session_catalog
+
 
 def load_jsonl(file_path: str) -> List[Dict[str, Any]]:
     """
@@ -129,12 +130,32 @@ def split_by_char_limit(session_path: str, start_line: int, char_limit: int) ->
     return chunks
 
 
+def _sample_dict(entry) -> Dict[str, Any]:
+    stats = entry.stats
+    return {
+        'slug': stats.last_slug,
+        'custom_title': stats.custom_title,
+        'path': entry.path,
+        'created': stats.created_at,
+        'last_activity': stats.last_activity,
+        'message_count': stats.message_count,
+        'char_count': stats.char_count,
+        'compact_count': stats.compact_count,
+        'last_compact_line': stats.last_compact_line,
+        'first_user_message': stats.first_user_sample,
+        'last_compact_summary': stats.last_compact_summary,
+        'recent_messages': [m for m in stats.recent if m is not None],
+    }
+
+
 def list_sessions_with_samples(project_dir: str, limit: int = 5) -> List[Dict[str, Any]]:
     """
     List recent sessions with metadata and content samples.
 
     Returns rich metadata including custom titles, timestamps, message counts,
-    and content samples for AI interpretation.
+    and content samples for AI interpretation. Served from the session
+    catalog, so only files that changed since the last call are re-read.
+    Sessions with malformed lines are skipped.
 
     Args:
         project_dir: Path to project's session directory
@@ -146,88 +167,37 @@ def list_sessions_with_samples(project_dir: str, limit: int = 5) -> List[Dict[st
     Raises:
         FileNotFoundError: If project_dir doesn't exist
     """
-    if not os.path.isdir(project_dir):
-        raise FileNotFoundError(f"Project directory not found: {project_dir}")
+    return find_sessions_by_name(project_dir, "", limit)
 
-    sessions = []
 
-    for jsonl_file in glob.glob(f"{project_dir}/*.jsonl"):
-        try:
-            messages = load_jsonl(jsonl_file)
-            if not messages:
-                continue
+def find_sessions_by_name(project_dir: str, name: str, limit: int = 10) -> List[Dict[str, Any]]:
+    """
+    Find sessions whose slug or custom title contains ``name``.
+
+    Case-insensitive substring match; an empty name matches every session.
+    Results have the same shape as :func:`list_sessions_with_samples`.
+
+    Args:
+        project_dir: Path to project's session directory
+        name: Search query
+        limit: Maximum sessions to return (default 10)
+
+    Returns:
+        List of session metadata dictionaries, sorted by last_activity descending
+
+    Raises:
+        FileNotFoundError: If project_dir doesn't exist
+    """
+    if not os.path.isdir(project_dir):
+        raise FileNotFoundError(f"Project directory not found: {project_dir}")
 
-            # Extract metadata
-            slug = None
-            first_timestamp = None
-            last_timestamp = None
-
-            for msg in messages:
-                if msg.get('slug'):
-                    slug = msg['slug']
-                if msg.get('timestamp'):
-                    if first_timestamp is None:
-                        first_timestamp = msg['timestamp']
-                    last_timestamp = msg['timestamp']
-
-            # Calculate statistics
-            total_chars = sum(len(json.dumps(msg)) for msg in messages)
-
-            # Count compact boundaries
-            compact_count = sum(
-                1 for msg in messages
-                if msg.get('type') == 'system' and msg.get('subtype') == 'compact_boundary'
-            )
-
-            last_compact_line = find_last_compact_boundary(messages)
-
-            # Extract custom title
-            custom_title = extract_custom_title(messages)
-
-            # Extract first user message
-            first_user_msg = None
-            for msg in messages:
-                if msg.get('type') == 'user':
-                    content = msg.get('message', {}).get('content', '')
-                    first_user_msg = content[:500] if isinstance(content, str) else str(content)[:500]
-                    break
-
-            # Extract last compact summary if exists
-            last_compact_summary = None
-            if last_compact_line is not None and last_compact_line + 1 < len(messages):
-                next_msg = messages[last_compact_line + 1]
-                if next_msg.get('isCompactSummary'):
-                    last_compact_summary = next_msg.get('message', {}).get('content', '')
-
-            # Extract recent messages (last 5)
-            recent_messages = []
-            for msg in messages[-5:]:
-                if msg.get('type') in ['user', 'assistant']:
-                    content = msg.get('message', {}).get('content', '')
-                    if isinstance(content, list):
-                        content = json.dumps(content)
-                    recent_messages.append(str(content)[:500])
-
-            sessions.append({
-                'slug': slug,
-                'custom_title': custom_title,
-                'path': jsonl_file,
-                'created': first_timestamp,
-                'last_activity': last_timestamp,
-                'message_count': len(messages),
-                'char_count': total_chars,
-                'compact_count': compact_count,
-                'last_compact_line': last_compact_line,
-                'first_user_message': first_user_msg,
-                'last_compact_summary': last_compact_summary,
-                'recent_messages': recent_messages
-            })
-        except Exception:
-            # Skip files that can't be parsed (graceful degradation)
-            continue
-
-    # Sort by last activity (most recent first)
-    sessions.sort(key=lambda x: x.get('last_activity') or '', reverse=True)
-
-    # Limit results
-    return sessions[:limit]
+    catalog = get_session_catalog()
+    catalog.sync_directory(project_dir)
+    entries, _total = catalog.query(
+        [project_dir],
+        search=name.strip(),
+        search_in="name",
+        limit=limit,
+        parsed_only=True,
+    )
+    return [_sample_dict(entry) for entry in entries]
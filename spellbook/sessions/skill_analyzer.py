@@ -4,7 +4,7 @@ import logging
 import os
 import re
 from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -268,73 +268,101 @@ def _get_tokens_from_message(msg: Dict[str, Any]) -> int:
     return usage.get("output_tokens", 0)
 
 
+class SkillInvocationExtractor:
+    """Resumable form of :func:`extract_skill_invocations`.
+
+    Messages are fed in transcript order, possibly across many calls (the
+    session watcher feeds only the lines appended since its last poll).
+    :meth:`snapshot` returns exactly what ``extract_skill_invocations``
+    would return for every message fed so far, without rescanning them.
+    """
+
+    def __init__(self, session_path: str = ""):
+        self.session_path = session_path
+        self.message_count = 0
+        self._closed: List[SkillInvocation] = []
+        self._current: Optional[SkillInvocation] = None
+
+    def feed(self, messages: List[Dict[str, Any]]) -> None:
+        """Advance the extraction over newly appended messages."""
+        for msg in messages:
+            idx = self.message_count
+            self.message_count += 1
+            msg_type = msg.get("type", "")
+
+            # Check for compact boundary (ends current skill)
+            if msg_type == "system" and msg.get("subtype") == "compact_boundary":
+                if self._current:
+                    self._current.end_idx = idx
+                    self._current.completed = True
+                    self._closed.append(self._current)
+                    self._current = None
+                continue
+
+            # Check for skill tool calls
+            for call in _get_tool_uses(msg):
+                if call.get("name") == "Skill":
+                    # End previous invocation if exists
+                    if self._current:
+                        self._current.end_idx = idx
+                        self._current.superseded = True
+                        self._closed.append(self._current)
+
+                    # Start new invocation
+                    skill_input = call.get("input", {})
+                    skill_name = skill_input.get("skill", "unknown")
+                    args = skill_input.get("args")
+                    base_skill, version = _extract_version(skill_name, args)
+
+                    self._current = SkillInvocation(
+                        skill=base_skill,
+                        version=version,
+                        start_idx=idx,
+                        timestamp=msg.get("timestamp"),
+                        session_path=self.session_path,
+                    )
+
+            # Track tokens for current invocation
+            if self._current and msg_type == "assistant":
+                self._current.tokens_used += _get_tokens_from_message(msg)
+
+            # Check for user corrections
+            if self._current and _get_role(msg) == "user":
+                content = _get_user_content(msg)
+                if _detect_correction(content):
+                    self._current.corrections += 1
+
+    def snapshot(self) -> List[SkillInvocation]:
+        """Return the invocations as of the messages fed so far.
+
+        The open invocation (if any) is closed at the current end of the
+        transcript, as in a one-shot extraction. Returned objects are copies;
+        feeding more messages never mutates a previous snapshot.
+        """
+        invocations = [replace(inv) for inv in self._closed]
+        if self._current:
+            invocations.append(
+                replace(self._current, end_idx=self.message_count, completed=True)
+            )
+
+        # Detect retries (same skill invoked within 5 messages)
+        for i, inv in enumerate(invocations):
+            for j in range(i + 1, min(i + 3, len(invocations))):
+                if invocations[j].skill == inv.skill:
+                    invocations[j].retried = True
+                    break
+
+        return invocations
+
+
 def extract_skill_invocations(messages: List[Dict[str, Any]], session_path: str = "") -> List[SkillInvocation]:
     """Extract all skill invocations from a session.
 
     Returns list of SkillInvocation objects with boundaries and metrics.
     """
-    invocations: List[SkillInvocation] = []
-    current_invocation: Optional[SkillInvocation] = None
-
-    for idx, msg in enumerate(messages):
-        msg_type = msg.get("type", "")
-
-        # Check for compact boundary (ends current skill)
-        if msg_type == "system" and msg.get("subtype") == "compact_boundary":
-            if current_invocation:
-                current_invocation.end_idx = idx
-                current_invocation.completed = True
-                invocations.append(current_invocation)
-                current_invocation = None
-            continue
-
-        # Check for skill tool calls
-        for call in _get_tool_uses(msg):
-            if call.get("name") == "Skill":
-                # End previous invocation if exists
-                if current_invocation:
-                    current_invocation.end_idx = idx
-                    current_invocation.superseded = True
-                    invocations.append(current_invocation)
-
-                # Start new invocation
-                skill_input = call.get("input", {})
-                skill_name = skill_input.get("skill", "unknown")
-                args = skill_input.get("args")
-                base_skill, version = _extract_version(skill_name, args)
-
-                current_invocation = SkillInvocation(
-                    skill=base_skill,
-                    version=version,
-                    start_idx=idx,
-                    timestamp=msg.get("timestamp"),
-                    session_path=session_path,
-                )
-
-        # Track tokens for current invocation
-        if current_invocation and msg_type == "assistant":
-            current_invocation.tokens_used += _get_tokens_from_message(msg)
-
-        # Check for user corrections
-        if current_invocation and _get_role(msg) == "user":
-            content = _get_user_content(msg)
-            if _detect_correction(content):
-                current_invocation.corrections += 1
-
-    # Close final invocation
-    if current_invocation:
-        current_invocation.end_idx = len(messages)
-        current_invocation.completed = True
-        invocations.append(current_invocation)
-
-    # Detect retries (same skill invoked within 5 messages)
-    for i, inv in enumerate(invocations):
-        for j in range(i + 1, min(i + 3, len(invocations))):
-            if invocations[j].skill == inv.skill:
-                invocations[j].retried = True
-                break
-
-    return invocations
+    extractor = SkillInvocationExtractor(session_path)
+    extractor.feed(messages)
+    return extractor.snapshot()
 
 
 def aggregate_metrics(
@@ -1,13 +1,18 @@
 """Background watcher for session heartbeat and skill-invocation analysis."""
 
 import asyncio
+import json
 import logging
 import os
 import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Set
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from spellbook.sessions.skill_analyzer import SkillInvocationExtractor
 
 
 logger = logging.getLogger(__name__)
@@ -16,22 +21,97 @@ logger = logging.getLogger(__name__)
 SESSION_INACTIVE_THRESHOLD_SECONDS = 300  # 5 minutes
 
 
+# Upper bound on how long the watcher sleeps with no file activity. Keeps
+# the heartbeat (checked against a 30 s freshness window) and the
+# inactivity finalizer ticking on an idle machine.
+IDLE_WAKE_INTERVAL_SECONDS = 10.0
+
+# Minimum spacing between heartbeat writes. File events can wake the loop
+# several times a second while a session is busy; the heartbeat only has
+# to stay inside its 30 s freshness window.
+HEARTBEAT_INTERVAL_SECONDS = 5.0
+
+
 @dataclass
 class SessionSkillState:
-    """Track skill analysis state for a single session."""
+    """Track skill analysis state for a single session.
+
+    The session file is consumed incrementally: ``offset`` is the byte
+    position just past the last complete line parsed, and ``extractor``
+    carries the invocation-extraction state across polls, so each poll only
+    parses what was appended since the previous one.
+    """
     session_id: str
     last_message_idx: int = 0  # Index of last processed message
     last_mtime: float = 0.0    # File mtime at last analysis
     known_invocations: Set[str] = field(default_factory=set)
     last_activity: datetime = field(default_factory=datetime.now)
+    offset: int = 0            # Byte offset of the next unread line
+    file_id: Optional[Tuple[int, int]] = None  # (st_dev, st_ino) being tailed
+    extractor: Optional["SkillInvocationExtractor"] = None
 
     def invocation_key(self, inv) -> str:
         """Unique key for an invocation within a session."""
         return f"{inv.skill}:{inv.start_idx}"
 
+    def reset(self) -> None:
+        """Forget parse progress (file truncated or replaced)."""
+        self.last_message_idx = 0
+        self.known_invocations.clear()
+        self.offset = 0
+        self.file_id = None
+        self.extractor = None
+
+
+def read_appended_messages(path: Path, state: SessionSkillState) -> Optional[list]:
+    """Parse the complete JSONL lines appended to ``path`` since the last call.
+
+    Truncation (size below the saved offset) and rotation (a different
+    inode at the same path) reset ``state`` and re-read from the start. A
+    trailing line without its newline is left for the next call, since the
+    writer may still be mid-append. Malformed complete lines are skipped.
+
+    Returns:
+        The new messages (possibly empty), or None if nothing changed.
+    """
+    st = path.stat()
+    file_id = (st.st_dev, st.st_ino)
+    if state.file_id is not None and (file_id != state.file_id or st.st_size < state.offset):
+        logger.debug("Session file %s truncated or replaced; re-reading", path)
+        state.reset()
+    state.file_id = file_id
+    if st.st_size == state.offset:
+        return None
+
+    with open(path, "rb") as f:
+        f.seek(state.offset)
+        chunk = f.read(st.st_size - state.offset)
+
+    end = chunk.rfind(b"\n")
+    if end < 0:
+        return []
+    messages = []
+    for line in chunk[:end].split(b"\n"):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            messages.append(json.loads(line))
+        except ValueError:
+            logger.debug("Skipping malformed line in %s", path)
+    state.offset += end + 1
+    return messages
+
 
 class SessionWatcher(threading.Thread):
-    """Background thread that monitors session files for compaction events."""
+    """Background thread that analyzes the project's session file as it grows.
+
+    Woken by the shared file-watch service (``spellbook.core.file_watch``)
+    when a session file in the project's Claude session directory is
+    created or appended to, and at least every
+    ``IDLE_WAKE_INTERVAL_SECONDS`` for the heartbeat and the inactivity
+    finalizer.
+    """
 
     CLEANUP_INTERVAL = 3600  # 1 hour between database pruning runs
 
@@ -42,7 +122,9 @@ class SessionWatcher(threading.Thread):
 
         Args:
             db_path: Path to SQLite database
-            poll_interval: Seconds between polls (default 2.0)
+            poll_interval: Scan interval for the shared file-watch service
+                when inotify is unavailable (default 2.0). Only applies if
+                this watcher is the first to start the service.
             project_path: Project directory to monitor (defaults to cwd)
         """
         super().__init__(daemon=True)
@@ -52,11 +134,17 @@ class SessionWatcher(threading.Thread):
         self._running = False
         self._shutdown = threading.Event()
         self._last_cleanup = 0.0
+        self._last_heartbeat = 0.0
 
         # Session tracking: session_id -> {path, last_mtime, last_size}
         self.sessions: Dict[str, dict] = {}
         # Skill analysis state per session
         self._skill_states: Dict[str, SessionSkillState] = {}
+        # Set by file events (and stop()); the run loop sleeps on it
+        self._activity = threading.Event()
+        # Session file named by the latest event; saves a directory glob
+        self._changed_file: Optional[Path] = None
+        self._subscription = None
 
     def is_running(self) -> bool:
         """Check if watcher is currently running.
@@ -80,18 +168,44 @@ class SessionWatcher(threading.Thread):
         """Stop the watcher thread gracefully."""
         self._running = False
         self._shutdown.set()
+        self._activity.set()
 
     def run(self):
         """Main watcher loop with error recovery and circuit breaker."""
+        from spellbook.core.file_watch import get_file_watch_service
+        from spellbook.sessions.compaction import _get_claude_session_dir
+
+        self._subscription = get_file_watch_service(self.poll_interval).subscribe(
+            _get_claude_session_dir(self.project_path),
+            self._on_file_event,
+            suffix=".jsonl",
+        )
+        try:
+            self._run_loop()
+        finally:
+            subscription, self._subscription = self._subscription, None
+            subscription.cancel()
+
+    def _on_file_event(self, event):
+        """File-watch callback (service thread): note the file, wake the loop."""
+        from spellbook.core.file_watch import RESCAN
+
+        self._changed_file = None if event.kind == RESCAN else event.path
+        self._activity.set()
+
+    def _run_loop(self):
         consecutive_errors = 0
         max_consecutive_errors = 5  # Give up after 5 consecutive failures
 
         while not self._shutdown.is_set():
             try:
                 self._poll_sessions()
-                self._write_heartbeat()
 
                 now = time.time()
+                if now - self._last_heartbeat >= HEARTBEAT_INTERVAL_SECONDS:
+                    self._write_heartbeat()
+                    self._last_heartbeat = now
+
                 if now - self._last_cleanup > self.CLEANUP_INTERVAL:
                     self._cleanup_stale_data()
                     self._last_cleanup = now
@@ -111,8 +225,9 @@ class SessionWatcher(threading.Thread):
                 )
                 time.sleep(5.0)  # Backoff before retry
 
-            # Use event.wait() instead of time.sleep() for responsive shutdown
-            self._shutdown.wait(self.poll_interval)
+            # Sleep until a session file changes (or stop() is called)
+            self._activity.wait(IDLE_WAKE_INTERVAL_SECONDS)
+            self._activity.clear()
 
     def _poll_sessions(self):
         """Poll session files and analyze skills for incremental persistence.
@@ -209,27 +324,30 @@ class SessionWatcher(threading.Thread):
     def _analyze_skills(self):
         """Analyze current session for skill invocations.
 
-        Called every poll interval (2s). Extracts new invocations
-        since last poll, persists outcomes incrementally.
+        Called on every session-file event and idle wake. Parses only the
+        lines appended since the last pass, persists outcomes incrementally.
 
         Lifecycle:
         1. Get current session file and mtime
         2. If new session, create SessionSkillState
         3. If file unchanged for 5+ minutes, finalize open skills
-        4. If file changed, extract invocations from last_message_idx
+        4. If file changed, feed appended lines to the session's extractor
         5. For each new/updated invocation, persist outcome
         6. Update state tracking
         """
         from spellbook.sessions.compaction import _get_current_session_file
         from spellbook.sessions.skill_analyzer import (
-            extract_skill_invocations,
+            SkillInvocationExtractor,
             persist_outcome,
             finalize_session_outcomes,
             SkillOutcome,
         )
-        from spellbook.sessions.parser import load_jsonl
 
-        session_file = _get_current_session_file(self.project_path)
+        # The file just written is the most recently modified one; only
+        # glob the directory when no event named it (startup, idle wake).
+        session_file, self._changed_file = self._changed_file, None
+        if session_file is None or not session_file.exists():
+            session_file = _get_current_session_file(self.project_path)
         if session_file is None:
             return
 
@@ -255,14 +373,21 @@ class SessionWatcher(threading.Thread):
         if current_mtime <= state.last_mtime:
             return
 
-        # Load messages and extract invocations
+        # Parse only the lines appended since the last poll
         try:
-            messages = load_jsonl(str(session_file))
-        except Exception as e:
-            logger.warning(f"Failed to load session file: {e}")
+            messages = read_appended_messages(session_file, state)
+        except OSError as e:
+            logger.warning(f"Failed to read session file: {e}")
+            return
+        if messages is None:
+            # mtime moved but no bytes were appended (e.g. touch)
+            state.last_mtime = current_mtime
             return
 
-        invocations = extract_skill_invocations(messages, str(session_file))
+        if state.extractor is None:
+            state.extractor = SkillInvocationExtractor(str(session_file))
+        state.extractor.feed(messages)
+        invocations = state.extractor.snapshot()
 
         # Cleanup: Remove states for sessions that no longer exist
         # This prevents memory leaks when session files are deleted externally
@@ -296,7 +421,7 @@ class SessionWatcher(threading.Thread):
 
         # Update tracking
         state.last_mtime = current_mtime
-        state.last_message_idx = len(messages)
+        state.last_message_idx = state.extractor.message_count
         state.last_activity = datetime.now()
 
     def _is_session_inactive(self, state: SessionSkillState, current_mtime: float) -> bool:
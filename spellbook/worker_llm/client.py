@@ -1,8 +1,16 @@
 """Async httpx client for OpenAI-compatible ``/v1/chat/completions`` calls.
 
 Single-shot (no retries) by design. Callers are responsible for fail-open or
-surface-error policy based on the exception type raised. Every call — success
-or failure — emits a ``publish_call`` event in the ``finally`` block.
+surface-error policy based on the exception type raised. Every request sent
+— success or failure — emits a ``publish_call`` event in the ``finally``
+block. Identical concurrent calls are coalesced onto one request, and
+responses may be served from the opt-in response cache (see
+``spellbook.worker_llm.response_cache``); neither emits a call event because
+no request reaches the worker.
+
+Streaming: ``stream`` yields SSE content deltas as the worker produces them,
+and ``call(..., stop_when=...)`` uses it to return as soon as the caller has
+seen enough (``tool_safety`` stops once the verdict is decided).
 
 Shared client: we cache one ``httpx.AsyncClient`` per running event loop so
 HTTP keep-alive actually pools connections across rerank / harvest / tool
@@ -20,15 +28,18 @@ from __future__ import annotations
 
 import asyncio
 import atexit
+import contextlib
+import json
 import logging
 import time
 import weakref
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any
+from typing import Any, AsyncIterator, Callable
 
 import httpx
 
-from spellbook.worker_llm.config import get_worker_config, is_configured
+from spellbook.worker_llm import response_cache
+from spellbook.worker_llm.config import WorkerConfig, get_worker_config, is_configured
 from spellbook.worker_llm.errors import (
     WorkerLLMBadResponse,
     WorkerLLMNotConfigured,
@@ -167,6 +178,7 @@ async def call(
     *,
     task: str = "unknown",
     override_loaded: bool = False,
+    stop_when: Callable[[str], bool] | None = None,
 ) -> str:
     """Single-shot ``/v1/chat/completions`` call.
 
@@ -178,9 +190,14 @@ async def call(
             integration passes its own short budget.
         task: Observability tag (e.g. ``"tool_safety"``).
         override_loaded: True if prompt was loaded from the user override file.
+        stop_when: If given, the response is streamed and this predicate is
+            checked on the accumulated text after every delta; the first
+            True closes the stream and returns the text received so far.
+            Such calls bypass coalescing and the response cache.
 
     Returns:
-        The assistant message content (``choices[0].message.content``).
+        The assistant message content (``choices[0].message.content``), or
+        its prefix when ``stop_when`` ended the stream early.
 
     Raises:
         WorkerLLMNotConfigured: ``worker_llm_base_url`` empty.
@@ -188,6 +205,17 @@ async def call(
         WorkerLLMUnreachable: Connection refused / DNS failure / 5xx.
         WorkerLLMBadResponse: 200 OK but schema does not match OpenAI shape.
     """
+    if stop_when is not None:
+        return await _collect_stream(
+            system_prompt,
+            user_prompt,
+            max_tokens,
+            timeout_s,
+            stop_when,
+            task=task,
+            override_loaded=override_loaded,
+        )
+
     cfg = get_worker_config()
     if not is_configured(cfg):
         raise WorkerLLMNotConfigured("worker_llm_base_url is not set")
@@ -195,21 +223,73 @@ async def call(
     eff_timeout = timeout_s if timeout_s is not None else cfg.timeout_s
     eff_max_tokens = max_tokens if max_tokens is not None else cfg.max_tokens
 
-    headers: dict[str, str] = {"Content-Type": "application/json"}
-    if cfg.api_key:
-        headers["Authorization"] = f"Bearer {cfg.api_key}"
+    key = response_cache.make_key(
+        cfg.base_url, cfg.model, eff_max_tokens, system_prompt, user_prompt
+    )
+    if cfg.response_cache_ttl_s > 0:
+        cached = response_cache.lookup(key)
+        if cached is not None:
+            return cached
+
+    shared, leader = response_cache.join_inflight(key)
+    if not leader:
+        # Identical request already in flight, possibly on another thread's
+        # loop: share its outcome. ``shield`` so our timeout never cancels
+        # the leader's future.
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(shared)), eff_timeout
+            )
+        except asyncio.TimeoutError as e:
+            raise WorkerLLMTimeout(
+                f"{task} timed out after {eff_timeout}s (coalesced)"
+            ) from e
+
+    try:
+        text = await _post(
+            cfg,
+            system_prompt,
+            user_prompt,
+            eff_max_tokens,
+            eff_timeout,
+            task=task,
+            override_loaded=override_loaded,
+        )
+    except asyncio.CancelledError:
+        shared.set_exception(WorkerLLMUnreachable(f"{task} coalesced request cancelled"))
+        raise
+    except Exception as e:
+        shared.set_exception(e)
+        raise
+    else:
+        shared.set_result(text)
+        if cfg.response_cache_ttl_s > 0:
+            response_cache.store(
+                key,
+                text,
+                cfg.response_cache_ttl_s,
+                cfg.response_cache_max_entries,
+                cfg.response_cache_max_bytes,
+            )
+        return text
+    finally:
+        response_cache.finish_inflight(key, shared)
 
-    body: dict[str, Any] = {
-        "model": cfg.model,
-        "messages": [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
-        "max_tokens": eff_max_tokens,
-        "stream": False,
-    }
 
-    url = f"{cfg.base_url.rstrip('/')}/chat/completions"
+async def _post(
+    cfg: WorkerConfig,
+    system_prompt: str,
+    user_prompt: str,
+    eff_max_tokens: int,
+    eff_timeout: float,
+    *,
+    task: str,
+    override_loaded: bool,
+) -> str:
+    """Send one ``/chat/completions`` request and emit its call event."""
+    url, headers, body = _request(
+        cfg, system_prompt, user_prompt, eff_max_tokens, stream=False
+    )
     started = time.monotonic()
     response_text = ""
     error: Exception | None = None
@@ -227,14 +307,7 @@ async def call(
         except httpx.HTTPError as e:
             raise WorkerLLMUnreachable(f"{task} connect failed: {e}") from e
 
-        if r.status_code >= 500:
-            raise WorkerLLMUnreachable(
-                f"{task} HTTP {r.status_code}: {r.text[:200]}"
-            )
-        if r.status_code >= 400:
-            raise WorkerLLMBadResponse(
-                f"{task} HTTP {r.status_code}: {r.text[:200]}"
-            )
+        _raise_for_status(task, r)
 
         try:
             payload = r.json()
@@ -264,6 +337,174 @@ async def call(
         )
 
 
+async def stream(
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int | None = None,
+    timeout_s: float | None = None,
+    *,
+    task: str = "unknown",
+    override_loaded: bool = False,
+) -> AsyncIterator[str]:
+    """Streaming ``/v1/chat/completions`` call; yields content deltas.
+
+    Sends ``"stream": true`` and parses the server-sent events as they
+    arrive. ``timeout_s`` bounds the whole stream, not each chunk. Closing
+    the iterator early (``break`` inside ``contextlib.aclosing``) drops the
+    connection so the server stops generating; the call event then records
+    ``success`` with the length received so far. Streams are never
+    coalesced or cached.
+
+    Raises the same exceptions as ``call``.
+    """
+    cfg = get_worker_config()
+    if not is_configured(cfg):
+        raise WorkerLLMNotConfigured("worker_llm_base_url is not set")
+
+    eff_timeout = timeout_s if timeout_s is not None else cfg.timeout_s
+    eff_max_tokens = max_tokens if max_tokens is not None else cfg.max_tokens
+    url, headers, body = _request(
+        cfg, system_prompt, user_prompt, eff_max_tokens, stream=True
+    )
+    started = time.monotonic()
+    deadline = started + eff_timeout
+    response_len = 0
+    error: Exception | None = None
+
+    try:
+        http = _get_shared_client()
+        try:
+            async with http.stream(
+                "POST", url, headers=headers, json=body, timeout=eff_timeout
+            ) as r:
+                if r.status_code >= 400:
+                    await r.aread()
+                    _raise_for_status(task, r)
+                lines = r.aiter_lines()
+                while True:
+                    try:
+                        line = await asyncio.wait_for(
+                            lines.__anext__(), deadline - time.monotonic()
+                        )
+                    except StopAsyncIteration:
+                        break
+                    except asyncio.TimeoutError as e:
+                        raise WorkerLLMTimeout(
+                            f"{task} timed out after {eff_timeout}s (streaming)"
+                        ) from e
+                    delta = _sse_delta(task, line)
+                    if delta is None:
+                        break
+                    if delta:
+                        response_len += len(delta)
+                        yield delta
+        except httpx.TimeoutException as e:
+            raise WorkerLLMTimeout(
+                f"{task} timed out after {eff_timeout}s"
+            ) from e
+        except httpx.HTTPError as e:
+            raise WorkerLLMUnreachable(f"{task} connect failed: {e}") from e
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        publish_call(
+            task=task,
+            model=cfg.model,
+            latency_ms=int((time.monotonic() - started) * 1000),
+            status=_canonical_status(error),
+            prompt_len=len(system_prompt) + len(user_prompt),
+            response_len=response_len,
+            error=str(error) if error else None,
+            override_loaded=override_loaded,
+        )
+
+
+async def _collect_stream(
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int | None,
+    timeout_s: float | None,
+    stop_when: Callable[[str], bool],
+    *,
+    task: str,
+    override_loaded: bool,
+) -> str:
+    """Accumulate ``stream`` deltas until ``stop_when(text)`` or end of stream."""
+    text = ""
+    chunks = stream(
+        system_prompt,
+        user_prompt,
+        max_tokens,
+        timeout_s,
+        task=task,
+        override_loaded=override_loaded,
+    )
+    async with contextlib.aclosing(chunks):
+        async for delta in chunks:
+            text += delta
+            if stop_when(text):
+                break
+    return text
+
+
+def _request(
+    cfg: WorkerConfig,
+    system_prompt: str,
+    user_prompt: str,
+    eff_max_tokens: int,
+    *,
+    stream: bool,
+) -> tuple[str, dict[str, str], dict[str, Any]]:
+    """Return ``(url, headers, json body)`` for a ``/chat/completions`` POST."""
+    headers: dict[str, str] = {"Content-Type": "application/json"}
+    if cfg.api_key:
+        headers["Authorization"] = f"Bearer {cfg.api_key}"
+
+    body: dict[str, Any] = {
+        "model": cfg.model,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ],
+        "max_tokens": eff_max_tokens,
+        "stream": stream,
+    }
+    return f"{cfg.base_url.rstrip('/')}/chat/completions", headers, body
+
+
+def _raise_for_status(task: str, r: httpx.Response) -> None:
+    if r.status_code >= 500:
+        raise WorkerLLMUnreachable(
+            f"{task} HTTP {r.status_code}: {r.text[:200]}"
+        )
+    if r.status_code >= 400:
+        raise WorkerLLMBadResponse(
+            f"{task} HTTP {r.status_code}: {r.text[:200]}"
+        )
+
+
+def _sse_delta(task: str, line: str) -> str | None:
+    """Return the content delta carried by one SSE line.
+
+    ``""`` for lines that carry no content (blank separators, comments,
+    role-only or usage-only chunks); ``None`` for the ``[DONE]`` sentinel.
+    """
+    if not line.startswith("data:"):
+        return ""
+    data = line[len("data:"):].strip()
+    if data == "[DONE]":
+        return None
+    try:
+        choices = json.loads(data)["choices"]
+        if not choices:
+            return ""
+        content = (choices[0].get("delta") or {}).get("content")
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        raise WorkerLLMBadResponse(f"{task} malformed stream chunk: {e}") from e
+    return content if isinstance(content, str) else ""
+
+
 def call_sync(
     system_prompt: str,
     user_prompt: str,
@@ -272,6 +513,7 @@ def call_sync(
     *,
     task: str = "unknown",
     override_loaded: bool = False,
+    stop_when: Callable[[str], bool] | None = None,
 ) -> str:
     """Sync wrapper over ``call``. Safe from sync hook handlers.
 
@@ -301,6 +543,7 @@ def call_sync(
                 timeout_s=timeout_s,
                 task=task,
                 override_loaded=override_loaded,
+                stop_when=stop_when,
             )
         finally:
             await aclose_shared_client()
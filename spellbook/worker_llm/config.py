@@ -25,6 +25,9 @@ class WorkerConfig:
     feature_roundtable: bool
     feature_tool_safety: bool
     safety_cache_ttl_s: int
+    response_cache_ttl_s: float
+    response_cache_max_entries: int
+    response_cache_max_bytes: int
 
 
 def get_worker_config() -> WorkerConfig:
@@ -50,6 +53,15 @@ def get_worker_config() -> WorkerConfig:
             config_get("worker_llm_feature_tool_safety") or False
         ),
         safety_cache_ttl_s=int(config_get("worker_llm_safety_cache_ttl_s") or 300),
+        response_cache_ttl_s=float(
+            config_get("worker_llm_response_cache_ttl_s") or 0.0
+        ),
+        response_cache_max_entries=int(
+            config_get("worker_llm_response_cache_max_entries") or 256
+        ),
+        response_cache_max_bytes=int(
+            config_get("worker_llm_response_cache_max_bytes") or 1048576
+        ),
     )
 
 
@@ -78,3 +90,59 @@ def feature_enabled(feature_name: str) -> bool:
     if attr is None:
         raise ValueError(f"Unknown worker-llm feature: {feature_name}")
     return getattr(cfg, attr)
+
+
+# Priority lanes for the async queue, highest priority first.
+QUEUE_LANES: tuple[str, ...] = ("interactive", "warmup", "background")
+
+
+def _parse_task_map(raw: object) -> dict[str, str]:
+    """Split a ``"task=value,task=value"`` config string into a dict.
+
+    Raises:
+        ValueError: A non-empty pair is missing ``=`` or either side is empty.
+    """
+    out: dict[str, str] = {}
+    for pair in str(raw or "").split(","):
+        pair = pair.strip()
+        if not pair:
+            continue
+        task, sep, value = pair.partition("=")
+        task, value = task.strip(), value.strip()
+        if not sep or not task or not value:
+            raise ValueError(f"expected 'task=value', got {pair!r}")
+        out[task] = value
+    return out
+
+
+def parse_queue_lanes(raw: object) -> dict[str, str]:
+    """Parse ``worker_llm_queue_lanes`` into ``{task_name: lane}``.
+
+    Raises:
+        ValueError: Malformed pair or a lane not in ``QUEUE_LANES``.
+    """
+    lanes = _parse_task_map(raw)
+    for task, lane in lanes.items():
+        if lane not in QUEUE_LANES:
+            raise ValueError(
+                f"lane for {task!r} must be one of {', '.join(QUEUE_LANES)}; got {lane!r}"
+            )
+    return lanes
+
+
+def parse_queue_caps(raw: object) -> dict[str, int]:
+    """Parse ``worker_llm_queue_task_concurrency`` into ``{task_name: cap}``.
+
+    Raises:
+        ValueError: Malformed pair or a cap that is not a positive integer.
+    """
+    caps: dict[str, int] = {}
+    for task, value in _parse_task_map(raw).items():
+        try:
+            cap = int(value)
+        except ValueError:
+            cap = 0
+        if cap < 1:
+            raise ValueError(f"cap for {task!r} must be a positive integer; got {value!r}")
+        caps[task] = cap
+    return caps
@@ -19,10 +19,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import os
 from typing import Any, Callable
 
 from spellbook.admin.events import Event, Subsystem, event_bus, publish_sync
+from spellbook.core import run_context
 from spellbook.worker_llm.auth import _load_bearer_token
 from spellbook.worker_llm.net import build_host_url
 from spellbook.worker_llm.observability import record_call
@@ -117,8 +117,8 @@ def _fallback_http_post(path: str, payload: dict, timeout: float = 1.0) -> None:
 
     global _publish_failures
 
-    host = os.environ.get("SPELLBOOK_MCP_HOST", "127.0.0.1")
-    port = os.environ.get("SPELLBOOK_MCP_PORT", "8765")
+    host = run_context.getenv("SPELLBOOK_MCP_HOST", "127.0.0.1")
+    port = run_context.getenv("SPELLBOOK_MCP_PORT", "8765")
     url = build_host_url(host, port, path)
     headers = {"Content-Type": "application/json"}
     token = _load_bearer_token()
@@ -291,6 +291,40 @@ def publish_hook_integration(
     )
 
 
+def publish_queue_stats(
+    workers: int,
+    depth: dict[str, int],
+    in_flight: dict[str, int],
+    max_depth: int,
+    wait_ms: int | None = None,
+) -> None:
+    """Emit a ``queue_stats`` gauge event for the async worker queue.
+
+    Published by the queue consumers on every dequeue (with ``wait_ms``, how
+    long the dequeued task sat in the queue) and every completion (with
+    ``wait_ms=None``). Daemon-only in practice: the queue never runs in a
+    subprocess.
+
+    Args:
+        workers: Number of consumers in the pool.
+        depth: Queued task count per lane.
+        in_flight: Running call count per task name (zero entries omitted).
+        max_depth: Queue capacity across all lanes.
+        wait_ms: Queue wait of the task just dequeued; None on completion.
+    """
+    _publish(
+        Subsystem.WORKER_LLM,
+        "queue_stats",
+        {
+            "workers": workers,
+            "depth": depth,
+            "in_flight": in_flight,
+            "max_depth": max_depth,
+            "wait_ms": wait_ms,
+        },
+    )
+
+
 def publish_fail_open(task: str, reason: str, error: str) -> None:
     """Emit a ``fail_open`` event when a task bails before calling the worker.
 
@@ -6,7 +6,8 @@ swallowed — the LLM call must never be blocked by observability.
 
 Uses a first-failure-loud log policy (mirrors
 ``events.py:_publish_failures``) so a broken persistence path surfaces
-once without spamming subsequent writes.
+once without spamming subsequent writes. Inside the daemon rows are
+queued to the batched writer in ``spellbook.db.ingest``.
 
 This module also hosts the retention purge loop: ``_run_purge_once``
 performs two passes — time-cap and count-cap — each batched at
@@ -30,7 +31,13 @@ from sqlalchemy import delete, desc, select
 from spellbook.core.command_utils import atomic_replace
 from spellbook.core.config import config_get
 from spellbook.db.engines import get_spellbook_sync_session
-from spellbook.db.spellbook_models import WorkerLLMCall
+from spellbook.db.ingest import enqueue
+from spellbook.db.rollups import purge_rollups
+from spellbook.db.spellbook_models import (
+    WorkerLLMCall,
+    WorkerLLMCallRollupHour,
+    WorkerLLMCallRollupMinute,
+)
 
 log = logging.getLogger(__name__)
 
@@ -78,24 +85,27 @@ def record_call(
             is used.
     """
     global _record_call_failures
+    ts = timestamp or datetime.now(timezone.utc).isoformat()
     try:
-        ts = timestamp or datetime.now(timezone.utc).isoformat()
-        with get_spellbook_sync_session() as session:
-            session.add(
-                WorkerLLMCall(
-                    timestamp=ts,
-                    task=task,
-                    model=model,
-                    status=status,
-                    latency_ms=int(latency_ms),
-                    prompt_len=int(prompt_len),
-                    response_len=int(response_len),
-                    error=error,
-                    override_loaded=1 if override_loaded else 0,
-                ),
-            )
-            # ``get_spellbook_sync_session`` commits on clean exit and rolls
-            # back on exception, so no explicit flush/commit is needed here.
+        row = {
+            "timestamp": ts,
+            "task": task,
+            "model": model,
+            "status": status,
+            "latency_ms": int(latency_ms),
+            "prompt_len": int(prompt_len),
+            "response_len": int(response_len),
+            "error": error,
+            "override_loaded": 1 if override_loaded else 0,
+        }
+        # In the daemon the batched writer owns the INSERT (its failures
+        # are counted in ``ingestion_stats``); elsewhere, or while it is
+        # shutting down, fall through to a one-row write.
+        if not enqueue(get_spellbook_sync_session, WorkerLLMCall, row):
+            with get_spellbook_sync_session() as session:
+                session.add(WorkerLLMCall(**row))
+                # ``get_spellbook_sync_session`` commits on clean exit and
+                # rolls back on exception, so no explicit commit is needed.
     except Exception as exc:
         # First failure per process lifetime: loud warning naming the
         # exception type and the message. Every subsequent failure drops to
@@ -296,7 +306,10 @@ def _run_purge_once() -> None:
        ``retention_hours``. Batched at ``_PURGE_BATCH_LIMIT`` rows per
        transaction, each batch in a fresh
        ``get_spellbook_sync_session()`` context so the writer lock is
-       released between batches. Breaks when a DELETE returns 0 rows.
+       released between batches. Breaks when a DELETE returns 0 rows;
+       that last session also drops metric rollup buckets older than the
+       cutoff. The count cap does not apply to rollups (their size is
+       bounded by time, not traffic).
 
     2. **Count cap:** delete the oldest rows beyond the ``max_rows`` cap.
        Expressed as ``DELETE WHERE id NOT IN (top ``max_rows`` by
@@ -335,6 +348,14 @@ def _run_purge_once() -> None:
                 .all()
             )
             if not victim_ids:
+                # Raw rows are done; the rollups get the same time cap in
+                # this last (otherwise idle) session.
+                purge_rollups(
+                    session,
+                    WorkerLLMCallRollupMinute.__table__,
+                    WorkerLLMCallRollupHour.__table__,
+                    cutoff,
+                )
                 break
             session.execute(
                 delete(WorkerLLMCall).where(WorkerLLMCall.id.in_(victim_ids)),
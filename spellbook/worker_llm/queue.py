@@ -3,23 +3,45 @@
 Fire-and-forget callers (warm pings from tool_safety cold-start detection)
 do not want to block on the worker
 endpoint. When the queue is enabled, callers enqueue a ``WorkerTask`` and
-return immediately; a single background consumer coroutine, owned by the
-daemon lifespan, drains the queue and calls ``client.call`` per task.
+return immediately; a pool of ``worker_llm_queue_workers`` background
+consumer coroutines, owned by the daemon lifespan, drains the queue and
+calls ``client.call`` per task.
 
 Runtime shape
 -------------
-The queue and consumer live **inside the daemon event loop only**. The
+The queue and consumers live **inside the daemon event loop only**. The
 helpers ``is_available`` and ``enqueue`` check that shape before routing.
 Subprocess callers (hook scripts) that want to enqueue must POST to the
 ``/api/worker-llm/enqueue`` endpoint (see ``spellbook/mcp/routes.py``),
 which runs inside the daemon loop and calls ``enqueue`` on their behalf.
 
+Lanes and concurrency
+---------------------
+Every task is routed to a priority lane by task name
+(``worker_llm_queue_lanes``; unlisted tasks go to ``background``).
+Consumers always take the oldest task from the highest-priority lane, so a
+backlog of roundtable jobs never delays an interactive call by more than
+the calls already in flight. ``worker_llm_queue_task_concurrency`` caps how
+many calls of one task name run at once; a consumer skips tasks whose cap
+is reached and takes the next eligible one instead of waiting. A single
+consumer (the default) keeps the original serial behavior; raise the
+worker count when the endpoint serves parallel slots (vLLM, llama.cpp
+``--parallel``).
+
 Drop policy
 -----------
-When the queue is at capacity, ``enqueue`` drops the **OLDEST** queued
-task (not the incoming one; the incoming call is the most recent signal).
-The drop fires a ``publish_call(status='dropped', error='queue_overflow')``
-so the overflow is observable.
+When the queue is at capacity, ``enqueue`` drops the **OLDEST** task of the
+lowest-priority lane that is not higher priority than the incoming task.
+If everything queued outranks the incoming task, the incoming task is the
+one dropped. Either way the drop fires a
+``publish_call(status='dropped', error='queue_overflow')`` so the overflow
+is observable.
+
+Gauges
+------
+Each dequeue and each completion publishes a ``queue_stats`` event with the
+per-lane depth, per-task in-flight counts, and the dequeued task's wait
+time, so the admin event monitor shows saturation as it happens.
 
 Callback failures
 -----------------
@@ -29,8 +51,8 @@ takes down the consumer (and therefore the queue).
 
 This module does NOT double-publish ``call_ok`` / ``call_failed`` events
 -- ``client.call``'s ``finally`` block already emits those. The queue
-emits exactly one additional event-type (``dropped``) in addition to
-whatever the underlying call emits.
+emits exactly two additional event-types (``dropped`` and
+``queue_stats``) in addition to whatever the underlying call emits.
 """
 
 from __future__ import annotations
@@ -38,12 +60,18 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from typing import Any, Awaitable, Callable, Optional
 
-from spellbook.core.config import config_get
+from spellbook.core.config import CONFIG_DEFAULTS, config_get
 from spellbook.worker_llm import client
-from spellbook.worker_llm.events import publish_call
+from spellbook.worker_llm.config import (
+    QUEUE_LANES,
+    parse_queue_caps,
+    parse_queue_lanes,
+)
+from spellbook.worker_llm.events import publish_call, publish_queue_stats
 
 log = logging.getLogger(__name__)
 
@@ -73,24 +101,116 @@ class WorkerTask:
     callback: Optional[Callable[[WorkerResult], Awaitable[None]]] = None
     enqueued_at: float = field(default_factory=time.monotonic)
     context: dict[str, Any] = field(default_factory=dict)
+    lane: str = "background"
+
+
+class LaneQueue:
+    """Bounded multi-lane queue with per-task-name concurrency caps.
+
+    Single-loop only: every method runs on the daemon event loop, so the
+    check-then-pop sequences below need no lock. ``get`` returns the oldest
+    task of the highest-priority lane whose task name is under its cap and
+    counts it as in flight until ``task_done`` is called for it.
+    """
+
+    def __init__(self, maxsize: int, caps: Optional[dict[str, int]] = None) -> None:
+        self.maxsize = maxsize
+        self.caps = dict(caps or {})
+        self._lanes: dict[str, deque[WorkerTask]] = {lane: deque() for lane in QUEUE_LANES}
+        self._in_flight: Counter[str] = Counter()
+        self._waiters: deque[asyncio.Future] = deque()
+
+    def qsize(self) -> int:
+        return sum(len(q) for q in self._lanes.values())
+
+    def full(self) -> bool:
+        return self.qsize() >= self.maxsize
+
+    def put_nowait(self, task: WorkerTask) -> Optional[WorkerTask]:
+        """Queue ``task``; return the task dropped to make room, if any.
+
+        The returned victim may be ``task`` itself when every queued task
+        is in a higher-priority lane.
+        """
+        victim = None
+        if self.full():
+            rank = QUEUE_LANES.index(task.lane)
+            for lane in reversed(QUEUE_LANES[rank:]):
+                if self._lanes[lane]:
+                    victim = self._lanes[lane].popleft()
+                    break
+            else:
+                return task
+        self._lanes[task.lane].append(task)
+        self._wake()
+        return victim
+
+    async def get(self) -> WorkerTask:
+        """Wait for and claim the next eligible task."""
+        while True:
+            task = self._pop_eligible()
+            if task is not None:
+                self._in_flight[task.task_name] += 1
+                return task
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                raise
+
+    def task_done(self, task: WorkerTask) -> None:
+        """Release ``task``'s concurrency slot and wake waiting consumers."""
+        self._in_flight[task.task_name] -= 1
+        if self._in_flight[task.task_name] <= 0:
+            del self._in_flight[task.task_name]
+        self._wake()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "depth": {lane: len(q) for lane, q in self._lanes.items()},
+            "in_flight": dict(self._in_flight),
+            "max_depth": self.maxsize,
+        }
+
+    def _pop_eligible(self) -> Optional[WorkerTask]:
+        for lane in QUEUE_LANES:
+            q = self._lanes[lane]
+            for i, task in enumerate(q):
+                cap = self.caps.get(task.task_name)
+                if cap is None or self._in_flight[task.task_name] < cap:
+                    del q[i]
+                    return task
+        return None
+
+    def _wake(self) -> None:
+        # Wake every waiter: after a completion the newly eligible task may
+        # not be the one a particular consumer would have picked.
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
 
 
 # Module-level queue / consumer state. The daemon lifespan creates exactly
-# one queue + consumer per process. ``None`` when the queue is not running
-# in this process (subprocess callers, CLI runs, test processes without the
-# lifespan hook).
-_queue: Optional[asyncio.Queue[WorkerTask]] = None
-_consumer_task: Optional[asyncio.Task] = None
+# one queue + consumer pool per process. ``None`` / empty when the queue is
+# not running in this process (subprocess callers, CLI runs, test processes
+# without the lifespan hook).
+_queue: Optional[LaneQueue] = None
+_consumer_tasks: list[asyncio.Task] = []
 _queue_loop: Optional[asyncio.AbstractEventLoop] = None
+# Task-name -> lane routing, read from config at ``start_queue``.
+_lanes: dict[str, str] = {}
 
 
 def _get_max_depth() -> int:
     """Return the configured queue depth, clamped to a minimum of 1.
 
-    Guard against a pathologically small / non-numeric config value: the
-    queue would otherwise raise at ``asyncio.Queue(maxsize=0)`` -- which
-    creates an *unbounded* queue. Clamp to >= 1 so the drop-oldest path
-    always has something to drop when full.
+    Guard against a pathologically small / non-numeric config value: a
+    ``maxsize`` of 0 would leave the queue permanently full and drop every
+    incoming task. Clamp to >= 1 so the queue always holds something.
     """
     raw = config_get("worker_llm_queue_max_depth")
     try:
@@ -100,15 +220,45 @@ def _get_max_depth() -> int:
     return max(1, depth)
 
 
+def _get_worker_count() -> int:
+    """Return the configured consumer count, clamped to a minimum of 1."""
+    raw = config_get("worker_llm_queue_workers")
+    try:
+        workers = int(raw)
+    except (TypeError, ValueError):
+        workers = 1
+    return max(1, workers)
+
+
+def _get_lanes() -> dict[str, str]:
+    """Return the task -> lane routing; a malformed value falls back to defaults."""
+    raw = config_get("worker_llm_queue_lanes")
+    try:
+        return parse_queue_lanes(raw)
+    except ValueError as e:
+        log.warning("ignoring worker_llm_queue_lanes=%r: %s", raw, e)
+        return parse_queue_lanes(CONFIG_DEFAULTS["worker_llm_queue_lanes"])
+
+
+def _get_caps() -> dict[str, int]:
+    """Return per-task concurrency caps; a malformed value means no caps."""
+    raw = config_get("worker_llm_queue_task_concurrency")
+    try:
+        return parse_queue_caps(raw)
+    except ValueError as e:
+        log.warning("ignoring worker_llm_queue_task_concurrency=%r: %s", raw, e)
+        return {}
+
+
 def is_available() -> bool:
-    """True iff the queue + consumer are running in the current process / loop.
+    """True iff the queue + consumers are running in the current process / loop.
 
     Used by sync enqueue shims and by callers deciding whether to fall back
     to the sync client path when the async queue is unavailable.
     """
-    if _queue is None or _consumer_task is None:
+    if _queue is None or not _consumer_tasks:
         return False
-    if _consumer_task.done():
+    if all(t.done() for t in _consumer_tasks):
         return False
     try:
         loop = asyncio.get_running_loop()
@@ -127,8 +277,9 @@ async def enqueue(
 
     Returns:
         ``True`` if the task was queued without evicting anything.
-        ``False`` if the queue was full and the oldest task was dropped to
-        make room -- the incoming task is still queued.
+        ``False`` if the queue was full and a task was dropped (see the
+        module docstring's drop policy) -- usually the oldest queued
+        lower-priority task, in which case the incoming task is queued.
 
     Raises:
         RuntimeError: The queue has not been started in this process
@@ -143,33 +294,21 @@ async def enqueue(
         prompt=prompt,
         callback=callback,
         context=dict(context or {}),
+        lane=_lanes.get(task_name, "background"),
     )
 
-    dropped = False
-    if _queue.full():
-        # Drop the oldest queued task. ``get_nowait`` cannot raise here
-        # because the queue is full, but guard anyway: a concurrent
-        # consumer pull could drain it between our ``full()`` check and
-        # the ``get_nowait``.
-        try:
-            victim = _queue.get_nowait()
-            _queue.task_done()
-            publish_call(
-                task=victim.task_name,
-                model="",
-                latency_ms=0,
-                status="dropped",
-                prompt_len=len(victim.prompt),
-                response_len=0,
-                error="queue_overflow",
-            )
-            dropped = True
-        except asyncio.QueueEmpty:
-            # Someone beat us to it; proceed to enqueue normally.
-            pass
-
-    await _queue.put(task)
-    return not dropped
+    victim = _queue.put_nowait(task)
+    if victim is not None:
+        publish_call(
+            task=victim.task_name,
+            model="",
+            latency_ms=0,
+            status="dropped",
+            prompt_len=len(victim.prompt),
+            response_len=0,
+            error="queue_overflow",
+        )
+    return victim is None
 
 
 def enqueue_nowait(
@@ -183,9 +322,9 @@ def enqueue_nowait(
     Schedules ``enqueue`` on ``_queue_loop`` via ``call_soon_threadsafe``.
     Returns ``True`` if scheduled, ``False`` if the queue is not running.
 
-    Unlike ``enqueue``, the boolean return does NOT reflect drop-oldest
+    Unlike ``enqueue``, the boolean return does NOT reflect overflow-drop
     behavior (there is no synchronous way to observe the queued task's
-    fate). Callers needing the drop-oldest signal must use ``enqueue``.
+    fate). Callers needing the drop signal must use ``enqueue``.
     """
     if _queue_loop is None or not _queue_loop.is_running():
         return False
@@ -239,21 +378,33 @@ async def _run_task(task: WorkerTask) -> WorkerResult:
         return WorkerResult(task_name=task.task_name, error=e, context=task.context)
 
 
-async def _consumer_loop() -> None:
+def _publish_stats(wait_ms: Optional[int] = None) -> None:
+    """Publish the queue gauges; ``wait_ms`` is set on dequeue events."""
+    if _queue is None:
+        return
+    try:
+        publish_queue_stats(
+            workers=len(_consumer_tasks),
+            wait_ms=wait_ms,
+            **_queue.stats(),
+        )
+    except Exception:  # noqa: BLE001 -- gauges are best-effort
+        log.debug("worker_llm queue stats publish failed", exc_info=True)
+
+
+async def _consumer_loop(queue: LaneQueue) -> None:
     """Drain the queue forever; one task at a time, failure-isolated.
 
-    The consumer runs serially by design: siesta is a single-writer small
-    model, and running multiple worker calls in parallel would not reduce
-    end-to-end latency. If parallelism becomes useful later, spawn N
-    consumers against the same queue.
+    ``start_queue`` runs ``worker_llm_queue_workers`` of these against the
+    same ``LaneQueue``; the queue itself enforces lane order and per-task
+    concurrency caps.
     """
-    assert _queue is not None  # invariant: consumer only started after queue
     while True:
+        task = await queue.get()
         try:
-            task = await _queue.get()
-        except asyncio.CancelledError:
-            raise
-        try:
+            _publish_stats(
+                wait_ms=int((time.monotonic() - task.enqueued_at) * 1000)
+            )
             result = await _run_task(task)
             if task.callback is not None:
                 try:
@@ -273,7 +424,8 @@ async def _consumer_loop() -> None:
                 exc_info=True,
             )
         finally:
-            _queue.task_done()
+            queue.task_done(task)
+            _publish_stats()
 
 
 # ---------------------------------------------------------------------------
@@ -282,34 +434,41 @@ async def _consumer_loop() -> None:
 
 
 async def start_queue() -> None:
-    """Create the queue + spawn the consumer task.
+    """Create the queue + spawn the consumer pool.
 
     Called from ``admin/app.py:_lifespan`` at daemon startup when
-    ``worker_llm_queue_enabled`` is True. Idempotent: calling twice leaves
-    the existing queue / consumer in place.
+    ``worker_llm_queue_enabled`` is True. Worker count, lanes and caps are
+    read once here; changing them takes effect on the next daemon start.
+    Idempotent: calling twice leaves the existing queue / consumers in
+    place.
     """
-    global _queue, _consumer_task, _queue_loop
-    if _queue is not None and _consumer_task is not None and not _consumer_task.done():
+    global _queue, _consumer_tasks, _queue_loop, _lanes
+    if is_available():
         return
-    _queue = asyncio.Queue(maxsize=_get_max_depth())
+    _lanes = _get_lanes()
+    _queue = LaneQueue(maxsize=_get_max_depth(), caps=_get_caps())
     _queue_loop = asyncio.get_running_loop()
-    _consumer_task = asyncio.create_task(
-        _consumer_loop(), name="spellbook-worker-llm-queue"
-    )
+    _consumer_tasks = [
+        asyncio.create_task(
+            _consumer_loop(_queue), name=f"spellbook-worker-llm-queue-{i}"
+        )
+        for i in range(_get_worker_count())
+    ]
 
 
 async def stop_queue() -> None:
-    """Cancel + await the consumer; release module state.
+    """Cancel + await the consumers; release module state.
 
     Called from the daemon lifespan's shutdown branch. Any queued tasks
     not yet picked up are discarded -- fire-and-forget semantics mean we
     do not owe the caller a completion signal.
     """
-    global _queue, _consumer_task, _queue_loop
-    if _consumer_task is not None:
-        _consumer_task.cancel()
+    global _queue, _consumer_tasks, _queue_loop
+    for task in _consumer_tasks:
+        task.cancel()
+    for task in _consumer_tasks:
         try:
-            await _consumer_task
+            await task
         except asyncio.CancelledError:
             pass
         except Exception:
@@ -318,10 +477,17 @@ async def stop_queue() -> None:
                 exc_info=True,
             )
     _queue = None
-    _consumer_task = None
+    _consumer_tasks = []
     _queue_loop = None
 
 
+def queue_stats() -> Optional[dict[str, Any]]:
+    """Return the current gauges, or ``None`` when the queue is not running."""
+    if _queue is None:
+        return None
+    return {"workers": len(_consumer_tasks), **_queue.stats()}
+
+
 # ---------------------------------------------------------------------------
 # Test helpers
 # ---------------------------------------------------------------------------
@@ -329,7 +495,8 @@ async def stop_queue() -> None:
 
 def _reset_for_tests() -> None:
     """Clear module state between tests. NOT part of the public API."""
-    global _queue, _consumer_task, _queue_loop
+    global _queue, _consumer_tasks, _queue_loop, _lanes
     _queue = None
-    _consumer_task = None
+    _consumer_tasks = []
     _queue_loop = None
+    _lanes = {}
@@ -0,0 +1,143 @@
+"""Request coalescing and response cache for ``client.call``.
+
+Both layers key on a SHA-256 of the request identity: endpoint, model,
+``max_tokens`` and the two prompts. The timeout is deliberately not part
+of the key -- it bounds how long a caller waits, not what it asks.
+
+**Coalescing (always on).** While a request is in flight, an identical
+``call`` anywhere in the process does not send its own request; it awaits
+the first caller's result (or exception), bounded by its own timeout.
+The in-flight map holds ``concurrent.futures.Future`` objects rather than
+loop-bound asyncio futures, so ``call_sync`` callers -- each on its own
+short-lived loop, e.g. concurrent hook events checking the same Bash
+command in the daemon -- coalesce with each other and with daemon-loop
+callers. Streaming calls (``stop_when``) are never coalesced.
+
+**Response cache (opt-in).** With ``worker_llm_response_cache_ttl_s`` > 0,
+successful responses are kept in an in-process LRU bounded by
+``worker_llm_response_cache_max_entries`` and
+``worker_llm_response_cache_max_bytes`` (UTF-8 size of the cached text).
+Errors are never cached. Off by default: a worker model sampled at
+non-zero temperature is expected to answer a repeated prompt differently,
+and callers like ``tool_safety`` already keep their own verdict cache.
+
+Counters are process-lifetime and exposed through
+``response_cache_info()``; the daemon reports them in
+``GET /api/worker-llm/metrics``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+_lock = threading.Lock()
+
+# key -> (monotonic expiry, response text, size in bytes). Ordered LRU-first.
+_entries: "OrderedDict[str, tuple[float, str, int]]" = OrderedDict()
+_bytes = 0
+_hits = 0
+_misses = 0
+_coalesced = 0
+
+# In-flight requests, process-wide: key -> future of the leading call.
+_inflight: dict[str, Future] = {}
+
+
+def make_key(
+    base_url: str, model: str, max_tokens: int, system_prompt: str, user_prompt: str
+) -> str:
+    """Content address of one ``/chat/completions`` request."""
+    body = json.dumps([base_url, model, max_tokens, system_prompt, user_prompt])
+    return hashlib.sha256(body.encode()).hexdigest()
+
+
+def lookup(key: str) -> str | None:
+    """Return the cached response for ``key`` if present and fresh."""
+    global _hits, _misses, _bytes
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None and entry[0] < time.monotonic():
+            del _entries[key]
+            _bytes -= entry[2]
+            entry = None
+        if entry is None:
+            _misses += 1
+            return None
+        _entries.move_to_end(key)
+        _hits += 1
+        return entry[1]
+
+
+def store(key: str, text: str, ttl_s: float, max_entries: int, max_bytes: int) -> None:
+    """Cache ``text`` under ``key``, evicting LRU entries past either cap.
+
+    A single response larger than ``max_bytes`` is not cached at all.
+    """
+    global _bytes
+    size = len(text.encode())
+    if size > max_bytes:
+        return
+    with _lock:
+        old = _entries.pop(key, None)
+        if old is not None:
+            _bytes -= old[2]
+        _entries[key] = (time.monotonic() + ttl_s, text, size)
+        _bytes += size
+        while len(_entries) > max_entries or _bytes > max_bytes:
+            _, (_, _, evicted) = _entries.popitem(last=False)
+            _bytes -= evicted
+
+
+def join_inflight(key: str) -> tuple[Future, bool]:
+    """Return ``(future, leader)`` for a request about to be sent.
+
+    The first caller for ``key`` gets a fresh future and ``leader=True``;
+    it must send the request, settle the future and call
+    :func:`finish_inflight`. Callers arriving before that get the same
+    future and ``leader=False`` (counted as coalesced).
+    """
+    global _coalesced
+    with _lock:
+        shared = _inflight.get(key)
+        if shared is not None:
+            _coalesced += 1
+            return shared, False
+        shared = _inflight[key] = Future()
+        return shared, True
+
+
+def finish_inflight(key: str, shared: Future) -> None:
+    """Drop the leader's entry so the next identical call sends afresh."""
+    with _lock:
+        if _inflight.get(key) is shared:
+            del _inflight[key]
+
+
+def response_cache_info() -> dict:
+    """Return hit/miss/coalesce counters and occupancy of the response cache."""
+    with _lock:
+        lookups = _hits + _misses
+        return {
+            "hits": _hits,
+            "misses": _misses,
+            "hit_rate": (_hits / lookups) if lookups else None,
+            "coalesced": _coalesced,
+            "size": len(_entries),
+            "bytes": _bytes,
+        }
+
+
+def response_cache_clear() -> None:
+    """Drop every cached response and reset the counters."""
+    global _bytes, _hits, _misses, _coalesced
+    with _lock:
+        _entries.clear()
+        _bytes = 0
+        _hits = 0
+        _misses = 0
+        _coalesced = 0
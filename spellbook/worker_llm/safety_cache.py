@@ -1,28 +1,33 @@
 """Persistent verdict + block cache for ``tool_safety``.
 
-Disk schema (JSON)::
+Disk schema (SQLite, ``CACHE_PATH``)::
 
-    {
-      "verdicts": {<sha256>: {"verdict": "OK|WARN|BLOCK",
-                              "reasoning": "...",
-                              "expires_at": <float wall-clock>}},
-      "blocks":   {<sha256>: <float wall-clock>}
-    }
+    verdicts(key TEXT PRIMARY KEY, verdict TEXT, reasoning TEXT,
+             expires_at REAL wall-clock, touched INTEGER LRU sequence)
+    blocks(key TEXT PRIMARY KEY, blocked_at REAL wall-clock)
 
 The cache is file-backed because Claude Code fires each hook in a fresh
 subprocess — an in-process dict would never see the 30-second bypass
-window record. Writes are atomic (temp file + ``os.replace``) so a
-concurrent read never observes a partially-written cache.
+window record. Every operation touches only the rows for its key: a
+lookup is one indexed ``SELECT``, a store is one ``INSERT OR REPLACE``.
+The database is opened in WAL mode, so a hook process reading the cache
+never waits on another one writing it, and every hook process shares the
+same entries without loading the whole cache at startup.
 
-**Graceful degradation.** A corrupt cache file on disk is not a crash:
-we log a single WARNING and start with empty caches. The next successful
-write heals the file.
+**Lazy expiry.** Expired verdicts and stale block records are ignored on
+read and deleted by the next write, never by a scan at startup.
+
+**Graceful degradation.** An unreadable or corrupt cache database is not a
+crash: we log a single WARNING and fall back to an in-memory database for
+the rest of the process. Read failures count as misses.
 
 **Size cap.** ``MAX_CACHE_ENTRIES`` (default 500) bounds the on-disk
 footprint. Once full, LRU eviction drops the least-recently-touched
-entry (reads move hits to MRU, writes rotate). Worst-case collision
-rate is tiny because verdict keys are sha256 of the (tool_name, params)
-pair.
+entry. Writes always bump the entry's ``touched`` sequence; a read bumps
+it only once the entry has drifted out of the newest quarter of the
+sequence, so repeated hits on a warm entry never write to disk.
+Worst-case collision rate is tiny because verdict keys are sha256 of the
+(tool_name, params) pair.
 
 See impl plan Task SC1, design §5.2, §14.4.
 """
@@ -32,39 +37,57 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
-import os
-import secrets
+import sqlite3
+import threading
 import time
-from dataclasses import dataclass
 from pathlib import Path
 
-from spellbook.core.command_utils import atomic_replace
 from spellbook.worker_llm.tasks.tool_safety import SafetyVerdict
 
 logger = logging.getLogger(__name__)
 
 CACHE_PATH: Path = (
-    Path.home() / ".local" / "spellbook" / "cache" / "worker_llm_block.json"
+    Path.home() / ".local" / "spellbook" / "cache" / "worker_llm_safety.db"
 )
 
+# Pre-SQLite JSON cache. Its entries expire within minutes, so it is not
+# imported; the file is removed the first time the database is created.
+LEGACY_CACHE_PATH: Path = CACHE_PATH.with_name("worker_llm_block.json")
+
 BYPASS_WINDOW_S: float = 30.0
 MAX_CACHE_ENTRIES: int = 500
 
+# Bump when the table layout changes; older databases are rebuilt empty.
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verdicts (
+    key TEXT PRIMARY KEY,
+    verdict TEXT NOT NULL,
+    reasoning TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    touched INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_verdicts_touched ON verdicts(touched);
+CREATE TABLE IF NOT EXISTS blocks (
+    key TEXT PRIMARY KEY,
+    blocked_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
 
-@dataclass
-class _Entry:
-    verdict: SafetyVerdict
-    expires_at: float  # wall-clock
+# Next value of the LRU sequence; served from the index on ``touched``.
+_NEXT_TOUCH = "(SELECT COALESCE(MAX(touched), 0) + 1 FROM verdicts)"
 
+# A hit re-touches its entry only when it lags the newest ``touched`` by
+# more than MAX_CACHE_ENTRIES // _TOUCH_SLACK_DIVISOR sequence steps.
+_TOUCH_SLACK_DIVISOR = 4
 
-# Insertion-ordered dicts (CPython 3.7+) give us move-to-end for free:
-# reads rotate hits to MRU position (``get_cached_verdict``) and writes
-# evict the LRU (oldest-touched) entry when ``MAX_CACHE_ENTRIES`` is full.
-_VERDICT_CACHE: dict[str, _Entry] = {}
-_BLOCK_CACHE: dict[str, float] = {}
+_conn: sqlite3.Connection | None = None
+_conn_path: Path | None = None
+_conn_lock = threading.Lock()
 
 # Module-level counter so we can emit a single loud warning on the first
-# persist failure per process, then fall back to DEBUG for the rest.
+# cache failure per process, then fall back to DEBUG for the rest.
 # Rationale: cache persistence is best-effort (fire-and-forget) and runs in
 # the hot hook subprocess path, so we do not want to spam logs — but silent
 # swallow hid unwritable-cache-dir bugs. One WARN makes misconfigurations
@@ -90,45 +113,80 @@ def make_key(tool_name: str, params: dict) -> str:
 
 def get_cached_verdict(key: str) -> SafetyVerdict | None:
     """Return a cached verdict if one exists and has not expired."""
-    entry = _VERDICT_CACHE.get(key)
-    if entry is None:
-        return None
-    if entry.expires_at < time.time():
-        _VERDICT_CACHE.pop(key, None)
-        _persist_to_disk()
+    try:
+        with _conn_lock:
+            conn = _connection()
+            row = conn.execute(
+                "SELECT verdict, reasoning, expires_at, touched, "
+                "(SELECT MAX(touched) FROM verdicts) "
+                "FROM verdicts WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or row[2] < time.time():
+                # Expired rows are left for the next write to delete.
+                return None
+            # LRU: bump this key to MRU so eviction drops cold entries, but
+            # only once it is far enough behind the newest entry to be at
+            # risk; hot hits stay read-only.
+            if row[4] - row[3] > MAX_CACHE_ENTRIES // _TOUCH_SLACK_DIVISOR:
+                with conn:
+                    conn.execute(
+                        f"UPDATE verdicts SET touched = {_NEXT_TOUCH} WHERE key = ?",
+                        (key,),
+                    )
+    except sqlite3.Error as e:
+        _record_failure("reading", e)
         return None
-    # LRU: rotate this key to MRU position so eviction drops cold entries.
-    # In-memory only -- on-disk order isn't persisted (order is rebuilt on
-    # subsequent writes), so no _persist_to_disk() call on the hot read path.
-    _VERDICT_CACHE[key] = _VERDICT_CACHE.pop(key)
-    return entry.verdict
+    return SafetyVerdict(verdict=row[0], reasoning=row[1])
 
 
 def cache_verdict(key: str, verdict: SafetyVerdict) -> None:
     """Store ``verdict`` under ``key`` with a wall-clock expiry.
 
-    Enforces ``MAX_CACHE_ENTRIES`` via LRU eviction: reads move hits to
-    MRU, writes evict the oldest-touched entry when the cache is full.
+    Enforces ``MAX_CACHE_ENTRIES`` via LRU eviction: reads move stale
+    hits to MRU, writes evict the least-recently-touched entries once the cache
+    is over the cap. Expired entries are purged here too.
     """
-    ttl = _ttl_seconds()
-    # If key already present, rotate it to MRU position by popping first.
-    if key in _VERDICT_CACHE:
-        _VERDICT_CACHE.pop(key)
-    elif len(_VERDICT_CACHE) >= MAX_CACHE_ENTRIES:
-        # Evict LRU (least-recently-read-or-written) to make room.
-        oldest_key = next(iter(_VERDICT_CACHE))
-        _VERDICT_CACHE.pop(oldest_key, None)
-
-    _VERDICT_CACHE[key] = _Entry(
-        verdict=verdict, expires_at=time.time() + ttl
-    )
-    _persist_to_disk()
+    now = time.time()
+    expires_at = now + _ttl_seconds()
+    try:
+        with _conn_lock:
+            conn = _connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO verdicts "
+                    "(key, verdict, reasoning, expires_at, touched) "
+                    f"VALUES (?, ?, ?, ?, {_NEXT_TOUCH})",
+                    (key, verdict.verdict, verdict.reasoning, expires_at),
+                )
+                conn.execute("DELETE FROM verdicts WHERE expires_at < ?", (now,))
+                conn.execute(
+                    "DELETE FROM verdicts WHERE key IN ("
+                    "SELECT key FROM verdicts ORDER BY touched DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (MAX_CACHE_ENTRIES,),
+                )
+    except sqlite3.Error as e:
+        _record_failure("writing", e)
 
 
 def record_block(key: str) -> None:
     """Remember that a BLOCK verdict fired for ``key`` at wall-clock now."""
-    _BLOCK_CACHE[key] = time.time()
-    _persist_to_disk()
+    now = time.time()
+    try:
+        with _conn_lock:
+            conn = _connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO blocks (key, blocked_at) VALUES (?, ?)",
+                    (key, now),
+                )
+                conn.execute(
+                    "DELETE FROM blocks WHERE blocked_at < ?",
+                    (now - BYPASS_WINDOW_S,),
+                )
+    except sqlite3.Error as e:
+        _record_failure("writing", e)
 
 
 def should_bypass(key: str) -> bool:
@@ -136,19 +194,53 @@ def should_bypass(key: str) -> bool:
 
     Consuming means the next call returns False. Rationale: the 30s
     window is meant to let a user re-run the exact same blocked call
-    once, not grant a rolling amnesty.
+    once, not grant a rolling amnesty. The check and the consume are
+    one ``DELETE ... RETURNING`` statement, so when two hook processes
+    race on the same key only one of them gets the bypass.
     """
-    t = _BLOCK_CACHE.get(key)
-    if t is None:
+    try:
+        with _conn_lock:
+            conn = _connection()
+            with conn:
+                rows = conn.execute(
+                    "DELETE FROM blocks WHERE key = ? RETURNING blocked_at", (key,)
+                ).fetchall()
+        if not rows:
+            return False
+    except sqlite3.Error as e:
+        _record_failure("reading", e)
         return False
-    within = (time.time() - t) <= BYPASS_WINDOW_S
-    _BLOCK_CACHE.pop(key, None)
-    _persist_to_disk()
-    return within
+    return (time.time() - rows[0][0]) <= BYPASS_WINDOW_S
+
+
+def cache_stats() -> dict:
+    """Return ``{"verdicts": n, "blocks": n}`` (live and not-yet-purged rows).
+
+    A database error counts as an empty cache.
+    """
+    try:
+        with _conn_lock:
+            conn = _connection()
+            verdicts = conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+            blocks = conn.execute("SELECT COUNT(*) FROM blocks").fetchone()[0]
+    except sqlite3.Error as e:
+        _record_failure("reading", e)
+        return {"verdicts": 0, "blocks": 0}
+    return {"verdicts": verdicts, "blocks": blocks}
+
+
+def close_cache() -> None:
+    """Close the cached database connection (reopened on next use)."""
+    global _conn, _conn_path
+    with _conn_lock:
+        if _conn is not None:
+            _conn.close()
+        _conn = None
+        _conn_path = None
 
 
 # ---------------------------------------------------------------------------
-# Disk I/O
+# Storage
 # ---------------------------------------------------------------------------
 
 
@@ -158,136 +250,72 @@ def _ttl_seconds() -> float:
     return float(config_get("worker_llm_safety_cache_ttl_s") or 300.0)
 
 
-def _load_from_disk() -> None:
-    """Repopulate the in-memory caches from ``CACHE_PATH``.
+def _connection() -> sqlite3.Connection:
+    """Return the connection for ``CACHE_PATH``, opening it if needed.
 
-    Called once at import time and exposed for tests that reload the
-    module. Corrupt JSON, missing keys, or wrong-type payloads produce a
-    single WARNING and an empty cache — never an exception.
+    Caller holds ``_conn_lock``. Reopens when ``CACHE_PATH`` has been
+    repointed (tests do this). An unopenable or corrupt database logs one
+    WARNING and is replaced by an in-memory database.
     """
-    _VERDICT_CACHE.clear()
-    _BLOCK_CACHE.clear()
-    if not CACHE_PATH.exists():
-        return
+    global _conn, _conn_path
+    path = CACHE_PATH
+    if _conn is not None and _conn_path == path:
+        return _conn
+    if _conn is not None:
+        _conn.close()
     try:
-        payload = json.loads(CACHE_PATH.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError) as e:
+        conn = _open(str(path))
+    except (OSError, sqlite3.Error) as e:
         logger.warning(
-            "worker_llm safety_cache is corrupt (%s: %s); "
-            "starting fresh, next write will heal the file.",
+            "worker_llm safety_cache unavailable at %s (%s: %s); "
+            "using an in-memory cache for this process.",
+            path,
             type(e).__name__,
             e,
         )
-        return
-    if not isinstance(payload, dict):
-        logger.warning(
-            "worker_llm safety_cache schema mismatch "
-            "(expected object, got %s); starting fresh.",
-            type(payload).__name__,
-        )
-        return
+        conn = _open(":memory:")
+    _conn, _conn_path = conn, path
+    return conn
 
-    now = time.time()
-    verdicts = payload.get("verdicts") or {}
-    if isinstance(verdicts, dict):
-        for k, row in verdicts.items():
-            if not isinstance(row, dict):
-                continue
-            try:
-                expires_at = float(row["expires_at"])
-            except (KeyError, TypeError, ValueError):
-                continue
-            if expires_at < now:
-                continue  # dead on arrival
-            verdict = str(row.get("verdict", ""))
-            reasoning = str(row.get("reasoning", ""))
-            if verdict not in {"OK", "WARN", "BLOCK"}:
-                continue
-            _VERDICT_CACHE[str(k)] = _Entry(
-                verdict=SafetyVerdict(verdict=verdict, reasoning=reasoning),
-                expires_at=expires_at,
-            )
-
-    blocks = payload.get("blocks") or {}
-    if isinstance(blocks, dict):
-        for k, ts in blocks.items():
-            try:
-                _BLOCK_CACHE[str(k)] = float(ts)
-            except (TypeError, ValueError):
-                continue
-
-
-def _persist_to_disk() -> None:
-    """Atomically write the current caches to ``CACHE_PATH``.
-
-    Fire-and-forget: IO errors are logged but do not propagate — the
-    tool_safety path is already in the hot hook subprocess and must
-    never raise here.
-    """
-    payload = {
-        "verdicts": {
-            k: {
-                "verdict": e.verdict.verdict,
-                "reasoning": e.verdict.reasoning,
-                "expires_at": e.expires_at,
-            }
-            for k, e in _VERDICT_CACHE.items()
-        },
-        "blocks": dict(_BLOCK_CACHE),
-    }
-    global _persist_failures
+
+def _open(db_path: str) -> sqlite3.Connection:
+    if db_path != ":memory:":
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=2.0, check_same_thread=False)
     try:
-        _atomic_write_json(CACHE_PATH, payload)
-    except OSError as e:
-        # FIRST failure per process -> WARNING (actionable, names the path
-        # and exception type). Subsequent failures drop to DEBUG to avoid
-        # flooding logs from the hot hook subprocess path.
-        if _persist_failures == 0:
-            logger.warning(
-                "worker_llm safety_cache persist failed (%s writing to %s): "
-                "%s. Further failures will be logged at DEBUG.",
-                type(e).__name__,
-                CACHE_PATH,
-                e,
-            )
-        else:
-            logger.debug("safety_cache write failed: %s", e)
-        _persist_failures += 1
-
-
-def _atomic_write_json(path: Path, data: dict) -> None:
-    """Atomic write via tempfile + ``os.replace``.
-
-    Pattern mirrors ``hooks/spellbook_hook.py::_atomic_write_json`` so a
-    crashing process never leaves a half-written cache visible to a
-    concurrent reader.
-    """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    body = json.dumps(data).encode("utf-8")
-    for _ in range(5):
-        tmp = path.with_suffix(f".tmp.{os.getpid()}.{secrets.token_hex(4)}")
-        try:
-            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
-        except FileExistsError:
-            continue
-        try:
-            with os.fdopen(fd, "wb") as fh:
-                fh.write(body)
-            atomic_replace(str(tmp), str(path))
-            return
-        except Exception:
-            # Clean up the temp file so a failed write does not leave
-            # litter in the cache directory.
-            try:
-                tmp.unlink()
-            except OSError:
-                pass
-            raise
-    raise OSError(
-        f"safety_cache: could not acquire a fresh tempfile suffix near {path}"
-    )
-
-
-# Populate in-memory caches at import time so hook subprocesses that never
-# call `_load_from_disk()` explicitly still see the persisted state.
-_load_from_disk()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != _SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS verdicts")
+            conn.execute("DROP TABLE IF EXISTS blocks")
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            legacy = Path(db_path).with_name(LEGACY_CACHE_PATH.name)
+            if db_path != ":memory:" and legacy != Path(db_path):
+                legacy.unlink(missing_ok=True)
+        conn.commit()
+    except sqlite3.Error:
+        conn.close()
+        raise
+    return conn
+
+
+def _record_failure(action: str, e: Exception) -> None:
+    """Log a cache failure: WARNING the first time, DEBUG afterwards."""
+    global _persist_failures
+    # FIRST failure per process -> WARNING (actionable, names the path and
+    # exception type). Subsequent failures drop to DEBUG to avoid flooding
+    # logs from the hot hook subprocess path.
+    if _persist_failures == 0:
+        logger.warning(
+            "worker_llm safety_cache failed (%s %s while %s): %s. "
+            "Further failures will be logged at DEBUG.",
+            type(e).__name__,
+            CACHE_PATH,
+            action,
+            e,
+        )
+    else:
+        logger.debug("safety_cache %s failed: %s", action, e)
+    _persist_failures += 1
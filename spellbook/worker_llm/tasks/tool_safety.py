@@ -17,6 +17,14 @@ raising. Two reasons:
    than propagated — the only verdicts the integration knows how to
    render are OK / WARN / BLOCK.
 
+**Streaming (opt-in).** With ``worker_llm_tool_safety_stream`` set, the
+response is streamed and the call returns as soon as the verdict is
+decided: an ``OK`` verdict ends the stream right after its ``verdict``
+field (OK reasoning is never shown to the user), while ``WARN`` / ``BLOCK``
+read on until the object closes because their reasoning is rendered by
+the hook. Models that emit ``verdict`` first (as the prompt's examples do)
+skip generating the OK rationale entirely.
+
 **SC1 cache integration.** Reads through on entry and writes through on
 successful parse. Fail-open results are intentionally NOT cached so a
 transient worker outage cannot poison a 5-minute TTL with a bogus OK
@@ -29,10 +37,11 @@ from __future__ import annotations
 
 import json
 import logging
-import os
+import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
+from spellbook.core import run_context
 from spellbook.worker_llm import client, prompts
 from spellbook.worker_llm.auth import _load_bearer_token
 from spellbook.worker_llm.config import get_worker_config
@@ -77,6 +86,14 @@ _RECENT_CONTEXT_BYTES = 1500
 _PARAM_VALUE_CAP = 800
 _PARAM_VALUE_HEAD_TAIL = 300
 _FAIL_OPEN = SafetyVerdict(verdict="OK", reasoning="error; fail-open")
+# A complete top-level ``"verdict": "..."`` member in a (possibly partial)
+# streamed response. Anchored on ``{`` / ``,`` so an escaped
+# ``\"verdict\"`` inside the reasoning string never matches.
+_VERDICT_FIELD = re.compile(r'[{,]\s*"verdict"\s*:\s*"([^"\\]*)"')
+# Verdicts whose reasoning the hook renders; the stream runs to the end of
+# the object for these.
+_VERDICTS_WITH_REASONING = frozenset({"WARN", "BLOCK"})
+_EARLY_OK_REASONING = "verdict streamed; reasoning not read"
 
 
 def _cold_threshold_s() -> float | None:
@@ -102,6 +119,13 @@ def _cold_threshold_s() -> float | None:
     return val
 
 
+def _stream_enabled() -> bool:
+    """Return True when ``worker_llm_tool_safety_stream`` is set."""
+    from spellbook.core.config import config_get
+
+    return bool(config_get("worker_llm_tool_safety_stream"))
+
+
 def _trim_param_value(
     value: object, _visited: set[int] | None = None
 ) -> object:
@@ -229,8 +253,8 @@ def _post_warmup_enqueue() -> bool:
     from spellbook.worker_llm.net import build_host_url
 
     try:
-        host = os.environ.get("SPELLBOOK_MCP_HOST", "127.0.0.1")
-        port = os.environ.get("SPELLBOOK_MCP_PORT", "8765")
+        host = run_context.getenv("SPELLBOOK_MCP_HOST", "127.0.0.1")
+        port = run_context.getenv("SPELLBOOK_MCP_PORT", "8765")
         url = build_host_url(host, port, "/api/worker-llm/enqueue")
         headers = {"Content-Type": "application/json"}
         token = _load_bearer_token()
@@ -355,6 +379,7 @@ def tool_safety(
         ensure_ascii=False,
     )
 
+    streaming = _stream_enabled()
     try:
         raw = client.call_sync(
             system_prompt=system,
@@ -363,6 +388,7 @@ def tool_safety(
             timeout_s=cfg.tool_safety_timeout_s,
             task="tool_safety",
             override_loaded=override,
+            stop_when=_verdict_decided if streaming else None,
         )
     except WorkerLLMError as e:
         logger.warning("worker_llm tool_safety failed open: %s", e)
@@ -377,6 +403,8 @@ def tool_safety(
         return _FAIL_OPEN
 
     verdict = _parse_verdict(raw)
+    if verdict is None and streaming:
+        verdict = _parse_early_verdict(raw)
     if verdict is None:
         # Drifty small model: response parsed but verdict token was unknown
         # (or payload was non-JSON). Log a truncated body so operators can
@@ -412,6 +440,29 @@ def _parse_verdict(raw: str) -> SafetyVerdict | None:
     )
 
 
+def _verdict_decided(text: str) -> bool:
+    """``stop_when`` predicate for a streamed verdict.
+
+    True once the ``verdict`` field is complete and is not WARN/BLOCK (an
+    unknown token fails open either way, so there is nothing left to
+    read), or once the whole object parses.
+    """
+    match = _VERDICT_FIELD.search(text)
+    if match is None:
+        return False
+    if match.group(1).upper() not in _VERDICTS_WITH_REASONING:
+        return True
+    return _parse_verdict(text) is not None
+
+
+def _parse_early_verdict(raw: str) -> SafetyVerdict | None:
+    """Recover an ``OK`` verdict from a stream cut short by ``_verdict_decided``."""
+    match = _VERDICT_FIELD.search(raw)
+    if match is None or match.group(1).upper() != "OK":
+        return None
+    return SafetyVerdict(verdict="OK", reasoning=_EARLY_OK_REASONING)
+
+
 def _strip_code_fences(text: str) -> str:
     s = text.strip()
     if s.startswith("```"):
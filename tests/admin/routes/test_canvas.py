@@ -108,6 +108,34 @@ def test_get_canvas_happy(canvas_tmp_root, authed_client):
     }
 
 
+def test_get_canvas_etag_not_modified(canvas_tmp_root, authed_client):
+    canvas_store.open_canvas("design", title="Design Doc")
+    canvas_store.write_page("design", "# Hello")
+    first = authed_client.get("/api/canvas/design")
+    etag = first.headers["etag"]
+    assert etag == canvas_store.canvas_etag("design")
+    assert first.headers["cache-control"] == "no-cache"
+
+    resp = authed_client.get(
+        "/api/canvas/design", headers={"If-None-Match": f'"other", W/{etag}'}
+    )
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+
+
+def test_get_canvas_etag_changes_on_write(canvas_tmp_root, authed_client):
+    canvas_store.open_canvas("design", title="Design Doc")
+    canvas_store.write_page("design", "# Hello")
+    etag = authed_client.get("/api/canvas/design").headers["etag"]
+    canvas_store.write_page("design", "# Hullo")
+
+    resp = authed_client.get("/api/canvas/design", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["content"] == "# Hullo"
+    assert resp.headers["etag"] != etag
+
+
 def test_get_canvas_not_found(canvas_tmp_root, authed_client):
     resp = authed_client.get("/api/canvas/ghost")
     assert resp.status_code == 404
@@ -586,3 +586,127 @@ class TestHookEventsMigration:
         assert orphan_indexes == []
 
         engine.dispose()
+
+
+class TestMetricRollupsMigration:
+    """Verify the 0003_metric_rollups Alembic revision creates the four
+    rollup tables, backfills them from existing raw rows, installs the
+    rollup triggers, and drops all of it on downgrade.
+
+    Runs 0001 and 0002 first so the raw tables the triggers attach to
+    exist, as they do on a real upgrade.
+    """
+
+    MIGRATIONS = ("0001_add_worker_llm_calls", "0002_add_hook_events")
+    REVISION_PATH = (
+        MIGRATIONS_DIR / "versions" / "spellbook" / "0003_add_metric_rollups.py"
+    )
+
+    EXPECTED_TABLES = {
+        "hook_event_rollup_minute",
+        "hook_event_rollup_hour",
+        "worker_llm_call_rollup_minute",
+        "worker_llm_call_rollup_hour",
+    }
+
+    EXPECTED_TRIGGERS = {"hook_events_rollup_ai", "worker_llm_calls_rollup_ai"}
+
+    def _load(self, path, name):
+        spec = importlib.util.spec_from_file_location(name, str(path))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def _load_revision_module(self):
+        return self._load(self.REVISION_PATH, "spellbook_migration_0003")
+
+    def _run(self, engine, *steps):
+        from alembic.migration import MigrationContext
+        from alembic.operations import Operations
+
+        with engine.begin() as conn:
+            ctx = MigrationContext.configure(conn)
+            with Operations.context(ctx):
+                for step in steps:
+                    step()
+
+    def _upgrade_base(self, engine):
+        base = [
+            self._load(
+                MIGRATIONS_DIR / "versions" / "spellbook" / f"{name}.py",
+                f"spellbook_migration_{name}",
+            )
+            for name in self.MIGRATIONS
+        ]
+        self._run(engine, *(m.upgrade for m in base))
+
+    def _triggers(self, engine):
+        from sqlalchemy import text
+
+        with engine.connect() as conn:
+            return {
+                r[0] for r in conn.execute(
+                    text("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+                )
+            }
+
+    def test_revision_file_exists(self):
+        assert self.REVISION_PATH.is_file(), (
+            f"expected migration file at {self.REVISION_PATH}"
+        )
+
+    def test_revision_metadata(self):
+        module = self._load_revision_module()
+        assert module.revision == "0003_metric_rollups"
+        assert module.down_revision == "0002_hook_events"
+        assert module.branch_labels is None
+        assert module.depends_on is None
+
+    def test_upgrade_creates_tables_backfills_and_installs_triggers(self, tmp_path):
+        from sqlalchemy import create_engine, inspect, text
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'test_migration.db'}")
+        self._upgrade_base(engine)
+        with engine.begin() as conn:
+            conn.execute(text(
+                "INSERT INTO hook_events (timestamp, hook_name, event_name, "
+                "duration_ms, exit_code) VALUES "
+                "('2026-04-22T10:15:00+00:00', 'h', 'PreToolUse', 12, 0)"
+            ))
+
+        self._run(engine, self._load_revision_module().upgrade)
+
+        assert self.EXPECTED_TABLES <= set(inspect(engine).get_table_names())
+        assert self._triggers(engine) == self.EXPECTED_TRIGGERS
+        with engine.begin() as conn:
+            # Backfilled pre-existing row...
+            assert conn.execute(text(
+                "SELECT event_count FROM hook_event_rollup_hour"
+            )).scalar() == 1
+            # ...and new rows land via the trigger.
+            conn.execute(text(
+                "INSERT INTO hook_events (timestamp, hook_name, event_name, "
+                "duration_ms, exit_code) VALUES "
+                "('2026-04-22T10:45:00+00:00', 'h', 'PreToolUse', 13, 0)"
+            ))
+            assert conn.execute(text(
+                "SELECT event_count FROM hook_event_rollup_hour"
+            )).scalar() == 2
+
+        engine.dispose()
+
+    def test_downgrade_drops_tables_and_triggers(self, tmp_path):
+        from sqlalchemy import create_engine, inspect
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'test_migration.db'}")
+        self._upgrade_base(engine)
+        module = self._load_revision_module()
+        self._run(engine, module.upgrade)
+        self._run(engine, module.downgrade)
+
+        tables = set(inspect(engine).get_table_names())
+        assert tables & self.EXPECTED_TABLES == set()
+        assert {"hook_events", "worker_llm_calls"} <= tables
+        assert self._triggers(engine) == set()
+
+        engine.dispose()
@@ -169,3 +169,106 @@ class TestCompactionDetection:
         assert event.leaf_uuid == "leaf-uuid-456"
         assert event.project_path == project_path
         assert event.injected is False
+
+
+_COMPACTION = {
+    "type": "user",
+    "isCompactSummary": True,
+    "summary": "appended summary",
+    "leafUuid": "leaf-1",
+}
+
+
+class TestIncrementalCheck:
+    """check_for_compaction reads only what was appended since the last check."""
+
+    def test_reads_only_appended_lines(self, session_dir):
+        project_path, session_base = session_dir
+        session_file = _write_session_file(session_base, [_COMPACTION])
+
+        first = check_for_compaction(project_path, session_file)
+        assert first is not None
+
+        # Nothing appended: the old compaction line is not reported again.
+        assert check_for_compaction(project_path, session_file) is None
+
+        with open(session_file, "a") as f:
+            f.write(json.dumps({"type": "user", "content": "more"}) + "\n")
+        assert check_for_compaction(project_path, session_file) is None
+
+        with open(session_file, "a") as f:
+            f.write(json.dumps(_COMPACTION) + "\n")
+        assert check_for_compaction(project_path, session_file) is not None
+
+    def test_partial_trailing_line_waits_for_newline(self, session_dir):
+        project_path, session_base = session_dir
+        session_file = _write_session_file(session_base, [])
+        line = json.dumps(_COMPACTION)
+
+        with open(session_file, "a") as f:
+            f.write(line[:10])
+        assert check_for_compaction(project_path, session_file) is None
+
+        with open(session_file, "a") as f:
+            f.write(line[10:] + "\n")
+        assert check_for_compaction(project_path, session_file) is not None
+
+    def test_unchanged_file_does_not_rewrite_state(self, session_dir, monkeypatch):
+        from spellbook.sessions import compaction
+
+        project_path, session_base = session_dir
+        session_file = _write_session_file(session_base, [{"type": "user"}])
+        check_for_compaction(project_path, session_file)
+
+        saves = []
+        monkeypatch.setattr(compaction, "save_state", saves.append)
+        check_for_compaction(project_path, session_file)
+        assert saves == []
+
+    def test_legacy_line_count_state_skips_checked_lines(self, session_dir):
+        from spellbook.sessions import compaction
+
+        project_path, session_base = session_dir
+        session_file = _write_session_file(session_base, [_COMPACTION])
+        compaction.save_state({
+            "pending_events": [],
+            "last_check": {
+                project_path: {"session_id": "test-session", "line_count": 1},
+            },
+        })
+
+        assert check_for_compaction(project_path, session_file) is None
+        state = compaction.load_state()["last_check"][project_path]
+        assert state["offset"] == session_file.stat().st_size
+
+
+def test_compaction_watcher_reports_appended_compaction(session_dir, monkeypatch):
+    import threading
+
+    from spellbook.core import file_watch
+    from spellbook.sessions.compaction import CompactionWatcher
+
+    project_path, session_base = session_dir
+    monkeypatch.setattr(
+        "spellbook.sessions.compaction._get_claude_session_dir",
+        lambda project_path_arg: session_base,
+    )
+    service = file_watch.FileWatchService(poll_interval=0.05, use_inotify=False)
+    monkeypatch.setattr(file_watch, "get_file_watch_service", lambda poll_interval: service)
+    service.start()
+    seen = []
+    detected = threading.Event()
+
+    def on_compaction(event):
+        seen.append(event)
+        detected.set()
+
+    watcher = CompactionWatcher(project_path, on_compaction=on_compaction)
+    watcher.start()
+    try:
+        _write_session_file(session_base, [{"type": "user"}, _COMPACTION])
+        assert detected.wait(5.0)
+        assert seen[0].summary == "appended summary"
+    finally:
+        watcher.stop()
+        service.stop()
@@ -586,6 +586,7 @@ class TestNumericConfigValidation:
             "worker_llm_observability_notify_window",
             "worker_llm_max_tokens",
             "worker_llm_queue_max_depth",
+            "worker_llm_queue_workers",
         ],
     )
     def test_positive_int_accepts_one_and_large(self, client, monkeypatch, key):
@@ -608,6 +609,7 @@ class TestNumericConfigValidation:
             "worker_llm_observability_notify_window",
             "worker_llm_max_tokens",
             "worker_llm_queue_max_depth",
+            "worker_llm_queue_workers",
         ],
     )
     def test_positive_int_rejects_zero_and_negative(self, client, key):
@@ -636,6 +638,40 @@ class TestNumericConfigValidation:
         assert response.status_code == 400
         assert response.json()["error"]["code"] == "CONFIG_VALUE_INVALID"
 
+    # ------------------------------------------------------------------
+    # task=value maps (queue lanes / per-task caps)
+    # ------------------------------------------------------------------
+
+    @pytest.mark.parametrize(
+        "key,good",
+        [
+            ("worker_llm_queue_lanes", "tool_safety=interactive,x=background"),
+            ("worker_llm_queue_lanes", ""),
+            ("worker_llm_queue_task_concurrency", "roundtable_voice=1"),
+        ],
+    )
+    def test_task_map_accepts_valid(self, client, monkeypatch, key, good):
+        monkeypatch.setattr(
+            "spellbook.admin.routes.config.set_config_value",
+            lambda k, v: {"status": "ok", "config": {k: v}},
+        )
+        response = client.put(f"/api/config/{key}", json={"value": good})
+        assert response.status_code == 200, (key, good, response.json())
+
+    @pytest.mark.parametrize(
+        "key,bad",
+        [
+            ("worker_llm_queue_lanes", "tool_safety=urgent"),
+            ("worker_llm_queue_lanes", "tool_safety"),
+            ("worker_llm_queue_task_concurrency", "roundtable_voice=0"),
+            ("worker_llm_queue_task_concurrency", 3),
+        ],
+    )
+    def test_task_map_rejects_invalid(self, client, key, bad):
+        response = client.put(f"/api/config/{key}", json={"value": bad})
+        assert response.status_code == 400, (key, bad, response.json())
+        assert response.json()["error"]["code"] == "CONFIG_VALUE_INVALID"
+
     # ------------------------------------------------------------------
     # Positive numbers (int or float, > 0)
     # ------------------------------------------------------------------
@@ -167,3 +167,90 @@ class TestPragmas:
 
             result = await session.execute(sqlalchemy.text("PRAGMA foreign_keys"))
             assert result.scalar() == 1
+
+
+class TestPooling:
+    @pytest.mark.asyncio
+    async def test_enable_pooling_rebinds_factories(self):
+        from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+
+        from spellbook.db import disable_pooling, enable_pooling
+        from spellbook.db.engines import SpellbookReadSession, SpellbookSession
+
+        enable_pooling(reader_pool_size=2)
+        try:
+            writer = SpellbookSession.kw["bind"]
+            reader = SpellbookReadSession.kw["bind"]
+            assert isinstance(writer.pool, AsyncAdaptedQueuePool)
+            assert isinstance(reader.pool, AsyncAdaptedQueuePool)
+            assert writer.pool.size() == 1
+            assert reader.pool.size() == 2
+        finally:
+            await disable_pooling()
+
+        assert isinstance(SpellbookSession.kw["bind"].pool, NullPool)
+        assert isinstance(SpellbookReadSession.kw["bind"].pool, NullPool)
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused_and_counted(self):
+        import sqlalchemy
+
+        from spellbook.db import (
+            disable_pooling,
+            enable_pooling,
+            get_spellbook_session,
+            pool_stats,
+        )
+
+        enable_pooling()
+        try:
+            for _ in range(3):
+                async with get_spellbook_session() as session:
+                    await session.execute(sqlalchemy.text("SELECT 1"))
+            writer = pool_stats()["spellbook.db"]["writer"]
+        finally:
+            await disable_pooling()
+
+        assert writer["connects"] == 1
+        assert writer["checkouts"] == 3
+        assert writer["checked_out"] == 0
+        assert pool_stats()["spellbook.db"] == {"pooled": False}
+
+    @pytest.mark.asyncio
+    async def test_reader_pool_is_query_only(self):
+        import sqlalchemy
+        from sqlalchemy.exc import OperationalError
+
+        from spellbook.db import (
+            disable_pooling,
+            enable_pooling,
+            get_spellbook_read_session,
+        )
+
+        enable_pooling()
+        try:
+            async with get_spellbook_read_session() as session:
+                result = await session.execute(sqlalchemy.text("PRAGMA foreign_keys"))
+                assert result.scalar() == 1
+                with pytest.raises(OperationalError, match="readonly"):
+                    await session.execute(
+                        sqlalchemy.text("CREATE TABLE pool_probe (id INTEGER)")
+                    )
+        finally:
+            await disable_pooling()
+
+    @pytest.mark.asyncio
+    async def test_nested_writer_sessions_overflow(self):
+        import sqlalchemy
+
+        from spellbook.db import disable_pooling, enable_pooling, get_spellbook_session
+
+        enable_pooling()
+        try:
+            async with get_spellbook_session() as outer:
+                await outer.execute(sqlalchemy.text("SELECT 1"))
+                async with get_spellbook_session() as inner:
+                    result = await inner.execute(sqlalchemy.text("SELECT 2"))
+                    assert result.scalar() == 2
+        finally:
+            await disable_pooling()
@@ -0,0 +1,173 @@
+"""Tests for the single-writer batched ingestion in ``spellbook.db.ingest``."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, func, select
+
+from spellbook.db import ingest
+from spellbook.db.engines import get_sync_session
+from spellbook.db.spellbook_models import HookEvent, SpellbookBase, WorkerLLMCall
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> str:
+    path = str(tmp_path / "spellbook.db")
+    engine = create_engine(f"sqlite:///{path}")
+    SpellbookBase.metadata.create_all(engine)
+    engine.dispose()
+    return path
+
+
+@pytest.fixture
+def session_factory(db_path):
+    @contextmanager
+    def _factory():
+        with get_sync_session(db_path) as session:
+            yield session
+
+    return _factory
+
+
+@pytest.fixture(autouse=True)
+def no_global_writer():
+    ingest.stop_ingestion()
+    yield
+    ingest.stop_ingestion()
+
+
+def _hook_row(i: int) -> dict:
+    return {
+        "timestamp": "2026-04-22T12:00:00+00:00",
+        "hook_name": "spellbook_hook",
+        "event_name": "PreToolUse",
+        "tool_name": "Bash",
+        "duration_ms": i,
+        "exit_code": 0,
+        "error": None,
+        "notes": None,
+    }
+
+
+def _count(db_path: str, model: type) -> int:
+    with get_sync_session(db_path) as session:
+        return session.execute(select(func.count()).select_from(model)).scalar_one()
+
+
+class TestBatchWriter:
+    def test_stop_drains_queued_rows_in_one_batch(self, db_path, session_factory):
+        # Long interval and large batch: nothing flushes until stop().
+        writer = ingest.BatchWriter(max_batch=1000, flush_interval=60).start()
+        for i in range(50):
+            assert writer.submit(session_factory, HookEvent, _hook_row(i)) is True
+        writer.stop()
+
+        assert _count(db_path, HookEvent) == 50
+        stats = writer.stats()
+        assert stats == {
+            "enqueued": 50,
+            "written": 50,
+            "dropped": 0,
+            "failed": 0,
+            "batches": 1,
+            "queued": 0,
+            "running": False,
+        }
+
+    def test_flushes_when_batch_is_full(self, db_path, session_factory):
+        writer = ingest.BatchWriter(max_batch=10, flush_interval=60).start()
+        for i in range(25):
+            writer.submit(session_factory, HookEvent, _hook_row(i))
+        writer.stop()
+
+        assert _count(db_path, HookEvent) == 25
+        assert writer.stats()["batches"] == 3
+
+    def test_flushes_after_interval_without_stop(self, db_path, session_factory):
+        import time
+
+        writer = ingest.BatchWriter(max_batch=1000, flush_interval=0.05).start()
+        try:
+            writer.submit(session_factory, HookEvent, _hook_row(0))
+            deadline = time.monotonic() + 5
+            while writer.stats()["written"] == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert _count(db_path, HookEvent) == 1
+        finally:
+            writer.stop()
+
+    def test_groups_models_within_one_flush(self, db_path, session_factory):
+        writer = ingest.BatchWriter(max_batch=1000, flush_interval=60).start()
+        writer.submit(session_factory, HookEvent, _hook_row(0))
+        writer.submit(
+            session_factory,
+            WorkerLLMCall,
+            {
+                "timestamp": "2026-04-22T12:00:00+00:00",
+                "task": "tool_safety",
+                "model": "m",
+                "status": "success",
+                "latency_ms": 5,
+                "prompt_len": 1,
+                "response_len": 1,
+                "error": None,
+                "override_loaded": 0,
+            },
+        )
+        writer.stop()
+
+        assert _count(db_path, HookEvent) == 1
+        assert _count(db_path, WorkerLLMCall) == 1
+        assert writer.stats()["batches"] == 1
+
+    def test_full_queue_drops_without_blocking(self, db_path, session_factory):
+        # Not started: nothing consumes, so the second row overflows.
+        writer = ingest.BatchWriter(max_queue=1)
+        assert writer.submit(session_factory, HookEvent, _hook_row(0)) is True
+        assert writer.submit(session_factory, HookEvent, _hook_row(1)) is True
+        writer.stop()
+
+        assert _count(db_path, HookEvent) == 1
+        stats = writer.stats()
+        assert stats["enqueued"] == 1
+        assert stats["dropped"] == 1
+        assert stats["written"] == 1
+
+    def test_submit_after_stop_is_refused(self, session_factory):
+        writer = ingest.BatchWriter().start()
+        writer.stop()
+        assert writer.submit(session_factory, HookEvent, _hook_row(0)) is False
+
+    def test_failed_batch_is_counted_not_raised(self, session_factory):
+        @contextmanager
+        def _broken():
+            raise RuntimeError("database is locked")
+            yield  # pragma: no cover
+
+        writer = ingest.BatchWriter(max_batch=1000, flush_interval=60).start()
+        writer.submit(_broken, HookEvent, _hook_row(0))
+        writer.submit(_broken, HookEvent, _hook_row(1))
+        writer.stop()
+
+        stats = writer.stats()
+        assert stats["failed"] == 2
+        assert stats["written"] == 0
+
+
+class TestModuleWriter:
+    def test_enqueue_without_writer_returns_false(self, session_factory):
+        assert ingest.enqueue(session_factory, HookEvent, _hook_row(0)) is False
+        assert ingest.ingestion_stats() == {"running": False}
+
+    def test_start_is_idempotent_and_stop_flushes(self, db_path, session_factory):
+        first = ingest.start_ingestion(flush_interval=60)
+        assert ingest.start_ingestion() is first
+        assert ingest.enqueue(session_factory, HookEvent, _hook_row(0)) is True
+        assert ingest.ingestion_stats()["running"] is True
+
+        ingest.stop_ingestion()
+        assert _count(db_path, HookEvent) == 1
+        assert ingest.ingestion_stats() == {"running": False}
@@ -0,0 +1,230 @@
+"""Tests for the metric rollups in ``spellbook.db.rollups``."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, func, select, text
+
+from spellbook.db import rollups
+from spellbook.db.engines import get_sync_session
+from spellbook.db.spellbook_models import (
+    HookEvent,
+    HookEventRollupHour,
+    HookEventRollupMinute,
+    SpellbookBase,
+    WorkerLLMCall,
+    WorkerLLMCallRollupHour,
+    WorkerLLMCallRollupMinute,
+)
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> str:
+    path = str(tmp_path / "spellbook.db")
+    engine = create_engine(f"sqlite:///{path}")
+    SpellbookBase.metadata.create_all(engine)
+    engine.dispose()
+    return path
+
+
+def _hook(ts: str, duration_ms: int, exit_code: int = 0, error=None, event="PreToolUse"):
+    return HookEvent(
+        timestamp=ts, hook_name="spellbook_hook", event_name=event,
+        duration_ms=duration_ms, exit_code=exit_code, error=error,
+    )
+
+
+def _call(ts: str, latency_ms: int, status: str = "success", error=None):
+    return WorkerLLMCall(
+        timestamp=ts, task="tool_safety", model="m", status=status,
+        latency_ms=latency_ms, prompt_len=0, response_len=0, error=error,
+    )
+
+
+def test_bucket_sql_maps_to_lower_edge(db_path):
+    engine = create_engine(f"sqlite:///{db_path}")
+    with engine.connect() as conn:
+        for value, edge in ((0, 0), (7, 6), (10, 10), (149, 120), (10**7, 600000)):
+            got = conn.exec_driver_sql(
+                f"SELECT {rollups.bucket_sql(str(value))}"
+            ).scalar()
+            assert got == edge
+    engine.dispose()
+
+
+def test_hook_insert_updates_minute_and_hour_rollups(db_path):
+    with get_sync_session(db_path) as session:
+        session.add_all([
+            _hook("2026-04-22T10:15:01+00:00", 45),
+            _hook("2026-04-22T10:15:30+00:00", 47, exit_code=2),
+            _hook("2026-04-22T10:16:00+00:00", 41, error="boom"),
+            _hook("2026-04-22T11:00:00+00:00", 3),
+        ])
+
+    with get_sync_session(db_path) as session:
+        minutes = session.execute(
+            select(HookEventRollupMinute).order_by(
+                HookEventRollupMinute.bucket_start,
+                HookEventRollupMinute.duration_bucket,
+            )
+        ).scalars().all()
+        hours = session.execute(
+            select(HookEventRollupHour).order_by(
+                HookEventRollupHour.bucket_start,
+                HookEventRollupHour.duration_bucket,
+            )
+        ).scalars().all()
+
+        assert [
+            (m.bucket_start, m.duration_bucket, m.event_count, m.error_count,
+             m.duration_sum, m.duration_min, m.duration_max)
+            for m in minutes
+        ] == [
+            ("2026-04-22T10:15", 40, 2, 1, 92, 45, 47),
+            ("2026-04-22T10:16", 40, 1, 1, 41, 41, 41),
+            ("2026-04-22T11:00", 3, 1, 0, 3, 3, 3),
+        ]
+        assert [
+            (h.bucket_start, h.duration_bucket, h.event_count, h.error_count,
+             h.duration_min, h.duration_max)
+            for h in hours
+        ] == [
+            ("2026-04-22T10", 40, 3, 2, 41, 47),
+            ("2026-04-22T11", 3, 1, 0, 3, 3),
+        ]
+
+
+def test_worker_rollup_keys_errors_like_the_breakdown(db_path):
+    ts = "2026-04-22T10:15:00+00:00"
+    with get_sync_session(db_path) as session:
+        session.add_all([
+            _call(ts, 12),
+            _call(ts, 900, status="timeout"),
+            _call(ts, 5, status="error", error="ConnectionError"),
+            _call(ts, 5, status="error", error=""),
+        ])
+
+    with get_sync_session(db_path) as session:
+        rows = session.execute(
+            select(
+                WorkerLLMCallRollupHour.status,
+                WorkerLLMCallRollupHour.error_key,
+                WorkerLLMCallRollupHour.call_count,
+            ).order_by(WorkerLLMCallRollupHour.error_key)
+        ).all()
+    assert [tuple(r) for r in rows] == [
+        ("success", "", 1),
+        ("error", "ConnectionError", 1),
+        ("error", "error", 1),
+        ("timeout", "timeout", 1),
+    ]
+
+
+def test_backfill_matches_trigger_maintained_rollups(db_path):
+    with get_sync_session(db_path) as session:
+        for i in range(50):
+            session.add(_hook(f"2026-04-22T1{i % 3}:{i:02d}:00+00:00", i * 7, exit_code=i % 4))
+            session.add(_call(f"2026-04-22T1{i % 3}:{i:02d}:00+00:00", i * 11))
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    snapshot_q = {
+        name: f"SELECT * FROM {name} ORDER BY 1, 2, 3, 4, 5"
+        for name in rollups.ROLLUP_TABLES
+    }
+    with engine.begin() as conn:
+        before = {n: conn.exec_driver_sql(q).fetchall() for n, q in snapshot_q.items()}
+        rollups.backfill_rollups(conn)
+        after = {n: conn.exec_driver_sql(q).fetchall() for n, q in snapshot_q.items()}
+    engine.dispose()
+
+    assert all(before.values())
+    assert after == before
+
+
+def test_window_rows_use_minutes_then_hours(db_path):
+    with get_sync_session(db_path) as session:
+        session.add_all([
+            _hook("2026-04-22T09:59:59+00:00", 1),  # before the window
+            _hook("2026-04-22T10:29:00+00:00", 2),  # same hour, before cutoff minute
+            _hook("2026-04-22T10:30:00+00:00", 3),
+            _hook("2026-04-22T10:59:00+00:00", 4),
+            _hook("2026-04-22T11:05:00+00:00", 5),
+            _hook("2026-04-22T13:00:00+00:00", 6),
+        ])
+
+    with get_sync_session(db_path) as session:
+        window = rollups.window_rows(
+            HookEventRollupMinute.__table__,
+            HookEventRollupHour.__table__,
+            "2026-04-22T10:30:12.5+00:00",
+            "duration_bucket", "event_count",
+        )
+        rows = session.execute(
+            select(window.c.duration_bucket, func.sum(window.c.event_count))
+            .group_by(window.c.duration_bucket)
+            .order_by(window.c.duration_bucket)
+        ).all()
+    assert [tuple(r) for r in rows] == [(3, 1), (4, 1), (5, 1), (6, 1)]
+
+
+def test_purge_rollups_drops_only_whole_buckets_before_cutoff(db_path):
+    with get_sync_session(db_path) as session:
+        session.add_all([
+            _hook("2026-04-22T09:10:00+00:00", 1),
+            _hook("2026-04-22T10:10:00+00:00", 2),
+            _hook("2026-04-22T10:40:00+00:00", 3),
+        ])
+
+    with get_sync_session(db_path) as session:
+        rollups.purge_rollups(
+            session,
+            HookEventRollupMinute.__table__,
+            HookEventRollupHour.__table__,
+            "2026-04-22T10:30:00+00:00",
+        )
+
+    with get_sync_session(db_path) as session:
+        minutes = session.execute(
+            select(HookEventRollupMinute.bucket_start)
+        ).scalars().all()
+        hours = session.execute(
+            select(HookEventRollupHour.bucket_start)
+        ).scalars().all()
+    assert minutes == ["2026-04-22T10:40"]
+    assert hours == ["2026-04-22T10", "2026-04-22T10"]  # buckets 2 and 3
+
+
+def test_triggers_wait_for_all_their_tables(tmp_path):
+    """Creating tables one at a time installs each trigger once all exist."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'partial.db'}")
+    HookEvent.__table__.create(engine)
+    WorkerLLMCall.__table__.create(engine)
+
+    def triggers():
+        with engine.connect() as conn:
+            return {
+                r[0] for r in conn.exec_driver_sql(
+                    "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+                )
+            }
+
+    assert triggers() == set()
+    HookEventRollupMinute.__table__.create(engine)
+    HookEventRollupHour.__table__.create(engine)
+    assert triggers() == {"hook_events_rollup_ai"}
+    WorkerLLMCallRollupMinute.__table__.create(engine)
+    WorkerLLMCallRollupHour.__table__.create(engine)
+    assert triggers() == {"hook_events_rollup_ai", "worker_llm_calls_rollup_ai"}
+
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO worker_llm_calls (timestamp, task, model, status, "
+            "latency_ms, prompt_len, response_len, override_loaded) VALUES "
+            "('2026-04-22T10:00:00+00:00', 't', 'm', 'success', 7, 0, 0, 0)"
+        ))
+        assert conn.execute(
+            text("SELECT call_count FROM worker_llm_call_rollup_minute")
+        ).scalar() == 1
+    engine.dispose()
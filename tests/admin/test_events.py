@@ -181,3 +181,107 @@ async def test_duplicate_subscribe_replaces_queue():
         Event(subsystem=Subsystem.SESSION, event_type="test", data={})
     )
     assert not q2.empty()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_with_subsystems_filters_delivery():
+    bus = EventBus()
+    fractal_only = await bus.subscribe("fractal", subsystems=[Subsystem.FRACTAL])
+    everything = await bus.subscribe("all")
+    await bus.publish(Event(subsystem=Subsystem.CONFIG, event_type="updated", data={}))
+    await bus.publish(Event(subsystem=Subsystem.FRACTAL, event_type="created", data={}))
+    assert fractal_only.qsize() == 1
+    assert fractal_only.get_nowait().subsystem is Subsystem.FRACTAL
+    assert everything.qsize() == 2
+
+
+@pytest.mark.asyncio
+async def test_set_filter_replaces_and_clears():
+    bus = EventBus()
+    queue = await bus.subscribe("sub", subsystems=["config"])
+    assert bus.get_filter("sub") == frozenset({"config"})
+    bus.set_filter("sub", [Subsystem.SESSION])
+    await bus.publish(Event(subsystem=Subsystem.CONFIG, event_type="a", data={}))
+    assert queue.empty()
+    bus.set_filter("sub", None)
+    await bus.publish(Event(subsystem=Subsystem.CONFIG, event_type="b", data={}))
+    assert queue.get_nowait().event_type == "b"
+    await bus.unsubscribe("sub")
+    assert bus.get_filter("sub") is None
+    bus.set_filter("sub", ["config"])  # unknown subscriber: no-op
+    assert bus._filters == {}
+
+
+@pytest.mark.asyncio
+async def test_subscribe_during_publish_iteration_is_safe():
+    """Subscriber table is copy-on-write, so publish walks a stable snapshot."""
+    bus = EventBus()
+
+    class Subscribing(asyncio.Queue):
+        def put_nowait(self, item):
+            super().put_nowait(item)
+            bus._subscribers = {**bus._subscribers, "late": asyncio.Queue()}
+
+    bus._subscribers = {"first": Subscribing()}
+    bus.publish_nowait(Event(subsystem=Subsystem.SESSION, event_type="x", data={}))
+    assert bus._subscribers["late"].empty()
+
+
+def test_event_frame_is_encoded_once():
+    import json
+
+    event = Event(
+        subsystem=Subsystem.CONFIG, event_type="updated", data={"key": "x"}
+    )
+    frame = event.frame()
+    assert event.frame() is frame
+    assert json.loads(frame) == {
+        "type": "event",
+        "subsystem": "config",
+        "event": "updated",
+        "data": {"key": "x"},
+        "timestamp": event.timestamp,
+    }
+
+
+def test_batch_frame_wraps_event_frames():
+    import json
+
+    from spellbook.admin.events import batch_frame
+
+    events = [
+        Event(subsystem=Subsystem.WORKER_LLM, event_type=f"e{i}", data={})
+        for i in range(3)
+    ]
+    decoded = json.loads(batch_frame(events))
+    assert decoded["type"] == "batch"
+    assert [e["event"] for e in decoded["events"]] == ["e0", "e1", "e2"]
+
+
+@pytest.mark.asyncio
+async def test_next_batch_coalesces_burst_from_high_volume_subsystem():
+    bus = EventBus()
+    bus.COALESCE_WINDOWS = {Subsystem.WORKER_LLM: 0.05}
+    queue = await bus.subscribe("sub")
+
+    async def burst():
+        for i in range(5):
+            await bus.publish(
+                Event(subsystem=Subsystem.WORKER_LLM, event_type=f"call-{i}", data={})
+            )
+            await asyncio.sleep(0.001)
+
+    task = asyncio.create_task(burst())
+    batch = await bus.next_batch(queue)
+    await task
+    assert [e.event_type for e in batch] == [f"call-{i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_next_batch_does_not_delay_other_subsystems():
+    bus = EventBus()
+    bus.COALESCE_WINDOWS = {Subsystem.WORKER_LLM: 10.0}
+    queue = await bus.subscribe("sub")
+    await bus.publish(Event(subsystem=Subsystem.CONFIG, event_type="a", data={}))
+    batch = await asyncio.wait_for(bus.next_batch(queue), timeout=1.0)
+    assert [e.event_type for e in batch] == ["a"]
@@ -30,7 +30,7 @@ class TestFractalModelTables:
     def test_all_tables_created(self, engine):
         inspector = inspect(engine)
         table_names = set(inspector.get_table_names())
-        expected = {"graphs", "nodes", "edges"}
+        expected = {"graphs", "nodes", "edges", "convergence_clusters", "node_closure"}
         missing = expected - table_names
         extra = table_names - expected
         assert missing == set(), f"Missing tables: {missing}"
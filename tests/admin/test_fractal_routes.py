@@ -840,3 +840,79 @@ class TestFractalGraphStatusUpdate:
             json={"status": "completed"},
         )
         assert response.status_code == 401
+
+
+class TestChatLogWindow:
+    def test_only_messages_inside_window_are_returned(self, tmp_path):
+        import json
+
+        from spellbook.admin.routes.fractal import _parse_jsonl_messages
+
+        path = tmp_path / "worker.jsonl"
+        lines = [{"type": "summary", "summary": "no timestamp"}]
+        for minute in range(60):
+            lines.append({
+                "type": "user",
+                "timestamp": f"2026-03-14T10:{minute:02d}:00Z",
+                "message": {"content": f"m{minute}"},
+            })
+        lines.insert(30, {"type": "file-history-snapshot"})
+        path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+
+        messages = _parse_jsonl_messages(
+            path, "2026-03-14T10:20:00Z", "2026-03-14T10:22:00Z",
+        )
+        assert [m["content"] for m in messages] == ["m20", "m21", "m22"]
+
+        everything = _parse_jsonl_messages(path, None, None)
+        assert len(everything) == 60
+
+    def test_out_of_order_entries_fall_back_to_full_filter(self, tmp_path):
+        import json
+
+        from spellbook.admin.routes.fractal import _parse_jsonl_messages
+
+        def user(minute, text):
+            return {
+                "type": "user",
+                "timestamp": f"2026-03-14T10:{minute:02d}:00Z",
+                "message": {"content": text},
+            }
+
+        path = tmp_path / "worker.jsonl"
+        lines = [user(m, f"m{m}") for m in range(60)]
+        # An in-window entry written late, after entries past the window,
+        # and one written early, before entries preceding the window.
+        lines.insert(50, user(21, "late"))
+        lines.insert(5, user(20, "early"))
+        path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+
+        messages = _parse_jsonl_messages(
+            path, "2026-03-14T10:20:00Z", "2026-03-14T10:22:00Z",
+        )
+        assert sorted(m["content"] for m in messages) == [
+            "early", "late", "m20", "m21", "m22",
+        ]
+
+    def test_order_check_is_extended_on_append(self, tmp_path):
+        import json
+
+        from spellbook.admin.routes import fractal
+
+        def user(minute):
+            return json.dumps({
+                "type": "user",
+                "timestamp": f"2026-03-14T10:{minute:02d}:00Z",
+                "message": {"content": f"m{minute}"},
+            }) + "\n"
+
+        path = tmp_path / "worker.jsonl"
+        path.write_text("".join(user(m) for m in range(10)))
+        window = ("2026-03-14T10:05:00Z", "2026-03-14T10:06:00Z")
+        assert len(fractal._parse_jsonl_messages(path, *window)) == 2
+        assert fractal._time_order[str(path)].checked == 10
+
+        with open(path, "a") as f:
+            f.write(user(5))
+        assert len(fractal._parse_jsonl_messages(path, *window)) == 3
+        assert fractal._time_order[str(path)].ordered is False
@@ -82,19 +82,19 @@ class TestHealthMatrix:
         ])
 
         monkeypatch.setattr(
-            "spellbook.admin.routes.health.get_spellbook_session",
+            "spellbook.admin.routes.health.get_spellbook_read_session",
             lambda: _make_session_factory(mock_spellbook_session)(),
         )
         monkeypatch.setattr(
-            "spellbook.admin.routes.health.get_fractal_session",
+            "spellbook.admin.routes.health.get_fractal_read_session",
             lambda: _make_session_factory(mock_fractal_session)(),
         )
         monkeypatch.setattr(
-            "spellbook.admin.routes.health.get_forged_session",
+            "spellbook.admin.routes.health.get_forged_read_session",
             lambda: _make_session_factory(mock_forged_session)(),
         )
         monkeypatch.setattr(
-            "spellbook.admin.routes.health.get_coordination_session",
+            "spellbook.admin.routes.health.get_coordination_read_session",
             lambda: _make_session_factory(mock_coord_session)(),
         )
         monkeypatch.setattr(
@@ -183,6 +183,35 @@ class TestHealthMatrix:
             "tables": [],
         }
 
+    def test_reports_bash_parser_cache_counters(self, client, monkeypatch):
+        monkeypatch.setattr(
+            "spellbook.admin.routes.health._get_db_paths",
+            lambda *a, **kw: {},
+        )
+        monkeypatch.setattr(
+            "spellbook.admin.routes.health.parse_cache_info",
+            lambda: {
+                "hits": 7,
+                "misses": 3,
+                "invalidations": 1,
+                "size": 3,
+                "max_size": 1024,
+            },
+        )
+
+        response = client.get("/api/health/matrix")
+
+        assert response.status_code == 200
+        assert response.json()["caches"] == {
+            "bash_parser": {
+                "hits": 7,
+                "misses": 3,
+                "invalidations": 1,
+                "size": 3,
+                "max_size": 1024,
+            }
+        }
+
     def test_requires_auth(self, unauthenticated_client):
         response = unauthenticated_client.get("/api/health/matrix")
         assert response.status_code == 401
@@ -117,3 +117,33 @@ class TestBuildListResponse:
             "per_page": 50,
             "pages": 1,
         }
+
+
+class TestHistogramPercentile:
+    def test_empty_histogram_is_none(self):
+        from spellbook.admin.routes.list_helpers import histogram_percentile
+
+        assert histogram_percentile([], 95) is None
+        assert histogram_percentile([(0, 5, 5)], 95) is None
+
+    def test_single_value_buckets_are_exact(self):
+        from spellbook.admin.routes.list_helpers import histogram_percentile
+
+        buckets = [(1, 10, 10), (1, 20, 20), (1, 30, 30), (1, 40, 40), (1, 50, 50)]
+        assert histogram_percentile(buckets, 50) == 30
+        assert histogram_percentile(buckets, 95) == 50
+        assert histogram_percentile(buckets, 20) == 10
+
+    def test_interpolates_within_bucket(self):
+        from spellbook.admin.routes.list_helpers import histogram_percentile
+
+        # 11 samples in one bucket spanning 100..200: rank k maps to
+        # 100 + 10 * (k - 1).
+        assert histogram_percentile([(11, 100, 200)], 50) == 150
+
+    def test_extremes_return_min_and_max(self):
+        from spellbook.admin.routes.list_helpers import histogram_percentile
+
+        buckets = [(3, 1, 4), (2, 80, 95)]
+        assert histogram_percentile(buckets, 0) == 1
+        assert histogram_percentile(buckets, 100) == 95
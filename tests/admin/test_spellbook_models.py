@@ -1,6 +1,6 @@
 """Tests for spellbook.db ORM model definitions.
 
-Verifies that all 16 spellbook.db SQLAlchemy models match the actual
+Verifies that all 20 spellbook.db SQLAlchemy models match the actual
 CREATE TABLE schemas defined in spellbook/core/db.py and
 spellbook/coordination/curator.py.
 """
@@ -13,7 +13,7 @@ from sqlalchemy.orm import Session
 from spellbook.db.base import SpellbookBase
 
 
-# All 16 expected tables and their exact column definitions.
+# All 20 expected tables and their exact column definitions.
 # Derived from spellbook/core/db.py and
 # spellbook/coordination/curator.py.
 EXPECTED_TABLES = {
@@ -78,6 +78,24 @@ EXPECTED_TABLES = {
         "id", "timestamp", "hook_name", "event_name", "tool_name",
         "duration_ms", "exit_code", "error", "notes",
     ],
+    "hook_event_rollup_minute": [
+        "bucket_start", "hook_name", "event_name", "duration_bucket",
+        "event_count", "error_count", "duration_sum", "duration_min",
+        "duration_max",
+    ],
+    "hook_event_rollup_hour": [
+        "bucket_start", "hook_name", "event_name", "duration_bucket",
+        "event_count", "error_count", "duration_sum", "duration_min",
+        "duration_max",
+    ],
+    "worker_llm_call_rollup_minute": [
+        "bucket_start", "task", "status", "error_key", "latency_bucket",
+        "call_count", "latency_sum", "latency_min", "latency_max",
+    ],
+    "worker_llm_call_rollup_hour": [
+        "bucket_start", "task", "status", "error_key", "latency_bucket",
+        "call_count", "latency_sum", "latency_min", "latency_max",
+    ],
 }
 
 
@@ -91,6 +109,8 @@ def engine():
         SpawnRateLimit,
         StintStack, StintCorrectionEvent, CuratorEvent,
         WorkerLLMCall, HookEvent,
+        HookEventRollupMinute, HookEventRollupHour,
+        WorkerLLMCallRollupMinute, WorkerLLMCallRollupHour,
     )
     engine = create_engine("sqlite:///:memory:")
     SpellbookBase.metadata.create_all(engine)
@@ -98,10 +118,10 @@ def engine():
 
 
 class TestAllTablesExist:
-    """Verify all 16 expected tables are created by the ORM models."""
+    """Verify all 20 expected tables are created by the ORM models."""
 
-    def test_all_16_tables_created(self, engine):
-        """All 16 spellbook.db tables must exist after create_all."""
+    def test_all_20_tables_created(self, engine):
+        """All 20 spellbook.db tables must exist after create_all."""
         inspector = inspect(engine)
         table_names = set(inspector.get_table_names())
         expected = set(EXPECTED_TABLES.keys())
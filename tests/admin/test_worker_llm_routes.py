@@ -31,6 +31,7 @@ from sqlalchemy.pool import StaticPool
 
 from spellbook.db.base import SpellbookBase
 from spellbook.db.spellbook_models import WorkerLLMCall
+from spellbook.worker_llm.response_cache import response_cache_info
 
 
 def _ts(offset_seconds: int = 0) -> str:
@@ -338,8 +339,8 @@ class TestWorkerLLMCallsRoute:
 class TestWorkerLLMMetricsRoute:
     """GET /api/worker-llm/metrics -- aggregate metrics over a window."""
 
-    def test_metrics_returns_six_key_shape(self, seeded_client):
-        """T15: 6-key response shape with expected values from seed mix.
+    def test_metrics_returns_seven_key_shape(self, seeded_client):
+        """T15: 7-key response shape with expected values from seed mix.
 
         Seed mix within the 24h window:
           - 5 successes (latencies 10, 20, 30, 40, 50)
@@ -348,8 +349,8 @@ class TestWorkerLLMMetricsRoute:
           - 1 fail_open (error='prompt_load_error: missing.md')
         Total = 9; successes = 5; success_rate = 5/9.
 
-        ESCAPE: test_metrics_returns_six_key_shape
-          CLAIM:    /metrics returns the documented 6-key shape with
+        ESCAPE: test_metrics_returns_seven_key_shape
+          CLAIM:    /metrics returns the documented 7-key shape with
                     correctly computed success_rate, percentiles, and a
                     Counter-based error_breakdown.
           PATH:     route -> SELECT rows in window -> count successes ->
@@ -380,6 +381,10 @@ class TestWorkerLLMMetricsRoute:
         assert set(data.keys()) == {
             "success_rate", "p95_latency_ms", "p99_latency_ms",
             "error_breakdown", "total_calls", "window_hours",
+            "response_cache",
+        }
+        assert set(data["response_cache"].keys()) == {
+            "hits", "misses", "hit_rate", "coalesced", "size", "bytes",
         }
         assert data["total_calls"] == 9
         assert data["window_hours"] == 24
@@ -424,6 +429,7 @@ class TestWorkerLLMMetricsRoute:
             "error_breakdown": {},
             "total_calls": 0,
             "window_hours": 24,
+            "response_cache": response_cache_info(),
         }
 
     def test_metrics_excludes_rows_outside_window(
@@ -486,6 +492,7 @@ class TestWorkerLLMMetricsRoute:
                 "error_breakdown": {},
                 "total_calls": 0,
                 "window_hours": 1,
+                "response_cache": response_cache_info(),
             }
         finally:
             admin_app.dependency_overrides.clear()
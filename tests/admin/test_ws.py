@@ -246,3 +246,61 @@ def test_ws_host_loopback_passes_host_validator(
     ) as ws:
         # Successful accept; send a pong to confirm the socket is open.
         ws.send_json({"type": "pong"})
+
+
+def _publish(event):
+    import asyncio as _asyncio
+
+    loop = _asyncio.new_event_loop()
+    loop.run_until_complete(event_bus.publish(event))
+    loop.close()
+
+
+def _wait_for_filter():
+    import time
+
+    deadline = time.monotonic() + 5
+    while not event_bus._filters and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert event_bus._filters, "subscribe message was not applied"
+
+
+def test_ws_subscribe_filters_events_server_side(admin_app, mock_mcp_token):
+    client = TestClient(admin_app, headers={"Host": "127.0.0.1:8765", "Origin": "http://127.0.0.1:8765"})
+    ticket = create_ws_ticket()
+    with client.websocket_connect(f"/ws?ticket={ticket}") as ws:
+        ws.send_json({"type": "subscribe", "subsystems": ["fractal", "bogus"]})
+        _wait_for_filter()
+        assert list(event_bus._filters.values()) == [frozenset({"fractal"})]
+
+        _publish(Event(subsystem=Subsystem.CONFIG, event_type="skipped", data={}))
+        _publish(Event(subsystem=Subsystem.FRACTAL, event_type="created", data={}))
+
+        data = ws.receive_json()
+        assert data["subsystem"] == "fractal"
+        assert data["event"] == "created"
+
+
+def test_ws_unsubscribe_removes_subsystem(admin_app, mock_mcp_token):
+    client = TestClient(admin_app, headers={"Host": "127.0.0.1:8765", "Origin": "http://127.0.0.1:8765"})
+    ticket = create_ws_ticket()
+    with client.websocket_connect(f"/ws?ticket={ticket}") as ws:
+        ws.send_json({"type": "unsubscribe", "subsystems": ["config"]})
+        _wait_for_filter()
+        (allowed,) = event_bus._filters.values()
+        assert "config" not in allowed
+        assert "fractal" in allowed
+
+
+def test_ws_coalesces_worker_llm_burst_into_batch(admin_app, mock_mcp_token, monkeypatch):
+    monkeypatch.setattr(event_bus, "COALESCE_WINDOWS", {Subsystem.WORKER_LLM: 0.2})
+    client = TestClient(admin_app, headers={"Host": "127.0.0.1:8765", "Origin": "http://127.0.0.1:8765"})
+    ticket = create_ws_ticket()
+    with client.websocket_connect(f"/ws?ticket={ticket}") as ws:
+        for i in range(3):
+            _publish(Event(subsystem=Subsystem.WORKER_LLM, event_type=f"call-{i}", data={"i": i}))
+
+        data = ws.receive_json()
+        assert data["type"] == "batch"
+        assert [e["event"] for e in data["events"]] == ["call-0", "call-1", "call-2"]
+        assert all(e["type"] == "event" for e in data["events"])
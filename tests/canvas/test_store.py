@@ -329,6 +329,60 @@ def test_list_canvases_root_missing(monkeypatch, tmp_path):
     assert store.list_canvases() == []
 
 
+def _age(*paths):
+    """Backdate mtimes past the catalog's racy window so reads get cached."""
+    old = os.stat(paths[0]).st_mtime - 60
+    for path in paths:
+        os.utime(path, (old, old))
+
+
+def test_catalog_caches_settled_meta(canvas_tmp_root):
+    store.open_canvas("foo", title="Foo")
+    canvas_dir = os.path.join(canvas_tmp_root, "foo")
+    meta_p = os.path.join(canvas_dir, "meta.json")
+    _age(meta_p, canvas_tmp_root)
+    assert [i["title"] for i in store.list_canvases()] == ["Foo"]
+    assert meta_p in store._meta_cache
+    assert store.read_meta("foo") is store._meta_cache[meta_p][1]
+
+
+def test_catalog_skips_recently_modified_files(canvas_tmp_root):
+    store.open_canvas("foo", title="Foo")
+    store.list_canvases()
+    assert os.path.join(canvas_tmp_root, "foo", "meta.json") not in store._meta_cache
+
+
+def test_catalog_detects_in_place_edit(canvas_tmp_root):
+    store.open_canvas("foo", title="Foo")
+    meta_p = os.path.join(canvas_tmp_root, "foo", "meta.json")
+    _age(meta_p, canvas_tmp_root)
+    store.list_canvases()
+    with open(meta_p, "r", encoding="utf-8") as f:
+        raw = f.read()
+    with open(meta_p, "w", encoding="utf-8") as f:
+        f.write(raw.replace('"title":"Foo"', '"title":"Bar"'))
+    assert [i["title"] for i in store.list_canvases()] == ["Bar"]
+
+
+def test_catalog_listing_sees_new_canvas(canvas_tmp_root):
+    store.open_canvas("foo")
+    _age(canvas_tmp_root)
+    assert [i["name"] for i in store.list_canvases()] == ["foo"]
+    store.open_canvas("bar")
+    assert sorted(i["name"] for i in store.list_canvases()) == ["bar", "foo"]
+
+
+def test_read_canvas_etag(canvas_tmp_root):
+    store.open_canvas("foo")
+    store.write_page("foo", "one")
+    payload, etag = store.read_canvas_with_etag("foo")
+    assert payload == store.read_canvas("foo")
+    assert store.canvas_etag("foo") == etag
+    store.write_page("foo", "two")
+    assert store.canvas_etag("foo") != etag
+    assert store.canvas_etag("missing") is None
+
+
 def test_close_canvas_invalid_name(canvas_tmp_root):
     assert store.close_canvas("../etc") is None
 
@@ -653,3 +653,173 @@ def test_compound_with_dangerous_payload_blocked_full_stack(name, command):
         f"expected CRITICAL/HIGH severity in {severities!r} for {command!r}; "
         f"findings: {result['findings']!r}"
     )
+
+
+# ---------------------------------------------------------------------------
+# Parse cache
+# ---------------------------------------------------------------------------
+
+
+class TestParseCache:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self, monkeypatch, tmp_path):
+        """Start every test with an empty cache and a private tiers.toml so
+        the fingerprint can be moved without touching the shipped seed."""
+        from spellbook.gates import bash_parser, check
+
+        self.tiers_path = tmp_path / "tiers.toml"
+        self.tiers_path.write_text("", encoding="utf-8")
+        monkeypatch.setattr(check, "_tiers_toml_path", lambda: self.tiers_path)
+        bash_parser.parse_cache_clear()
+        yield
+        bash_parser.parse_cache_clear()
+
+    def test_repeat_command_is_served_from_cache(self):
+        from spellbook.gates.bash_parser import parse_and_check, parse_cache_info
+
+        first = parse_and_check("echo $(whoami)")
+        second = parse_and_check("echo $(whoami)")
+
+        assert second == first
+        assert [f["rule_id"] for f in first] == ["BASH-PARSER-CMDSUB"]
+        info = parse_cache_info()
+        assert (info["hits"], info["misses"], info["size"]) == (1, 1, 1)
+
+    def test_cached_findings_are_not_shared_with_callers(self):
+        from spellbook.gates.bash_parser import parse_and_check
+
+        parse_and_check("echo $(whoami)")[0]["severity"] = "LOW"
+
+        assert parse_and_check("echo $(whoami)")[0]["severity"] == "CRITICAL"
+
+    def test_security_mode_is_part_of_the_key(self):
+        from spellbook.gates.bash_parser import parse_and_check
+
+        assert parse_and_check("ls && pwd", security_mode="standard") == []
+        paranoid = parse_and_check("ls && pwd", security_mode="paranoid")
+        assert [f["rule_id"] for f in paranoid] == ["BASH-PARSER-COMPOUND"]
+
+    def test_compound_env_toggle_bypasses_stale_entry(self, monkeypatch):
+        from spellbook.gates.bash_parser import parse_and_check
+
+        assert parse_and_check("ls && pwd") == []
+        monkeypatch.setenv("SPELLBOOK_BASH_DENY_COMPOUND", "1")
+        assert [f["rule_id"] for f in parse_and_check("ls && pwd")] == [
+            "BASH-PARSER-COMPOUND"
+        ]
+
+    def test_tiers_toml_change_invalidates(self):
+        import os
+
+        from spellbook.gates.bash_parser import parse_and_check, parse_cache_info
+
+        parse_and_check("git status")
+        st = self.tiers_path.stat()
+        os.utime(self.tiers_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        parse_and_check("git status")
+
+        info = parse_cache_info()
+        assert (info["hits"], info["misses"], info["invalidations"]) == (0, 2, 1)
+
+    def test_bash_policy_change_invalidates(self, monkeypatch, tmp_path):
+        from spellbook.gates import rules
+        from spellbook.gates.bash_parser import parse_and_check, parse_cache_info
+
+        policy = tmp_path / "bash-policy.toml"
+        monkeypatch.setattr(rules, "_supplemental_bash_policy_path", lambda: policy)
+        parse_and_check("git status")
+        policy.write_text("rules = []\n", encoding="utf-8")
+        parse_and_check("git status")
+
+        info = parse_cache_info()
+        assert (info["hits"], info["invalidations"]) == (0, 1)
+
+    def test_lru_evicts_oldest_entry(self, monkeypatch):
+        from spellbook.gates import bash_parser
+
+        monkeypatch.setattr(bash_parser, "_PARSE_CACHE_MAX", 2)
+        for cmd in ("ls", "pwd", "ls", "date"):
+            bash_parser.parse_and_check(cmd)
+        bash_parser.parse_and_check("ls")
+
+        info = bash_parser.parse_cache_info()
+        assert (info["hits"], info["size"]) == (2, 2)
+
+    def test_redirect_results_are_not_cached(self, tmp_path, monkeypatch):
+        """A redirect target re-pointed at a protected path is re-checked."""
+        from spellbook.gates import bash_parser
+
+        monkeypatch.chdir(tmp_path)
+        assert bash_parser.parse_and_check("echo x > ./out") == []
+        (tmp_path / "out").symlink_to("/etc/out")
+
+        findings = bash_parser.parse_and_check("echo x > ./out")
+
+        assert [f["rule_id"] for f in findings] == ["BASH-PARSER-REDIRECT"]
+        assert bash_parser.parse_cache_info()["size"] == 0
+
+    def test_redirect_rechecked_from_another_cwd(self, tmp_path, monkeypatch):
+        from spellbook.gates import bash_parser
+
+        monkeypatch.chdir(tmp_path)
+        assert bash_parser.parse_and_check("echo x > out") == []
+        monkeypatch.chdir("/etc")
+
+        findings = bash_parser.parse_and_check("echo x > out")
+
+        assert [f["rule_id"] for f in findings] == ["BASH-PARSER-REDIRECT"]
+
+    def test_cacheability_is_tracked_per_thread(self, monkeypatch, tmp_path):
+        """A redirect checked on another thread mid-walk neither blocks
+        caching this command nor leaks into its verdict."""
+        import threading
+
+        from spellbook.gates import bash_parser
+
+        monkeypatch.chdir(tmp_path)
+        real_walk = bash_parser._walk
+        started = []
+
+        def walk_with_concurrent_redirect(node, command, security_mode):
+            if not started:
+                started.append(command)
+                t = threading.Thread(
+                    target=bash_parser.parse_and_check, args=("echo x > out",),
+                )
+                t.start()
+                t.join()
+            return real_walk(node, command, security_mode)
+
+        monkeypatch.setattr(bash_parser, "_walk", walk_with_concurrent_redirect)
+        bash_parser.parse_and_check("git status")
+
+        assert started == ["git status"]
+        assert bash_parser.parse_cache_info()["size"] == 1
+        assert bash_parser.parse_and_check("git status") == []
+        assert bash_parser.parse_cache_info()["hits"] == 1
+
+    def test_unknown_kind_results_are_not_cached(self, monkeypatch):
+        """Every unknown-kind verdict must keep producing its audit entry."""
+        from spellbook.gates import bash_parser
+
+        monkeypatch.setattr(
+            bash_parser,
+            "_KNOWN_NODE_KINDS",
+            bash_parser._KNOWN_NODE_KINDS - {"parameter"},
+        )
+        captured: list[dict] = []
+        m = tripwire.mock("spellbook.gates.bash_parser:_append_audit")
+        m.calls(lambda record: captured.append(record))
+        m.calls(lambda record: captured.append(record))
+
+        with tripwire:
+            for _ in range(2):
+                findings = bash_parser.parse_and_check("echo $HOME")
+                assert [f["rule_id"] for f in findings] == [
+                    "BASH-PARSER-UNKNOWN-NODE"
+                ]
+        m.assert_call(args=(captured[0],), kwargs={})
+        m.assert_call(args=(captured[1],), kwargs={})
+
+        assert len(captured) == 2
+        assert bash_parser.parse_cache_info()["size"] == 0
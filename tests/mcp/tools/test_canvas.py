@@ -149,7 +149,14 @@ async def test_write_happy(canvas_tmp_root, mock_ctx, event_subscriber):
     assert len(event_subscriber) == 1
     evt = event_subscriber[0]
     assert evt.event_type == "canvas.updated"
-    assert evt.data == {"canvas": "design", "page": "index.md", "bytes": 7}
+    from spellbook.canvas import store
+
+    assert evt.data == {
+        "canvas": "design",
+        "page": "index.md",
+        "bytes": 7,
+        "etag": store.canvas_etag("design"),
+    }
 
 
 @pytest.mark.asyncio
@@ -448,7 +455,12 @@ async def test_canvas_decision_open_publishes_opened(canvas_tmp_root, mcp_ctx_wi
     assert len(event_subscriber) == 1
     evt = event_subscriber[-1]
     assert evt.event_type == events.CANVAS_DECISION_OPENED
-    assert evt.data == {"canvas": "plan-x", "decision_id": "d1", "kind": "approve"}
+    assert evt.data == {
+        "canvas": "plan-x",
+        "decision_id": "d1",
+        "kind": "approve",
+        "etag": store.canvas_etag("plan-x"),
+    }
 
 
 # -----------------------------------------------------------------------
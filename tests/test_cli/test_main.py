@@ -135,3 +135,74 @@ class TestEntryPoint:
         )
         assert result.returncode == 0
         assert "spellbook" in result.stdout.lower() or "usage" in result.stdout.lower()
+
+
+def _importtime(code: str) -> dict[str, int]:
+    """Run ``code`` under ``-X importtime``; return module -> cumulative us."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=tempfile.gettempdir(),
+    )
+    assert result.returncode == 0, result.stderr
+    out = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            out[name.strip()] = int(cumulative)
+    return out
+
+
+class TestLazySubcommands:
+    """Subcommand modules are imported only when dispatched."""
+
+    # Budget for ``import spellbook.cli.main`` + ``create_parser()``. The
+    # lazy parser needs ~6 ms; eager registration of every command module
+    # cost ~25 ms, and pulling in SQLAlchemy or the admin app costs far
+    # more. Generous so slow CI machines do not flake.
+    IMPORT_BUDGET_US = 60_000
+
+    def test_registry_help_matches_command_modules(self):
+        """``_COMMANDS`` help text agrees with each module's ``register``."""
+        import importlib
+        import argparse
+
+        from spellbook.cli.main import _COMMANDS
+
+        for name, (module_name, help_text) in _COMMANDS.items():
+            sub = argparse.ArgumentParser().add_subparsers()
+            module = importlib.import_module(
+                f"spellbook.cli.commands.{module_name}",
+            )
+            module.register(sub)
+            registered = {a.dest: a.help for a in sub._choices_actions}
+            assert registered == {name: help_text}
+
+    def test_dispatch_loads_the_real_subparser(self):
+        parser = create_parser()
+        args = parser.parse_args(["config", "get", "some_key"])
+        assert args.command == "config"
+        assert args.key == "some_key"
+        assert callable(args.func)
+
+    def test_create_parser_imports_no_command_module(self):
+        modules = _importtime(
+            "from spellbook.cli.main import create_parser\n"
+            "create_parser().parse_args(['--json'])\n"
+        )
+        loaded = {m for m in modules if m.startswith("spellbook.cli.commands.")}
+        assert loaded == set()
+        for heavy in ("importlib.metadata", "sqlalchemy", "fastapi", "asyncio"):
+            assert heavy not in modules, f"{heavy} imported at CLI startup"
+        assert modules["spellbook.cli.main"] < self.IMPORT_BUDGET_US
+
+    def test_dispatch_imports_only_that_command(self):
+        modules = _importtime(
+            "from spellbook.cli.main import create_parser\n"
+            "create_parser().parse_args(['session', 'list'])\n"
+        )
+        loaded = {m for m in modules if m.startswith("spellbook.cli.commands.")}
+        assert loaded == {"spellbook.cli.commands.session"}
@@ -0,0 +1,123 @@
+"""Tests for the shared file-watch service."""
+
+import queue
+
+import pytest
+
+from spellbook.core.file_watch import (
+    CREATED,
+    MODIFIED,
+    RESCAN,
+    FileEvent,
+    FileWatchService,
+)
+from spellbook.core.inotify import inotify_available
+
+
+@pytest.fixture(
+    params=[
+        pytest.param(
+            True,
+            id="inotify",
+            marks=pytest.mark.skipif(
+                not inotify_available(), reason="inotify is Linux-only"
+            ),
+        ),
+        pytest.param(False, id="polling"),
+    ]
+)
+def service(request):
+    svc = FileWatchService(poll_interval=0.05, use_inotify=request.param)
+    svc.start()
+    yield svc
+    svc.stop()
+
+
+def _collect(service, directory, suffix=".jsonl"):
+    events: queue.Queue = queue.Queue()
+    service.subscribe(directory, events.put, suffix=suffix)
+    return events
+
+
+def _next(events, timeout=5.0) -> FileEvent:
+    return events.get(timeout=timeout)
+
+
+def _drain(events, timeout=0.3) -> list:
+    out = []
+    try:
+        while True:
+            out.append(events.get(timeout=timeout))
+    except queue.Empty:
+        return out
+
+
+def test_reports_create_then_append(service, tmp_path):
+    events = _collect(service, tmp_path)
+    session = tmp_path / "s.jsonl"
+
+    session.write_text("{}\n")
+    assert _next(events) == FileEvent(CREATED, session)
+    _drain(events)
+
+    with open(session, "a") as f:
+        f.write("{}\n")
+    assert _next(events) == FileEvent(MODIFIED, session)
+
+
+def test_filters_by_suffix_and_ignores_existing_files(service, tmp_path):
+    (tmp_path / "old.jsonl").write_text("{}\n")
+    events = _collect(service, tmp_path)
+
+    (tmp_path / "notes.txt").write_text("x")
+    (tmp_path / "new.jsonl").write_text("{}\n")
+
+    paths = {e.path.name for e in [_next(events)] + _drain(events)}
+    assert paths == {"new.jsonl"}
+
+
+def test_directory_created_after_subscribe(service, tmp_path):
+    directory = tmp_path / "later"
+    events = _collect(service, directory)
+
+    directory.mkdir()
+    (directory / "s.jsonl").write_text("{}\n")
+
+    received = [_next(events)] + _drain(events)
+    # inotify arms the watch once the directory exists and asks for a
+    # rescan; polling sees the file appear.
+    assert {e.kind for e in received} & {RESCAN, CREATED}
+
+
+def test_unsubscribe_stops_delivery(service, tmp_path):
+    events = queue.Queue()
+    sub = service.subscribe(tmp_path, events.put, suffix=".jsonl")
+    sub.cancel()
+
+    (tmp_path / "s.jsonl").write_text("{}\n")
+    assert _drain(events) == []
+    assert service._subs == {}
+
+
+def test_failing_callback_does_not_starve_others(service, tmp_path):
+    def boom(event):
+        raise RuntimeError("consumer bug")
+
+    service.subscribe(tmp_path, boom, suffix=".jsonl")
+    events = _collect(service, tmp_path)
+
+    (tmp_path / "s.jsonl").write_text("{}\n")
+    assert _next(events).path == tmp_path / "s.jsonl"
+
+
+def test_shared_service_is_reused(monkeypatch):
+    from spellbook.core import file_watch
+
+    monkeypatch.setattr(file_watch, "_service", None)
+    try:
+        first = file_watch.get_file_watch_service()
+        assert file_watch.get_file_watch_service() is first
+        assert first.is_running()
+    finally:
+        file_watch.stop_file_watch_service()
+    assert file_watch._service is None
@@ -0,0 +1,139 @@
+"""Tests for the stat-validated git context service."""
+
+import os
+import subprocess
+
+import pytest
+
+from spellbook.core.git_context import GitContextService
+from spellbook.core.path_utils import detect_git_context
+
+pytestmark = pytest.mark.allow("subprocess")
+
+_ENV = {
+    **os.environ,
+    "GIT_AUTHOR_NAME": "Test",
+    "GIT_AUTHOR_EMAIL": "t@t",
+    "GIT_COMMITTER_NAME": "Test",
+    "GIT_COMMITTER_EMAIL": "t@t",
+}
+
+
+def _git(cwd, *args):
+    return subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True, env=_ENV
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    path = tmp_path / "repo"
+    path.mkdir()
+    _git(path, "init", "-b", "main")
+    _git(path, "commit", "--allow-empty", "-m", "init")
+    return path
+
+
+@pytest.fixture
+def service():
+    return GitContextService()
+
+
+def test_reads_branch_and_roots(repo, service):
+    (repo / "sub").mkdir()
+    state = service.lookup(str(repo / "sub"))
+    assert state.branch == "main"
+    assert state.detached_sha is None
+    assert state.toplevel == str(repo)
+    assert state.main_worktree == str(repo)
+
+
+def test_checkout_invalidates(repo, service):
+    assert service.lookup(str(repo)).branch == "main"
+    _git(repo, "checkout", "-q", "-b", "feature")
+    assert service.lookup(str(repo)).branch == "feature"
+
+
+def test_cache_hit_returns_same_state(repo, service):
+    first = service.lookup(str(repo))
+    assert service.lookup(str(repo)) is first
+
+
+def test_unborn_branch_becomes_born(tmp_path, service):
+    repo = tmp_path / "empty"
+    repo.mkdir()
+    _git(repo, "init", "-b", "main")
+    state = service.lookup(str(repo))
+    assert state.branch is None
+    assert state.detached_sha is None
+    _git(repo, "commit", "--allow-empty", "-m", "first")
+    assert service.lookup(str(repo)).branch == "main"
+
+
+def test_packed_refs(repo, service):
+    _git(repo, "pack-refs", "--all")
+    assert not (repo / ".git" / "refs" / "heads" / "main").exists()
+    assert service.lookup(str(repo)).branch == "main"
+
+
+def test_detached_head(repo, service):
+    sha = _git(repo, "rev-parse", "HEAD")
+    _git(repo, "checkout", "-q", "--detach")
+    state = service.lookup(str(repo))
+    assert state.branch is None
+    assert state.detached_sha == sha
+
+
+def test_linked_worktree(repo, tmp_path, service):
+    wt = tmp_path / "wt"
+    _git(repo, "worktree", "add", "-q", "-b", "wt-branch", str(wt))
+    state = service.lookup(str(wt))
+    assert state.branch == "wt-branch"
+    assert state.toplevel == str(wt)
+    assert state.main_worktree == str(repo)
+    assert service.lookup(str(repo)).branch == "main"
+
+
+def test_not_a_repo(tmp_path, service):
+    assert service.lookup(str(tmp_path)) is None
+    assert service.lookup(str(tmp_path / "missing")) is None
+
+
+def test_bare_repo_not_answered(tmp_path, service):
+    bare = tmp_path / "bare.git"
+    _git(tmp_path, "init", "-q", "--bare", str(bare))
+    (bare / "x").mkdir()
+    assert service.lookup(str(bare / "x")) is None
+
+
+def test_lru_bound(tmp_path):
+    service = GitContextService(max_worktrees=2)
+    repos = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / name
+        path.mkdir()
+        _git(path, "init", "-q", "-b", "main")
+        repos.append(path)
+        service.lookup(str(path))
+    assert len(service._entries) == 2
+    assert str(repos[0] / ".git") not in service._entries
+
+
+def test_detect_git_context_matches_git(repo, tmp_path):
+    wt = tmp_path / "wt"
+    _git(repo, "worktree", "add", "-q", "-b", "wt-branch", str(wt))
+    ctx = detect_git_context(str(wt))
+    assert ctx.branch == "wt-branch"
+    assert ctx.is_worktree is True
+    assert ctx.worktree_name == "wt"
+    assert ctx.repo_root == _git(repo, "rev-parse", "--show-toplevel")
+
+
+def test_detect_git_context_cached_without_subprocess(repo, monkeypatch):
+    detect_git_context(str(repo))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("git was run on a cache hit")
+
+    monkeypatch.setattr(subprocess, "run", fail)
+    assert detect_git_context(str(repo)).branch == "main"
@@ -0,0 +1,65 @@
+"""Tests for the ctypes inotify binding."""
+
+import threading
+import time
+
+import pytest
+
+from spellbook.core.inotify import (
+    IN_CLOSE_WRITE,
+    IN_CREATE,
+    IN_MODIFY,
+    Inotify,
+    inotify_available,
+)
+
+pytestmark = pytest.mark.skipif(not inotify_available(), reason="inotify is Linux-only")
+
+
+@pytest.fixture
+def notifier():
+    n = Inotify()
+    yield n
+    n.close()
+
+
+def test_reports_create_and_write_with_file_name(notifier, tmp_path):
+    notifier.add_watch(tmp_path, IN_CREATE | IN_MODIFY | IN_CLOSE_WRITE)
+
+    (tmp_path / "session.jsonl").write_text("{}\n")
+
+    events = notifier.wait(1.0)
+    assert {e.name for e in events} == {"session.jsonl"}
+    masks = 0
+    for e in events:
+        masks |= e.mask
+    assert masks & IN_CREATE
+    assert masks & IN_CLOSE_WRITE
+
+
+def test_wait_times_out_with_no_events(notifier, tmp_path):
+    notifier.add_watch(tmp_path, IN_CREATE)
+    start = time.monotonic()
+    assert notifier.wait(0.05) == []
+    assert time.monotonic() - start >= 0.04
+
+
+def test_wake_interrupts_blocking_wait(notifier, tmp_path):
+    notifier.add_watch(tmp_path, IN_CREATE)
+    threading.Timer(0.05, notifier.wake).start()
+    start = time.monotonic()
+    assert notifier.wait(5.0) == []
+    assert time.monotonic() - start < 2.0
+
+
+def test_add_watch_on_missing_path_raises(notifier, tmp_path):
+    with pytest.raises(OSError):
+        notifier.add_watch(tmp_path / "missing", IN_CREATE)
+
+
+def test_closed_instance_is_inert(tmp_path):
+    n = Inotify()
+    n.close()
+    n.close()
+    n.wake()
+    assert n.wait(0) == []
@@ -0,0 +1,45 @@
+"""Tests for per-run environment and cwd bindings."""
+
+import os
+import threading
+from pathlib import Path
+
+from spellbook.core import run_context
+
+
+def test_unbound_reads_the_process(monkeypatch):
+    monkeypatch.setenv("SPELLBOOK_RC_TEST", "process")
+    assert run_context.getenv("SPELLBOOK_RC_TEST") == "process"
+    assert run_context.getcwd() == os.getcwd()
+    assert run_context.resolve_path("x") == Path("x").resolve()
+
+
+def test_bound_env_replaces_process_env(monkeypatch):
+    monkeypatch.setenv("SPELLBOOK_RC_TEST", "process")
+    with run_context.bind({"OTHER": "1"}, "/"):
+        assert run_context.getenv("SPELLBOOK_RC_TEST") is None
+        assert run_context.getenv("OTHER") == "1"
+    assert run_context.getenv("SPELLBOOK_RC_TEST") == "process"
+
+
+def test_relative_paths_resolve_against_bound_cwd(tmp_path):
+    with run_context.bind({}, str(tmp_path)):
+        assert run_context.resolve_path("out") == (tmp_path / "out").resolve()
+        assert run_context.resolve_path("/etc/x") == Path("/etc/x").resolve()
+
+
+def test_tilde_uses_bound_home(tmp_path):
+    with run_context.bind({"HOME": str(tmp_path)}, "/"):
+        assert run_context.expanduser("~/a") == f"{tmp_path}/a"
+        assert run_context.home() == tmp_path
+    with run_context.bind({"HOME": "/"}, "/"):
+        assert run_context.expanduser("~") == "/"
+
+
+def test_bindings_are_per_thread():
+    seen = []
+    with run_context.bind({"SPELLBOOK_RC_TEST": "bound"}, "/"):
+        t = threading.Thread(target=lambda: seen.append(run_context.getenv("SPELLBOOK_RC_TEST")))
+        t.start()
+        t.join()
+    assert seen == [os.environ.get("SPELLBOOK_RC_TEST")]
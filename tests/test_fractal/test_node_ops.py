@@ -1380,6 +1380,198 @@ class TestClaimWork:
             )
 
 
+class TestClaimWorkBatch:
+    """Tests for claim_work_batch function."""
+
+    async def test_batch_claims_in_claim_work_order(self, graph_with_root):
+        """claim_work_batch must claim up to max_nodes, shallowest then oldest."""
+        from spellbook.fractal.node_ops import add_node, claim_work_batch
+
+        gid = graph_with_root["graph_id"]
+        db = graph_with_root["db_path"]
+        children = [
+            await add_node(
+                graph_id=gid, parent_id=graph_with_root["root_node_id"],
+                node_type="question", text=f"Question {i}", db_path=db,
+            )
+            for i in range(4)
+        ]
+
+        result = await claim_work_batch(
+            graph_id=gid, worker_id="worker-batch", max_nodes=3, db_path=db,
+        )
+
+        assert result["graph_done"] is False
+        assert [n["depth"] for n in result["nodes"]] == [0, 1, 1]
+        assert result["nodes"][0]["node_id"] == graph_with_root["root_node_id"]
+        claimed_children = {n["node_id"] for n in result["nodes"][1:]}
+        assert claimed_children <= {c["node_id"] for c in children}
+
+    async def test_batch_returns_fewer_when_work_runs_out(self, graph_with_root):
+        """claim_work_batch must return only the open nodes that remain."""
+        from spellbook.fractal.node_ops import claim_work_batch
+
+        gid = graph_with_root["graph_id"]
+        db = graph_with_root["db_path"]
+
+        first = await claim_work_batch(
+            graph_id=gid, worker_id="worker-1", max_nodes=5, db_path=db,
+        )
+        second = await claim_work_batch(
+            graph_id=gid, worker_id="worker-2", max_nodes=5, db_path=db,
+        )
+
+        assert [n["node_id"] for n in first["nodes"]] == [graph_with_root["root_node_id"]]
+        assert second == {"nodes": [], "graph_done": False}
+
+    async def test_batch_prefers_affine_siblings(self, fractal_db):
+        """Siblings of the worker's nodes must come before shallower strangers."""
+        from spellbook.fractal.graph_ops import create_graph
+        from spellbook.fractal.node_ops import add_node, claim_work_batch
+        from spellbook.fractal.schema import get_fractal_connection
+
+        graph = await create_graph(
+            seed="Batch affinity", intensity="explore",
+            checkpoint_mode="autonomous", db_path=fractal_db,
+        )
+        gid = graph["graph_id"]
+        branch = await add_node(
+            graph_id=gid, parent_id=graph["root_node_id"],
+            node_type="answer", text="Branch", db_path=fractal_db,
+        )
+        shallow = await add_node(
+            graph_id=gid, parent_id=graph["root_node_id"],
+            node_type="question", text="Shallow", db_path=fractal_db,
+        )
+        owned, sibling = [
+            await add_node(
+                graph_id=gid, parent_id=branch["node_id"],
+                node_type="question", text=text, db_path=fractal_db,
+            )
+            for text in ("Owned", "Sibling")
+        ]
+        conn = get_fractal_connection(fractal_db)
+        conn.execute(
+            "UPDATE nodes SET owner = 'worker-aff', status = 'claimed' WHERE id = ?",
+            (owned["node_id"],),
+        )
+        conn.commit()
+
+        result = await claim_work_batch(
+            graph_id=gid, worker_id="worker-aff", max_nodes=2, db_path=fractal_db,
+        )
+
+        assert [n["node_id"] for n in result["nodes"]] == [
+            sibling["node_id"], shallow["node_id"],
+        ]
+
+    async def test_batch_graph_done(self, graph_with_root):
+        """claim_work_batch with no open and no claimed nodes reports graph_done."""
+        from spellbook.fractal.node_ops import claim_work_batch, mark_saturated
+
+        await mark_saturated(
+            graph_id=graph_with_root["graph_id"],
+            node_id=graph_with_root["root_node_id"],
+            reason="semantic_overlap",
+            db_path=graph_with_root["db_path"],
+        )
+
+        result = await claim_work_batch(
+            graph_id=graph_with_root["graph_id"], worker_id="worker-done",
+            max_nodes=3, db_path=graph_with_root["db_path"],
+        )
+
+        assert result == {"nodes": [], "graph_done": True}
+
+    async def test_batch_rejects_non_positive_max_nodes(self, graph_with_root):
+        """claim_work_batch must reject max_nodes < 1."""
+        from spellbook.fractal.node_ops import claim_work_batch
+
+        with pytest.raises(ValueError, match="max_nodes"):
+            await claim_work_batch(
+                graph_id=graph_with_root["graph_id"], worker_id="worker-0",
+                max_nodes=0, db_path=graph_with_root["db_path"],
+            )
+
+    async def test_batch_inactive_graph(self, fractal_db):
+        """claim_work_batch on a non-active graph must raise ValueError."""
+        from spellbook.fractal.graph_ops import create_graph, update_graph_status
+        from spellbook.fractal.node_ops import claim_work_batch
+
+        graph = await create_graph(
+            seed="Inactive batch", intensity="pulse",
+            checkpoint_mode="autonomous", db_path=fractal_db,
+        )
+        await update_graph_status(graph["graph_id"], "paused", db_path=fractal_db)
+
+        with pytest.raises(ValueError, match="active"):
+            await claim_work_batch(
+                graph_id=graph["graph_id"], worker_id="worker-inactive",
+                max_nodes=2, db_path=fractal_db,
+            )
+
+
+class TestConcurrentClaims:
+    """Stress tests for many workers claiming from one graph at once."""
+
+    @pytest.mark.parametrize("max_nodes", [1, 3])
+    async def test_concurrent_claimers_never_double_claim(self, fractal_db, max_nodes):
+        """Every open question is claimed exactly once across racing workers."""
+        import asyncio
+
+        from spellbook.fractal.graph_ops import create_graph
+        from spellbook.fractal.node_ops import add_node, claim_work, claim_work_batch
+        from spellbook.fractal.schema import get_fractal_connection
+
+        graph = await create_graph(
+            seed="Stress", intensity="explore",
+            checkpoint_mode="autonomous", db_path=fractal_db,
+        )
+        gid = graph["graph_id"]
+        questions = {graph["root_node_id"]}
+        for b in range(4):
+            branch = await add_node(
+                graph_id=gid, parent_id=graph["root_node_id"],
+                node_type="question", text=f"Branch {b}", db_path=fractal_db,
+            )
+            questions.add(branch["node_id"])
+            for q in range(15):
+                leaf = await add_node(
+                    graph_id=gid, parent_id=branch["node_id"],
+                    node_type="question", text=f"Q {b}.{q}", db_path=fractal_db,
+                )
+                questions.add(leaf["node_id"])
+
+        async def worker(worker_id):
+            claimed = []
+            while True:
+                if max_nodes == 1:
+                    result = await claim_work(gid, worker_id, db_path=fractal_db)
+                    nodes = [result] if result["node_id"] else []
+                else:
+                    result = await claim_work_batch(
+                        gid, worker_id, max_nodes, db_path=fractal_db,
+                    )
+                    nodes = result["nodes"]
+                if not nodes:
+                    return claimed
+                claimed.extend((n["node_id"], worker_id) for n in nodes)
+
+        results = await asyncio.gather(*(worker(f"w{i}") for i in range(12)))
+
+        claims = [c for worker_claims in results for c in worker_claims]
+        claimed_ids = [node_id for node_id, _ in claims]
+        assert len(claimed_ids) == len(set(claimed_ids))
+        assert set(claimed_ids) == questions
+
+        cursor = get_fractal_connection(fractal_db).cursor()
+        cursor.execute(
+            "SELECT id, owner FROM nodes WHERE graph_id = ? AND status = 'claimed'",
+            (gid,),
+        )
+        assert dict(cursor.fetchall()) == dict(claims)
+
+
 class TestSynthesizeNode:
     """Tests for synthesize_node function."""
 
@@ -335,6 +335,24 @@ class TestGetBranch:
 
         assert len(result["nodes"]) == 7
 
+    async def test_branch_closure_matches_parent_links(self, branching_graph):
+        """Closure rows written by add_node must equal a rebuild from parent_id."""
+        from spellbook.fractal.schema import _rebuild_node_closure, get_fractal_connection
+
+        conn = get_fractal_connection(branching_graph["db_path"])
+        cursor = conn.cursor()
+        query = "SELECT ancestor_id, descendant_id, graph_id, distance FROM node_closure"
+        cursor.execute(query)
+        maintained = sorted(cursor.fetchall())
+        _rebuild_node_closure(cursor)
+        cursor.execute(query)
+        rebuilt = sorted(cursor.fetchall())
+        conn.rollback()
+
+        # 7 self pairs + 6 parent pairs + 3 grandparent pairs
+        assert len(maintained) == 16
+        assert maintained == rebuilt
+
     async def test_branch_graph_not_found(self, fractal_db):
         """get_branch with nonexistent graph_id must return error."""
         from spellbook.fractal.query_ops import get_branch
@@ -598,6 +616,44 @@ class TestQueryConvergence:
 
         assert "error" in result
 
+    async def test_convergence_merges_transitive_clusters(self, branching_graph):
+        """Edges a-b and c-d form two clusters until b-c joins them into one."""
+        from spellbook.fractal.node_ops import update_node
+        from spellbook.fractal.query_ops import query_convergence
+
+        gid = branching_graph["graph_id"]
+        db = branching_graph["db_path"]
+        a, b = branching_graph["sub_a1"], branching_graph["sub_b1"]
+        c, d = branching_graph["branch_c"], branching_graph["sub_a2"]
+
+        await update_node(
+            graph_id=gid, node_id=a, db_path=db,
+            metadata_json=json.dumps({"convergence_with": [b]}),
+        )
+        await update_node(
+            graph_id=gid, node_id=c, db_path=db,
+            metadata_json=json.dumps({
+                "convergence_with": [d],
+                "convergence_insight": "Wavelength dependence",
+            }),
+        )
+
+        result = await query_convergence(graph_id=gid, db_path=db)
+        assert sorted(cp["nodes"] for cp in result["convergence_points"]) == sorted(
+            [sorted([a, b]), sorted([c, d])]
+        )
+
+        await update_node(
+            graph_id=gid, node_id=b, db_path=db,
+            metadata_json=json.dumps({"convergence_with": [c]}),
+        )
+
+        result = await query_convergence(graph_id=gid, db_path=db)
+        assert result["convergence_points"] == [
+            {"nodes": sorted([a, b, c, d]), "insight": "Wavelength dependence"},
+        ]
+        assert result["count"] == 1
+
 
 class TestQueryContradictions:
     """Tests for query_contradictions function."""
@@ -53,6 +53,30 @@ class TestSchemaInit:
         assert cursor.fetchone() is not None
 
 
+    def test_init_creates_convergence_clusters_table(self, fractal_db):
+        """convergence_clusters table must exist after initialization."""
+        from spellbook.fractal.schema import get_fractal_connection
+
+        conn = get_fractal_connection(fractal_db)
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='convergence_clusters'"
+        )
+        assert cursor.fetchone() is not None
+
+
+    def test_init_creates_node_closure_table(self, fractal_db):
+        """node_closure table must exist after initialization."""
+        from spellbook.fractal.schema import get_fractal_connection
+
+        conn = get_fractal_connection(fractal_db)
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='node_closure'"
+        )
+        assert cursor.fetchone() is not None
+
+
 class TestSchemaVersionTable:
     """Tests for schema_version table structure and content."""
 
@@ -540,7 +564,7 @@ class TestIdempotency:
         cursor.execute("SELECT COUNT(*) FROM schema_version")
         count = cursor.fetchone()[0]
 
-        assert count == 3  # version 2 + version 3 + version 4 rows
+        assert count == 5  # version 2 through version 6 rows
         close_all_fractal_connections()
 
 
@@ -842,9 +866,9 @@ class TestV1ToV2Migration:
         cursor.execute("SELECT status FROM nodes WHERE id = 'n-synth-mig'")
         assert cursor.fetchone()[0] == "synthesized"
 
-        # Verify schema version 4 was recorded (v2 + v3 + v4 migrations all apply)
+        # Verify schema version 6 was recorded (v2 through v6 migrations all apply)
         cursor.execute("SELECT MAX(version) FROM schema_version")
-        assert cursor.fetchone()[0] == 4
+        assert cursor.fetchone()[0] == 6
 
         # Verify new index exists
         cursor.execute(
@@ -853,3 +877,94 @@ class TestV1ToV2Migration:
         assert cursor.fetchone() is not None
 
         close_all_fractal_connections()
+
+
+class TestV4ToV5Migration:
+    """Tests for v4 to v5 schema migration."""
+
+    def test_migration_backfills_convergence_clusters(self, fractal_db):
+        """Existing convergence edges must be grouped into clusters on upgrade."""
+        from spellbook.fractal.schema import get_fractal_connection, init_fractal_schema
+
+        conn = get_fractal_connection(fractal_db)
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO graphs (id, seed, intensity, checkpoint_mode)
+            VALUES ('g-v4', 'test', 'pulse', 'autonomous')
+        """)
+        for nid in ("n1", "n2", "n3", "n4", "n5"):
+            cursor.execute(
+                "INSERT INTO nodes (id, graph_id, node_type, text) "
+                "VALUES (?, 'g-v4', 'question', 'q')",
+                (nid,),
+            )
+        for from_node, to_node, edge_type in [
+            ("n1", "n2", "convergence"),
+            ("n3", "n2", "convergence"),
+            ("n4", "n5", "convergence"),
+            ("n1", "n5", "contradiction"),
+        ]:
+            cursor.execute(
+                "INSERT INTO edges (graph_id, from_node, to_node, edge_type) "
+                "VALUES ('g-v4', ?, ?, ?)",
+                (from_node, to_node, edge_type),
+            )
+        # Roll the database back to v4 with an empty cluster table
+        cursor.execute("DELETE FROM convergence_clusters")
+        cursor.execute("DELETE FROM schema_version WHERE version >= 5")
+        conn.commit()
+
+        init_fractal_schema(fractal_db)
+
+        cursor.execute("SELECT node_id, cluster_id FROM convergence_clusters")
+        clusters = {}
+        for node_id, cluster_id in cursor.fetchall():
+            clusters.setdefault(cluster_id, set()).add(node_id)
+        assert sorted(map(sorted, clusters.values())) == [["n1", "n2", "n3"], ["n4", "n5"]]
+
+        cursor.execute("SELECT MAX(version) FROM schema_version")
+        assert cursor.fetchone()[0] == 6
+
+
+class TestV5ToV6Migration:
+    """Tests for v5 to v6 schema migration."""
+
+    def test_migration_backfills_node_closure(self, fractal_db):
+        """Existing parent links must be expanded into closure rows on upgrade."""
+        from spellbook.fractal.schema import get_fractal_connection, init_fractal_schema
+
+        conn = get_fractal_connection(fractal_db)
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO graphs (id, seed, intensity, checkpoint_mode)
+            VALUES ('g-v5', 'test', 'pulse', 'autonomous')
+        """)
+        for nid, parent in [("r", None), ("a", "r"), ("b", "r"), ("a1", "a")]:
+            cursor.execute(
+                "INSERT INTO nodes (id, graph_id, parent_id, node_type, text) "
+                "VALUES (?, 'g-v5', ?, 'question', 'q')",
+                (nid, parent),
+            )
+        # Roll the database back to v5 with an empty closure table
+        cursor.execute("DELETE FROM node_closure")
+        cursor.execute("DELETE FROM schema_version WHERE version = 6")
+        conn.commit()
+
+        init_fractal_schema(fractal_db)
+
+        cursor.execute(
+            "SELECT ancestor_id, descendant_id, graph_id, distance FROM node_closure"
+        )
+        assert sorted(cursor.fetchall()) == [
+            ("a", "a", "g-v5", 0),
+            ("a", "a1", "g-v5", 1),
+            ("a1", "a1", "g-v5", 0),
+            ("b", "b", "g-v5", 0),
+            ("r", "a", "g-v5", 1),
+            ("r", "a1", "g-v5", 2),
+            ("r", "b", "g-v5", 1),
+            ("r", "r", "g-v5", 0),
+        ]
+
+        cursor.execute("SELECT MAX(version) FROM schema_version")
+        assert cursor.fetchone()[0] == 6
@@ -27,7 +27,7 @@ def fractal_db(tmp_path):
 
 
 # ---------------------------------------------------------------------------
-# Task 4.2a: Verify all 17 tool functions exist on the server module
+# Task 4.2a: Verify all 18 tool functions exist on the server module
 # ---------------------------------------------------------------------------
 
 
@@ -46,6 +46,7 @@ EXPECTED_FRACTAL_TOOLS = [
     "fractal_query_contradictions",
     "fractal_get_saturation_status",
     "fractal_claim_work",
+    "fractal_claim_work_batch",
     "fractal_synthesize_node",
     "fractal_get_claimable_work",
     "fractal_get_ready_to_synthesize",
@@ -394,6 +394,136 @@ class TestAgent2AgentHookFast:
         )
 
 
+    def test_empty_inbox_skips_helper_spawn(self, tmp_path, monkeypatch):
+        """Bound name with an empty inbox -> silent WITHOUT running the helper
+        (no subprocess is mocked, so any spawn fails the tripwire)."""
+        monkeypatch.setenv("AGENT2AGENT_DIR", str(tmp_path))
+        _stub_helper_tree(tmp_path)
+        monkeypatch.setenv("SPELLBOOK_DIR", str(tmp_path))
+        bindings = tmp_path / ".bindings"
+        bindings.mkdir()
+        (bindings / "session-empty").write_text("alice", encoding="utf-8")
+        (tmp_path / "alice" / "inbox").mkdir(parents=True)
+
+        with tripwire:
+            result = spellbook_hook._agent2agent_notify_for_prompt(
+                {"session_id": "session-empty"}
+            )
+        assert result is None
+
+    def test_name_dir_without_inbox_goes_to_helper(self, tmp_path, monkeypatch):
+        """A half-removed name dir (close racing the hook) is not an empty
+        inbox: the helper still runs and owns the stale-binding cleanup."""
+        monkeypatch.setenv("AGENT2AGENT_DIR", str(tmp_path))
+        helper = _stub_helper_tree(tmp_path)
+        monkeypatch.setenv("SPELLBOOK_DIR", str(tmp_path))
+        bindings = tmp_path / ".bindings"
+        bindings.mkdir()
+        (bindings / "session-closed").write_text("alice", encoding="utf-8")
+        (tmp_path / "alice" / "pending").mkdir(parents=True)
+
+        argv = _expected_helper_argv(helper, "alice")
+        tripwire.subprocess.mock_run(command=argv, returncode=0, stdout="")
+
+        with tripwire:
+            result = spellbook_hook._agent2agent_notify_for_prompt(
+                {"session_id": "session-closed"}
+            )
+        assert result is None
+        tripwire.subprocess.assert_run(
+            command=argv, returncode=0, stdout="", stderr="",
+        )
+
+
+# ---------------------------------------------------------------------------
+# Cached pending counts (<bus>/.counts/<name>)
+# ---------------------------------------------------------------------------
+
+
+def _backdate(*paths: Path) -> None:
+    """Push mtimes past the racy window so the count cache may be written."""
+    past = time.time() - 60
+    for path in paths:
+        os.utime(path, (past, past))
+
+
+class TestPendingCountCache:
+    def _tree(self, tmp_path: Path) -> Path:
+        name_dir = tmp_path / "alice"
+        inbox = name_dir / "inbox"
+        batch = name_dir / "pending" / "batch-1"
+        inbox.mkdir(parents=True)
+        batch.mkdir(parents=True)
+        (inbox / "001.json").write_text("{}", encoding="utf-8")
+        (inbox / ".tmp-x.json").write_text("{}", encoding="utf-8")
+        (batch / "002.json").write_text("{}", encoding="utf-8")
+        _backdate(inbox, name_dir / "pending", batch)
+        return name_dir
+
+    def test_settled_scan_writes_cache(self, tmp_path):
+        name_dir = self._tree(tmp_path)
+        assert spellbook_hook._a2a_message_counts(name_dir) == (1, 1)
+        cached = json.loads((tmp_path / ".counts" / "alice").read_text())
+        assert (cached["inbox"], cached["staged"]) == (1, 1)
+        assert set(cached["stamps"]) == {"inbox", "pending", "pending/batch-1"}
+        # Nothing is written inside the name dir, so a concurrent close
+        # cannot leave it behind.
+        assert sorted(p.name for p in name_dir.iterdir()) == ["inbox", "pending"]
+
+    def test_cache_hit_skips_directory_listing(self, tmp_path, monkeypatch):
+        name_dir = self._tree(tmp_path)
+        spellbook_hook._a2a_message_counts(name_dir)
+
+        def fail(_self):
+            raise AssertionError("directory listed on a cache hit")
+
+        monkeypatch.setattr(Path, "iterdir", fail)
+        assert spellbook_hook._a2a_count_pending(name_dir) == 2
+
+    def test_new_message_invalidates_cache(self, tmp_path):
+        name_dir = self._tree(tmp_path)
+        spellbook_hook._a2a_message_counts(name_dir)
+        (name_dir / "inbox" / "003.json").write_text("{}", encoding="utf-8")
+        assert spellbook_hook._a2a_message_counts(name_dir) == (2, 1)
+
+    def test_drained_batch_invalidates_cache(self, tmp_path):
+        name_dir = self._tree(tmp_path)
+        spellbook_hook._a2a_message_counts(name_dir)
+        (name_dir / "pending" / "batch-1" / "002.json").unlink()
+        assert spellbook_hook._a2a_message_counts(name_dir) == (1, 0)
+
+    def test_recent_changes_not_cached(self, tmp_path):
+        name_dir = tmp_path / "alice"
+        (name_dir / "inbox").mkdir(parents=True)
+        assert spellbook_hook._a2a_message_counts(name_dir) == (0, 0)
+        assert not (tmp_path / ".counts" / "alice").exists()
+
+    def test_missing_name_dir_returns_none(self, tmp_path):
+        assert spellbook_hook._a2a_message_counts(tmp_path / "ghost") is None
+        assert spellbook_hook._a2a_count_pending(tmp_path / "ghost") == 0
+
+    def test_missing_inbox_returns_none(self, tmp_path):
+        name_dir = self._tree(tmp_path)
+        spellbook_hook._a2a_message_counts(name_dir)
+        shutil.rmtree(name_dir / "inbox")
+        assert spellbook_hook._a2a_message_counts(name_dir) is None
+
+    @pytest.mark.skipif(
+        sys.platform == "win32",
+        reason="loads the agent2agent helper module which requires fcntl (POSIX-only)",
+    )
+    def test_close_removes_cached_counts(self, a2a, tmp_path):
+        assert _run_helper(a2a, "open", "alice")[0] == 0
+        name_dir = tmp_path / "alice"
+        _backdate(*(p for p in name_dir.iterdir() if p.is_dir()))
+        spellbook_hook._a2a_message_counts(name_dir)
+        assert (tmp_path / ".counts" / "alice").exists()
+
+        assert _run_helper(a2a, "close", "alice")[0] == 0
+        assert not name_dir.exists()
+        assert not (tmp_path / ".counts" / "alice").exists()
+
+
 # ---------------------------------------------------------------------------
 # Drift guard: hook constants must mirror helper constants
 # ---------------------------------------------------------------------------
@@ -417,7 +547,7 @@ def _load_helper_module():
     sys.platform == "win32",
     reason="loads the agent2agent helper module which requires fcntl (POSIX-only)",
 )
-def test_hook_helper_constants_in_sync():
+def test_hook_helper_constants_in_sync(monkeypatch):
     """The hook's name regex / session-id regex / default bus dir must
     exactly mirror the helper's. If one side drifts, the hook silently
     rejects names the helper accepts (or vice versa).
@@ -425,7 +555,8 @@ def test_hook_helper_constants_in_sync():
     helper = _load_helper_module()
     assert spellbook_hook._A2A_NAME_RE.pattern == helper._NAME_RE.pattern
     assert spellbook_hook._A2A_SESSION_ID_RE.pattern == helper._SESSION_ID_RE.pattern
-    assert spellbook_hook._A2A_DEFAULT_BUS_DIR == helper.DEFAULT_BUS_DIR
+    monkeypatch.delenv("AGENT2AGENT_DIR", raising=False)
+    assert spellbook_hook._a2a_bus_dir() == helper.DEFAULT_BUS_DIR
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,264 @@
+"""Tests for warm hook dispatch over the daemon's Unix socket.
+
+Covers both halves:
+
+- ``hooks/spellbook_hook.py``: ``run_captured`` (per-run env and captured
+  streams) and ``_dispatch_via_socket`` (client; returns None whenever the
+  dispatcher cannot answer, which selects the in-process fallback).
+- ``spellbook.hooks.dispatcher.HookDispatcher``: socket server that runs
+  events against the warm hook module.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import stat
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from spellbook.hooks.dispatcher import HookDispatcher, warm_dispatch_supported
+
+HOOKS_DIR = Path(__file__).resolve().parent.parent.parent / "hooks"
+if str(HOOKS_DIR) not in sys.path:
+    sys.path.insert(0, str(HOOKS_DIR))
+
+import spellbook_hook  # noqa: E402
+
+HOOK_SCRIPT = HOOKS_DIR / "spellbook_hook.py"
+
+pytestmark = pytest.mark.skipif(
+    not warm_dispatch_supported(), reason="Unix domain sockets required",
+)
+
+_DENIED_BASH = json.dumps({
+    "hook_event_name": "PreToolUse",
+    "tool_name": "Bash",
+    "tool_input": {"command": "rm -rf /"},
+})
+
+
+@pytest.fixture
+def sock_dir():
+    # AF_UNIX paths are capped at ~104 bytes; pytest's tmp_path can exceed it.
+    d = tempfile.mkdtemp(prefix="sbhk", dir="/tmp")
+    yield Path(d)
+    shutil.rmtree(d, ignore_errors=True)
+
+
+@pytest.fixture
+def dispatcher(sock_dir):
+    d = HookDispatcher(socket_path=sock_dir / "hook.sock", script=HOOK_SCRIPT).start()
+    yield d
+    d.stop()
+
+
+class TestRunCaptured:
+    def test_empty_payload_exits_zero_with_no_output(self, capsys):
+        assert spellbook_hook.run_captured("", {}) == (0, "", "")
+        assert capsys.readouterr() == ("", "")
+
+    def test_output_and_env_are_scoped_to_the_run(self, monkeypatch, capsys):
+        monkeypatch.delenv("SPELLBOOK_TEST_MARKER", raising=False)
+
+        def fake_dispatch(event_name, tool_name, data):
+            print("diag", file=spellbook_hook._stderr())
+            return spellbook_hook._getenv("SPELLBOOK_TEST_MARKER")
+
+        monkeypatch.setattr(spellbook_hook, "dispatch", fake_dispatch)
+        raw = json.dumps({"hook_event_name": "UserPromptSubmit"})
+
+        result = spellbook_hook.run_captured(raw, {"SPELLBOOK_TEST_MARKER": "from-shim"})
+
+        assert result == (0, "from-shim\n", "diag\n")
+        # Nothing leaked onto the real streams, and the overlay is gone.
+        assert capsys.readouterr() == ("", "")
+        assert spellbook_hook._getenv("SPELLBOOK_TEST_MARKER") is None
+
+    def test_background_notification_uses_shim_env(self, monkeypatch, tmp_path):
+        import threading
+        import time
+
+        monkeypatch.delenv("SPELLBOOK_NOTIFY_ENABLED", raising=False)
+        monkeypatch.setattr(tempfile, "gettempdir", lambda: str(tmp_path))
+        tool_use_id = "toolu_warm_notify"
+        start = tmp_path / f"claude-notify-start-{tool_use_id}"
+        start.write_text(str(int(time.time()) - 600))
+
+        sent = []
+        done = threading.Event()
+        real_notify = spellbook_hook._notify_on_complete
+
+        def tracked_notify(*args):
+            try:
+                real_notify(*args)
+            finally:
+                done.set()
+
+        monkeypatch.setattr(spellbook_hook, "_notify_on_complete", tracked_notify)
+        monkeypatch.setattr(spellbook_hook, "_send_os_notification", lambda *a: sent.append(a))
+        raw = json.dumps({
+            "hook_event_name": "PostToolUse",
+            "tool_name": "Bash",
+            "tool_use_id": tool_use_id,
+        })
+
+        spellbook_hook.run_captured(raw, {**os.environ, "SPELLBOOK_NOTIFY_ENABLED": "false"})
+
+        assert done.wait(5)
+        assert sent == []
+        assert start.exists()
+
+    def test_a2a_default_bus_dir_uses_shim_home(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("AGENT2AGENT_DIR", raising=False)
+        seen = []
+        monkeypatch.setattr(
+            spellbook_hook, "dispatch", lambda *a: seen.append(spellbook_hook._a2a_bus_dir()),
+        )
+        raw = json.dumps({"hook_event_name": "UserPromptSubmit"})
+
+        spellbook_hook.run_captured(raw, {"HOME": str(tmp_path)})
+
+        assert seen == [tmp_path / ".local" / "share" / "agent2agent"]
+
+    def test_blocking_gate_returns_exit_two(self):
+        exit_code, stdout, stderr = spellbook_hook.run_captured(
+            _DENIED_BASH, dict(os.environ),
+        )
+        assert exit_code == 2
+        assert stdout == ""
+        assert "Security check failed" in stderr
+        # Anti-reflection: the blocked command is never echoed back.
+        assert "rm -rf" not in stderr
+
+
+class TestDispatchViaSocket:
+    def test_round_trip_matches_in_process_result(self, dispatcher, monkeypatch):
+        monkeypatch.setenv("SPELLBOOK_HOOK_SOCKET", str(dispatcher.socket_path))
+
+        warm = spellbook_hook._dispatch_via_socket(_DENIED_BASH)
+
+        assert warm is not None
+        assert warm == spellbook_hook.run_captured(_DENIED_BASH, dict(os.environ))
+        assert dispatcher.served == 1
+
+    def test_socket_is_owner_only(self, dispatcher):
+        mode = stat.S_IMODE(os.stat(dispatcher.socket_path).st_mode)
+        assert mode == 0o600
+
+    def test_missing_socket_falls_back(self, sock_dir, monkeypatch):
+        monkeypatch.setenv("SPELLBOOK_HOOK_SOCKET", str(sock_dir / "absent.sock"))
+        assert spellbook_hook._dispatch_via_socket(_DENIED_BASH) is None
+
+    def test_empty_override_disables_warm_dispatch(self, dispatcher, monkeypatch):
+        monkeypatch.setenv("SPELLBOOK_HOOK_SOCKET", "")
+        assert spellbook_hook._dispatch_via_socket(_DENIED_BASH) is None
+        assert dispatcher.served == 0
+
+    def test_foreign_script_falls_back(self, sock_dir, monkeypatch):
+        other = sock_dir / "other_hook.py"
+        other.write_text("")
+        d = HookDispatcher(socket_path=sock_dir / "hook.sock", script=other).start()
+        try:
+            monkeypatch.setenv("SPELLBOOK_HOOK_SOCKET", str(d.socket_path))
+            assert spellbook_hook._dispatch_via_socket(_DENIED_BASH) is None
+            assert d.served == 0
+            assert d.fallbacks == 1
+        finally:
+            d.stop()
+
+    def test_stop_removes_socket(self, sock_dir):
+        d = HookDispatcher(socket_path=sock_dir / "hook.sock", script=HOOK_SCRIPT).start()
+        d.stop()
+        assert not (sock_dir / "hook.sock").exists()
+        assert not d.is_running()
+
+
+class TestHandleRequest:
+    def test_malformed_request_falls_back(self, sock_dir):
+        d = HookDispatcher(socket_path=sock_dir / "hook.sock", script=HOOK_SCRIPT)
+        assert d.handle_request(b"not json") == {"fallback": True}
+        assert d.handle_request(json.dumps({"stdin": 1}).encode()) == {"fallback": True}
+        assert d.handle_request(None) == {"fallback": True}
+        assert d.fallbacks == 3
+
+    def test_request_without_cwd_falls_back(self, sock_dir):
+        d = HookDispatcher(socket_path=sock_dir / "hook.sock", script=HOOK_SCRIPT)
+        request = {"script": str(HOOK_SCRIPT), "stdin": _DENIED_BASH, "env": {}}
+        assert d.handle_request(json.dumps(request).encode()) == {"fallback": True}
+        request["cwd"] = "relative/dir"
+        assert d.handle_request(json.dumps(request).encode()) == {"fallback": True}
+        assert d.served == 0
+
+
+def _bash_event(command: str) -> str:
+    return json.dumps({
+        "hook_event_name": "PreToolUse",
+        "tool_name": "Bash",
+        "tool_input": {"command": command},
+    })
+
+
+class TestWarmRunsUseShimContext:
+    """Gates must judge a warm event by the shim's env and cwd, not the daemon's."""
+
+    def _request(self, command: str, env: dict, cwd: str) -> bytes:
+        return json.dumps({
+            "script": str(HOOK_SCRIPT),
+            "stdin": _bash_event(command),
+            "env": env,
+            "cwd": cwd,
+        }).encode()
+
+    def test_deny_compound_set_only_in_shim_env(self, sock_dir, monkeypatch):
+        monkeypatch.delenv("SPELLBOOK_BASH_DENY_COMPOUND", raising=False)
+        d = HookDispatcher(socket_path=sock_dir / "hook.sock", script=HOOK_SCRIPT)
+        command = "ls && pwd  # shim-env-compound"
+        daemon_env = dict(os.environ)
+        shim_env = {**daemon_env, "SPELLBOOK_BASH_DENY_COMPOUND": "1"}
+
+        allowed = d.handle_request(self._request(command, daemon_env, os.getcwd()))
+        denied = d.handle_request(self._request(command, shim_env, os.getcwd()))
+
+        assert allowed["exit_code"] == 0
+        assert denied["exit_code"] == 2
+        assert "Security check failed" in denied["stderr"]
+        assert "SPELLBOOK_BASH_DENY_COMPOUND" not in os.environ
+
+    def test_relative_redirect_resolves_against_shim_cwd(self, sock_dir):
+        d = HookDispatcher(socket_path=sock_dir / "hook.sock", script=HOOK_SCRIPT)
+        command = "echo x > shim-cwd-target"
+
+        reply = d.handle_request(self._request(command, dict(os.environ), "/etc"))
+
+        assert reply["exit_code"] == 2
+        assert d.served == 1
+
+    def test_context_is_unbound_after_the_run(self, sock_dir):
+        from spellbook.core import run_context
+
+        d = HookDispatcher(socket_path=sock_dir / "hook.sock", script=HOOK_SCRIPT)
+        d.handle_request(self._request("ls", {"SPELLBOOK_X": "1"}, "/"))
+
+        assert run_context.getenv("SPELLBOOK_X") is None
+        assert run_context.getcwd() == os.getcwd()
+
+    def test_reloads_hook_script_when_it_changes(self, sock_dir):
+        script = sock_dir / "hook_copy.py"
+        script.write_text(
+            "def run_captured(raw, env, cwd):\n    return 0, 'v1', ''\n"
+        )
+        d = HookDispatcher(socket_path=sock_dir / "hook.sock", script=script)
+        request = json.dumps(
+            {"script": str(script), "stdin": "{}", "env": {}, "cwd": "/"}
+        ).encode()
+        assert d.handle_request(request)["stdout"] == "v1"
+
+        script.write_text(
+            "def run_captured(raw, env, cwd):\n    return 0, 'v2-longer', ''\n"
+        )
+        assert d.handle_request(request)["stdout"] == "v2-longer"
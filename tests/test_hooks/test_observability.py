@@ -162,3 +162,23 @@ def test_record_hook_event_swallows_unexpected_exception(fresh_db, monkeypatch):
     observability.record_hook_event(
         hook_name="h", event_name="e", duration_ms=0, exit_code=0,
     )
+
+
+def test_record_hook_event_routes_through_batched_writer(fresh_db):
+    """With the daemon writer running, the row is queued and written on stop."""
+    from spellbook.db import ingest
+
+    ingest.start_ingestion(flush_interval=60)
+    try:
+        observability.record_hook_event(
+            hook_name="h", event_name="Stop", duration_ms=1, exit_code=0,
+        )
+        assert ingest.ingestion_stats()["enqueued"] == 1
+        with get_sync_session(fresh_db) as session:
+            assert session.execute(select(HookEvent)).scalars().all() == []
+    finally:
+        ingest.stop_ingestion()
+
+    with get_sync_session(fresh_db) as session:
+        rows = session.execute(select(HookEvent)).scalars().all()
+    assert [r.hook_name for r in rows] == ["h"]
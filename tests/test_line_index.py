@@ -0,0 +1,139 @@
+"""Tests for the byte-offset transcript line index."""
+
+import json
+import os
+
+import pytest
+
+from spellbook.sessions import line_index
+from spellbook.sessions.line_index import LineIndex
+
+
+def _write(path, *lines, mode="w"):
+    with open(path, mode) as f:
+        for line in lines:
+            f.write(line + "\n")
+
+
+@pytest.fixture
+def transcript(tmp_path):
+    path = tmp_path / "s.jsonl"
+    _write(path, *(json.dumps({"n": i}) for i in range(10)))
+    return path
+
+
+@pytest.fixture
+def sidecar(tmp_path):
+    return tmp_path / "index" / "s.idx"
+
+
+def _numbers(raw_lines):
+    return [json.loads(line)["n"] for line in raw_lines]
+
+
+class TestLineIndex:
+    def test_pages_and_total(self, transcript, sidecar):
+        with LineIndex.open(transcript, sidecar) as index:
+            assert len(index) == 10
+            assert _numbers(index.lines(4, 7)) == [4, 5, 6]
+            assert _numbers(index.lines(8, 50)) == [8, 9]
+            assert index.lines(10, 20) == []
+        assert sidecar.stat().st_size == 128 + 8 * 10
+
+    def test_blank_lines_are_not_counted(self, tmp_path, sidecar):
+        path = tmp_path / "s.jsonl"
+        _write(path, '{"n": 0}', "", "   ", '{"n": 1}', "", '{"n": 2}')
+        with LineIndex.open(path, sidecar) as index:
+            assert len(index) == 3
+            assert _numbers(index.lines(0, 2)) == [0, 1]
+            assert _numbers(index.lines(1, 3)) == [1, 2]
+
+    def test_append_extends_without_rescanning(self, transcript, sidecar, monkeypatch):
+        LineIndex.open(transcript, sidecar).close()
+        _write(transcript, '{"n": 10}', '{"n": 11}', mode="a")
+
+        scanned = []
+        original = line_index._scan_offsets
+        monkeypatch.setattr(
+            line_index, "_scan_offsets",
+            lambda f, start, end, offsets: (scanned.append(start), original(f, start, end, offsets))[1],
+        )
+        with LineIndex.open(transcript, sidecar) as index:
+            assert len(index) == 12
+            assert _numbers(index.lines(9, 12)) == [9, 10, 11]
+        assert scanned == [transcript.stat().st_size - 20]
+
+    def test_unterminated_tail_is_counted_not_indexed(self, transcript, sidecar):
+        with open(transcript, "a") as f:
+            f.write('{"n": 10}')
+        with LineIndex.open(transcript, sidecar) as index:
+            assert len(index) == 11
+            assert _numbers(index.lines(9, 11)) == [9, 10]
+        assert sidecar.stat().st_size == 128 + 8 * 10
+
+        with open(transcript, "a") as f:
+            f.write("\n")
+        with LineIndex.open(transcript, sidecar) as index:
+            assert len(index) == 11
+        assert sidecar.stat().st_size == 128 + 8 * 11
+
+    def test_rewrite_and_rotation_rebuild(self, transcript, sidecar):
+        LineIndex.open(transcript, sidecar).close()
+
+        _write(transcript, *(json.dumps({"n": i}) for i in range(100, 112)))
+        with LineIndex.open(transcript, sidecar) as index:
+            assert len(index) == 12
+            assert _numbers(index.lines(0, 1)) == [100]
+
+        replacement = transcript.with_suffix(".new")
+        _write(replacement, '{"n": 7}')
+        os.replace(replacement, transcript)
+        with LineIndex.open(transcript, sidecar) as index:
+            assert _numbers(index.lines(0, 5)) == [7]
+
+    def test_unwritable_sidecar_falls_back_to_memory(self, transcript, tmp_path):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        with LineIndex.open(transcript, blocker / "s.idx") as index:
+            assert len(index) == 10
+            assert _numbers(index.lines(3, 4)) == [3]
+
+
+class TestPruneSidecars:
+    def test_sidecar_of_deleted_transcript_is_pruned(self, transcript, tmp_path):
+        index_dir = tmp_path / "index"
+        kept = tmp_path / "kept.jsonl"
+        _write(kept, '{"n": 0}')
+        LineIndex.open(transcript, index_dir / "gone.idx").close()
+        LineIndex.open(kept, index_dir / "kept.idx").close()
+        transcript.unlink()
+
+        assert line_index.prune_sidecars(index_dir) == 1
+        assert sorted(p.name for p in index_dir.iterdir()) == ["kept.idx", "kept.src"]
+
+    def test_sidecar_without_source_record_is_pruned(self, transcript, sidecar):
+        LineIndex.open(transcript, sidecar).close()
+        sidecar.with_suffix(".src").unlink()
+
+        assert line_index.prune_sidecars(sidecar.parent) == 1
+        assert not sidecar.exists()
+
+    def test_stale_temp_files_are_removed(self, tmp_path):
+        index_dir = tmp_path / "index"
+        index_dir.mkdir()
+        stale = index_dir / "abc.tmp1.2"
+        fresh = index_dir / "def.tmp1.2"
+        stale.write_bytes(b"")
+        fresh.write_bytes(b"")
+        old = os.stat(stale).st_mtime - 2 * line_index._STALE_TMP_S
+        os.utime(stale, (old, old))
+
+        line_index.prune_sidecars(index_dir)
+
+        assert not stale.exists()
+        assert fresh.exists()
+
+    def test_lock_pool_is_bounded(self):
+        locks = {id(line_index._lock_for(f"/t/{i}.idx")) for i in range(1000)}
+        assert len(locks) <= line_index._LOCK_STRIPES
+        assert line_index._lock_for("/t/x.idx") is line_index._lock_for("/t/x.idx")
@@ -0,0 +1,176 @@
+"""Tests for the persistent session metadata catalog."""
+
+import json
+import os
+
+import pytest
+
+from spellbook.sessions.catalog import SessionCatalog, SessionStats
+
+
+def _line(obj) -> str:
+    return json.dumps(obj) + "\n"
+
+
+def _user(text, ts="2026-01-01T10:00:00Z", **extra) -> dict:
+    return {"type": "user", "timestamp": ts, "message": {"content": text}, **extra}
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    c = SessionCatalog(tmp_path / "catalog.db")
+    yield c
+    c.close()
+
+
+@pytest.fixture
+def project(tmp_path):
+    d = tmp_path / "projects" / "Users-me-proj"
+    d.mkdir(parents=True)
+    return d
+
+
+def _stats(catalog, project, **kwargs):
+    catalog.sync_directory(project)
+    entries, _ = catalog.query([project], **kwargs)
+    return {e.session_id: e.stats for e in entries}
+
+
+class TestSessionStats:
+    def test_matches_both_historical_scanners(self):
+        stats = SessionStats()
+        for entry in [
+            {"slug": "first-slug", "type": "user", "timestamp": "t1",
+             "message": {"content": [{"type": "image"}, {"type": "text", "text": "hello"}]}},
+            {"type": "system", "subtype": "compact_boundary"},
+            {"isCompactSummary": True, "message": {"content": "summary"}},
+            {"slug": "last-slug", "type": "assistant", "timestamp": "t2",
+             "message": {"content": "x" * 600}},
+            {"type": "custom-title", "customTitle": "Renamed"},
+        ]:
+            stats.feed_line(json.dumps(entry).encode())
+
+        assert stats.first_slug == "first-slug"
+        assert stats.last_slug == "last-slug"
+        assert stats.first_user_message == "hello"
+        assert stats.first_user_sample.startswith("[{'type': 'image'}")
+        assert (stats.created_at, stats.last_activity) == ("t1", "t2")
+        assert (stats.compact_count, stats.last_compact_line) == (1, 1)
+        assert stats.last_compact_summary == "summary"
+        assert stats.custom_title == stats.any_custom_title == "Renamed"
+        assert stats.recent[3] == "x" * 500
+        assert stats.message_count == 5
+
+    def test_malformed_lines_are_counted_not_fatal(self):
+        stats = SessionStats()
+        for raw in (b"not json", b"[1, 2]", b"   ", b'{"type": "user"}'):
+            stats.feed_line(raw)
+        assert (stats.message_count, stats.parse_errors) == (1, 2)
+
+
+class TestSessionCatalog:
+    def test_appended_bytes_are_parsed_incrementally(self, catalog, project, monkeypatch):
+        path = project / "s.jsonl"
+        path.write_text(_line(_user("first")) + _line(_user("second", ts="t9")))
+        assert _stats(catalog, project)["s"].message_count == 2
+
+        fed = []
+        original = SessionStats.feed_line
+        monkeypatch.setattr(
+            SessionStats, "feed_line",
+            lambda self, line: (fed.append(line), original(self, line))[1],
+        )
+        with open(path, "a") as f:
+            f.write(_line(_user("third", ts="t99")))
+
+        stats = _stats(catalog, project)["s"]
+        assert [json.loads(line)["message"]["content"] for line in fed if line] == ["third"]
+        assert (stats.message_count, stats.first_user_message) == (3, "first")
+        assert stats.last_activity == "t99"
+
+    def test_unchanged_files_are_not_reread(self, catalog, project, monkeypatch):
+        (project / "s.jsonl").write_text(_line(_user("hi")))
+        catalog.sync_directory(project)
+        monkeypatch.setattr(
+            "spellbook.sessions.catalog._read_appended",
+            lambda *a: pytest.fail("unchanged file was re-read"),
+        )
+        assert _stats(catalog, project)["s"].message_count == 1
+
+    def test_rewritten_file_is_reparsed_from_start(self, catalog, project):
+        path = project / "s.jsonl"
+        path.write_text(_line(_user("old")) + _line(_user("old2")))
+        catalog.sync_directory(project)
+
+        path.write_text(_line(_user("new")) + _line(_user("new2")) + _line(_user("new3")))
+        stats = _stats(catalog, project)["s"]
+        assert (stats.message_count, stats.first_user_message) == (3, "new")
+
+        replacement = project / "s.tmp"
+        replacement.write_text(_line(_user("rotated")))
+        os.replace(replacement, path)
+        stats = _stats(catalog, project)["s"]
+        assert (stats.message_count, stats.first_user_message) == (1, "rotated")
+
+    def test_unterminated_tail_is_visible_but_not_committed(self, catalog, project):
+        path = project / "s.jsonl"
+        path.write_text(_line(_user("a")) + json.dumps(_user("b")))
+        assert _stats(catalog, project)["s"].message_count == 2
+
+        with open(path, "a") as f:
+            f.write("\n" + _line(_user("c")))
+        assert _stats(catalog, project)["s"].message_count == 3
+
+    def test_deleted_files_are_dropped(self, catalog, project):
+        (project / "a.jsonl").write_text(_line(_user("a")))
+        (project / "b.jsonl").write_text(_line(_user("b")))
+        assert set(_stats(catalog, project)) == {"a", "b"}
+        (project / "a.jsonl").unlink()
+        assert set(_stats(catalog, project)) == {"b"}
+
+    def test_search_sort_and_pagination(self, catalog, project):
+        for i, text in enumerate(["Fix auth bug", "Add docs", "auth refactor"]):
+            (project / f"s{i}.jsonl").write_text(_line(_user(text, ts=f"2026-01-0{i + 1}")))
+        catalog.sync_directory(project)
+
+        entries, total = catalog.query([project], search="AUTH")
+        assert total == 2
+        assert [e.session_id for e in entries] == ["s2", "s0"]
+
+        entries, total = catalog.query(
+            [project], sort="created_at", descending=False, limit=1, offset=1,
+        )
+        assert total == 3
+        assert [e.session_id for e in entries] == ["s1"]
+
+    def test_parsed_only_excludes_malformed_and_empty(self, catalog, project):
+        (project / "good.jsonl").write_text(_line(_user("ok")))
+        (project / "bad.jsonl").write_text(_line(_user("ok")) + "{broken\n")
+        (project / "blank.jsonl").write_text("\n\n")
+        catalog.sync_directory(project)
+
+        entries, _ = catalog.query([project], parsed_only=True)
+        assert [e.session_id for e in entries] == ["good"]
+        _, total = catalog.query([project])
+        assert total == 3
+
+    def test_catalog_persists_across_instances(self, tmp_path, project):
+        (project / "s.jsonl").write_text(_line(_user("hi")))
+        first = SessionCatalog(tmp_path / "catalog.db")
+        first.sync_directory(project)
+        first.close()
+
+        second = SessionCatalog(tmp_path / "catalog.db")
+        try:
+            entries, _ = second.query([project])
+            assert entries[0].stats.first_user_message == "hi"
+        finally:
+            second.close()
+
+    def test_missing_project_directories_are_pruned(self, catalog, project):
+        (project / "s.jsonl").write_text(_line(_user("hi")))
+        catalog.sync_directory(project)
+        (project / "s.jsonl").unlink()
+        project.rmdir()
+        assert catalog.prune_missing_directories(force=True) == 1
+        assert catalog.query([project]) == ([], 0)
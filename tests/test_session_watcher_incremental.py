@@ -0,0 +1,195 @@
+"""Tests for incremental (tail-reading) session analysis in SessionWatcher."""
+
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from spellbook.sessions.watcher import (
+    SessionSkillState,
+    SessionWatcher,
+    read_appended_messages,
+)
+
+
+def _line(obj) -> str:
+    return json.dumps(obj) + "\n"
+
+
+def _skill(name: str) -> dict:
+    return {
+        "type": "assistant",
+        "timestamp": "2026-01-26T10:00:00",
+        "message": {
+            "content": [{"type": "tool_use", "name": "Skill", "input": {"skill": name}}],
+            "usage": {"output_tokens": 10},
+        },
+    }
+
+
+class TestReadAppendedMessages:
+    def test_reads_only_new_lines(self, tmp_path):
+        path = tmp_path / "s.jsonl"
+        path.write_text(_line({"n": 1}) + _line({"n": 2}))
+        state = SessionSkillState(session_id="s")
+
+        assert read_appended_messages(path, state) == [{"n": 1}, {"n": 2}]
+        assert read_appended_messages(path, state) is None
+
+        with open(path, "a") as f:
+            f.write(_line({"n": 3}))
+        assert read_appended_messages(path, state) == [{"n": 3}]
+        assert state.offset == path.stat().st_size
+
+    def test_partial_trailing_line_waits_for_newline(self, tmp_path):
+        path = tmp_path / "s.jsonl"
+        path.write_text(_line({"n": 1}) + '{"n": ')
+        state = SessionSkillState(session_id="s")
+
+        assert read_appended_messages(path, state) == [{"n": 1}]
+        with open(path, "a") as f:
+            f.write("2}\n")
+        assert read_appended_messages(path, state) == [{"n": 2}]
+
+    def test_skips_blank_and_malformed_lines(self, tmp_path):
+        path = tmp_path / "s.jsonl"
+        path.write_text(_line({"n": 1}) + "\n" + "not json\n" + _line({"n": 2}))
+        state = SessionSkillState(session_id="s")
+        assert read_appended_messages(path, state) == [{"n": 1}, {"n": 2}]
+
+    def test_truncation_rereads_from_start(self, tmp_path):
+        path = tmp_path / "s.jsonl"
+        path.write_text(_line({"n": 1}) + _line({"n": 2}))
+        state = SessionSkillState(session_id="s")
+        read_appended_messages(path, state)
+        state.known_invocations.add("x:1")
+
+        path.write_text(_line({"n": 9}))
+        assert read_appended_messages(path, state) == [{"n": 9}]
+        assert state.known_invocations == set()
+
+    def test_rotation_rereads_replacement_file(self, tmp_path):
+        path = tmp_path / "s.jsonl"
+        path.write_text(_line({"n": 1}))
+        state = SessionSkillState(session_id="s")
+        read_appended_messages(path, state)
+
+        replacement = tmp_path / "s.jsonl.new"
+        replacement.write_text(_line({"n": 1}) + _line({"n": 2}) + _line({"n": 3}))
+        os.replace(replacement, path)
+        assert read_appended_messages(path, state) == [{"n": 1}, {"n": 2}, {"n": 3}]
+
+
+class TestIncrementalAnalyzeSkills:
+    @pytest.fixture
+    def watcher(self, tmp_path, monkeypatch):
+        from spellbook.core.db import init_db
+
+        db_path = tmp_path / "test.db"
+        init_db(str(db_path))
+        session_file = tmp_path / "sess.jsonl"
+        session_file.write_text("")
+        monkeypatch.setattr(
+            "spellbook.sessions.compaction._get_current_session_file",
+            lambda project_path: session_file,
+        )
+        w = SessionWatcher(str(db_path), project_path=str(tmp_path / "project"))
+        w.session_file = session_file
+        return w
+
+    def _append(self, watcher, *messages):
+        with open(watcher.session_file, "a") as f:
+            for m in messages:
+                f.write(_line(m))
+        # Force a visible mtime change even on coarse-grained filesystems.
+        st = watcher.session_file.stat()
+        os.utime(watcher.session_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    def _outcomes(self, watcher):
+        from spellbook.core.db import get_connection
+
+        conn = get_connection(watcher.db_path)
+        return conn.execute(
+            "SELECT skill_name, outcome, tokens_used FROM skill_outcomes ORDER BY id"
+        ).fetchall()
+
+    def test_each_poll_parses_only_appended_lines(self, watcher, monkeypatch):
+        fed = []
+        from spellbook.sessions import skill_analyzer
+
+        original_feed = skill_analyzer.SkillInvocationExtractor.feed
+
+        def spy_feed(self, messages):
+            fed.append(len(messages))
+            return original_feed(self, messages)
+
+        monkeypatch.setattr(skill_analyzer.SkillInvocationExtractor, "feed", spy_feed)
+
+        self._append(watcher, _skill("debugging"), {"type": "assistant", "message": {}})
+        watcher._analyze_skills()
+        self._append(watcher, _skill("tdd"))
+        watcher._analyze_skills()
+
+        assert fed == [2, 1]
+        state = watcher._skill_states["sess"]
+        assert state.last_message_idx == 3
+        assert self._outcomes(watcher) == [
+            ("debugging", "superseded", 10),
+            ("tdd", "completed", 10),
+        ]
+
+    def test_truncated_session_is_reanalyzed(self, watcher):
+        self._append(watcher, _skill("debugging"), _skill("tdd"))
+        watcher._analyze_skills()
+
+        watcher.session_file.write_text("")
+        self._append(watcher, _skill("brainstorming"))
+        watcher._analyze_skills()
+
+        state = watcher._skill_states["sess"]
+        assert state.last_message_idx == 1
+        assert state.known_invocations == {"brainstorming:0"}
+
+
+def test_session_write_wakes_watcher_with_changed_file(tmp_path, monkeypatch):
+    from spellbook.core import file_watch
+    from spellbook.core.db import init_db
+
+    session_dir = tmp_path / "projects" / "proj"
+    session_dir.mkdir(parents=True)
+    monkeypatch.setattr(
+        "spellbook.sessions.compaction._get_claude_session_dir",
+        lambda project_path: session_dir,
+    )
+    service = file_watch.FileWatchService(poll_interval=0.05, use_inotify=False)
+    monkeypatch.setattr(file_watch, "get_file_watch_service", lambda poll_interval: service)
+    service.start()
+
+    db_path = tmp_path / "test.db"
+    init_db(str(db_path))
+    w = SessionWatcher(str(db_path), project_path=str(tmp_path))
+    passes = []
+    woke = threading.Event()
+
+    def record_pass():
+        passes.append(w._changed_file)
+        woke.set()
+
+    monkeypatch.setattr(w, "_poll_sessions", record_pass)
+    w.start()
+    try:
+        assert woke.wait(5.0)
+        woke.clear()
+        (session_dir / "s.jsonl").write_text("{}\n")
+        start = time.monotonic()
+        assert woke.wait(5.0)
+        # Well under IDLE_WAKE_INTERVAL_SECONDS: the write woke the loop.
+        assert time.monotonic() - start < 2.0
+        assert passes[-1] == session_dir / "s.jsonl"
+    finally:
+        w.stop()
+        w.join(timeout=2.0)
+        service.stop()
+    assert service._subs == {}
@@ -706,3 +706,65 @@ class TestAnonymizeForTelemetry:
         assert agg.duration_bucket == "1-5m"
         assert agg.token_bucket == "1-5k"
         assert agg.count == 5
+
+
+class TestSkillInvocationExtractor:
+    """Resumable extraction must match one-shot extraction at every split."""
+
+    MESSAGES = [
+        {"type": "user", "message": {"role": "user", "content": "start"}},
+        {
+            "type": "assistant",
+            "timestamp": "2026-01-01T00:00:00",
+            "message": {
+                "content": [{"type": "tool_use", "name": "Skill", "input": {"skill": "debugging"}}],
+                "usage": {"output_tokens": 10},
+            },
+        },
+        {"type": "user", "message": {"role": "user", "content": "no, that's wrong"}},
+        {"type": "assistant", "message": {"content": [], "usage": {"output_tokens": 5}}},
+        {
+            "type": "assistant",
+            "message": {
+                "content": [{"type": "tool_use", "name": "Skill", "input": {"skill": "debugging"}}],
+            },
+        },
+        {"type": "system", "subtype": "compact_boundary"},
+        {
+            "type": "assistant",
+            "message": {
+                "content": [
+                    {"type": "tool_use", "name": "Skill", "input": {"skill": "tdd", "args": "[v2]"}}
+                ],
+                "usage": {"output_tokens": 7},
+            },
+        },
+        {"type": "assistant", "message": {"content": [], "usage": {"output_tokens": 3}}},
+    ]
+
+    def test_matches_one_shot_extraction_for_every_split(self):
+        from spellbook.sessions.skill_analyzer import SkillInvocationExtractor
+
+        for split in range(len(self.MESSAGES) + 1):
+            extractor = SkillInvocationExtractor("s.jsonl")
+            extractor.feed(self.MESSAGES[:split])
+            assert extractor.snapshot() == extract_skill_invocations(
+                self.MESSAGES[:split], "s.jsonl"
+            )
+            extractor.feed(self.MESSAGES[split:])
+            assert extractor.snapshot() == extract_skill_invocations(
+                self.MESSAGES, "s.jsonl"
+            )
+            assert extractor.message_count == len(self.MESSAGES)
+
+    def test_snapshot_is_not_mutated_by_later_feeds(self):
+        from spellbook.sessions.skill_analyzer import SkillInvocationExtractor
+
+        extractor = SkillInvocationExtractor()
+        extractor.feed(self.MESSAGES[:2])
+        first = extractor.snapshot()
+        assert [(i.skill, i.end_idx, i.completed) for i in first] == [("debugging", 2, True)]
+
+        extractor.feed(self.MESSAGES[2:5])
+        assert [(i.skill, i.end_idx, i.completed) for i in first] == [("debugging", 2, True)]
+        assert extractor.snapshot()[0].superseded is True
@@ -1131,11 +1131,16 @@ def _watch_env_no_fswatch(tmp_path: Path) -> dict:
 def _spawn_watch_no_fswatch(
     tmp_path: Path, name: str, max_elapsed: float
 ) -> subprocess.Popen:
-    """Like _spawn_watch but with PATH stripped of fswatch."""
+    """Like _spawn_watch but with PATH stripped of fswatch.
+
+    ``--backend fswatch`` skips the inotify wake source (preferred on Linux)
+    so the fswatch-absent polling fallback is exercised on every host.
+    """
     return subprocess.Popen(
         [
             sys.executable, str(HELPER_PATH),
             "watch", name, "--max-elapsed", str(max_elapsed),
+            "--backend", "fswatch",
         ],
         env=_watch_env_no_fswatch(tmp_path),
         stdout=subprocess.PIPE,
@@ -1245,6 +1250,82 @@ def test_watch_polling_path_when_no_fswatch(tmp_path):
     )
 
 
+_INOTIFY_SKIP = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+)
+
+
+@_INOTIFY_SKIP
+def test_watch_inotify_wakes_without_polling(tmp_path):
+    """inotify path (default backend on Linux): a message dropped after 0.5s
+    is claimed well before the 5s polling backstop, and no fallback notice is
+    logged."""
+    _open_inbox(tmp_path, "alice")
+    proc = _spawn_watch(tmp_path, "alice", max_elapsed=20.0)
+    try:
+        time.sleep(0.5)
+        started = time.monotonic()
+        _drop_inbox_message(tmp_path, "alice", "msg-inotify-0001")
+        rc, stdout, stderr = _wait_proc(proc, paranoia_timeout=3.0)
+        latency = time.monotonic() - started
+    finally:
+        if proc.poll() is None:
+            proc.terminate()
+            proc.wait(timeout=2.0)
+
+    assert rc == 0, f"stderr={stderr!r} stdout={stdout!r}"
+    assert re.match(r"^PENDING_BATCH (\S+) count=1$", stdout.strip()), stdout
+    assert latency < 2.0, f"woke after {latency:.2f}s; inotify not in use?"
+    assert "watch: fswatch unavailable, polling-only" not in stderr.splitlines()
+
+
+@_INOTIFY_SKIP
+def test_watch_inotify_rearms_after_inbox_replaced(tmp_path):
+    """Replacing the inbox directory kills the kernel watch; the watcher
+    re-arms on the new inbox instead of idling at the 5s backstop."""
+    _open_inbox(tmp_path, "alice")
+    proc = _spawn_watch(tmp_path, "alice", max_elapsed=20.0)
+    inbox = tmp_path / "alice" / "inbox"
+    try:
+        time.sleep(0.5)
+        inbox.rename(tmp_path / "alice" / "inbox.old")
+        inbox.mkdir()
+        time.sleep(0.5)
+        started = time.monotonic()
+        _drop_inbox_message(tmp_path, "alice", "msg-rearm-0001")
+        rc, stdout, stderr = _wait_proc(proc, paranoia_timeout=8.0)
+        latency = time.monotonic() - started
+    finally:
+        if proc.poll() is None:
+            proc.terminate()
+            proc.wait(timeout=2.0)
+
+    assert rc == 0, f"stderr={stderr!r} stdout={stdout!r}"
+    assert re.match(r"^PENDING_BATCH (\S+) count=1$", stdout.strip()), stdout
+    assert latency < 2.0, f"woke after {latency:.2f}s; watch not re-armed?"
+
+
+@_INOTIFY_SKIP
+def test_watch_inotify_ignores_dotfile_events(tmp_path):
+    """Dotfile writes wake the inotify fd but are filtered before any rescan;
+    the watcher runs out its budget with WATCH_RECYCLE."""
+    _open_inbox(tmp_path, "alice")
+    proc = _spawn_watch(tmp_path, "alice", max_elapsed=2.0)
+    try:
+        time.sleep(0.4)
+        (tmp_path / "alice" / "inbox" / ".tmp-spurious.json").write_text(
+            "ignore-me", encoding="utf-8"
+        )
+        rc, stdout, stderr = _wait_proc(proc, paranoia_timeout=2.0 + 5)
+    finally:
+        if proc.poll() is None:
+            proc.terminate()
+            proc.wait(timeout=2.0)
+
+    assert rc == 0, f"stderr={stderr!r}"
+    assert stdout.strip() == "WATCH_RECYCLE elapsed=2s", stdout
+
+
 @pytest.mark.skipif(not _fswatch_available(), reason="fswatch not on PATH")
 def test_watch_recovers_from_spurious_fswatch_event(tmp_path):
     """fswatch fires for a dotfile: _list_inbox filters it; watcher must NOT
@@ -4,6 +4,8 @@ import json
 import logging
 from pathlib import Path
 
+import pytest
+
 
 class TestConfigGet:
     """Tests for config_get function."""
@@ -79,6 +81,72 @@ class TestConfigGet:
         assert result is None
 
 
+class TestConfigSnapshot:
+    """Tests for the in-memory config snapshot behind config_get."""
+
+    @pytest.fixture
+    def config_path(self, tmp_path, monkeypatch):
+        config_path = tmp_path / "spellbook.json"
+        config_path.write_text('{"theme": "dark", "tags": ["a"]}')
+        monkeypatch.setattr("spellbook.core.config.get_config_path", lambda: config_path)
+        return config_path
+
+    def test_unchanged_file_is_parsed_once(self, config_path, monkeypatch):
+        """Repeated lookups must not re-read an unchanged file."""
+        from spellbook.core import config
+
+        config.config_get("theme")
+        reads = []
+        real_read = config._read_config_file
+        monkeypatch.setattr(
+            config, "_read_config_file", lambda path: reads.append(path) or real_read(path),
+        )
+
+        for _ in range(5):
+            assert config.config_get("theme") == "dark"
+        assert reads == []
+
+    def test_external_write_is_picked_up(self, config_path):
+        """A replaced file must be reloaded and bump the generation."""
+        from spellbook.core.config import config_generation, config_get
+
+        assert config_get("theme") == "dark"
+        generation = config_generation()
+
+        tmp = config_path.with_suffix(".tmp")
+        tmp.write_text('{"theme": "lite", "tags": ["a"]}')
+        tmp.replace(config_path)
+
+        assert config_get("theme") == "lite"
+        assert config_generation() == generation + 1
+
+    def test_config_set_is_visible_immediately(self, config_path, monkeypatch):
+        from spellbook.core.config import config_get, config_set
+
+        monkeypatch.setattr(
+            "spellbook.core.config.CONFIG_LOCK_PATH", config_path.parent / "config.lock",
+        )
+        assert config_get("theme") == "dark"
+        config_set("theme", "lite")
+        assert config_get("theme") == "lite"
+
+    def test_config_get_many(self, config_path):
+        from spellbook.core.config import CONFIG_DEFAULTS, config_get_many
+
+        assert config_get_many(["theme", "missing", "worker_llm_timeout_s"]) == {
+            "theme": "dark",
+            "missing": None,
+            "worker_llm_timeout_s": CONFIG_DEFAULTS["worker_llm_timeout_s"],
+        }
+
+    def test_returned_containers_are_copies(self, config_path):
+        """Mutating a returned list must not leak into later lookups."""
+        from spellbook.core.config import config_get
+
+        config_get("tags").append("b")
+        assert config_get("tags") == ["a"]
+
+
 class TestConfigSet:
     """Tests for config_set function."""
 
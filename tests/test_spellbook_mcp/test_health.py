@@ -2,6 +2,7 @@
 
 import sqlite3
 import subprocess
+import time
 
 
 
@@ -1227,4 +1228,106 @@ class TestRunHealthCheck:
         # Full mode includes all domains
         assert result.domains is not None
         assert "watcher" in result.domains
-        assert "skills" in result.domains
\ No newline at end of file
+        assert "skills" in result.domains
+
+class TestConcurrentDomainChecks:
+    """Domains run concurrently, each under its own deadline."""
+
+    def _dirs(self, tmp_path):
+        from spellbook.core.db import init_db
+
+        for name in ("config", "data", "skills"):
+            (tmp_path / name).mkdir()
+        db_path = tmp_path / "test.db"
+        init_db(str(db_path))
+        return {
+            "db_path": str(db_path),
+            "config_dir": str(tmp_path / "config"),
+            "data_dir": str(tmp_path / "data"),
+            "skills_dir": str(tmp_path / "skills"),
+            "server_uptime": 60.0,
+            "version": "0.9.6",
+            "tools_available": [],
+        }
+
+    def _slow(self, domain, seconds, calls=None):
+        from spellbook.health.checker import DomainCheck, HealthStatus
+
+        def check(*args):
+            if calls is not None:
+                calls.append(domain)
+            time.sleep(seconds)
+            return DomainCheck(domain=domain, status=HealthStatus.HEALTHY, message="ok")
+
+        return check
+
+    def test_slow_domains_run_concurrently(self, tmp_path, monkeypatch):
+        from spellbook.health import checker
+
+        monkeypatch.setattr(checker, "_check_github_cli", self._slow("github_cli", 0.4))
+        monkeypatch.setattr(checker, "_check_skills", self._slow("skills", 0.4))
+        monkeypatch.setattr(checker, "_check_coordination", self._slow("coordination", 0.4))
+
+        start = time.perf_counter()
+        result = checker.run_health_check(**self._dirs(tmp_path))
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.0
+        assert list(result.domains) == [
+            "database", "filesystem", "watcher", "github_cli", "coordination", "skills",
+        ]
+        assert all(d.stale_after for d in result.domains.values())
+
+    def test_domain_past_its_timeout_is_degraded(self, tmp_path, monkeypatch):
+        from spellbook.health import checker
+        from spellbook.health.checker import HealthStatus
+
+        monkeypatch.setattr(checker, "_check_skills", self._slow("skills", 0.5))
+        monkeypatch.setitem(checker.DOMAIN_TIMEOUT_SECONDS, "skills", 0.05)
+        monkeypatch.setattr(checker, "_check_github_cli", self._slow("github_cli", 0))
+
+        result = checker.run_health_check(**self._dirs(tmp_path))
+
+        skills = result.domains["skills"]
+        assert skills.status == HealthStatus.DEGRADED
+        assert "timed out" in skills.message
+        assert result.status == HealthStatus.DEGRADED
+
+    def test_cache_serves_fresh_results_without_rechecking(self, tmp_path, monkeypatch):
+        from spellbook.health import checker
+
+        calls = []
+        monkeypatch.setattr(checker, "_check_github_cli", self._slow("github_cli", 0, calls))
+        cache = checker.HealthCache()
+        args = self._dirs(tmp_path)
+
+        first = checker.run_health_check(**args, cache=cache)
+        second = checker.run_health_check(**args, cache=cache)
+
+        assert calls == ["github_cli"]
+        assert second.domains["github_cli"] is first.domains["github_cli"]
+
+    def test_cache_returns_stale_result_and_refreshes_in_background(
+        self, tmp_path, monkeypatch
+    ):
+        from spellbook.health import checker
+
+        calls = []
+        monkeypatch.setattr(checker, "_check_github_cli", self._slow("github_cli", 0.3, calls))
+        monkeypatch.setitem(checker.DOMAIN_TTL_SECONDS, "github_cli", 0.01)
+        cache = checker.HealthCache()
+        args = self._dirs(tmp_path)
+
+        first = checker.run_health_check(**args, cache=cache)
+        time.sleep(0.05)
+        start = time.perf_counter()
+        stale = checker.run_health_check(**args, cache=cache)
+        assert time.perf_counter() - start < 0.2
+        assert stale.domains["github_cli"] is first.domains["github_cli"]
+
+        deadline = time.monotonic() + 5
+        while len(calls) < 2 or cache._refreshing:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        refreshed = checker.run_health_check(**args, cache=cache)
+        assert refreshed.domains["github_cli"] is not first.domains["github_cli"]
@@ -8,6 +8,8 @@ Fixtures:
   (``url``, ``content``, ``read()``) so existing tests can introspect bodies.
 - ``worker_llm_config``: Patches ``spellbook.core.config.config_get`` to return
   a fixed dict of worker_llm settings so tests never touch the user config.
+- ``isolated_safety_cache`` (autouse): Points the tool_safety verdict cache at
+  a per-test SQLite file so tests never touch the user's cache.
 
 Script item contract (unchanged; binding on every consumer):
 
@@ -295,3 +297,22 @@ def worker_llm_config(monkeypatch):
     # reference that must be patched separately.
     monkeypatch.setattr(_wl_cfg, "config_get", fake)
     return overrides
+
+
+@pytest.fixture(autouse=True)
+def isolated_safety_cache(tmp_path, monkeypatch):
+    """Point ``safety_cache.CACHE_PATH`` at a per-test SQLite file.
+
+    Any path through ``tool_safety`` reads and writes the verdict cache;
+    without this, tests would write to the user's real
+    ``~/.local/spellbook/cache/worker_llm_safety.db``. Autouse so the
+    connection is opened before ``worker_llm_transport`` enters the
+    tripwire sandbox, whose database plugin rejects real
+    ``sqlite3.connect`` calls.
+    """
+    from spellbook.worker_llm import safety_cache
+
+    monkeypatch.setattr(safety_cache, "CACHE_PATH", tmp_path / "worker_llm_safety.db")
+    safety_cache.cache_stats()
+    yield safety_cache
+    safety_cache.close_cache()
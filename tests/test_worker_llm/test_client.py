@@ -302,6 +302,7 @@ def test_call_sync_runs_asyncio(monkeypatch):
                 "timeout_s": 3.0,
                 "task": "t",
                 "override_loaded": True,
+                "stop_when": None,
             },
         )
     ]
@@ -352,6 +353,100 @@ async def test_call_sync_from_running_loop_does_not_raise(monkeypatch):
                 "timeout_s": None,
                 "task": "t_running_loop",
                 "override_loaded": False,
+                "stop_when": None,
             },
         )
     ]
+
+
+# ---------------------------------------------------------------------------
+# Streaming (SSE)
+# ---------------------------------------------------------------------------
+
+
+def _sse(*deltas: str, done: bool = True) -> str:
+    import json
+
+    lines = [
+        "data: " + json.dumps({"choices": [{"delta": {"role": "assistant"}}]}),
+        "",
+    ]
+    for d in deltas:
+        lines += ["data: " + json.dumps({"choices": [{"delta": {"content": d}}]}), ""]
+    if done:
+        lines += ["data: [DONE]", ""]
+    return "\n".join(lines)
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_deltas_and_sends_stream_true(
+    worker_llm_transport, worker_llm_config, monkeypatch
+):
+    import json
+
+    calls: list = []
+    monkeypatch.setattr(
+        "spellbook.worker_llm.client.publish_call",
+        lambda **kw: calls.append(kw),
+    )
+    requests = worker_llm_transport([_script(body=_sse("hel", "lo"))])
+
+    deltas = [d async for d in client.stream("sys", "usr", task="test")]
+
+    assert deltas == ["hel", "lo"]
+    assert json.loads(requests[0].read())["stream"] is True
+    assert len(calls) == 1
+    assert calls[0]["status"] == "success"
+    assert calls[0]["response_len"] == len("hello")
+
+
+@pytest.mark.asyncio
+async def test_call_stop_when_returns_prefix(
+    worker_llm_transport, worker_llm_config, monkeypatch
+):
+    calls: list = []
+    monkeypatch.setattr(
+        "spellbook.worker_llm.client.publish_call",
+        lambda **kw: calls.append(kw),
+    )
+    worker_llm_transport([_script(body=_sse("a", "b", "c", "d"))])
+
+    out = await client.call("sys", "usr", task="test", stop_when=lambda t: "b" in t)
+
+    assert out == "ab"
+    assert calls[0]["status"] == "success"
+    assert calls[0]["response_len"] == 2
+
+
+@pytest.mark.asyncio
+async def test_call_stop_when_never_true_returns_full_text(
+    worker_llm_transport, worker_llm_config
+):
+    worker_llm_transport([_script(body=_sse("a", "b", done=False))])
+    out = await client.call("sys", "usr", stop_when=lambda t: False)
+    assert out == "ab"
+
+
+@pytest.mark.asyncio
+async def test_stream_malformed_chunk_raises_bad_response(
+    worker_llm_transport, worker_llm_config
+):
+    worker_llm_transport([_script(body="data: {not json}\n\n")])
+    with pytest.raises(WorkerLLMBadResponse):
+        await client.call("sys", "usr", stop_when=lambda t: False)
+
+
+@pytest.mark.asyncio
+async def test_stream_5xx_raises_unreachable(worker_llm_transport, worker_llm_config):
+    worker_llm_transport([_script(status=503, body="overloaded")])
+    with pytest.raises(WorkerLLMUnreachable):
+        await client.call("sys", "usr", stop_when=lambda t: False)
+
+
+@pytest.mark.asyncio
+async def test_stream_timeout_maps_to_worker_timeout(
+    worker_llm_transport, worker_llm_config
+):
+    worker_llm_transport([_script(raise_on_send=httpx.ReadTimeout("slow"))])
+    with pytest.raises(WorkerLLMTimeout):
+        await client.call("sys", "usr", stop_when=lambda t: False)
@@ -9,11 +9,11 @@ from spellbook.worker_llm import config as wl_config
 
 # ``get_worker_config()`` issues one ``config_get`` per key, plus one extra
 # read for the single conditional key (``allow_prompt_overrides``) when it is
-# set to a concrete value. An empty config therefore produces 10 reads; a
-# fully populated config produces 11. Tests below pass the appropriate count
+# set to a concrete value. An empty config therefore produces 13 reads; a
+# fully populated config produces 14. Tests below pass the appropriate count
 # so tripwire's strict interaction tracking stays in balance.
-_CALLS_EMPTY = 10
-_CALLS_FULL = 11
+_CALLS_EMPTY = 13
+_CALLS_FULL = 14
 
 
 def _mock_config_get(values: dict, expected_calls: int):
@@ -65,6 +65,9 @@ def test_configured_reads_all_keys():
         "worker_llm_feature_tool_safety": True,
         "worker_llm_feature_roundtable": False,
         "worker_llm_safety_cache_ttl_s": 600,
+        "worker_llm_response_cache_ttl_s": 30,
+        "worker_llm_response_cache_max_entries": 64,
+        "worker_llm_response_cache_max_bytes": 4096,
     }
     mock = _mock_config_get(vals, _CALLS_FULL)
     with tripwire:
@@ -79,6 +82,9 @@ def test_configured_reads_all_keys():
         assert cfg.feature_tool_safety is True
         assert cfg.feature_roundtable is False
         assert cfg.safety_cache_ttl_s == 600
+        assert cfg.response_cache_ttl_s == 30.0
+        assert cfg.response_cache_max_entries == 64
+        assert cfg.response_cache_max_bytes == 4096
         assert wl_config.is_configured(cfg) is True
     _assert_config_get_calls(mock, _CALLS_FULL)
 
@@ -94,6 +100,9 @@ def test_defaults_when_keys_absent():
         assert cfg.feature_roundtable is False
         assert cfg.feature_tool_safety is False
         assert cfg.safety_cache_ttl_s == 300
+        assert cfg.response_cache_ttl_s == 0.0
+        assert cfg.response_cache_max_entries == 256
+        assert cfg.response_cache_max_bytes == 1048576
     _assert_config_get_calls(mock, _CALLS_EMPTY)
 
 
@@ -5,6 +5,8 @@ same values so ``config_get`` returns the documented defaults when a key is
 absent from the user's ``spellbook.json``.
 """
 
+import pytest
+
 from spellbook.admin.routes.config import (
     CONFIG_DEFAULTS,
     CONFIG_SCHEMA,
@@ -38,15 +40,18 @@ def test_all_core_worker_keys_in_admin_schema():
 def test_core_worker_entries_added():
     # Observability keys share the ``worker_llm_`` prefix but land under the
     # disjoint ``worker_llm_observability_`` namespace. The queue / warm-probe
-    # keys (``worker_llm_queue_*``, ``worker_llm_tool_safety_cold_threshold_s``)
-    # are a separate, newer cluster. Exclude both so this assertion stays
-    # scoped to the core worker_llm set (the memory-system keys were removed).
+    # keys (``worker_llm_queue_*``, ``worker_llm_tool_safety_cold_threshold_s``),
+    # the response-cache keys and the tool-safety stream flag are separate,
+    # newer clusters. Exclude them so this assertion stays scoped to the core
+    # worker_llm set (the memory-system keys were removed).
     schema_worker_keys = {
         e["key"]
         for e in CONFIG_SCHEMA
         if e["key"].startswith("worker_llm_")
         and not e["key"].startswith("worker_llm_observability_")
         and e["key"] not in QUEUE_KEYS
+        and e["key"] not in RESPONSE_CACHE_KEYS
+        and e["key"] != "worker_llm_tool_safety_stream"
     }
     assert schema_worker_keys == WORKER_KEYS
     assert len(schema_worker_keys) == 10
@@ -228,6 +233,9 @@ def test_observability_every_entry_has_required_fields():
 QUEUE_KEYS = {
     "worker_llm_queue_enabled",
     "worker_llm_queue_max_depth",
+    "worker_llm_queue_workers",
+    "worker_llm_queue_lanes",
+    "worker_llm_queue_task_concurrency",
     "worker_llm_tool_safety_cold_threshold_s",
 }
 
@@ -248,6 +256,51 @@ def test_queue_max_depth_schema():
     assert e["default"] == 256
 
 
+def test_queue_workers_schema():
+    e = _entry("worker_llm_queue_workers")
+    assert e["type"] == "number"
+    assert e["default"] == 1
+
+
+def test_queue_lanes_default_parses():
+    from spellbook.worker_llm.config import parse_queue_lanes
+
+    e = _entry("worker_llm_queue_lanes")
+    assert e["type"] == "string"
+    assert parse_queue_lanes(e["default"]) == {
+        "tool_safety": "interactive",
+        "tool_safety_warmup": "warmup",
+        "roundtable_voice": "background",
+    }
+
+
+def test_queue_task_concurrency_default_is_uncapped():
+    from spellbook.worker_llm.config import parse_queue_caps
+
+    e = _entry("worker_llm_queue_task_concurrency")
+    assert e["type"] == "string"
+    assert parse_queue_caps(e["default"]) == {}
+
+
+@pytest.mark.parametrize(
+    "raw",
+    ["tool_safety", "tool_safety=", "=interactive", "tool_safety=urgent"],
+)
+def test_parse_queue_lanes_rejects_malformed(raw):
+    from spellbook.worker_llm.config import parse_queue_lanes
+
+    with pytest.raises(ValueError):
+        parse_queue_lanes(raw)
+
+
+@pytest.mark.parametrize("raw", ["roundtable_voice=0", "roundtable_voice=two"])
+def test_parse_queue_caps_rejects_non_positive(raw):
+    from spellbook.worker_llm.config import parse_queue_caps
+
+    with pytest.raises(ValueError):
+        parse_queue_caps(raw)
+
+
 def test_tool_safety_cold_threshold_schema():
     e = _entry("worker_llm_tool_safety_cold_threshold_s")
     assert e["type"] == "number"
@@ -264,3 +317,32 @@ def test_queue_core_config_defaults_carry_all_keys():
 def test_queue_core_defaults_match_admin_schema_defaults():
     for k in QUEUE_KEYS:
         assert CORE_DEFAULTS[k] == _entry(k)["default"], k
+
+
+# ---------------------------------------------------------------------------
+# Response cache keys (opt-in; TTL 0 disables).
+# ---------------------------------------------------------------------------
+
+RESPONSE_CACHE_KEYS = {
+    "worker_llm_response_cache_ttl_s",
+    "worker_llm_response_cache_max_entries",
+    "worker_llm_response_cache_max_bytes",
+}
+
+
+def test_response_cache_keys_in_schema_and_core_defaults():
+    assert RESPONSE_CACHE_KEYS.issubset(KNOWN_KEYS)
+    for k in RESPONSE_CACHE_KEYS:
+        assert _entry(k)["type"] == "number"
+        assert CORE_DEFAULTS[k] == _entry(k)["default"], k
+
+
+def test_response_cache_disabled_by_default():
+    assert _entry("worker_llm_response_cache_ttl_s")["default"] == 0
+
+
+def test_tool_safety_stream_is_opt_in():
+    e = _entry("worker_llm_tool_safety_stream")
+    assert e["type"] == "boolean"
+    assert e["default"] is False
+    assert CORE_DEFAULTS["worker_llm_tool_safety_stream"] is False
@@ -56,20 +56,6 @@ def config_enabled(monkeypatch):
     monkeypatch.setattr(spellbook_hook, "_get_config_value", fake_config_value)
 
 
-@pytest.fixture
-def isolated_safety_cache(tmp_path, monkeypatch):
-    """Scope the safety cache file to tmp_path so runs don't bleed state."""
-    from spellbook.worker_llm import safety_cache as sc
-
-    cache_path = tmp_path / "worker_llm_block.json"
-    monkeypatch.setattr(sc, "CACHE_PATH", cache_path)
-    sc._VERDICT_CACHE.clear()
-    sc._BLOCK_CACHE.clear()
-    yield sc
-    sc._VERDICT_CACHE.clear()
-    sc._BLOCK_CACHE.clear()
-
-
 # ---------------------------------------------------------------------------
 # Feature off (default / backwards-compat invariant)
 # ---------------------------------------------------------------------------
@@ -1,8 +1,9 @@
 """Tests for ``spellbook.worker_llm.queue``.
 
 Covers: availability gate, start/stop lifecycle, enqueue + drain, callback
-invocation, callback failure isolation, drop-oldest on overflow, and the
-``publish_call`` event emission on drops.
+invocation, callback failure isolation, lane-aware drop-oldest on overflow
+and the ``publish_call`` event emission on drops, lane priority, per-task
+concurrency caps, the consumer pool, and ``queue_stats`` gauges.
 
 Strategy
 --------
@@ -158,51 +159,48 @@ async def test_enqueue_raises_when_queue_not_running():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_drop_oldest_on_overflow_publishes_drop_event(monkeypatch):
-    """When the queue is full, the OLDEST task is evicted and a
-    ``publish_call(status='dropped', error='queue_overflow')`` fires.
+@pytest.fixture
+def idle_queue(monkeypatch):
+    """Install a ``LaneQueue`` with no consumers draining it.
 
-    We drive the queue directly (no consumer) so the full/drop-oldest
-    behavior is deterministic. ``start_queue`` is bypassed; we install a
-    pre-filled asyncio.Queue at module scope and call ``enqueue``
-    directly. This avoids races between the consumer pulling items off
-    and the test enqueuing new ones.
+    ``start_queue`` is bypassed so full/drop behavior is deterministic: a
+    dummy never-finishing task stands in for the consumer pool so
+    ``is_available`` stays True. Yields a factory taking ``maxsize`` and
+    optional caps; the drop events land in the returned list.
     """
     published: list[dict] = []
+    monkeypatch.setattr(_queue, "publish_call", lambda **kw: published.append(kw))
+    monkeypatch.setattr(
+        _queue,
+        "_lanes",
+        {"urgent_task": "interactive", "roundtable_voice": "background"},
+    )
+    dummy: list[asyncio.Task] = []
 
-    def fake_publish_call(**kw):
-        published.append(kw)
+    def _install(maxsize: int, caps=None):
+        q = _queue.LaneQueue(maxsize=maxsize, caps=caps)
+        monkeypatch.setattr(_queue, "_queue", q)
+        dummy.append(asyncio.create_task(asyncio.sleep(60)))
+        monkeypatch.setattr(_queue, "_consumer_tasks", dummy)
+        monkeypatch.setattr(_queue, "_queue_loop", asyncio.get_running_loop())
+        return q, published
 
-    monkeypatch.setattr(_queue, "publish_call", fake_publish_call)
+    yield _install
+    for t in dummy:
+        t.cancel()
 
-    # Build a bounded queue with capacity 1 and plant a sentinel task so
-    # the next ``enqueue`` call trips the drop-oldest path.
-    q: asyncio.Queue[_queue.WorkerTask] = asyncio.Queue(maxsize=1)
-    await q.put(
-        _queue.WorkerTask(task_name="t_victim", prompt="oldest-payload")
-    )
 
-    # Monkeypatch the module globals so ``enqueue`` sees our queue as
-    # "running in this loop".
-    monkeypatch.setattr(_queue, "_queue", q)
-    monkeypatch.setattr(
-        _queue, "_consumer_task",
-        # A dummy task that never completes so ``is_available`` stays True.
-        asyncio.create_task(asyncio.sleep(60)),
-    )
-    monkeypatch.setattr(_queue, "_queue_loop", asyncio.get_running_loop())
+@pytest.mark.asyncio
+async def test_drop_oldest_on_overflow_publishes_drop_event(idle_queue):
+    """When the queue is full, the OLDEST task is evicted and a
+    ``publish_call(status='dropped', error='queue_overflow')`` fires."""
+    q, published = idle_queue(maxsize=1)
+    await _queue.enqueue("t_victim", "oldest-payload")
 
-    try:
-        # Queue is full (size 1, one item). Enqueue triggers drop-oldest.
-        result = await _queue.enqueue("t_new", "newest-payload")
-        assert result is False  # indicates drop-oldest fired
-    finally:
-        _queue._consumer_task.cancel()
-        try:
-            await _queue._consumer_task
-        except asyncio.CancelledError:
-            pass
+    # Queue is full (size 1, one item). Enqueue triggers drop-oldest.
+    result = await _queue.enqueue("t_new", "newest-payload")
+    assert result is False  # indicates a drop fired
+    assert q.qsize() == 1
 
     # Exactly one drop published, for the victim task.
     drops = [p for p in published if p.get("status") == "dropped"]
@@ -211,81 +209,151 @@ async def test_drop_oldest_on_overflow_publishes_drop_event(monkeypatch):
     assert drops[0]["error"] == "queue_overflow"
 
 
+@pytest.mark.asyncio
+async def test_overflow_drops_lower_lane_before_higher(idle_queue):
+    """A full queue evicts background work to admit an interactive task,
+    even when the interactive task is older."""
+    q, published = idle_queue(maxsize=2)
+    await _queue.enqueue("urgent_task", "old-interactive")
+    await _queue.enqueue("roundtable_voice", "background")
+
+    assert await _queue.enqueue("urgent_task", "new-interactive") is False
+
+    assert [p["task"] for p in published] == ["roundtable_voice"]
+    assert q.stats()["depth"] == {"interactive": 2, "warmup": 0, "background": 0}
+
+
+@pytest.mark.asyncio
+async def test_overflow_drops_incoming_when_outranked(idle_queue):
+    """Background work never evicts queued interactive tasks: when
+    everything queued outranks it, the incoming task is the one dropped."""
+    q, published = idle_queue(maxsize=1)
+    await _queue.enqueue("urgent_task", "interactive")
+
+    assert await _queue.enqueue("roundtable_voice", "background") is False
+
+    assert [p["task"] for p in published] == ["roundtable_voice"]
+    assert q.stats()["depth"]["interactive"] == 1
+
+
 # ---------------------------------------------------------------------------
-# Regression: concurrent drain during ``full()`` -> ``get_nowait`` window.
-#
-# ``enqueue`` checks ``_queue.full()`` and then pulls the oldest task via
-# ``get_nowait``. If a consumer drains between those two calls, the
-# pre-fix code raised ``asyncio.QueueEmpty`` and leaked the exception to
-# the caller. The guard swallows the ``QueueEmpty`` and suppresses the
-# spurious ``dropped`` event.
+# LaneQueue ordering + caps
 # ---------------------------------------------------------------------------
 
 
+def _task(name: str, lane: str, prompt: str = "") -> _queue.WorkerTask:
+    return _queue.WorkerTask(task_name=name, prompt=prompt, lane=lane)
+
+
 @pytest.mark.asyncio
-async def test_concurrent_drain_between_full_check_and_get_nowait(monkeypatch):
-    """Simulate a consumer winning the race between ``_queue.full()`` and
-    ``_queue.get_nowait()`` by draining the queue inside a patched
-    ``full()``. The enqueue path must not raise and must not publish a
-    ``dropped`` event — there is nothing to drop once the consumer pulled
-    the victim.
-    """
-    published: list[dict] = []
+async def test_get_serves_highest_priority_lane_first():
+    q = _queue.LaneQueue(maxsize=10)
+    q.put_nowait(_task("bg", "background", "1"))
+    q.put_nowait(_task("warm", "warmup", "2"))
+    q.put_nowait(_task("fg", "interactive", "3"))
+    q.put_nowait(_task("fg", "interactive", "4"))
 
-    def fake_publish_call(**kw):
-        published.append(kw)
+    order = [(await q.get()).prompt for _ in range(4)]
+    assert order == ["3", "4", "2", "1"]
 
-    monkeypatch.setattr(_queue, "publish_call", fake_publish_call)
 
-    q: asyncio.Queue[_queue.WorkerTask] = asyncio.Queue(maxsize=1)
-    await q.put(
-        _queue.WorkerTask(task_name="t_victim", prompt="oldest-payload")
-    )
+@pytest.mark.asyncio
+async def test_get_skips_task_at_concurrency_cap():
+    """A capped task name does not block eligible tasks behind it."""
+    q = _queue.LaneQueue(maxsize=10, caps={"roundtable_voice": 1})
+    q.put_nowait(_task("roundtable_voice", "background", "a"))
+    q.put_nowait(_task("roundtable_voice", "background", "b"))
+    q.put_nowait(_task("other", "background", "c"))
+
+    first = await q.get()
+    second = await q.get()
+    assert (first.prompt, second.prompt) == ("a", "c")
+    assert q.stats()["in_flight"] == {"roundtable_voice": 1, "other": 1}
+
+    # "b" only becomes eligible once "a" finishes.
+    waiter = asyncio.create_task(q.get())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    q.task_done(first)
+    third = await asyncio.wait_for(waiter, timeout=1.0)
+    assert third.prompt == "b"
 
-    # Wrap ``full()`` so the first call returns True (invariant is still
-    # "queue is at capacity at the check moment"), then drain the queue
-    # before ``enqueue`` proceeds to ``get_nowait``. This deterministically
-    # reproduces the race window.
-    original_full = q.full
-    call_count = {"n": 0}
-
-    def racing_full() -> bool:
-        call_count["n"] += 1
-        if call_count["n"] == 1:
-            # Consumer drains after we report "full".
-            try:
-                q.get_nowait()
-                q.task_done()
-            except asyncio.QueueEmpty:
-                pass
-            return True
-        return original_full()
-
-    # Bind the patched ``full`` onto the queue instance.
-    object.__setattr__(q, "full", racing_full)
-
-    monkeypatch.setattr(_queue, "_queue", q)
-    monkeypatch.setattr(
-        _queue, "_consumer_task",
-        asyncio.create_task(asyncio.sleep(60)),
-    )
-    monkeypatch.setattr(_queue, "_queue_loop", asyncio.get_running_loop())
 
+# ---------------------------------------------------------------------------
+# Consumer pool + gauges
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_consumer_pool_runs_tasks_concurrently(monkeypatch):
+    """With N workers, N tasks are in flight at once."""
+    monkeypatch.setattr(_queue, "_get_worker_count", lambda: 3)
+    running = 0
+    peak = 0
+    release = asyncio.Event()
+
+    async def fake_run_task(task):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await release.wait()
+        running -= 1
+        return _queue.WorkerResult(task_name=task.task_name, text="ok")
+
+    monkeypatch.setattr(_queue, "_run_task", fake_run_task)
+    monkeypatch.setattr(_queue, "publish_queue_stats", lambda **kw: None)
+
+    done = asyncio.Event()
+    finished: list[str] = []
+
+    async def cb(result):
+        finished.append(result.task_name)
+        if len(finished) == 3:
+            done.set()
+
+    await _queue.start_queue()
+    try:
+        for _ in range(3):
+            await _queue.enqueue("roundtable_voice", "p", callback=cb)
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert peak == 3
+        release.set()
+        await asyncio.wait_for(done.wait(), timeout=2.0)
+    finally:
+        await _queue.stop_queue()
+
+
+@pytest.mark.asyncio
+async def test_queue_stats_published_on_dequeue_and_completion(monkeypatch):
+    async def fake_run_task(task):
+        return _queue.WorkerResult(task_name=task.task_name, text="ok")
+
+    stats: list[dict] = []
+    monkeypatch.setattr(_queue, "_run_task", fake_run_task)
+    monkeypatch.setattr(_queue, "publish_queue_stats", lambda **kw: stats.append(kw))
+    done = asyncio.Event()
+
+    async def cb(_result):
+        done.set()
+
+    await _queue.start_queue()
     try:
-        # Must NOT raise asyncio.QueueEmpty. The race guard falls through
-        # to the ``put`` and returns True (nothing was dropped).
-        result = await _queue.enqueue("t_new", "newest-payload")
-        assert result is True, "No drop occurred — consumer beat us to it"
+        await _queue.enqueue("tool_safety_warmup", "ping", callback=cb)
+        await asyncio.wait_for(done.wait(), timeout=2.0)
+        for _ in range(5):
+            await asyncio.sleep(0)
     finally:
-        _queue._consumer_task.cancel()
-        try:
-            await _queue._consumer_task
-        except asyncio.CancelledError:
-            pass
+        await _queue.stop_queue()
 
-    # No spurious ``dropped`` event should have been published.
-    drops = [p for p in published if p.get("status") == "dropped"]
-    assert drops == [], f"unexpected drop events: {drops!r}"
+    assert len(stats) == 2
+    dequeued, completed = stats
+    assert dequeued["wait_ms"] >= 0
+    assert dequeued["in_flight"] == {"tool_safety_warmup": 1}
+    assert dequeued["workers"] == 1
+    assert completed["wait_ms"] is None
+    assert completed["in_flight"] == {}
+    assert completed["depth"] == {"interactive": 0, "warmup": 0, "background": 0}
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,227 @@
+"""Tests for request coalescing and the response cache in ``client.call``.
+
+``client._post`` (one HTTP request + its call event) is replaced with a
+counting fake so the tests control exactly when the "request" finishes;
+the HTTP layer itself is covered by ``test_client.py``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from spellbook.worker_llm import client, response_cache
+from spellbook.worker_llm.errors import WorkerLLMTimeout, WorkerLLMUnreachable
+
+
+@pytest.fixture(autouse=True)
+def _clear_response_cache():
+    response_cache.response_cache_clear()
+    yield
+    response_cache.response_cache_clear()
+
+
+@pytest.fixture
+def fake_post(monkeypatch):
+    """Replace ``client._post``; requests block until ``release`` is set."""
+
+    class _Fake:
+        def __init__(self) -> None:
+            self.prompts: list[str] = []
+            self.release = asyncio.Event()
+            self.release.set()
+            self.error: Exception | None = None
+
+        async def __call__(self, cfg, system_prompt, user_prompt, *args, **kwargs):
+            self.prompts.append(user_prompt)
+            await self.release.wait()
+            if self.error is not None:
+                raise self.error
+            return f"answer:{user_prompt}"
+
+    fake = _Fake()
+    monkeypatch.setattr(client, "_post", fake)
+    return fake
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+# ---------------------------------------------------------------------------
+# Coalescing
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_request(
+    worker_llm_config, fake_post
+):
+    fake_post.release.clear()
+    calls = [asyncio.create_task(client.call("sys", "ls -la")) for _ in range(3)]
+    await _settle()
+    fake_post.release.set()
+
+    assert await asyncio.gather(*calls) == ["answer:ls -la"] * 3
+    assert fake_post.prompts == ["ls -la"]
+    assert response_cache.response_cache_info()["coalesced"] == 2
+
+
+@pytest.mark.asyncio
+async def test_different_prompts_are_not_coalesced(worker_llm_config, fake_post):
+    fake_post.release.clear()
+    calls = [
+        asyncio.create_task(client.call("sys", "a")),
+        asyncio.create_task(client.call("sys", "b")),
+        asyncio.create_task(client.call("sys", "a", max_tokens=7)),
+    ]
+    await _settle()
+    fake_post.release.set()
+    await asyncio.gather(*calls)
+
+    assert sorted(fake_post.prompts) == ["a", "a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_leader_error_reaches_followers(worker_llm_config, fake_post):
+    fake_post.release.clear()
+    fake_post.error = WorkerLLMUnreachable("down")
+    calls = [asyncio.create_task(client.call("sys", "p")) for _ in range(2)]
+    await _settle()
+    fake_post.release.set()
+
+    results = await asyncio.gather(*calls, return_exceptions=True)
+    assert all(isinstance(r, WorkerLLMUnreachable) for r in results)
+    assert fake_post.prompts == ["p"]
+
+    # Nothing is left in flight: the next call sends a fresh request.
+    fake_post.error = None
+    assert await client.call("sys", "p") == "answer:p"
+    assert fake_post.prompts == ["p", "p"]
+
+
+@pytest.mark.asyncio
+async def test_follower_timeout_does_not_cancel_leader(worker_llm_config, fake_post):
+    fake_post.release.clear()
+    leader = asyncio.create_task(client.call("sys", "slow"))
+    await _settle()
+
+    with pytest.raises(WorkerLLMTimeout):
+        await client.call("sys", "slow", timeout_s=0.01)
+
+    fake_post.release.set()
+    assert await leader == "answer:slow"
+
+
+def test_call_sync_threads_share_one_request(worker_llm_config, monkeypatch):
+    """``call_sync`` runs each call on its own loop; identical calls from two
+    threads (e.g. two hook events for the same command) still coalesce."""
+    prompts: list[str] = []
+    release = threading.Event()
+
+    async def fake_post(cfg, system_prompt, user_prompt, *args, **kwargs):
+        prompts.append(user_prompt)
+        while not release.is_set():
+            await asyncio.sleep(0.005)
+        return f"answer:{user_prompt}"
+
+    monkeypatch.setattr(client, "_post", fake_post)
+    results: list[str] = []
+
+    def worker() -> None:
+        results.append(client.call_sync("sys", "git status", timeout_s=5.0))
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    threads[0].start()
+    deadline = time.monotonic() + 5.0
+    while not prompts and time.monotonic() < deadline:
+        time.sleep(0.005)
+    threads[1].start()
+    while (
+        response_cache.response_cache_info()["coalesced"] < 1
+        and time.monotonic() < deadline
+    ):
+        time.sleep(0.005)
+    release.set()
+    for t in threads:
+        t.join(timeout=5.0)
+
+    assert results == ["answer:git status"] * 2
+    assert prompts == ["git status"]
+    assert response_cache.response_cache_info()["coalesced"] == 1
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_cache_disabled_by_default(worker_llm_config, fake_post):
+    await client.call("sys", "p")
+    await client.call("sys", "p")
+
+    assert fake_post.prompts == ["p", "p"]
+    info = response_cache.response_cache_info()
+    assert (info["hits"], info["misses"], info["size"]) == (0, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_cache_serves_repeat_and_reports_hit_rate(
+    worker_llm_config, fake_post
+):
+    worker_llm_config["worker_llm_response_cache_ttl_s"] = 60
+
+    assert await client.call("sys", "p") == "answer:p"
+    assert await client.call("sys", "p") == "answer:p"
+
+    assert fake_post.prompts == ["p"]
+    info = response_cache.response_cache_info()
+    assert (info["hits"], info["misses"], info["size"]) == (1, 1, 1)
+    assert info["hit_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_cache_entry_expires(worker_llm_config, fake_post, monkeypatch):
+    worker_llm_config["worker_llm_response_cache_ttl_s"] = 60
+    now = {"t": 1000.0}
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now["t"])
+
+    await client.call("sys", "p")
+    now["t"] += 61
+    await client.call("sys", "p")
+
+    assert fake_post.prompts == ["p", "p"]
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached(worker_llm_config, fake_post):
+    worker_llm_config["worker_llm_response_cache_ttl_s"] = 60
+    fake_post.error = WorkerLLMUnreachable("down")
+    with pytest.raises(WorkerLLMUnreachable):
+        await client.call("sys", "p")
+
+    fake_post.error = None
+    assert await client.call("sys", "p") == "answer:p"
+    assert response_cache.response_cache_info()["size"] == 1
+
+
+def test_store_evicts_lru_past_entry_and_byte_caps():
+    for key in ("a", "b", "c"):
+        response_cache.store(key, "x" * 10, ttl_s=60, max_entries=2, max_bytes=100)
+    assert response_cache.lookup("a") is None
+    assert response_cache.lookup("b") is not None  # b becomes MRU
+
+    response_cache.store("d", "y" * 85, ttl_s=60, max_entries=10, max_bytes=100)
+    assert response_cache.lookup("c") is None
+    assert response_cache.lookup("b") is not None
+    assert response_cache.response_cache_info()["bytes"] == 95
+
+
+def test_store_skips_response_larger_than_byte_cap():
+    response_cache.store("big", "z" * 200, ttl_s=60, max_entries=10, max_bytes=100)
+    assert response_cache.response_cache_info()["size"] == 0
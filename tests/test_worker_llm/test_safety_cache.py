@@ -1,16 +1,15 @@
-"""Tests for persistent JSON safety cache.
+"""Tests for the persistent SQLite safety cache.
 
 Covers: make_key stability, TTL expiry (time-travel via monkeypatch —
 freezegun is not a dev dep, see impl plan I4), record_block + bypass
-consumption, persistence across importlib.reload, size cap + insertion-
-order eviction, atomic writes (no partial file on crash), graceful
-degradation on corrupt cache file.
+consumption, persistence across connections (a second hook process),
+size cap + LRU eviction, lazy expiry, graceful degradation on a corrupt
+cache file.
 """
 
 from __future__ import annotations
 
-import importlib
-import json
+import sqlite3
 
 import pytest
 
@@ -21,14 +20,11 @@ from spellbook.worker_llm.tasks.tool_safety import SafetyVerdict
 @pytest.fixture(autouse=True)
 def _isolate_cache(tmp_path, monkeypatch):
     """Redirect the module-global cache file to a temp path for every test
-    and reset the in-memory mirrors."""
-    path = tmp_path / "c.json"
+    and drop the cached connection afterwards."""
+    path = tmp_path / "c.db"
     monkeypatch.setattr(safety_cache, "CACHE_PATH", path)
-    safety_cache._VERDICT_CACHE.clear()
-    safety_cache._BLOCK_CACHE.clear()
     yield path
-    safety_cache._VERDICT_CACHE.clear()
-    safety_cache._BLOCK_CACHE.clear()
+    safety_cache.close_cache()
 
 
 # ---------------------------------------------------------------------------
@@ -122,36 +118,51 @@ def test_bypass_expires_after_window(_isolate_cache, monkeypatch):
     assert safety_cache.should_bypass(k) is False
 
 
+def test_bypass_is_consumed_once_across_connections(_isolate_cache, monkeypatch):
+    """Another hook process that already consumed the bypass leaves nothing
+    for this one."""
+    monkeypatch.setattr("time.time", lambda: 1_700_000_000.0)
+    k = safety_cache.make_key("Bash", {})
+    safety_cache.record_block(k)
+
+    other = sqlite3.connect(_isolate_cache)
+    with other:
+        taken = other.execute(
+            "DELETE FROM blocks WHERE key = ? RETURNING blocked_at", (k,)
+        ).fetchall()
+    other.close()
+
+    assert len(taken) == 1
+    assert safety_cache.should_bypass(k) is False
+
+
 def test_should_bypass_on_empty_cache_returns_false(_isolate_cache):
     assert safety_cache.should_bypass("unknown-key") is False
 
 
 # ---------------------------------------------------------------------------
-# Persistence: file-backed across reload
+# Persistence: shared across processes
 # ---------------------------------------------------------------------------
 
 
-def test_block_persists_across_module_reload(_isolate_cache, monkeypatch):
-    """record_block must be durable: a second process (simulated by reload)
-    sees the block and can honor the 30s bypass window."""
+def test_block_persists_across_connections(_isolate_cache, monkeypatch):
+    """record_block must be durable: a second process (simulated by closing
+    and reopening the connection) sees the block and can honor the 30s
+    bypass window."""
     start_t = 1_700_000_000.0
     monkeypatch.setattr("time.time", lambda: start_t)
     k = safety_cache.make_key("Bash", {"x": 1})
     safety_cache.record_block(k)
     assert _isolate_cache.exists()
 
-    # Preserve the CACHE_PATH override across the reload.
-    saved_path = safety_cache.CACHE_PATH
-    reloaded = importlib.reload(safety_cache)
-    reloaded.CACHE_PATH = saved_path
-    reloaded._load_from_disk()
+    safety_cache.close_cache()
 
-    # Still within bypass window after reload.
+    # Still within bypass window after reopening.
     monkeypatch.setattr("time.time", lambda: start_t + 5.0)
-    assert reloaded.should_bypass(k) is True
+    assert safety_cache.should_bypass(k) is True
 
 
-def test_verdict_persists_across_module_reload(_isolate_cache, monkeypatch):
+def test_verdict_persists_across_connections(_isolate_cache, monkeypatch):
     monkeypatch.setattr(
         "spellbook.core.config.config_get",
         lambda k: 300.0 if k == "worker_llm_safety_cache_ttl_s" else None,
@@ -164,16 +175,34 @@ def test_verdict_persists_across_module_reload(_isolate_cache, monkeypatch):
         k, SafetyVerdict(verdict="WARN", reasoning="touches env")
     )
 
-    saved_path = safety_cache.CACHE_PATH
-    reloaded = importlib.reload(safety_cache)
-    reloaded.CACHE_PATH = saved_path
-    reloaded._load_from_disk()
+    safety_cache.close_cache()
 
-    assert reloaded.get_cached_verdict(k) == SafetyVerdict(
+    assert safety_cache.get_cached_verdict(k) == SafetyVerdict(
         verdict="WARN", reasoning="touches env"
     )
 
 
+def test_writes_from_another_connection_are_visible(_isolate_cache, monkeypatch):
+    """A verdict stored by a different hook process is a hit here without
+    reopening: lookups read the shared file, not a per-process snapshot."""
+    monkeypatch.setattr("time.time", lambda: 1_700_000_000.0)
+    k = safety_cache.make_key("Bash", {})
+    assert safety_cache.get_cached_verdict(k) is None  # opens the database
+
+    other = sqlite3.connect(_isolate_cache)
+    with other:
+        other.execute(
+            "INSERT INTO verdicts (key, verdict, reasoning, expires_at, touched) "
+            "VALUES (?, 'BLOCK', 'rm -rf', ?, 1)",
+            (k, 1_700_000_300.0),
+        )
+    other.close()
+
+    assert safety_cache.get_cached_verdict(k) == SafetyVerdict(
+        verdict="BLOCK", reasoning="rm -rf"
+    )
+
+
 # ---------------------------------------------------------------------------
 # Size cap + eviction
 # ---------------------------------------------------------------------------
@@ -227,64 +256,83 @@ def test_size_cap_lru_evicts_least_recently_read(_isolate_cache, monkeypatch):
         assert safety_cache.get_cached_verdict(k) is not None
 
 
-# ---------------------------------------------------------------------------
-# Atomic write + corruption recovery
-# ---------------------------------------------------------------------------
+def test_warm_hit_does_not_write(_isolate_cache, monkeypatch):
+    """Hits on an entry near the head of the LRU sequence are read-only."""
+    monkeypatch.setattr(
+        "spellbook.core.config.config_get",
+        lambda k: 300.0 if k == "worker_llm_safety_cache_ttl_s" else None,
+    )
+    monkeypatch.setattr("time.time", lambda: 1_700_000_000.0)
+    k = safety_cache.make_key("Bash", {"command": "ls"})
+    safety_cache.cache_verdict(k, SafetyVerdict(verdict="OK", reasoning=""))
+
+    conn = safety_cache._connection()
+    before = conn.total_changes
+    for _ in range(5):
+        assert safety_cache.get_cached_verdict(k) is not None
+    assert conn.total_changes == before
 
 
-def test_atomic_write_leaves_no_tempfile(_isolate_cache, monkeypatch):
-    """Successful write: only the target file survives, no orphan *.tmp."""
+def test_stale_hit_is_bumped_to_mru(_isolate_cache, monkeypatch):
+    """A hit that has fallen behind the newest quarter of the sequence
+    is re-touched so it survives the next eviction."""
+    monkeypatch.setattr(safety_cache, "MAX_CACHE_ENTRIES", 8)
     monkeypatch.setattr(
         "spellbook.core.config.config_get",
         lambda k: 300.0 if k == "worker_llm_safety_cache_ttl_s" else None,
     )
-    k = safety_cache.make_key("Bash", {})
-    safety_cache.cache_verdict(k, SafetyVerdict(verdict="OK", reasoning=""))
+    monkeypatch.setattr("time.time", lambda: 1_700_000_000.0)
+    keys = [safety_cache.make_key("Bash", {"i": i}) for i in range(9)]
+    for k in keys[:8]:
+        safety_cache.cache_verdict(k, SafetyVerdict(verdict="OK", reasoning=""))
 
-    parent = _isolate_cache.parent
-    entries = sorted(p.name for p in parent.iterdir())
-    assert entries == [_isolate_cache.name]
+    assert safety_cache.get_cached_verdict(keys[0]) is not None
+    safety_cache.cache_verdict(keys[8], SafetyVerdict(verdict="OK", reasoning=""))
 
+    assert safety_cache.get_cached_verdict(keys[0]) is not None
+    assert safety_cache.get_cached_verdict(keys[1]) is None
 
-def test_corrupt_cache_file_starts_fresh(tmp_path, monkeypatch, caplog):
-    """A garbage cache file must not crash import; log a warning and start
-    from an empty in-memory cache."""
-    import logging
 
-    path = tmp_path / "c.json"
-    path.write_text("{not valid json")
-    monkeypatch.setattr(safety_cache, "CACHE_PATH", path)
+# ---------------------------------------------------------------------------
+# Lazy expiry + corruption recovery
+# ---------------------------------------------------------------------------
 
-    with caplog.at_level(logging.WARNING, logger="spellbook.worker_llm.safety_cache"):
-        safety_cache._load_from_disk()
 
-    assert safety_cache._VERDICT_CACHE == {}
-    assert safety_cache._BLOCK_CACHE == {}
-    warnings = [
-        r
-        for r in caplog.records
-        if r.levelno == logging.WARNING
-        and r.name == "spellbook.worker_llm.safety_cache"
-    ]
-    assert len(warnings) == 1
-    assert "corrupt" in warnings[0].getMessage().lower()
+def test_expired_rows_purged_on_next_write(_isolate_cache, monkeypatch):
+    """Expired verdicts stay on disk until the next write deletes them."""
+    ttl = {"v": 1.0}
+    monkeypatch.setattr(
+        "spellbook.core.config.config_get",
+        lambda k: ttl["v"] if k == "worker_llm_safety_cache_ttl_s" else None,
+    )
+    start_t = 1_700_000_000.0
+    monkeypatch.setattr("time.time", lambda: start_t)
+    dead = safety_cache.make_key("Bash", {"i": 0})
+    safety_cache.cache_verdict(dead, SafetyVerdict(verdict="OK", reasoning=""))
 
+    monkeypatch.setattr("time.time", lambda: start_t + 2.0)
+    assert safety_cache.get_cached_verdict(dead) is None
+    assert safety_cache.cache_stats()["verdicts"] == 1  # read does not delete
 
-def test_cache_file_with_missing_keys_tolerated(tmp_path, monkeypatch):
-    """A partial cache file (missing 'verdicts' or 'blocks') must not crash;
-    the missing section starts empty."""
-    path = tmp_path / "c.json"
-    path.write_text(json.dumps({"verdicts": {}}))  # 'blocks' omitted
-    monkeypatch.setattr(safety_cache, "CACHE_PATH", path)
+    ttl["v"] = 300.0
+    live = safety_cache.make_key("Bash", {"i": 1})
+    safety_cache.cache_verdict(live, SafetyVerdict(verdict="OK", reasoning=""))
+    assert safety_cache.cache_stats() == {"verdicts": 1, "blocks": 0}
+
+
+def test_stale_blocks_purged_on_next_block(_isolate_cache, monkeypatch):
+    start_t = 1_700_000_000.0
+    monkeypatch.setattr("time.time", lambda: start_t)
+    safety_cache.record_block("old")
 
-    safety_cache._load_from_disk()
-    assert safety_cache._VERDICT_CACHE == {}
-    assert safety_cache._BLOCK_CACHE == {}
+    monkeypatch.setattr("time.time", lambda: start_t + 31.0)
+    safety_cache.record_block("new")
+    assert safety_cache.cache_stats()["blocks"] == 1
 
 
 def test_on_disk_schema_shape(_isolate_cache, monkeypatch):
-    """Disk schema: {"verdicts": {key: {verdict, reasoning, expires_at}},
-    "blocks": {key: ts}}. Fixed so external tooling can read it."""
+    """Disk schema: verdicts(key, verdict, reasoning, expires_at, touched)
+    and blocks(key, blocked_at). Fixed so external tooling can read it."""
     monkeypatch.setattr(
         "spellbook.core.config.config_get",
         lambda k: 300.0 if k == "worker_llm_safety_cache_ttl_s" else None,
@@ -295,54 +343,58 @@ def test_on_disk_schema_shape(_isolate_cache, monkeypatch):
     safety_cache.cache_verdict(k, SafetyVerdict(verdict="OK", reasoning="r"))
     safety_cache.record_block(k)
 
-    on_disk = json.loads(_isolate_cache.read_text())
-    assert set(on_disk.keys()) == {"verdicts", "blocks"}
-    assert k in on_disk["verdicts"]
-    assert set(on_disk["verdicts"][k].keys()) == {
-        "verdict",
-        "reasoning",
-        "expires_at",
-    }
-    assert on_disk["verdicts"][k]["verdict"] == "OK"
-    assert on_disk["verdicts"][k]["reasoning"] == "r"
-    assert on_disk["verdicts"][k]["expires_at"] == 1_700_000_300.0
-    assert on_disk["blocks"][k] == 1_700_000_000.0
-
-
-def test_expired_entries_not_reloaded(tmp_path, monkeypatch):
-    """A cache file with already-expired verdicts must not repopulate
-    _VERDICT_CACHE — they are dead on arrival."""
-    path = tmp_path / "c.json"
-    path.write_text(
-        json.dumps(
-            {
-                "verdicts": {
-                    "live": {
-                        "verdict": "OK",
-                        "reasoning": "",
-                        "expires_at": 1_700_000_100.0,
-                    },
-                    "dead": {
-                        "verdict": "OK",
-                        "reasoning": "",
-                        "expires_at": 1_000_000_000.0,
-                    },
-                },
-                "blocks": {},
-            }
-        )
-    )
+    conn = sqlite3.connect(_isolate_cache)
+    try:
+        assert conn.execute(
+            "SELECT verdict, reasoning, expires_at FROM verdicts WHERE key = ?",
+            (k,),
+        ).fetchone() == ("OK", "r", 1_700_000_300.0)
+        assert conn.execute(
+            "SELECT blocked_at FROM blocks WHERE key = ?", (k,)
+        ).fetchone() == (1_700_000_000.0,)
+    finally:
+        conn.close()
+
+
+def test_corrupt_cache_file_falls_back_to_memory(tmp_path, monkeypatch, caplog):
+    """A garbage cache file must not crash the hook; log a warning and keep
+    working from an in-memory cache."""
+    import logging
+
+    path = tmp_path / "c.db"
+    path.write_bytes(b"not a sqlite database" * 100)
     monkeypatch.setattr(safety_cache, "CACHE_PATH", path)
     monkeypatch.setattr("time.time", lambda: 1_700_000_000.0)
 
-    safety_cache._load_from_disk()
-    assert "live" in safety_cache._VERDICT_CACHE
-    assert "dead" not in safety_cache._VERDICT_CACHE
+    with caplog.at_level(logging.WARNING, logger="spellbook.worker_llm.safety_cache"):
+        safety_cache.record_block("k")
+        assert safety_cache.should_bypass("k") is True
+    safety_cache.close_cache()
+
+    warnings = [
+        r
+        for r in caplog.records
+        if r.levelno == logging.WARNING
+        and r.name == "spellbook.worker_llm.safety_cache"
+    ]
+    assert len(warnings) == 1
+    assert "in-memory" in warnings[0].getMessage()
+
+
+def test_legacy_json_cache_removed(tmp_path, monkeypatch):
+    """The pre-SQLite JSON file is deleted when the database is created."""
+    legacy = tmp_path / safety_cache.LEGACY_CACHE_PATH.name
+    legacy.write_text('{"verdicts": {}, "blocks": {}}')
+    monkeypatch.setattr(safety_cache, "CACHE_PATH", tmp_path / "c.db")
+
+    assert safety_cache.should_bypass("k") is False
+    safety_cache.close_cache()
+    assert not legacy.exists()
 
 
 def test_cache_path_parent_created_on_write(tmp_path, monkeypatch):
     """First write creates the parent directory if it does not exist."""
-    nested = tmp_path / "a" / "b" / "safety.json"
+    nested = tmp_path / "a" / "b" / "safety.db"
     monkeypatch.setattr(safety_cache, "CACHE_PATH", nested)
     monkeypatch.setattr(
         "spellbook.core.config.config_get",
@@ -352,12 +404,13 @@ def test_cache_path_parent_created_on_write(tmp_path, monkeypatch):
     k = safety_cache.make_key("Bash", {})
     safety_cache.cache_verdict(k, SafetyVerdict(verdict="OK", reasoning=""))
     assert nested.exists()
+    safety_cache.close_cache()
 
 
-def test_persist_osError_warns_exactly_once_across_failures(
+def test_sqlite_error_warns_exactly_once_across_failures(
     tmp_path, monkeypatch, caplog
 ):
-    """First persist OSError -> WARNING (names path and exception type);
+    """First sqlite error -> WARNING (names path and exception type);
     subsequent failures -> DEBUG. Keeps fire-and-forget semantics but makes
     unwritable-cache-dir bugs loud instead of silently swallowed.
 
@@ -367,8 +420,8 @@ def test_persist_osError_warns_exactly_once_across_failures(
     import logging
 
     # Redirect CACHE_PATH to a tmp location (value doesn't matter; the real
-    # failure trigger is forcing _atomic_write_json to raise).
-    monkeypatch.setattr(safety_cache, "CACHE_PATH", tmp_path / "safety.json")
+    # failure trigger is forcing _connection to raise).
+    monkeypatch.setattr(safety_cache, "CACHE_PATH", tmp_path / "safety.db")
     monkeypatch.setattr(
         "spellbook.core.config.config_get",
         lambda k: 300.0 if k == "worker_llm_safety_cache_ttl_s" else None,
@@ -376,10 +429,10 @@ def test_persist_osError_warns_exactly_once_across_failures(
     # Reset the module-level counter so the test is order-independent.
     monkeypatch.setattr(safety_cache, "_persist_failures", 0)
 
-    def raising_write(path, data):
-        raise OSError("disk full")
+    def raising_connection():
+        raise sqlite3.OperationalError("disk I/O error")
 
-    monkeypatch.setattr(safety_cache, "_atomic_write_json", raising_write)
+    monkeypatch.setattr(safety_cache, "_connection", raising_connection)
 
     k = safety_cache.make_key("Bash", {"command": "ls"})
     v = SafetyVerdict(verdict="OK", reasoning="")
@@ -406,10 +459,22 @@ def test_persist_osError_warns_exactly_once_across_failures(
     )
     msg = warning_records[0].getMessage()
     # Warning must name exception type and path so operators can act on it.
-    assert "OSError" in msg
-    assert str(tmp_path / "safety.json") in msg
+    assert "OperationalError" in msg
+    assert str(tmp_path / "safety.db") in msg
 
     # The other 4 failures fell back to DEBUG.
     assert len(debug_records) == 4, (
         f"expected 4 DEBUG records (failures 2..5), got {len(debug_records)}"
     )
+
+
+def test_cache_stats_degrades_on_sqlite_error(monkeypatch):
+    monkeypatch.setattr(safety_cache, "_persist_failures", 0)
+
+    def raising_connection():
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(safety_cache, "_connection", raising_connection)
+
+    assert safety_cache.cache_stats() == {"verdicts": 0, "blocks": 0}
+    assert safety_cache._persist_failures == 1
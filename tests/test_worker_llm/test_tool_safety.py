@@ -21,25 +21,6 @@ def _ok(content: str) -> dict:
     return {"choices": [{"message": {"content": content}}]}
 
 
-@pytest.fixture(autouse=True)
-def _reset_safety_cache(tmp_path, monkeypatch):
-    """Every tool_safety call reads/writes the module-global verdict and
-    block caches, and cache_verdict/record_block persist those caches to
-    ``safety_cache.CACHE_PATH``. Without monkeypatching ``CACHE_PATH`` to
-    a tmp path, these tests would write to the user's real
-    ``~/.local/spellbook/cache/worker_llm_block.json`` and pollute user
-    state. Pattern mirrors ``test_safety_cache.py::_isolate_cache``.
-    """
-    from spellbook.worker_llm import safety_cache
-
-    monkeypatch.setattr(safety_cache, "CACHE_PATH", tmp_path / "safety.json")
-    safety_cache._VERDICT_CACHE.clear()
-    safety_cache._BLOCK_CACHE.clear()
-    yield
-    safety_cache._VERDICT_CACHE.clear()
-    safety_cache._BLOCK_CACHE.clear()
-
-
 # ---------------------------------------------------------------------------
 # Happy-path parsing
 # ---------------------------------------------------------------------------
@@ -907,3 +888,90 @@ def test_post_warmup_enqueue_returns_false_on_pre_post_failure(monkeypatch):
     monkeypatch.setattr(ts_mod, "_load_bearer_token", _boom)
 
     assert ts_mod._post_warmup_enqueue() is False
+
+
+# ---------------------------------------------------------------------------
+# Streaming early exit (worker_llm_tool_safety_stream)
+# ---------------------------------------------------------------------------
+
+
+def _sse(*deltas: str) -> str:
+    lines = []
+    for d in deltas:
+        lines += ["data: " + json.dumps({"choices": [{"delta": {"content": d}}]}), ""]
+    lines += ["data: [DONE]", ""]
+    return "\n".join(lines)
+
+
+def test_stream_ok_verdict_stops_after_verdict_field(
+    worker_llm_transport, worker_llm_config, monkeypatch
+):
+    worker_llm_config["worker_llm_tool_safety_stream"] = True
+    calls: list = []
+    monkeypatch.setattr(
+        "spellbook.worker_llm.client.publish_call",
+        lambda **kw: calls.append(kw),
+    )
+    worker_llm_transport(
+        [
+            SimpleNamespace(
+                status=200,
+                body=_sse('{"verdict":', '"OK"', ',"reasoning":"', "long ", "tail"),
+            )
+        ]
+    )
+
+    from spellbook.worker_llm.tasks.tool_safety import tool_safety
+
+    v = tool_safety("Bash", {"command": "ls"}, "")
+    assert v.verdict == "OK"
+    assert calls[0]["response_len"] == len('{"verdict":"OK"')
+
+
+def test_stream_block_verdict_reads_reasoning(
+    worker_llm_transport, worker_llm_config
+):
+    worker_llm_config["worker_llm_tool_safety_stream"] = True
+    worker_llm_transport(
+        [
+            SimpleNamespace(
+                status=200,
+                body=_sse('{"verdict":"BLOCK",', '"reasoning":"rm ', '-rf"}'),
+            )
+        ]
+    )
+
+    from spellbook.worker_llm.tasks.tool_safety import SafetyVerdict, tool_safety
+
+    v = tool_safety("Bash", {"command": "rm -rf /"}, "")
+    assert v == SafetyVerdict(verdict="BLOCK", reasoning="rm -rf")
+
+
+def test_stream_unknown_verdict_fails_open(worker_llm_transport, worker_llm_config):
+    worker_llm_config["worker_llm_tool_safety_stream"] = True
+    worker_llm_transport(
+        [SimpleNamespace(status=200, body=_sse('{"verdict":"SAFE","reasoning":"x"}'))]
+    )
+
+    from spellbook.worker_llm.tasks.tool_safety import _FAIL_OPEN, tool_safety
+
+    assert tool_safety("Bash", {"command": "ls"}, "") == _FAIL_OPEN
+
+
+@pytest.mark.parametrize(
+    ("text", "decided"),
+    [
+        ('{"verdict":"O', False),
+        ('{"verdict": "OK"', True),
+        ('{"reasoning":"a \\"verdict\\": \\"OK\\"', False),
+        ('{"reasoning":"fine","verdict":"ok"', True),
+        ('{"verdict":"WARN","reasoning":"env', False),
+        ('{"verdict":"WARN","reasoning":"env"}', True),
+        ('```json\n{"verdict":"BLOCK","reasoning":"x"}', True),
+        ('{"verdict":"MAYBE"', True),
+    ],
+)
+def test_verdict_decided(text, decided):
+    from spellbook.worker_llm.tasks.tool_safety import _verdict_decided
+
+    assert _verdict_decided(text) is decided